@@ -4,7 +4,7 @@ from src import shared_imports
 from fastapi import FastAPI, HTTPException, Request, Response, Depends, WebSocket, WebSocketDisconnect, Body, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
-from typing import Optional, Set, List
+from typing import Optional, Set, List, Tuple
 from contextlib import asynccontextmanager
 from pydantic import BaseModel, Field
 from pathlib import Path
@@ -77,11 +77,8 @@ from gaia.infra.audio.provider_manager import provider_manager
 from gaia.api.routes.internal import router as internal_router
 from gaia.api.routes.combat import router as combat_router
 from gaia.api.routes.admin import router as admin_router
-from gaia.api.routes.scene_admin import router as scene_admin_router
-from gaia.api.routes.prompts import router as prompts_router
 
 from gaia.api.routes.chat import router as chat_router
-from gaia.api.routes.debug import router as debug_router
 from gaia.api.routes.room import router as room_router
 from gaia.api.routes.sound_effects import router as sfx_router
 from gaia.api.routes.scene_images import router as scene_images_router
@@ -241,23 +238,30 @@ async def lifespan(app: FastAPI):
     global orchestrator, campaign_service
     
     # Startup
-    init_secrets_cache_from_gcp_if_configured()
+    from gaia.api.startup import StartupOrchestrator, include_optional_routers
+    startup = StartupOrchestrator()
+    app.state.startup = startup
+    # Secrets come first: SECRETS_ON_STARTUP may supply the database credentials
+    await startup.run("secrets", init_secrets_cache_from_gcp_if_configured, in_thread=True)
+
     # Initialize database connection (optional in serverless staging)
     require_db = os.getenv("REQUIRE_DATABASE_ON_STARTUP", "true").strip().lower() not in {"0", "false", "no"}
-    try:
-        from db.src.connection import db_manager
-        db_manager.initialize()
-        if not await db_manager.test_connection():
+
+    async def _init_database() -> None:
+        try:
+            from db.src.connection import db_manager
+            await asyncio.to_thread(db_manager.initialize)
+            if not await db_manager.test_connection():
+                if require_db:
+                    logger.error("[CRITICAL] Database connection failed - cannot start without authentication")
+                    raise RuntimeError("Database connection required for authentication")
+                logger.warning("[WARN] Database connection failed; continuing with limited features")
+        except Exception as e:
             if require_db:
-                logger.error("[CRITICAL] Database connection failed - cannot start without authentication")
-                raise RuntimeError("Database connection required for authentication")
-            logger.warning("[WARN] Database connection failed; continuing with limited features")
-    except Exception as e:
-        if require_db:
-            logger.error(f"[CRITICAL] Could not initialize database: {e}")
-            logger.error("[CRITICAL] Cannot start without authentication. Please configure database.")
-            raise RuntimeError(f"Database initialization failed: {e}")
-        logger.warning("Database initialization error ignored (REQUIRE_DATABASE_ON_STARTUP=false): %s", e)
+                logger.error(f"[CRITICAL] Could not initialize database: {e}")
+                logger.error("[CRITICAL] Cannot start without authentication. Please configure database.")
+                raise RuntimeError(f"Database initialization failed: {e}")
+            logger.warning("Database initialization error ignored (REQUIRE_DATABASE_ON_STARTUP=false): %s", e)
 
     def _add_scripts_parent_to_path() -> None:
         """Ensure the parent of the scripts directory is on sys.path."""
@@ -272,53 +276,43 @@ async def lifespan(app: FastAPI):
     # Auth0 configuration is validated at runtime when tokens are verified
     # No pre-flight checks needed as Auth0 handles all authentication
 
-    # Check for users with pending admin notifications and retry sending emails
-    try:
-        _add_scripts_parent_to_path()
-        from scripts.backend.startup.check_pending_registrations import check_and_notify_pending_registrations
-        await check_and_notify_pending_registrations()
-    except Exception as e:
-        logger.warning(f"Failed to check pending registrations: {e}", exc_info=True)
-        # Don't fail startup if this check fails
-
     # Remote AI providers (Claude/Parasail) configured via environment variables
 
-    # F5-TTS DISABLED - No longer logging audio paths or checking local TTS
-    # from gaia.infra.audio.f5_tts_config import log_audio_paths
-    # log_audio_paths()
-
-    # F5-TTS DISABLED - No longer checking local TTS availability
-    # from gaia.infra.audio.tts_service import tts_service
-    # tts_service._check_local_tts()
-    # logger.info(f"[OK] TTS service updated - Local TTS available: {tts_service.local_tts_available}")
-    
-    # Initialize the unified orchestrator using the singleton getter
-    from gaia.api.routes.internal import get_orchestrator
-    orchestrator = get_orchestrator()
-
-    # Set up unified broadcaster for orchestrator (sends to both WebSocket + Socket.IO)
-    orchestrator.campaign_broadcaster = socketio_broadcaster
+    def _create_orchestrator() -> Orchestrator:
+        # Initialize the unified orchestrator using the singleton getter
+        from gaia.api.routes.internal import get_orchestrator
+        instance = get_orchestrator()
+        # Set up unified broadcaster for orchestrator (sends to both WebSocket + Socket.IO)
+        instance.campaign_broadcaster = socketio_broadcaster
+        return instance
+
+    async def _core_chain() -> Tuple[Orchestrator, SessionRegistry]:
+        await startup.run("database", _init_database)
+        # The orchestrator singleton is not known to be thread-safe, so build it on the loop thread
+        instance = await startup.run("orchestrator", _create_orchestrator)
+        # SessionRegistry seeds campaign sessions into the database, so it waits on the connection
+        registry = await startup.run("session_registry", SessionRegistry, in_thread=True)
+        return instance, registry
+
+    async def _optional_routers_chain() -> List[str]:
+        # Mounted before the server starts serving so the UI never sees their routes 404;
+        # a configured router that fails to import aborts startup
+        return await startup.run("optional_routers", include_optional_routers, app)
+
+    # Router imports run in a worker thread while the DB round-trip and orchestrator build proceed
+    (orchestrator, session_registry), _ = await startup.run_group(_core_chain, _optional_routers_chain)
 
     # Store orchestrator in app state for access in endpoints (same singleton instance)
     app.state.orchestrator = orchestrator
-    session_registry = SessionRegistry()
     app.state.session_registry = session_registry
     app.state.session_manager = SessionManager(campaign_broadcaster=socketio_broadcaster)
 
-    # Initialize room seats for campaigns seeded from filesystem
-    # This runs after SessionRegistry._seed_db_from_memory() has populated campaign_sessions
-    try:
-        _add_scripts_parent_to_path()
-        from scripts.backend.startup.initialize_campaign_rooms import initialize_campaign_rooms
-        room_init_stats = await initialize_campaign_rooms()
-        if room_init_stats.get("campaigns_initialized", 0) > 0:
-            logger.info(
-                f"✅ Initialized rooms for {room_init_stats['campaigns_initialized']} campaigns "
-                f"({room_init_stats['seats_created']} seats created)"
-            )
-    except Exception as e:
-        logger.warning(f"Failed to initialize campaign rooms: {e}", exc_info=True)
-        # Don't fail startup if room initialization fails
+    # Back DM conversation context with rolling campaign summaries once history exceeds its token budget
+    from gaia.engine.conversation_context import conversation_context_builder
+    from gaia.mechanics.campaign.campaign_summarizer import CampaignSummarizer
+    conversation_context_builder.set_summary_loader(
+        CampaignSummarizer(SimpleCampaignManager()).load_latest_summary
+    )
 
     # Background: prune idle sessions periodically
     # TTL and interval are environment-configurable; defaults keep memory tidy without being aggressive.
@@ -358,10 +352,34 @@ async def lifespan(app: FastAPI):
     await cleanup_task.start()
     await audio_cleanup_task.start()
 
+    # Non-critical work runs after readiness so it never adds to cold-start latency
+    async def _check_pending_registrations() -> None:
+        # Check for users with pending admin notifications and retry sending emails
+        _add_scripts_parent_to_path()
+        from scripts.backend.startup.check_pending_registrations import check_and_notify_pending_registrations
+        await check_and_notify_pending_registrations()
+
+    async def _initialize_campaign_rooms() -> None:
+        # Initialize room seats for campaigns seeded from filesystem
+        # This runs after SessionRegistry._seed_db_from_memory() has populated campaign_sessions
+        _add_scripts_parent_to_path()
+        from scripts.backend.startup.initialize_campaign_rooms import initialize_campaign_rooms
+        room_init_stats = await initialize_campaign_rooms()
+        if room_init_stats.get("campaigns_initialized", 0) > 0:
+            logger.info(
+                f"✅ Initialized rooms for {room_init_stats['campaigns_initialized']} campaigns "
+                f"({room_init_stats['seats_created']} seats created)"
+            )
+
+    startup.defer("pending_registrations", _check_pending_registrations)
+    startup.defer("campaign_rooms", _initialize_campaign_rooms)
+    startup.mark_ready()
+
     yield
     
     # Shutdown
     logger.info("Shutting down Gaia API server...")
+    await startup.shutdown()
 
     # Stop connection and audio cleanup tasks
     try:
@@ -383,6 +401,17 @@ async def lifespan(app: FastAPI):
                 task.cancel()
     except Exception as exc:  # noqa: BLE001
         logger.debug("Error stopping pruner: %s", exc)
+    # Stop image processing workers
+    try:
+        from gaia.infra.image.image_processing import image_processing_service
+        image_processing_service.shutdown()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Error stopping image processing pool: %s", exc)
+    try:
+        from gaia.infra.audio.audio_queue_manager import audio_queue_manager
+        audio_queue_manager.close()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Error stopping audio queue scheduler: %s", exc)
     auto_tts_service.cleanup()
     # TTS server cleanup handled by external service
     logger.info("[OK] API server shutdown complete")
@@ -403,13 +432,11 @@ app.include_router(registration_router)  # User registration flow endpoints
 logger.info("Registration endpoints registered")
 
 app.include_router(internal_router)  # Internal/debug endpoints
-app.include_router(debug_router)  # Ad-hoc debugging utilities
 app.include_router(chat_router)
 app.include_router(room_router)  # Game room management endpoints
 app.include_router(combat_router)  # Combat management endpoints
 app.include_router(admin_router)  # Admin endpoints (email-restricted)
-app.include_router(scene_admin_router)  # Scene inspection admin endpoints
-app.include_router(prompts_router)  # Prompt management endpoints (admin-only)
+# Debug, scene admin and prompt routers are imported and mounted during lifespan startup (see OPTIONAL_ROUTERS)
 app.include_router(sfx_router)  # Sound effects endpoints
 app.include_router(scene_images_router)  # Scene images endpoints (visual narrator)
 
@@ -453,6 +480,22 @@ async def health_check():
     """Health check endpoint - no auth required for monitoring."""
     return {"status": "healthy", "service": "Gaia Web API"}
 
+@app.get("/api/ready")
+async def readiness_check(response: Response):
+    """Startup report with per-step timings, including deferred work still running.
+
+    Uvicorn only serves requests once the lifespan startup has completed, so
+    this never observes the critical phase; it returns 503 only while the
+    service is shutting down.
+    """
+    startup = getattr(app.state, "startup", None)
+    if startup is None:
+        response.status_code = 503
+        return {"ready": False, "reason": "starting", "steps": []}
+    if not startup.ready:
+        response.status_code = 503
+    return startup.snapshot()
+
 @app.get("/api/health/runware")
 async def runware_health_check():
     """Health check for Runware service"""
@@ -504,6 +547,15 @@ async def get_available_models():
 
     return manager.get_available_models()
 
+@app.get("/api/images/cache/stats")
+async def get_image_cache_stats(
+    current_user = optional_auth()
+):
+    """Get hit rates and sizes of the image generation cache."""
+    from gaia.infra.image.image_service_manager import get_image_service_manager
+
+    return get_image_service_manager().get_cache_stats()
+
 @app.get("/api/combat/actions")
 async def get_combat_actions(
     current_user = optional_auth()
@@ -1025,7 +1077,7 @@ async def generate_image_old(
             "gcs_uploaded": image_result.get("gcs_uploaded"),
             "mime_type": image_result.get("mime_type"),
         }
-        metadata_manager.save_metadata(
+        await metadata_manager.save_metadata_async(
             storage_filename or f"image_{datetime.utcnow().timestamp():.0f}.png",
             metadata_payload,
             campaign_id=request.campaign_id or "default",
@@ -1713,12 +1765,18 @@ async def arena_quick_start(
 @app.get("/api/images/{filename:path}")
 async def serve_image(
     filename: str,
+    request: Request,
+    w: Optional[int] = Query(None, ge=1, description="Preferred display width in pixels"),
     current_user = optional_auth()
 ):
-    """Serve images from GCS or local storage using metadata paths."""
+    """Serve images from GCS or local storage using metadata paths.
+
+    Clients that accept WebP get the closest responsive variant (sized by ``w``)
+    when one was generated for the image.
+    """
     from pathlib import Path
     from fastapi.responses import Response, FileResponse
-    from gaia.infra.image.image_artifact_store import image_artifact_store
+    from gaia.infra.image.image_artifact_store import image_artifact_store, select_image_variant
 
     actual_filename = os.path.basename(filename)
     image_path = None
@@ -1728,6 +1786,22 @@ async def serve_image(
         from gaia.infra.image.image_metadata import get_metadata_manager
         meta = get_metadata_manager().get_metadata(actual_filename)
 
+        variant = select_image_variant(
+            (meta or {}).get('variants'), width=w, accept=request.headers.get("accept")
+        )
+        if variant:
+            try:
+                variant_bytes = await asyncio.to_thread(
+                    image_artifact_store.read_variant_bytes, meta.get('campaign_id', ''), variant
+                )
+                return Response(
+                    content=variant_bytes,
+                    media_type=variant.get('mime_type', 'image/webp'),
+                    headers={"Vary": "Accept"},
+                )
+            except FileNotFoundError:
+                logger.debug("Variant %s missing for %s; serving original", variant.get('filename'), actual_filename)
+
         if meta:
             # If image is in GCS, fetch it directly using the metadata's storage_path
             storage_bucket = meta.get('storage_bucket')
@@ -2622,7 +2696,7 @@ async def generate_image(
                 from gaia.infra.image.image_metadata import get_metadata_manager
                 metadata_manager = get_metadata_manager()
                 filename = os.path.basename(saved_path)
-                metadata_manager.save_metadata(
+                await metadata_manager.save_metadata_async(
                     filename,
                     {
                         "prompt": request.prompt,  # Original prompt without enhancement
@@ -8,7 +8,7 @@ import asyncio
 import mimetypes
 from typing import Optional, Dict, Any, List
 
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Request, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -673,6 +673,7 @@ async def proxy_image_artifact(
     filename: str,
     req: Request,
     token: Optional[str] = None,
+    w: Optional[int] = Query(None, ge=1),
     current_user=optional_auth(),
     db: AsyncSession = Depends(get_async_db),
 ):
@@ -682,8 +683,10 @@ async def proxy_image_artifact(
     Supports authentication via:
     1. Authorization header (for API calls)
     2. Query parameter ?token=... (for HTML img elements)
+
+    Clients that accept WebP receive the responsive variant closest to ``?w=``.
     """
-    from gaia.infra.image.image_artifact_store import image_artifact_store
+    from gaia.infra.image.image_artifact_store import image_artifact_store, select_image_variant
 
     if not image_artifact_store.enabled:
         raise HTTPException(status_code=404, detail="Image artifacts unavailable")
@@ -768,6 +771,28 @@ async def proxy_image_artifact(
         )
         raise HTTPException(status_code=403, detail="Not authorized to access this session's media")
 
+    accept = req.headers.get("accept")
+    if accept and "image/webp" in accept.lower():
+        try:
+            from gaia.infra.image.image_metadata import get_metadata_manager
+
+            meta = get_metadata_manager().get_metadata(filename, campaign_id=session_id)
+        except Exception:  # noqa: BLE001
+            meta = None
+        variant = select_image_variant((meta or {}).get("variants"), width=w, accept=accept)
+        if variant:
+            try:
+                variant_bytes = await asyncio.to_thread(
+                    image_artifact_store.read_variant_bytes, session_id, variant
+                )
+                return StreamingResponse(
+                    io.BytesIO(variant_bytes),
+                    media_type=variant.get("mime_type", "image/webp"),
+                    headers={"Cache-Control": "private, max-age=31536000, immutable", "Vary": "Accept"},
+                )
+            except FileNotFoundError:
+                logger.debug("[IMAGE][media] Variant missing session=%s file=%s", session_id, filename)
+
     try:
         image_bytes = image_artifact_store.read_artifact_bytes(session_id, filename)
     except FileNotFoundError as exc:
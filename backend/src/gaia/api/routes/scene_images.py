@@ -8,12 +8,11 @@ Visual Narrator agent. These endpoints allow the frontend to:
 - Create composite images from scene image sets
 """
 
+import asyncio
 import logging
-from io import BytesIO
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from PIL import Image
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +22,12 @@ from auth.src.models import AccessControl, PermissionLevel, User
 from db.src import get_async_db
 from gaia.infra.image.image_artifact_store import ImageStorageType, image_artifact_store
 from gaia.infra.image.image_metadata import get_metadata_manager
+from gaia.infra.image.image_processing import (
+    ImageProcessingBusyError,
+    ImageProcessingError,
+    ImageProcessingTimeoutError,
+    image_processing_service,
+)
 from gaia.infra.image.scene_image_set import ImageType, get_scene_image_set_manager
 
 logger = logging.getLogger(__name__)
@@ -338,7 +343,7 @@ async def create_composite_image(
         ImageType.MOMENT_FOCUS.value,
     ]
 
-    pil_images = []
+    image_bytes: List[bytes] = []
     for img_type in image_order:
         img = image_set.get_image(img_type)
         if img and img.status == "complete" and img.image_url:
@@ -351,65 +356,57 @@ async def create_composite_image(
                 filename = url_parts[-1] if url_parts else None
 
                 if filename:
-                    img_bytes = image_artifact_store.read_artifact_bytes(session_id, filename)
-                    pil_img = Image.open(BytesIO(img_bytes))
-                    pil_images.append(pil_img)
+                    # Artifact reads may hit GCS; keep them off the event loop
+                    img_bytes = await asyncio.to_thread(
+                        image_artifact_store.read_artifact_bytes, session_id, filename
+                    )
+                    image_bytes.append(img_bytes)
                     logger.debug(f"Loaded image for composite: {img_type}")
             except Exception as exc:
                 logger.warning(f"Failed to load image {img_type} for composite: {exc}")
 
-    if not pil_images:
+    # Decode, resize to a shared height and paste side by side in the image
+    # processing pool so PIL work never blocks the event loop
+    target_height = 512
+    composite = None
+    if image_bytes:
+        try:
+            composite = await image_processing_service.composite_horizontal(
+                image_bytes, target_height=target_height
+            )
+        except ImageProcessingBusyError as exc:
+            raise HTTPException(status_code=503, detail=str(exc)) from exc
+        except ImageProcessingTimeoutError as exc:
+            raise HTTPException(status_code=504, detail=str(exc)) from exc
+        except ImageProcessingError as exc:
+            logger.error(f"Failed to build composite for set {set_id}: {exc}")
+            composite = None
+
+    if composite is None:
         return {
             "success": False,
             "composite_url": None,
             "message": "No completed images available to create composite",
         }
 
-    # Create horizontal composite
-    # Resize all images to same height while maintaining aspect ratio
-    target_height = 512
-    resized_images = []
-    for img in pil_images:
-        # Convert to RGB if needed (in case of RGBA/P mode)
-        if img.mode in ("RGBA", "P"):
-            img = img.convert("RGB")
-
-        aspect = img.width / img.height
-        new_width = int(target_height * aspect)
-        resized = img.resize((new_width, target_height), Image.Resampling.LANCZOS)
-        resized_images.append(resized)
-
-    # Calculate total width and create composite
-    total_width = sum(img.width for img in resized_images)
-    composite = Image.new("RGB", (total_width, target_height))
-
-    # Paste images side by side
-    x_offset = 0
-    for img in resized_images:
-        composite.paste(img, (x_offset, 0))
-        x_offset += img.width
-
-    # Save composite using image artifact store
-    output = BytesIO()
-    composite.save(output, format="PNG", optimize=True)
-    output.seek(0)
-
-    artifact = image_artifact_store.persist_image(
+    composite_png, total_width, target_height, images_used = composite
+
+    artifact = await image_artifact_store.persist_image_async(
         session_id=image_set.campaign_id,
-        image_bytes=output.getvalue(),
+        image_bytes=composite_png,
         image_type="scene",
         filename=f"composite_{set_id}.png",
     )
 
     logger.info(
         f"Created composite image for set {set_id}: {artifact.url} "
-        f"({len(pil_images)} images, {total_width}x{target_height})"
+        f"({images_used} images, {total_width}x{target_height})"
     )
 
     # Save metadata so the image appears in the media gallery
     try:
         metadata_manager = get_metadata_manager()
-        metadata_manager.save_metadata(
+        await metadata_manager.save_metadata_async(
             image_filename=f"composite_{set_id}.png",
             metadata={
                 "prompt": "Scene Composite",
@@ -418,6 +415,7 @@ async def create_composite_image(
                 "storage_path": artifact.storage_path,
                 "proxy_url": artifact.url,
                 "set_id": set_id,
+                "variants": artifact.variants,
             },
             campaign_id=image_set.campaign_id,
         )
@@ -445,7 +443,7 @@ async def create_composite_image(
     return {
         "success": True,
         "composite_url": artifact.url,
-        "message": f"Created composite from {len(pil_images)} images",
+        "message": f"Created composite from {images_used} images",
     }
 
 
@@ -615,7 +613,7 @@ async def test_generate_scene_images(
                         if "b64_json" in img_data:
                             import base64
                             img_bytes = base64.b64decode(img_data["b64_json"])
-                            artifact = image_artifact_store.persist_image(
+                            artifact = await image_artifact_store.persist_image_async(
                                 session_id=request.campaign_id,
                                 image_bytes=img_bytes,
                                 image_type=style_map.get(img_type, "scene"),
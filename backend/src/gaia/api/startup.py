@@ -0,0 +1,231 @@
+"""Startup orchestration for the FastAPI lifespan.
+
+Runs independent startup steps concurrently, records per-step timings, and
+defers non-critical work until the service has been marked ready. The state
+is exposed through ``/api/ready``. Uvicorn does not serve requests before the
+lifespan startup completes, so that endpoint reports timings and deferred
+work rather than gating startup traffic; it turns 503 once shutdown begins.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import inspect
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _as_bool(value: Optional[str], default: bool) -> bool:
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+# Run independent steps concurrently; disable to debug ordering problems
+STARTUP_PARALLEL = _as_bool(os.getenv("STARTUP_PARALLEL"), True)
+# Delay before deferred (post-ready) work starts, so it does not compete with first requests
+STARTUP_DEFERRED_DELAY_SECONDS = float(os.getenv("STARTUP_DEFERRED_DELAY_SECONDS", "0"))
+# Rarely used routers (``gaia.api.routes.<name>``) imported off the loop during lifespan startup
+OPTIONAL_ROUTERS = [
+    name.strip()
+    for name in os.getenv("OPTIONAL_ROUTERS", "debug,scene_admin,prompts").split(",")
+    if name.strip()
+]
+
+
+@dataclass
+class StartupStep:
+    """Timing and outcome of a single startup step."""
+
+    name: str
+    critical: bool = True
+    deferred: bool = False
+    status: str = "pending"  # pending | running | ok | failed | cancelled
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "critical": self.critical,
+            "deferred": self.deferred,
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
+
+class StartupOrchestrator:
+    """Track startup steps, run them concurrently and gate readiness.
+
+    Critical step failures propagate to the caller (aborting startup);
+    non-critical failures are logged and recorded. Deferred steps are queued
+    until :meth:`mark_ready` and then run as background tasks.
+    """
+
+    def __init__(self, parallel: bool = STARTUP_PARALLEL,
+                 deferred_delay_seconds: float = STARTUP_DEFERRED_DELAY_SECONDS) -> None:
+        self.parallel = parallel
+        self.deferred_delay_seconds = deferred_delay_seconds
+        self.steps: Dict[str, StartupStep] = {}
+        self.ready = False
+        self.reason: Optional[str] = "starting"
+        self.started_at = datetime.now(timezone.utc)
+        self.ready_after_ms: Optional[float] = None
+        self._start = time.perf_counter()
+        self._pending_deferred: List[tuple[str, Callable[[], Awaitable[Any]]]] = []
+        self._deferred_tasks: List[asyncio.Task] = []
+
+    async def run(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        critical: bool = True,
+        in_thread: bool = False,
+        deferred: bool = False,
+    ) -> Any:
+        """Run one step and record its timing.
+
+        Args:
+            name: Step name reported by ``/api/ready``
+            func: Coroutine function, or a sync callable
+            critical: Re-raise failures instead of logging them
+            in_thread: Run a sync callable via ``asyncio.to_thread``
+        """
+        step = self.steps.get(name) or StartupStep(name=name, critical=critical, deferred=deferred)
+        self.steps[name] = step
+        step.status = "running"
+        started = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(func):
+                result = await func(*args)
+            elif in_thread:
+                result = await asyncio.to_thread(func, *args)
+            else:
+                result = func(*args)
+            if inspect.isawaitable(result):
+                result = await result
+        except asyncio.CancelledError:
+            self._finish(step, started, "cancelled")
+            raise
+        except Exception as exc:  # noqa: BLE001
+            step.error = str(exc)[:500]
+            self._finish(step, started, "failed")
+            if critical:
+                raise
+            logger.warning("[STARTUP] Step %s failed: %s", name, exc, exc_info=True)
+            return None
+        self._finish(step, started, "ok")
+        return result
+
+    @staticmethod
+    def _finish(step: StartupStep, started: float, status: str) -> None:
+        step.status = status
+        step.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info("[STARTUP] %s %s in %.1fms", step.name, status, step.duration_ms)
+
+    async def run_group(self, *steps: Callable[[], Awaitable[Any]]) -> List[Any]:
+        """Run independent step chains, concurrently unless parallelism is disabled.
+
+        Each entry is a zero-argument coroutine function (usually a small
+        closure calling :meth:`run` one or more times). The first critical
+        failure is re-raised once every chain has finished.
+        """
+        if not self.parallel:
+            return [await step() for step in steps]
+
+        results = await asyncio.gather(*(step() for step in steps), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return list(results)
+
+    def defer(self, name: str, func: Callable[[], Awaitable[Any]]) -> None:
+        """Queue non-critical work to start after the service is ready."""
+        self.steps[name] = StartupStep(name=name, critical=False, deferred=True)
+        if self.ready:
+            self._launch(name, func)
+        else:
+            self._pending_deferred.append((name, func))
+
+    def mark_ready(self) -> None:
+        """Mark startup complete and launch deferred work."""
+        self.ready = True
+        self.reason = None
+        self.ready_after_ms = round((time.perf_counter() - self._start) * 1000, 1)
+        logger.info("[STARTUP] Ready after %.1fms", self.ready_after_ms)
+        pending, self._pending_deferred = self._pending_deferred, []
+        for name, func in pending:
+            self._launch(name, func)
+
+    def mark_not_ready(self, reason: str) -> None:
+        self.ready = False
+        self.reason = reason
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop accepting traffic and cancel deferred work that is still running."""
+        self.mark_not_ready("shutting_down")
+        running = [task for task in self._deferred_tasks if not task.done()]
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.wait(running, timeout=timeout)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "reason": self.reason,
+            "started_at": self.started_at.isoformat(),
+            "ready_after_ms": self.ready_after_ms,
+            "steps": [step.to_dict() for step in self.steps.values()],
+        }
+
+    def _launch(self, name: str, func: Callable[[], Awaitable[Any]]) -> None:
+        async def _deferred() -> None:
+            if self.deferred_delay_seconds > 0:
+                await asyncio.sleep(self.deferred_delay_seconds)
+            await self.run(name, func, critical=False, deferred=True)
+
+        task = asyncio.create_task(_deferred(), name=f"startup:{name}")
+        self._deferred_tasks.append(task)
+
+    async def wait_deferred(self) -> None:
+        """Wait for deferred work launched so far (used by tests and scripts)."""
+        if self._deferred_tasks:
+            await asyncio.gather(*self._deferred_tasks, return_exceptions=True)
+
+
+async def include_optional_routers(app: Any, names: Optional[List[str]] = None) -> List[str]:
+    """Import rarely used routers off the event loop and mount them on ``app``.
+
+    Keeps their import cost out of module import; call it from the lifespan
+    before the server starts serving so the routes exist for the first
+    request. Import errors propagate, so a configured router that cannot load
+    fails startup. Set ``OPTIONAL_ROUTERS=`` to skip them entirely.
+    """
+    mounted: List[str] = []
+    for name in OPTIONAL_ROUTERS if names is None else names:
+        module = await asyncio.to_thread(importlib.import_module, f"gaia.api.routes.{name}")
+        app.include_router(module.router)
+        mounted.append(name)
+    if mounted:
+        # Regenerate the OpenAPI schema with the new routes on next request
+        app.openapi_schema = None
+    return mounted
+
+
+__all__ = [
+    "OPTIONAL_ROUTERS",
+    "STARTUP_PARALLEL",
+    "StartupOrchestrator",
+    "StartupStep",
+    "include_optional_routers",
+]
@@ -2,11 +2,11 @@
 
 import asyncio
 import logging
+import time
 
-from sqlalchemy import select, distinct
-from db.src.connection import db_manager
-from gaia.infra.audio.audio_models import AudioPlaybackRequest
 from gaia.infra.audio.audio_playback_service import audio_playback_service
+from gaia.infra.audio.audio_retention import audio_retention_engine
+from gaia.infra.audio.playback_reconciler import playback_state_reconciler
 
 logger = logging.getLogger(__name__)
 
@@ -14,15 +14,24 @@ logger = logging.getLogger(__name__)
 class AudioCleanupTask:
     """Background task to cleanup old audio chunks from the database."""
 
-    def __init__(self, cleanup_interval_seconds: int = 60, max_age_days: int = 7):
+    def __init__(
+        self,
+        cleanup_interval_seconds: int = 60,
+        max_age_days: int = 7,
+        reconcile_interval_seconds: int = 15,
+    ):
         """Initialize audio cleanup task.
 
         Args:
             cleanup_interval_seconds: How often to run cleanup (default: 60 seconds)
-            max_age_days: Age threshold for removing played chunks (default: 7 days)
+            max_age_days: Age threshold for removing played audio (default: 7 days)
+            reconcile_interval_seconds: How often to repair stuck playback
+                requests (default: 15 seconds)
         """
         self.cleanup_interval_seconds = cleanup_interval_seconds
         self.max_age_days = max_age_days
+        self.reconcile_interval_seconds = min(reconcile_interval_seconds, cleanup_interval_seconds)
+        self._last_cleanup = 0.0
         self._task = None
         self._running = False
 
@@ -33,6 +42,7 @@ class AudioCleanupTask:
             return
 
         self._running = True
+        self._last_cleanup = time.monotonic()
         self._task = asyncio.create_task(self._cleanup_loop())
         logger.debug(
             "Started audio cleanup task (interval=%ds, max_age=%dd)",
@@ -59,37 +69,34 @@ class AudioCleanupTask:
         """Main cleanup loop that runs periodically."""
         while self._running:
             try:
-                # Wait for the next cleanup interval
-                await asyncio.sleep(self.cleanup_interval_seconds)
+                # Wait for the next reconcile tick; retention runs less often
+                await asyncio.sleep(self.reconcile_interval_seconds)
 
                 if not self._running:
                     break
 
-                # Run cleanup for all active sessions
                 if audio_playback_service.db_enabled:
                     try:
-                        # Get all active campaign IDs from playback queue
-                        with db_manager.get_sync_session() as session:
-                            stmt = select(distinct(AudioPlaybackRequest.campaign_id))
-                            campaign_ids = session.execute(stmt).scalars().all()
-
-                        total_removed = 0
-                        for campaign_id in campaign_ids:
-                            removed = audio_playback_service.cleanup_old_chunks(
-                                campaign_id,
-                                days=self.max_age_days
-                            )
-                            total_removed += removed
-
-                        if total_removed > 0:
-                            logger.info(
-                                "[AUDIO_CLEANUP] Removed %d old audio chunks (older than %dd)",
-                                total_removed,
-                                self.max_age_days,
-                            )
+                        # Repair stuck requests so queue reads never have to
+                        await asyncio.to_thread(playback_state_reconciler.reconcile)
+
+                        now = time.monotonic()
+                        if now - self._last_cleanup < self.cleanup_interval_seconds:
+                            continue
+                        self._last_cleanup = now
+
+                        # Expire old audio across all campaigns in one set-based pass
+                        # The engine logs what it removed and records metrics
+                        await asyncio.to_thread(
+                            audio_retention_engine.run,
+                            days=self.max_age_days,
+                        )
 
                         # Clean up stuck requests (GENERATED/GENERATING older than 15 minutes)
-                        stuck_cleaned = audio_playback_service.cleanup_stuck_requests(max_age_minutes=15)
+                        stuck_cleaned = await asyncio.to_thread(
+                            audio_playback_service.cleanup_stuck_requests,
+                            max_age_minutes=15,
+                        )
                         if stuck_cleaned > 0:
                             logger.info(
                                 "[AUDIO_CLEANUP] Marked %d stuck requests as FAILED",
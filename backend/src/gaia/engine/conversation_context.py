@@ -0,0 +1,267 @@
+"""Token-budgeted, incremental conversation context for the DM.
+
+``DMContext.get_conversation_context`` used to re-render the full campaign
+history on every turn. ``ConversationContextBuilder`` keeps a per-campaign
+cache of rendered messages, renders only messages appended since the last
+build, and trims the output to a token budget. Messages that fall outside the
+budget are replaced by the latest rolling summary from ``CampaignSummarizer``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_BUDGET = int(os.getenv("DM_CONTEXT_TOKEN_BUDGET", "6000"))
+DEFAULT_SUMMARY_TOKEN_BUDGET = int(os.getenv("DM_CONTEXT_SUMMARY_TOKEN_BUDGET", "1000"))
+
+# Approximate characters per token for English prose
+CHARS_PER_TOKEN = 4
+
+SummaryLoader = Callable[[str], Optional[Dict[str, Any]]]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used for budgeting (no tokenizer dependency)."""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def render_message(message: Dict[str, Any]) -> str:
+    """Render one history message as ``role: content``."""
+    role = message.get("role", "unknown")
+    content = message.get("content", "")
+    if isinstance(content, (dict, list)):
+        try:
+            content_str = json.dumps(content, ensure_ascii=False)
+        except Exception:
+            content_str = str(content)
+    else:
+        content_str = str(content)
+    return f"{role}: {content_str}"
+
+
+@dataclass
+class ConversationContextResult:
+    """Rendered conversation context plus the token accounting behind it."""
+    text: str
+    history_tokens: int = 0
+    summary_tokens: int = 0
+    included_messages: int = 0
+    omitted_messages: int = 0
+    rendered_new_messages: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.history_tokens + self.summary_tokens
+
+
+@dataclass
+class _CampaignContextCache:
+    """Rendered tail of a campaign's history."""
+    # Index in the history of the first entry in ``lines``
+    offset: int = 0
+    lines: List[str] = field(default_factory=list)
+    tokens: List[int] = field(default_factory=list)
+    last_fingerprint: Optional[str] = None
+    summary_text: Optional[str] = None
+    summary_loaded_at: int = -1
+
+    @property
+    def history_length(self) -> int:
+        return self.offset + len(self.lines)
+
+
+class ConversationContextBuilder:
+    """Build DM conversation context incrementally within a token budget."""
+
+    def __init__(
+        self,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        summary_token_budget: int = DEFAULT_SUMMARY_TOKEN_BUDGET,
+        summary_loader: Optional[SummaryLoader] = None,
+        summary_refresh_messages: int = 10,
+        max_cached_messages: int = 500,
+    ):
+        """Initialize the builder.
+
+        Args:
+            token_budget: Maximum estimated tokens for rendered history
+            summary_token_budget: Maximum estimated tokens for the rolling summary
+            summary_loader: Callable returning the latest summary dict for a
+                campaign, typically ``CampaignSummarizer.load_latest_summary``
+            summary_refresh_messages: Reload the summary after this many new messages
+            max_cached_messages: Rendered messages retained per campaign
+        """
+        self.token_budget = token_budget
+        self.summary_token_budget = summary_token_budget
+        self.summary_loader = summary_loader
+        self.summary_refresh_messages = summary_refresh_messages
+        self.max_cached_messages = max(1, max_cached_messages)
+        self._caches: Dict[str, _CampaignContextCache] = {}
+        self._lock = threading.Lock()
+
+    def set_summary_loader(self, summary_loader: Optional[SummaryLoader]) -> None:
+        """Register the rolling summary source (e.g. a ``CampaignSummarizer``)."""
+        self.summary_loader = summary_loader
+
+    def invalidate(self, campaign_id: Optional[str] = None) -> None:
+        """Drop cached rendering for one campaign, or all campaigns."""
+        with self._lock:
+            if campaign_id is None:
+                self._caches.clear()
+            else:
+                self._caches.pop(campaign_id, None)
+
+    def build(
+        self,
+        campaign_id: Optional[str],
+        history: List[Dict[str, Any]],
+        token_budget: Optional[int] = None,
+    ) -> ConversationContextResult:
+        """Render ``history`` for ``campaign_id`` within the token budget.
+
+        Args:
+            campaign_id: Cache key; when None the history is rendered without caching
+            history: Full campaign history (list of ``{"role", "content"}`` dicts)
+            token_budget: Override for the builder's history token budget
+
+        Returns:
+            ConversationContextResult with the rendered text and token counts
+        """
+        budget = token_budget if token_budget is not None else self.token_budget
+        if not campaign_id:
+            cache = _CampaignContextCache()
+            rendered = self._sync(cache, history)
+            return self._assemble(cache, None, budget, rendered)
+
+        with self._lock:
+            cache = self._caches.get(campaign_id)
+            if cache is None:
+                cache = _CampaignContextCache()
+                self._caches[campaign_id] = cache
+            rendered = self._sync(cache, history)
+            return self._assemble(cache, campaign_id, budget, rendered)
+
+    def _sync(self, cache: _CampaignContextCache, history: List[Dict[str, Any]]) -> int:
+        """Render messages appended since the last build; return how many were rendered."""
+        if not self._is_prefix(cache, history):
+            # History was rewritten or truncated; start over
+            cache.offset = 0
+            cache.lines.clear()
+            cache.tokens.clear()
+            cache.last_fingerprint = None
+
+        start = cache.history_length
+        for message in history[start:]:
+            if not isinstance(message, dict):
+                continue
+            line = render_message(message)
+            cache.lines.append(line)
+            cache.tokens.append(estimate_tokens(line) + 1)  # +1 for the joining newline
+        if len(history) > start:
+            cache.last_fingerprint = self._fingerprint(cache.lines[-1]) if cache.lines else None
+            # Pad offset for any non-dict entries skipped above
+            cache.offset = len(history) - len(cache.lines)
+
+        overflow = len(cache.lines) - self.max_cached_messages
+        if overflow > 0:
+            del cache.lines[:overflow]
+            del cache.tokens[:overflow]
+            cache.offset += overflow
+        return max(0, len(history) - start)
+
+    def _is_prefix(self, cache: _CampaignContextCache, history: List[Dict[str, Any]]) -> bool:
+        """Check that the cached rendering is still a prefix of ``history``."""
+        cached_length = cache.history_length
+        if cached_length == 0:
+            return True
+        if len(history) < cached_length:
+            return False
+        last = history[cached_length - 1]
+        if not isinstance(last, dict):
+            return True
+        return self._fingerprint(render_message(last)) == cache.last_fingerprint
+
+    @staticmethod
+    def _fingerprint(line: str) -> str:
+        return hashlib.sha1(line.encode("utf-8")).hexdigest()
+
+    def _assemble(
+        self,
+        cache: _CampaignContextCache,
+        campaign_id: Optional[str],
+        budget: int,
+        rendered: int,
+    ) -> ConversationContextResult:
+        """Select the newest messages that fit the budget and prepend the summary."""
+        used = 0
+        first_included = len(cache.lines)
+        for index in range(len(cache.lines) - 1, -1, -1):
+            cost = cache.tokens[index]
+            if used + cost > budget and first_included < len(cache.lines):
+                break
+            used += cost
+            first_included = index
+
+        included = cache.lines[first_included:]
+        omitted = cache.offset + first_included
+
+        parts: List[str] = []
+        summary_tokens = 0
+        if omitted > 0 and campaign_id:
+            summary_text = self._summary_for(cache, campaign_id)
+            if summary_text:
+                parts.append(summary_text)
+                summary_tokens = estimate_tokens(summary_text)
+        parts.extend(included)
+
+        return ConversationContextResult(
+            text="\n".join(parts),
+            history_tokens=used,
+            summary_tokens=summary_tokens,
+            included_messages=len(included),
+            omitted_messages=omitted,
+            rendered_new_messages=rendered,
+        )
+
+    def _summary_for(self, cache: _CampaignContextCache, campaign_id: str) -> Optional[str]:
+        """Return the rendered rolling summary, reloading it periodically."""
+        if self.summary_loader is None:
+            return None
+        stale = (
+            cache.summary_loaded_at < 0
+            or cache.history_length - cache.summary_loaded_at >= self.summary_refresh_messages
+        )
+        if stale:
+            try:
+                summary = self.summary_loader(campaign_id)
+            except Exception as exc:
+                logger.warning("Failed to load rolling summary for %s: %s", campaign_id, exc)
+                summary = None
+            cache.summary_text = self._render_summary(summary)
+            cache.summary_loaded_at = cache.history_length
+        return cache.summary_text
+
+    def _render_summary(self, summary: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Render a summary dict and clip it to the summary token budget."""
+        if not summary:
+            return None
+        text = summary.get("summary") if isinstance(summary, dict) else str(summary)
+        if not text:
+            return None
+        max_chars = self.summary_token_budget * CHARS_PER_TOKEN
+        if len(text) > max_chars:
+            # Keep the most recent part of the rolling summary
+            text = "..." + text[-max_chars:]
+        return f"CAMPAIGN SUMMARY (earlier turns):\n{text}"
+
+
+# Shared builder used by DMContext
+conversation_context_builder = ConversationContextBuilder()
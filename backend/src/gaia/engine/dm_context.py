@@ -1,8 +1,11 @@
 """DM Context for enhanced Dungeon Master interactions."""
 
 from dataclasses import dataclass
-import json
 from typing import Dict, Optional
+from gaia.engine.conversation_context import (
+    ConversationContextResult,
+    conversation_context_builder,
+)
 from gaia.engine.game_configuration import GameConfiguration
 
 @dataclass 
@@ -17,6 +20,7 @@ class DMContext:
     game_config: GameConfiguration
     scene_context: Optional[str] = None  # Scene context from scene manager
     conversation_context: Optional[str] = None  # Conversation context from context manager
+    conversation_context_stats: Optional[ConversationContextResult] = None  # Token accounting of the last build
     
     def to_prompt_context(self) -> str:
         """Convert context to natural language for DM prompt"""
@@ -60,27 +64,23 @@ Use this scene context to maintain consistency and reference previous locations,
         return prompt 
 
     def get_conversation_context(self) -> str:
-        """Return the latest conversation context string for streaming workflows."""
+        """Return the latest conversation context string for streaming workflows.
+
+        History is rendered incrementally by ``conversation_context_builder`` and
+        trimmed to its token budget; the resulting token counts are stored on
+        ``conversation_context_stats``.
+        """
         if isinstance(self.conversation_context, str) and self.conversation_context.strip():
             return self.conversation_context
 
-        history = []
-        campaign_history = (self.campaign_state or {}).get("history")
-        if isinstance(campaign_history, list):
-            for message in campaign_history:
-                role = message.get("role", "unknown")
-                content = message.get("content", "")
-                if isinstance(content, (dict, list)):
-                    try:
-                        content_str = json.dumps(content, ensure_ascii=False)
-                    except Exception:
-                        content_str = str(content)
-                else:
-                    content_str = str(content)
-                history.append(f"{role}: {content_str}")
-
-        if history:
-            return "\n".join(history)
+        campaign_state = self.campaign_state or {}
+        campaign_history = campaign_state.get("history")
+        if isinstance(campaign_history, list) and campaign_history:
+            campaign_id = campaign_state.get("campaign_id") or campaign_state.get("session_id")
+            result = conversation_context_builder.build(campaign_id, campaign_history)
+            self.conversation_context_stats = result
+            if result.text:
+                return result.text
 
         # Fallback to the enhanced prompt so streaming has at least a minimal context
         return self.create_enhanced_prompt(self.player_input)
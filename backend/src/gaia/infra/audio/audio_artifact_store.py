@@ -8,22 +8,26 @@ import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 
 from gaia.infra.audio.voice_and_tts_config import (
     AUDIO_TEMP_DIR,
     get_client_audio_config,
 )
 from gaia.utils.google_auth_helpers import get_default_credentials
+from gaia.utils.lazy_imports import lazy_module, module_available
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of calls the GCS JSON API accepts in a single batch request
+GCS_DELETE_BATCH_SIZE = 100
+
+# google-cloud-storage is heavy; only import it once a bucket client is created
+storage = lazy_module("google.cloud.storage")
 try:
-    from google.cloud import storage  # type: ignore
     from google.auth.exceptions import DefaultCredentialsError  # type: ignore
-    _GCS_AVAILABLE = True
+    _GCS_AVAILABLE = module_available("google.cloud.storage")
 except Exception:  # pragma: no cover - import guard
-    storage = None
     DefaultCredentialsError = Exception  # type: ignore
     _GCS_AVAILABLE = False
 
@@ -226,6 +230,57 @@ class AudioArtifactStore:
             raise FileNotFoundError(str(local_path))
         return local_path.read_bytes()
 
+    def delete_artifacts(self, artifacts: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Delete many artifacts at once from local disk and GCS.
+
+        Each entry needs ``session_id`` and ``storage_path``; entries with a
+        ``bucket`` matching this store's bucket are also removed from GCS
+        using batched requests. Missing files and blobs are ignored.
+
+        Returns:
+            Dictionary with ``deleted`` and ``failed`` counts.
+        """
+        deleted = 0
+        failed = 0
+        blob_paths: List[str] = []
+
+        for artifact in artifacts:
+            session_id = artifact.get("session_id")
+            storage_path = artifact.get("storage_path")
+            if not session_id or not storage_path:
+                continue
+
+            filename = Path(storage_path).name
+            local_path = self.resolve_local_path(session_id, filename)
+            if self.local_root not in local_path.parents:
+                logger.warning("Refusing to delete audio artifact outside store: %s", local_path)
+                failed += 1
+                continue
+            try:
+                if local_path.exists():
+                    local_path.unlink()
+                    deleted += 1
+            except OSError as exc:
+                logger.warning("Failed to delete local audio artifact %s: %s", local_path, exc)
+                failed += 1
+
+            if self.uses_gcs and artifact.get("bucket") == self.bucket_name:
+                blob_paths.append(storage_path)
+
+        for start in range(0, len(blob_paths), GCS_DELETE_BATCH_SIZE):
+            batch_paths = blob_paths[start:start + GCS_DELETE_BATCH_SIZE]
+            try:
+                # One HTTP round trip per batch instead of one per blob
+                with self._client.batch():  # type: ignore[union-attr]
+                    for path in batch_paths:
+                        self._bucket.blob(path).delete()  # type: ignore[union-attr]
+                deleted += len(batch_paths)
+            except Exception as exc:  # pragma: no cover - runtime only
+                logger.warning("Failed to delete %d audio blobs from GCS: %s", len(batch_paths), exc)
+                failed += len(batch_paths)
+
+        return {"deleted": deleted, "failed": failed}
+
     def list_gcs_artifacts(self, prefix: Optional[str] = None):
         if not self.uses_gcs:
             return []
@@ -8,7 +8,7 @@ import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, and_, or_
 from sqlalchemy.orm import Session, selectinload
 
 from db.src.connection import db_manager
@@ -18,6 +18,7 @@ from gaia.infra.audio.audio_models import (
     UserAudioQueue,
     PlaybackStatus,
 )
+from gaia.infra.audio.playback_reconciler import UNFINALIZED_REQUEST_TIMEOUT_MINUTES
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,11 @@ class AudioPlaybackService:
                 AudioPlaybackRequest.__table__.create(bind=connection, checkfirst=True)
                 AudioChunk.__table__.create(bind=connection, checkfirst=True)
                 UserAudioQueue.__table__.create(bind=connection, checkfirst=True)
+                # Tables created before an index was added don't pick it up
+                # from create(); add any missing indexes explicitly
+                for model in (AudioPlaybackRequest, AudioChunk, UserAudioQueue):
+                    for index in model.__table__.indexes:
+                        index.create(bind=connection, checkfirst=True)
                 logger.info("Audio playback tables initialized successfully")
 
             self._db_enabled = True
@@ -697,42 +703,10 @@ class AudioPlaybackService:
         if not self._db_enabled:
             return 0
 
-        session = self._get_session()
-        if session is None:
-            return 0
+        from gaia.infra.audio.audio_retention import audio_retention_engine
 
-        try:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-            stmt = (
-                select(UserAudioQueue)
-                .where(
-                    and_(
-                        UserAudioQueue.campaign_id == campaign_id,
-                        UserAudioQueue.played_at.isnot(None),
-                        UserAudioQueue.played_at < cutoff,
-                    )
-                )
-            )
-            old_entries = session.execute(stmt).scalars().all()
-
-            for entry in old_entries:
-                session.delete(entry)
-
-            session.commit()
-            count = len(old_entries)
-            logger.info(
-                "[USER_QUEUE] Cleaned up %d played queue entries older than %d days for campaign %s",
-                count,
-                days,
-                campaign_id,
-            )
-            return count
-        except Exception as exc:
-            logger.error("Failed to cleanup queue entries: %s", exc)
-            session.rollback()
-            return 0
-        finally:
-            session.close()
+        result = audio_retention_engine.purge_queue_entries(days=days, campaign_id=campaign_id)
+        return result.queue_entries_deleted
 
     # ===== End User Audio Queue Management =====
 
@@ -1132,151 +1106,69 @@ class AudioPlaybackService:
             return None
 
         try:
-            # CLEANUP: First, detect and mark any stuck requests as FAILED
-            # (requests with total_chunks=None that were created more than 5 minutes ago)
-            from datetime import timedelta
-            cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=5)
-
-            cleanup_stmt = (
-                update(AudioPlaybackRequest)
-                .where(
-                    and_(
-                        AudioPlaybackRequest.campaign_id == campaign_id,
-                        AudioPlaybackRequest.total_chunks == None,
-                        AudioPlaybackRequest.requested_at < cutoff_time,
-                    )
-                )
-                .values(
-                    status=PlaybackStatus.FAILED,
-                    completed_at=datetime.now(timezone.utc),
-                )
+            # Stuck requests are repaired by the playback state reconciler; this
+            # read only skips the ones it would fail, so polling never writes.
+            unfinalized_cutoff = datetime.now(timezone.utc) - timedelta(
+                minutes=UNFINALIZED_REQUEST_TIMEOUT_MINUTES
             )
-            cleanup_result = session.execute(cleanup_stmt)
-            if cleanup_result.rowcount > 0:
-                session.commit()
-                logger.warning(
-                    "[AUDIO_DEBUG] 🧹 AUTO-CLEANUP: Marked %d stuck request(s) as FAILED (total_chunks=None, age>5min) | campaign=%s",
-                    cleanup_result.rowcount,
-                    campaign_id,
-                )
-
-            # CLEANUP: Also detect requests stuck in GENERATING/GENERATED status
-            # (marked as GENERATING/GENERATED but no chunks played in 3+ minutes - indicates frontend never connected or crashed)
-            streaming_cutoff = datetime.now(timezone.utc) - timedelta(minutes=3)
-
-            # Find GENERATING/GENERATED requests older than threshold
-            streaming_check = (
-                select(AudioPlaybackRequest)
+            next_request_id = (
+                select(AudioPlaybackRequest.request_id)
                 .where(
                     and_(
                         AudioPlaybackRequest.campaign_id == campaign_id,
-                        AudioPlaybackRequest.status.in_([
-                            PlaybackStatus.GENERATING,
-                            PlaybackStatus.GENERATED,
-                        ]),
-                        AudioPlaybackRequest.started_at < streaming_cutoff,
+                        AudioPlaybackRequest.status == PlaybackStatus.PENDING,
+                        or_(
+                            AudioPlaybackRequest.total_chunks > 0,
+                            and_(
+                                AudioPlaybackRequest.total_chunks.is_(None),
+                                AudioPlaybackRequest.requested_at >= unfinalized_cutoff,
+                            ),
+                        ),
                     )
                 )
-                .options(selectinload(AudioPlaybackRequest.chunks))
+                .order_by(AudioPlaybackRequest.requested_at)  # Oldest first (FIFO queue)
+                .limit(1)
+                .scalar_subquery()
             )
-
-            stuck_streaming = session.execute(streaming_check).scalars().all()
-            stuck_count = 0
-
-            for req in stuck_streaming:
-                # Check if ANY chunks have been played
-                has_progress = any(chunk.played_at is not None for chunk in req.chunks)
-
-                if not has_progress:
-                    # No chunks played - frontend never connected or crashed
-                    req.status = PlaybackStatus.FAILED
-                    req.completed_at = datetime.now(timezone.utc)
-                    stuck_count += 1
-                    logger.warning(
-                        "[AUDIO_DEBUG] 🧹 AUTO-CLEANUP: Marking GENERATING/GENERATED request as FAILED (no playback progress in 3min) | request_id=%s text='%s'",
-                        req.request_id,
-                        (req.text[:80] + "...") if req.text and len(req.text) > 80 else (req.text or "(no text)"),
-                    )
-
-            if stuck_count > 0:
-                session.commit()
-                logger.warning(
-                    "[AUDIO_DEBUG] 🧹 AUTO-CLEANUP: Marked %d GENERATING request(s) as FAILED (no progress) | campaign=%s",
-                    stuck_count,
-                    campaign_id,
-                )
-
             stmt = (
-                select(AudioPlaybackRequest)
-                .where(
-                    and_(
-                        AudioPlaybackRequest.campaign_id == campaign_id,
-                        AudioPlaybackRequest.status == PlaybackStatus.PENDING,
-                    )
+                select(
+                    AudioPlaybackRequest.request_id,
+                    AudioPlaybackRequest.campaign_id,
+                    AudioPlaybackRequest.playback_group,
+                    AudioPlaybackRequest.status,
+                    AudioPlaybackRequest.requested_at,
+                    AudioPlaybackRequest.text,
+                    AudioChunk.chunk_id,
                 )
-                .order_by(AudioPlaybackRequest.requested_at)  # Oldest first (FIFO queue)
-                .options(selectinload(AudioPlaybackRequest.chunks))
+                .outerjoin(AudioChunk, AudioChunk.request_id == AudioPlaybackRequest.request_id)
+                .where(AudioPlaybackRequest.request_id == next_request_id)
+                .order_by(AudioChunk.sequence_number)
             )
+            rows = session.execute(stmt).all()
 
-            request = session.execute(stmt).first()
-
-            if request is None:
+            if not rows:
                 return None
 
-            # Extract the request object from the row
-            request_obj = request[0]
+            request_row = rows[0]
+            chunk_ids = [str(row.chunk_id) for row in rows if row.chunk_id is not None]
 
-            # VALIDATION: Skip requests with zero chunks
-            if len(request_obj.chunks) == 0:
-                if request_obj.total_chunks == 0:
-                    # Intentionally invalid request (finalized with 0 chunks) - mark as FAILED
-                    logger.warning(
-                        "[AUDIO_DEBUG] ⚠️ Marking invalid request as FAILED | request_id=%s total_chunks=0",
-                        request_obj.request_id,
-                    )
-                    request_obj.status = PlaybackStatus.FAILED
-                    request_obj.completed_at = datetime.now(timezone.utc)
-                    session.commit()
-                    # Recursively get next request
-                    return self.get_next_pending_request(campaign_id)
-                else:
-                    # Request is still generating (total_chunks=None) - skip for now, don't fail
-                    logger.debug(
-                        "[AUDIO_DEBUG] ⏸️  Skipping request still generating chunks | request_id=%s total_chunks=%s (will retry on next auto-advance)",
-                        request_obj.request_id,
-                        request_obj.total_chunks,
-                    )
-                    # Return None to stop auto-advance and let the request finish generating
-                    return None
-
-            # Also check if total_chunks=0 but somehow has chunks (shouldn't happen)
-            if request_obj.total_chunks == 0:
-                logger.warning(
-                    "[AUDIO_DEBUG] ⚠️ Marking invalid request as FAILED | request_id=%s total_chunks=0 but has %d chunks",
-                    request_obj.request_id,
-                    len(request_obj.chunks),
+            if not chunk_ids:
+                # Request is still generating chunks - stop auto-advance and let it finish
+                logger.debug(
+                    "[AUDIO_DEBUG] ⏸️  Skipping request still generating chunks | request_id=%s (will retry on next auto-advance)",
+                    request_row.request_id,
                 )
-                request_obj.status = PlaybackStatus.FAILED
-                request_obj.completed_at = datetime.now(timezone.utc)
-                session.commit()
-                # Recursively get next request
-                return self.get_next_pending_request(campaign_id)
-
-            # Get chunk IDs ordered by sequence number
-            chunk_ids = [
-                str(chunk.chunk_id)
-                for chunk in sorted(request_obj.chunks, key=lambda c: c.sequence_number)
-            ]
+                return None
 
             return {
-                "request_id": str(request_obj.request_id),
-                "campaign_id": request_obj.campaign_id,
-                "playback_group": request_obj.playback_group,
-                "status": request_obj.status.value,
-                "chunk_count": len(request_obj.chunks),
+                "request_id": str(request_row.request_id),
+                "campaign_id": request_row.campaign_id,
+                "playback_group": request_row.playback_group,
+                "status": request_row.status.value,
+                "chunk_count": len(chunk_ids),
                 "chunk_ids": chunk_ids,
-                "requested_at": request_obj.requested_at.isoformat(),
-                "text": request_obj.text,  # Include text for debug logging
+                "requested_at": request_row.requested_at.isoformat(),
+                "text": request_row.text,  # Include text for debug logging
             }
         except Exception as exc:
             logger.error("Failed to get next pending request: %s", exc)
@@ -1315,58 +1207,9 @@ class AudioPlaybackService:
             }
 
         try:
-            # CLEANUP: Run the same cleanup as get_next_pending_request
-            # This ensures stuck requests are detected even when just checking queue status
-            from datetime import timedelta
-            cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=5)
-
-            # Cleanup stuck requests with total_chunks=None
-            cleanup_stmt = (
-                update(AudioPlaybackRequest)
-                .where(
-                    and_(
-                        AudioPlaybackRequest.campaign_id == campaign_id,
-                        AudioPlaybackRequest.total_chunks == None,
-                        AudioPlaybackRequest.requested_at < cutoff_time,
-                    )
-                )
-                .values(
-                    status=PlaybackStatus.FAILED,
-                    completed_at=datetime.now(timezone.utc),
-                )
-            )
-            cleanup_result = session.execute(cleanup_stmt)
-            if cleanup_result.rowcount > 0:
-                session.commit()
-
-            # Cleanup requests stuck in GENERATING/GENERATED status
-            streaming_cutoff = datetime.now(timezone.utc) - timedelta(minutes=3)
-            streaming_check = (
-                select(AudioPlaybackRequest)
-                .where(
-                    and_(
-                        AudioPlaybackRequest.campaign_id == campaign_id,
-                        AudioPlaybackRequest.status.in_([
-                            PlaybackStatus.GENERATING,
-                            PlaybackStatus.GENERATED,
-                        ]),
-                        AudioPlaybackRequest.started_at < streaming_cutoff,
-                    )
-                )
-                .options(selectinload(AudioPlaybackRequest.chunks))
-            )
-            stuck_streaming = session.execute(streaming_check).scalars().all()
-            stuck_count = 0
-            for req in stuck_streaming:
-                has_progress = any(chunk.played_at is not None for chunk in req.chunks)
-                if not has_progress:
-                    req.status = PlaybackStatus.FAILED
-                    req.completed_at = datetime.now(timezone.utc)
-                    stuck_count += 1
-            if stuck_count > 0:
-                session.commit()
-
-            # Get currently GENERATING/GENERATED request (oldest one if multiple exist)
+            # Get currently GENERATING/GENERATED request (oldest one if multiple exist).
+            # Requests without a positive chunk count are left to the playback
+            # state reconciler and not reported as playing.
             streaming_stmt = (
                 select(AudioPlaybackRequest)
                 .where(
@@ -1376,6 +1219,7 @@ class AudioPlaybackService:
                             PlaybackStatus.GENERATING,
                             PlaybackStatus.GENERATED,
                         ]),
+                        AudioPlaybackRequest.total_chunks > 0,
                     )
                 )
                 .options(selectinload(AudioPlaybackRequest.chunks))
@@ -1384,23 +1228,6 @@ class AudioPlaybackService:
             )
             streaming_result = session.execute(streaming_stmt).scalars().first()
 
-            # CLEANUP: Detect and fix stuck GENERATING/GENERATED requests with 0 total_chunks
-            if streaming_result and (streaming_result.total_chunks is None or streaming_result.total_chunks == 0):
-                logger.warning(
-                    "[AUDIO_DEBUG] 🧹 CLEANUP: Found stuck GENERATING/GENERATED request with %s total_chunks | request_id=%s",
-                    streaming_result.total_chunks,
-                    streaming_result.request_id,
-                )
-                # Mark as FAILED to remove from queue
-                streaming_result.status = PlaybackStatus.FAILED
-                streaming_result.completed_at = datetime.now(timezone.utc)
-                session.commit()
-                logger.debug(
-                    "[AUDIO_DEBUG] 🧹 CLEANUP: Marked stuck request as FAILED | request_id=%s",
-                    streaming_result.request_id,
-                )
-                streaming_result = None  # Treat as if no request is playing
-
             currently_playing = None
             if streaming_result:
                 text_preview = (streaming_result.text[:40] + "...") if streaming_result.text and len(streaming_result.text) > 40 else streaming_result.text
@@ -1554,7 +1381,7 @@ class AudioPlaybackService:
             session.close()
 
     def cleanup_old_chunks(self, campaign_id: str, days: int = 7) -> int:
-        """Delete played chunks older than specified days.
+        """Delete played chunks (and chunks of failed requests) older than specified days, with their artifacts.
 
         Args:
             campaign_id: Campaign/session identifier
@@ -1566,46 +1393,10 @@ class AudioPlaybackService:
         if not self._db_enabled:
             return 0
 
-        session = self._get_session()
-        if session is None:
-            return 0
+        from gaia.infra.audio.audio_retention import audio_retention_engine
 
-        try:
-            from datetime import timedelta
-
-            threshold = datetime.now(timezone.utc) - timedelta(days=days)
-
-            # Delete old played chunks
-            stmt = (
-                select(AudioChunk)
-                .where(
-                    and_(
-                        AudioChunk.campaign_id == campaign_id,
-                        AudioChunk.status == PlaybackStatus.PLAYED,
-                        AudioChunk.played_at < threshold,
-                    )
-                )
-            )
-            chunks = session.execute(stmt).scalars().all()
-
-            for chunk in chunks:
-                session.delete(chunk)
-
-            session.commit()
-            deleted_count = len(chunks)
-            if deleted_count > 0:
-                logger.info(
-                    "[AUDIO_DB] Cleaned up %d old played chunks for campaign %s",
-                    deleted_count,
-                    campaign_id,
-                )
-            return deleted_count
-        except Exception as exc:
-            logger.error("Failed to cleanup old chunks: %s", exc)
-            session.rollback()
-            return 0
-        finally:
-            session.close()
+        result = audio_retention_engine.purge_chunks(days=days, campaign_id=campaign_id)
+        return result.chunks_deleted
 
     def cleanup_stuck_requests(self, max_age_minutes: int = 15) -> int:
         """Mark stuck GENERATED/GENERATING requests as FAILED.
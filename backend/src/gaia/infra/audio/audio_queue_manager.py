@@ -4,13 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import queue
-import threading
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Deque, Dict, Optional
 
 from gaia.infra.audio.voice_and_tts_config import (
     AUTO_TTS_OUTPUT,
@@ -29,21 +27,27 @@ class _SessionState:
     """Internal per-session playback state."""
 
     session_id: str
-    audio_queue: "queue.Queue[Dict[str, Any]]" = field(default_factory=queue.Queue)
+    audio_queue: Deque[Dict[str, Any]] = field(default_factory=deque)
     playback_history: deque = field(default_factory=lambda: deque(maxlen=50))
     is_playing: bool = False
     current_process: Optional[Any] = None
     stop_requested: bool = False
-    worker_thread: Optional[threading.Thread] = None
+    worker_task: Optional[asyncio.Task] = None
+    idle_handle: Optional[asyncio.TimerHandle] = None
     last_activity: float = field(default_factory=time.time)
-    lock: threading.Lock = field(default_factory=threading.Lock)
     shutdown: bool = False
     current_playback_id: Optional[str] = None
     pending_playback_counts: Dict[str, int] = field(default_factory=dict)
 
 
 class AudioQueueManager:
-    """Manages per-session audio playback queues to prevent overlapping audio."""
+    """Manages per-session audio playback queues to prevent overlapping audio.
+
+    All sessions are driven by the running asyncio loop: a session gets a
+    drain task only while it has queued items, and idle sessions are evicted
+    by a loop timer. No OS threads are created per session, so the manager
+    must be used from the event loop thread.
+    """
 
     _instance = None
 
@@ -58,7 +62,6 @@ class AudioQueueManager:
         self._initialized = True
 
         self._sessions: Dict[str, _SessionState] = {}
-        self._sessions_lock = threading.Lock()
         self._max_history = 50
         self._session_idle_timeout = SESSION_IDLE_TIMEOUT_SECONDS
 
@@ -75,154 +78,164 @@ class AudioQueueManager:
 
     def _ensure_session(self, session_id: Optional[str]) -> _SessionState:
         session_key = self._normalize_session_id(session_id)
-        with self._sessions_lock:
-            state = self._sessions.get(session_key)
-            if state is None or state.shutdown:
-                state = _SessionState(session_id=session_key)
-                state.playback_history = deque(maxlen=self._max_history)
-                self._start_worker_thread(state)
-                self._sessions[session_key] = state
-                logger.debug(
-                    "Audio queue worker thread started for session %s", session_key
-                )
+        state = self._sessions.get(session_key)
+        if state is None or state.shutdown:
+            state = _SessionState(session_id=session_key)
+            state.playback_history = deque(maxlen=self._max_history)
+            self._sessions[session_key] = state
+            logger.debug("Audio queue session created for %s", session_key)
         return state
 
     def _get_session(
         self, session_id: Optional[str], create: bool = True
     ) -> Optional[_SessionState]:
         session_key = self._normalize_session_id(session_id)
-        with self._sessions_lock:
-            state = self._sessions.get(session_key)
+        state = self._sessions.get(session_key)
         if state is None and create:
             state = self._ensure_session(session_key)
         return state
 
-    def _start_worker_thread(self, state: _SessionState) -> None:
-        state.worker_thread = threading.Thread(
-            target=self._audio_worker, args=(state,), daemon=True
+    def _enqueue(self, state: _SessionState, item: Dict[str, Any]) -> None:
+        state.audio_queue.append(item)
+        state.last_activity = time.time()
+        playback_id = item.get("playback_id")
+        if playback_id:
+            state.pending_playback_counts[playback_id] = (
+                state.pending_playback_counts.get(playback_id, 0) + 1
+            )
+        self._schedule(state)
+
+    def _schedule(self, state: _SessionState) -> None:
+        """Start the session's drain task on the running loop if it is idle."""
+        loop = asyncio.get_running_loop()
+        if state.idle_handle is not None:
+            state.idle_handle.cancel()
+            state.idle_handle = None
+        task = state.worker_task
+        # A task from a previous (closed) loop cannot be resumed; start afresh
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        state.worker_task = loop.create_task(
+            self._drain(state), name=f"audio-queue:{state.session_id}"
         )
-        state.worker_thread.start()
 
     # ------------------------------------------------------------------ #
-    # Worker loop
+    # Scheduler
     # ------------------------------------------------------------------ #
-    def _audio_worker(self, state: _SessionState) -> None:
+    async def _drain(self, state: _SessionState) -> None:
+        logger.debug("Audio queue draining for session %s", state.session_id)
+        try:
+            while state.audio_queue and not state.shutdown:
+                audio_item = state.audio_queue.popleft()
+                await self._process_item(state, audio_item)
+        finally:
+            if asyncio.current_task() is state.worker_task:
+                state.worker_task = None
+            self._schedule_idle_check(state)
+        logger.debug("Audio queue drained for session %s", state.session_id)
+
+    async def _process_item(self, state: _SessionState, audio_item: Dict[str, Any]) -> None:
+        item_description = audio_item.get("file_path", "paragraph_break")
         logger.debug(
-            "Audio queue worker thread running for session %s", state.session_id
+            "Session %s processing audio item: %s",
+            state.session_id,
+            item_description,
         )
+        state.last_activity = time.time()
 
-        while True:
-            if state.shutdown:
-                break
-
-            try:
-                audio_item = state.audio_queue.get(timeout=1.0)
-            except queue.Empty:
-                if self._should_terminate_session(state):
-                    logger.debug(
-                        "Audio queue worker idle for session %s; shutting down",
-                        state.session_id,
-                    )
-                    self._mark_session_shutdown(state)
-                    break
-                continue
+        # Handle stop requests signalled from stop_current
+        state.is_playing = True
+        if state.stop_requested:
+            logger.info(
+                "Stop requested for session %s; skipping audio playback",
+                state.session_id,
+            )
+            state.stop_requested = False
+            state.is_playing = False
+            state.current_process = None
+            await self._sleep_between_items(audio_item)
+            return
 
-            if audio_item.get("__shutdown__"):
-                state.audio_queue.task_done()
+        start_time = time.time()
+        playback_id = audio_item.get("playback_id")
+        try:
+            if audio_item.get("is_paragraph_break"):
+                # No audio playback, just honour the pause duration.
                 logger.debug(
-                    "Audio queue worker received shutdown signal for session %s",
+                    "Session %s adding paragraph break pause",
                     state.session_id,
                 )
-                self._mark_session_shutdown(state)
-                break
-
-            item_description = audio_item.get("file_path", "paragraph_break")
-            logger.debug(
-                "Session %s processing audio item: %s",
-                state.session_id,
-                item_description,
-            )
-            state.last_activity = time.time()
-
-            # Handle stop requests signalled from stop_current
-            with state.lock:
-                state.is_playing = True
-                if state.stop_requested:
-                    logger.info(
-                        "Stop requested for session %s; skipping audio playback",
-                        state.session_id,
-                    )
-                    state.stop_requested = False
-                    state.is_playing = False
-                    state.current_process = None
-                    state.audio_queue.task_done()
-                    self._sleep_between_items(audio_item)
-                    continue
-
-            start_time = time.time()
-            playback_id = audio_item.get("playback_id")
-            try:
-                if audio_item.get("is_paragraph_break"):
-                    # No audio playback, just honour the pause duration.
-                    logger.debug(
-                        "Session %s adding paragraph break pause",
+            else:
+                file_path = audio_item.get("file_path")
+                if not file_path or not Path(file_path).exists():
+                    logger.error(
+                        "Audio file not found for session %s: %s",
                         state.session_id,
+                        file_path,
                     )
                 else:
-                    file_path = audio_item.get("file_path")
-                    if not file_path or not Path(file_path).exists():
-                        logger.error(
-                            "Audio file not found for session %s: %s",
+                    output_method, windows_routing = self._resolve_playback_config()
+                    if output_method in ("mute", "none"):
+                        logger.debug(
+                            "Session %s using %s output; skipping server-side playback for %s",
                             state.session_id,
+                            output_method,
                             file_path,
                         )
                     else:
-                        output_method, windows_routing = self._resolve_playback_config()
-                        if output_method in ("mute", "none"):
-                            logger.debug(
-                                "Session %s using %s output; skipping server-side playback for %s",
-                                state.session_id,
-                                output_method,
-                                file_path,
-                            )
-                        else:
-                            playback_process, loop = self._play_file(
-                                file_path, output_method, windows_routing
-                            )
-                            if playback_process and loop:
-                                with state.lock:
-                                    state.current_process = playback_process
-                                try:
-                                    loop.run_until_complete(playback_process.wait())
-                                finally:
-                                    loop.close()
-            except Exception as exc:  # pragma: no cover - safety net
-                logger.error(
-                    "Error playing audio for session %s: %s",
-                    state.session_id,
-                    exc,
-                )
-            finally:
-                self._record_history(state, audio_item, start_time)
-                with state.lock:
-                    state.is_playing = False
-                    state.current_process = None
-                    if playback_id:
-                        remaining = (
-                            state.pending_playback_counts.get(playback_id, 0) - 1
+                        playback_process = await self._play_file(
+                            file_path, output_method, windows_routing
                         )
-                        if remaining <= 0:
-                            state.pending_playback_counts.pop(playback_id, None)
-                        else:
-                            state.pending_playback_counts[playback_id] = remaining
-                    if not state.pending_playback_counts:
-                        state.current_playback_id = None
-                    elif playback_id and playback_id not in state.pending_playback_counts:
-                        state.current_playback_id = None
-                state.audio_queue.task_done()
-                self._sleep_between_items(audio_item)
-
-        logger.debug("Audio queue worker exited for session %s", state.session_id)
+                        if playback_process:
+                            state.current_process = playback_process
+                            await playback_process.wait()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - safety net
+            logger.error(
+                "Error playing audio for session %s: %s",
+                state.session_id,
+                exc,
+            )
+        finally:
+            self._record_history(state, audio_item, start_time)
+            state.is_playing = False
+            state.current_process = None
+            if playback_id:
+                remaining = state.pending_playback_counts.get(playback_id, 0) - 1
+                if remaining <= 0:
+                    state.pending_playback_counts.pop(playback_id, None)
+                else:
+                    state.pending_playback_counts[playback_id] = remaining
+            if not state.pending_playback_counts:
+                state.current_playback_id = None
+            elif playback_id and playback_id not in state.pending_playback_counts:
+                state.current_playback_id = None
+        await self._sleep_between_items(audio_item)
+
+    def _schedule_idle_check(self, state: _SessionState) -> None:
+        if state.session_id == DEFAULT_SESSION_ID or state.shutdown:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # pragma: no cover - drained outside a loop
+            return
+        if state.idle_handle is not None:
+            state.idle_handle.cancel()
+        state.idle_handle = loop.call_later(
+            self._session_idle_timeout, self._evict_if_idle, state
+        )
+
+    def _evict_if_idle(self, state: _SessionState) -> None:
+        state.idle_handle = None
+        if self._should_terminate_session(state):
+            logger.debug(
+                "Audio queue idle for session %s; releasing session",
+                state.session_id,
+            )
+            self._mark_session_shutdown(state)
+        elif not state.audio_queue and state.worker_task is None:
+            self._schedule_idle_check(state)
 
     def _record_history(
         self, state: _SessionState, audio_item: Dict[str, Any], start_time: float
@@ -238,11 +251,9 @@ class AudioQueueManager:
             "playback_id": audio_item.get("playback_id"),
             "metadata": audio_item.get("metadata") or {},
         }
-        with state.lock:
-            state.playback_history.append(entry)
+        state.playback_history.append(entry)
 
-    def _sleep_between_items(self, audio_item: Dict[str, Any]) -> None:
-        process: Optional[Any] = None
+    async def _sleep_between_items(self, audio_item: Dict[str, Any]) -> None:
         try:
             playback_config = get_playback_config()
             delay = (
@@ -253,7 +264,8 @@ class AudioQueueManager:
         except Exception as exc:  # pragma: no cover - config fallback
             logger.warning("Failed to load playback config: %s", exc)
             delay = 0.0
-        time.sleep(delay)
+        if delay > 0:
+            await asyncio.sleep(delay)
 
     def _resolve_playback_config(self) -> tuple[str, str]:
         try:
@@ -268,84 +280,54 @@ class AudioQueueManager:
             )
         return output_method, windows_routing
 
-    def _play_file(
+    async def _play_file(
         self,
         file_path: str,
         output_method: str,
         windows_routing: str,
-    ) -> Tuple[Optional[Any], Optional[asyncio.AbstractEventLoop]]:
+    ) -> Optional[Any]:
         """Create playback process using configured output method."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            if output_method == "unix":
-                from gaia.utils.audio_utils import play_audio_unix_with_process
-
-                process = loop.run_until_complete(
-                    play_audio_unix_with_process(file_path)
+        if output_method == "unix":
+            from gaia.utils.audio_utils import play_audio_unix_with_process
+
+            return await play_audio_unix_with_process(file_path)
+        if output_method == "windows":
+            if windows_routing == "windows_direct":
+                from gaia.utils.audio_utils import (
+                    play_audio_windows_direct_with_process,
                 )
-            elif output_method == "windows":
-                if windows_routing == "windows_direct":
-                    from gaia.utils.audio_utils import (
-                        play_audio_windows_direct_with_process,
-                    )
 
-                    process = loop.run_until_complete(
-                        play_audio_windows_direct_with_process(file_path)
-                    )
-                else:
-                    from gaia.utils.windows_audio_utils import (
-                        play_audio_windows_with_process,
-                    )
+                return await play_audio_windows_direct_with_process(file_path)
 
-                    process = loop.run_until_complete(
-                        play_audio_windows_with_process(file_path)
-                    )
-            elif output_method == "windows_direct":
-                from gaia.utils.audio_utils import play_audio_windows_direct_with_process
+            from gaia.utils.windows_audio_utils import (
+                play_audio_windows_with_process,
+            )
 
-                process = loop.run_until_complete(
-                    play_audio_windows_direct_with_process(file_path)
-                )
-            else:
-                from gaia.utils.audio_utils import play_audio_auto_with_process
+            return await play_audio_windows_with_process(file_path)
+        if output_method == "windows_direct":
+            from gaia.utils.audio_utils import play_audio_windows_direct_with_process
 
-                process = loop.run_until_complete(
-                    play_audio_auto_with_process(file_path)
-                )
-        except Exception:
-            loop.close()
-            asyncio.set_event_loop(None)
-            raise
-        finally:
-            asyncio.set_event_loop(None)
+            return await play_audio_windows_direct_with_process(file_path)
 
-        if process is None:
-            loop.close()
-            return None, None
+        from gaia.utils.audio_utils import play_audio_auto_with_process
 
-        return process, loop
+        return await play_audio_auto_with_process(file_path)
 
     def _should_terminate_session(self, state: _SessionState) -> bool:
         if state.session_id == DEFAULT_SESSION_ID:
             return False
-        if state.audio_queue.qsize() > 0:
+        if state.audio_queue or state.is_playing or state.worker_task is not None:
             return False
-        with state.lock:
-            if state.is_playing:
-                return False
         idle_for = time.time() - state.last_activity
         return idle_for > self._session_idle_timeout
 
     def _mark_session_shutdown(self, state: _SessionState) -> None:
-        with state.lock:
-            state.shutdown = True
-            state.is_playing = False
-            state.current_process = None
-        with self._sessions_lock:
-            existing = self._sessions.get(state.session_id)
-            if existing is state and state.session_id != DEFAULT_SESSION_ID:
-                del self._sessions[state.session_id]
+        state.shutdown = True
+        state.is_playing = False
+        state.current_process = None
+        existing = self._sessions.get(state.session_id)
+        if existing is state and state.session_id != DEFAULT_SESSION_ID:
+            del self._sessions[state.session_id]
 
     # ------------------------------------------------------------------ #
     # Public API
@@ -366,7 +348,7 @@ class AudioQueueManager:
                 "Audio file not found for session %s: %s", session_key, file_path
             )
             state = self._get_session(session_id, create=False)
-            queue_size = state.audio_queue.qsize() if state else 0
+            queue_size = len(state.audio_queue) if state else 0
             return {
                 "status": "error",
                 "message": "Audio file not found",
@@ -383,15 +365,9 @@ class AudioQueueManager:
             "playback_id": playback_id,
             "metadata": metadata or {},
         }
-        state.audio_queue.put(queue_payload)
-        state.last_activity = time.time()
-        if playback_id:
-            with state.lock:
-                state.pending_playback_counts[playback_id] = (
-                    state.pending_playback_counts.get(playback_id, 0) + 1
-                )
+        self._enqueue(state, queue_payload)
 
-        queue_size = state.audio_queue.qsize()
+        queue_size = len(state.audio_queue)
         return {
             "status": "queued",
             "message": f"Audio queued for playback (position: {queue_size})",
@@ -408,22 +384,17 @@ class AudioQueueManager:
     ) -> Dict[str, Any]:
         """Add a paragraph break pause to the queue."""
         state = self._ensure_session(session_id)
-        state.audio_queue.put(
+        self._enqueue(
+            state,
             {
                 "is_paragraph_break": True,
                 "queued_at": time.time(),
                 "playback_id": playback_id,
                 "metadata": metadata or {},
-            }
+            },
         )
-        state.last_activity = time.time()
-        if playback_id:
-            with state.lock:
-                state.pending_playback_counts[playback_id] = (
-                    state.pending_playback_counts.get(playback_id, 0) + 1
-                )
 
-        queue_size = state.audio_queue.qsize()
+        queue_size = len(state.audio_queue)
         return {
             "status": "queued",
             "message": f"Paragraph break queued (position: {queue_size})",
@@ -447,19 +418,17 @@ class AudioQueueManager:
                 "last_played": None,
             }
 
-        with state.lock:
-            status = {
-                "session_id": session_key,
-                "is_playing": state.is_playing,
-                "queue_size": state.audio_queue.qsize(),
-                "history_count": len(state.playback_history),
-                "last_played": state.playback_history[-1]
-                if state.playback_history
-                else None,
-                "current_playback_id": state.current_playback_id,
-                "pending_playback_ids": list(state.pending_playback_counts.keys()),
-            }
-        return status
+        return {
+            "session_id": session_key,
+            "is_playing": state.is_playing,
+            "queue_size": len(state.audio_queue),
+            "history_count": len(state.playback_history),
+            "last_played": state.playback_history[-1]
+            if state.playback_history
+            else None,
+            "current_playback_id": state.current_playback_id,
+            "pending_playback_ids": list(state.pending_playback_counts.keys()),
+        }
 
     async def clear_queue(
         self, session_id: Optional[str] = None
@@ -475,27 +444,19 @@ class AudioQueueManager:
             }
 
         cleared = 0
-        while True:
-            try:
-                item = state.audio_queue.get_nowait()
-                playback_id = item.get("playback_id")
-                if playback_id:
-                    with state.lock:
-                        remaining = (
-                            state.pending_playback_counts.get(playback_id, 0) - 1
-                        )
-                        if remaining <= 0:
-                            state.pending_playback_counts.pop(playback_id, None)
-                        else:
-                            state.pending_playback_counts[playback_id] = remaining
-                state.audio_queue.task_done()
-                cleared += 1
-            except queue.Empty:
-                break
-
-        with state.lock:
-            if not state.pending_playback_counts:
-                state.current_playback_id = None
+        while state.audio_queue:
+            item = state.audio_queue.popleft()
+            playback_id = item.get("playback_id")
+            if playback_id:
+                remaining = state.pending_playback_counts.get(playback_id, 0) - 1
+                if remaining <= 0:
+                    state.pending_playback_counts.pop(playback_id, None)
+                else:
+                    state.pending_playback_counts[playback_id] = remaining
+            cleared += 1
+
+        if not state.pending_playback_counts:
+            state.current_playback_id = None
 
         logger.info(
             "Cleared %s items from audio queue for session %s",
@@ -506,7 +467,7 @@ class AudioQueueManager:
         return {
             "status": "cleared",
             "cleared_count": cleared,
-            "queue_size": state.audio_queue.qsize(),
+            "queue_size": len(state.audio_queue),
             "session_id": state.session_id,
         }
 
@@ -524,15 +485,14 @@ class AudioQueueManager:
             }
 
         logger.info("Stopping audio playback for session %s", state.session_id)
-        with state.lock:
-            state.stop_requested = True
-            process = state.current_process if state.is_playing else None
+        state.stop_requested = True
+        process = state.current_process if state.is_playing else None
 
         if process:
             try:
                 process.terminate()
                 await asyncio.sleep(0.1)
-                if process.poll() is None:
+                if process.returncode is None:
                     process.kill()
                 logger.info("Audio process terminated for session %s", state.session_id)
             except Exception as exc:  # pragma: no cover - safety net
@@ -543,12 +503,11 @@ class AudioQueueManager:
                 )
 
         queue_result = await self.clear_queue(session_id)
-        with state.lock:
-            state.is_playing = False
-            state.current_process = None
-            state.stop_requested = False
-            state.pending_playback_counts.clear()
-            state.current_playback_id = None
+        state.is_playing = False
+        state.current_process = None
+        state.stop_requested = False
+        state.pending_playback_counts.clear()
+        state.current_playback_id = None
 
         return {
             "status": "stopped",
@@ -557,16 +516,19 @@ class AudioQueueManager:
             "session_id": state.session_id,
         }
 
-    def __del__(self) -> None:
-        """Cleanup worker threads when the manager is destroyed."""
-        with self._sessions_lock:
-            sessions = list(self._sessions.values())
-
-        for state in sessions:
-            with state.lock:
-                state.shutdown = True
-            # Push sentinel to ensure worker exits promptly.
-            state.audio_queue.put({"__shutdown__": True})
+    def close(self) -> None:
+        """Cancel all drain tasks and idle timers (e.g. on shutdown)."""
+        for state in list(self._sessions.values()):
+            state.shutdown = True
+            for pending in (state.idle_handle, state.worker_task):
+                if pending is None:
+                    continue
+                try:
+                    pending.cancel()
+                except RuntimeError:  # loop already closed
+                    pass
+            state.idle_handle = None
+            state.worker_task = None
 
 
 # Global instance
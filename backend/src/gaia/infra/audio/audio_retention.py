@@ -0,0 +1,333 @@
+"""Set-based retention for audio playback tables and their artifacts."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, delete, exists, or_, select
+from sqlalchemy.orm import Session
+
+from db.src.connection import db_manager
+from gaia.infra.audio.audio_models import (
+    AudioChunk,
+    AudioPlaybackRequest,
+    PlaybackStatus,
+    UserAudioQueue,
+)
+
+logger = logging.getLogger(__name__)
+
+AUDIO_RETENTION_BATCH_SIZE = int(os.getenv("AUDIO_RETENTION_BATCH_SIZE", "500"))
+AUDIO_RETENTION_MAX_BATCHES = int(os.getenv("AUDIO_RETENTION_MAX_BATCHES", "20"))
+
+# Requests in these states never produce more chunks or playback
+_TERMINAL_REQUEST_STATUSES = (PlaybackStatus.COMPLETED, PlaybackStatus.FAILED)
+
+# Tables a pass can be limited to, in the order they are purged
+RETENTION_TABLES = ("chunks", "queue_entries", "requests")
+
+
+@dataclass
+class AudioRetentionResult:
+    """Outcome of a single retention pass."""
+
+    chunks_deleted: int = 0
+    queue_entries_deleted: int = 0
+    requests_deleted: int = 0
+    artifacts_deleted: int = 0
+    artifact_failures: int = 0
+    batches: int = 0
+    duration_seconds: float = 0.0
+    exhausted: bool = False
+
+    @property
+    def total_deleted(self) -> int:
+        return self.chunks_deleted + self.queue_entries_deleted + self.requests_deleted
+
+
+class AudioRetentionEngine:
+    """Expire old audio playback rows across all campaigns in bounded batches.
+
+    Every batch is a single ``DELETE ... WHERE <pk> IN (SELECT ... LIMIT n)``
+    driven by the timestamp indexes, so the cost of a pass is proportional to
+    the number of expired rows rather than the number of campaigns. Deleted
+    chunks are returned with ``RETURNING`` and their artifacts are removed from
+    the audio artifact store in bulk once the batch has committed.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = AUDIO_RETENTION_BATCH_SIZE,
+        max_batches: int = AUDIO_RETENTION_MAX_BATCHES,
+        session_factory: Optional[Callable[[], Session]] = None,
+        artifact_store: Any = None,
+    ) -> None:
+        """Initialize the retention engine.
+
+        Args:
+            batch_size: Maximum rows removed by one DELETE statement
+            max_batches: Maximum DELETE statements per table in one pass; any
+                remaining backlog is picked up by the next pass
+            session_factory: Callable returning a sync session (defaults to db_manager)
+            artifact_store: Store used to delete artifact blobs (defaults to audio_artifact_store)
+        """
+        self.batch_size = max(1, batch_size)
+        self.max_batches = max(1, max_batches)
+        self._session_factory = session_factory
+        self._artifact_store = artifact_store
+        self.metrics: Counter[str] = Counter()
+        self.last_result: Optional[AudioRetentionResult] = None
+
+    def _open_session(self) -> Optional[Session]:
+        factory = self._session_factory or getattr(db_manager, "sync_session_factory", None)
+        if factory is None:
+            return None
+        return factory()
+
+    def _get_artifact_store(self):
+        if self._artifact_store is None:
+            from gaia.infra.audio.audio_artifact_store import audio_artifact_store
+
+            self._artifact_store = audio_artifact_store
+        return self._artifact_store
+
+    def run(
+        self,
+        days: int = 7,
+        campaign_id: Optional[str] = None,
+        tables: Sequence[str] = RETENTION_TABLES,
+    ) -> AudioRetentionResult:
+        """Run one retention pass.
+
+        Args:
+            days: Remove played audio older than this many days
+            campaign_id: Optionally restrict the pass to one campaign
+            tables: Subset of ``RETENTION_TABLES`` to purge (default: all)
+
+        Returns:
+            AudioRetentionResult describing what was removed
+        """
+        unknown = set(tables) - set(RETENTION_TABLES)
+        if unknown:
+            raise ValueError(f"Unknown retention tables: {sorted(unknown)}")
+        started = time.monotonic()
+        result = AudioRetentionResult()
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+
+        session = self._open_session()
+        if session is None:
+            return result
+
+        try:
+            purges = {
+                "chunks": self._purge_chunks,
+                "queue_entries": self._purge_queue_entries,
+                "requests": self._purge_requests,
+            }
+            for table in RETENTION_TABLES:
+                if table in tables and purges[table](session, cutoff, campaign_id, result):
+                    result.exhausted = True
+        except Exception as exc:
+            logger.error("[AUDIO_RETENTION] Retention pass failed: %s", exc, exc_info=True)
+            session.rollback()
+            self.metrics["retention_failures_total"] += 1
+        finally:
+            session.close()
+
+        result.duration_seconds = time.monotonic() - started
+        self._record(result)
+        return result
+
+    def purge_chunks(self, days: int = 7, campaign_id: Optional[str] = None) -> AudioRetentionResult:
+        """Retention pass over audio chunks (and their artifacts) only."""
+        return self.run(days=days, campaign_id=campaign_id, tables=("chunks",))
+
+    def purge_queue_entries(self, days: int = 7, campaign_id: Optional[str] = None) -> AudioRetentionResult:
+        """Retention pass over played user queue entries only."""
+        return self.run(days=days, campaign_id=campaign_id, tables=("queue_entries",))
+
+    def _purge_chunks(
+        self,
+        session: Session,
+        cutoff: datetime,
+        campaign_id: Optional[str],
+        result: AudioRetentionResult,
+    ) -> bool:
+        """Delete played chunks (and chunks of long-finished failed requests)."""
+        failed_requests = select(AudioPlaybackRequest.request_id).where(
+            and_(
+                AudioPlaybackRequest.status == PlaybackStatus.FAILED,
+                AudioPlaybackRequest.completed_at < cutoff,
+            )
+        )
+        conditions = [
+            or_(
+                and_(
+                    AudioChunk.status == PlaybackStatus.PLAYED,
+                    AudioChunk.played_at < cutoff,
+                ),
+                AudioChunk.request_id.in_(failed_requests),
+            )
+        ]
+        if campaign_id is not None:
+            conditions.append(AudioChunk.campaign_id == campaign_id)
+
+        for _ in range(self.max_batches):
+            expired_ids = (
+                select(AudioChunk.chunk_id)
+                .where(and_(*conditions))
+                .limit(self.batch_size)
+            )
+            # user_audio_queue rows referencing these chunks go with them via ON DELETE CASCADE
+            stmt = (
+                delete(AudioChunk)
+                .where(AudioChunk.chunk_id.in_(expired_ids))
+                .returning(AudioChunk.campaign_id, AudioChunk.storage_path, AudioChunk.bucket)
+                .execution_options(synchronize_session=False)
+            )
+            rows = session.execute(stmt).all()
+            session.commit()
+            result.batches += 1
+            if not rows:
+                return False
+
+            result.chunks_deleted += len(rows)
+            self._delete_artifacts(rows, result)
+            if len(rows) < self.batch_size:
+                return False
+        return True
+
+    def _purge_queue_entries(
+        self,
+        session: Session,
+        cutoff: datetime,
+        campaign_id: Optional[str],
+        result: AudioRetentionResult,
+    ) -> bool:
+        """Delete played user queue entries."""
+        conditions = [UserAudioQueue.played_at < cutoff]
+        if campaign_id is not None:
+            conditions.append(UserAudioQueue.campaign_id == campaign_id)
+
+        for _ in range(self.max_batches):
+            expired_ids = (
+                select(UserAudioQueue.queue_id)
+                .where(and_(*conditions))
+                .limit(self.batch_size)
+            )
+            stmt = (
+                delete(UserAudioQueue)
+                .where(UserAudioQueue.queue_id.in_(expired_ids))
+                .execution_options(synchronize_session=False)
+            )
+            deleted = session.execute(stmt).rowcount or 0
+            session.commit()
+            result.batches += 1
+            result.queue_entries_deleted += deleted
+            if deleted < self.batch_size:
+                return False
+        return True
+
+    def _purge_requests(
+        self,
+        session: Session,
+        cutoff: datetime,
+        campaign_id: Optional[str],
+        result: AudioRetentionResult,
+    ) -> bool:
+        """Delete finished requests whose chunks have all been removed.
+
+        Requests that still own chunks are left alone so their artifacts are
+        always cleaned up through the chunk path first.
+        """
+        has_chunks = exists().where(AudioChunk.request_id == AudioPlaybackRequest.request_id)
+        conditions = [
+            AudioPlaybackRequest.status.in_(_TERMINAL_REQUEST_STATUSES),
+            AudioPlaybackRequest.completed_at < cutoff,
+            ~has_chunks,
+        ]
+        if campaign_id is not None:
+            conditions.append(AudioPlaybackRequest.campaign_id == campaign_id)
+
+        for _ in range(self.max_batches):
+            expired_ids = (
+                select(AudioPlaybackRequest.request_id)
+                .where(and_(*conditions))
+                .limit(self.batch_size)
+            )
+            stmt = (
+                delete(AudioPlaybackRequest)
+                .where(AudioPlaybackRequest.request_id.in_(expired_ids))
+                .execution_options(synchronize_session=False)
+            )
+            deleted = session.execute(stmt).rowcount or 0
+            session.commit()
+            result.batches += 1
+            result.requests_deleted += deleted
+            if deleted < self.batch_size:
+                return False
+        return True
+
+    def _delete_artifacts(self, rows: List[Any], result: AudioRetentionResult) -> None:
+        artifacts = [
+            {"session_id": row.campaign_id, "storage_path": row.storage_path, "bucket": row.bucket}
+            for row in rows
+        ]
+        try:
+            outcome = self._get_artifact_store().delete_artifacts(artifacts)
+        except Exception as exc:
+            logger.warning("[AUDIO_RETENTION] Artifact deletion failed: %s", exc)
+            result.artifact_failures += len(artifacts)
+            return
+        result.artifacts_deleted += outcome.get("deleted", 0)
+        result.artifact_failures += outcome.get("failed", 0)
+
+    def _record(self, result: AudioRetentionResult) -> None:
+        self.last_result = result
+        self.metrics["retention_runs_total"] += 1
+        self.metrics["retention_batches_total"] += result.batches
+        self.metrics["chunks_deleted_total"] += result.chunks_deleted
+        self.metrics["queue_entries_deleted_total"] += result.queue_entries_deleted
+        self.metrics["requests_deleted_total"] += result.requests_deleted
+        self.metrics["artifacts_deleted_total"] += result.artifacts_deleted
+        self.metrics["artifact_delete_failures_total"] += result.artifact_failures
+
+        if result.total_deleted or result.artifact_failures:
+            logger.info(
+                "[AUDIO_RETENTION] Removed chunks=%d queue_entries=%d requests=%d artifacts=%d "
+                "(artifact_failures=%d batches=%d backlog=%s) in %.3fs",
+                result.chunks_deleted,
+                result.queue_entries_deleted,
+                result.requests_deleted,
+                result.artifacts_deleted,
+                result.artifact_failures,
+                result.batches,
+                result.exhausted,
+                result.duration_seconds,
+            )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return cumulative counters plus details of the most recent pass."""
+        metrics: Dict[str, Any] = dict(self.metrics)
+        if self.last_result is not None:
+            metrics["last_run_seconds"] = round(self.last_result.duration_seconds, 4)
+            metrics["last_run_deleted"] = self.last_result.total_deleted
+            metrics["last_run_backlog"] = self.last_result.exhausted
+        return metrics
+
+
+# Global singleton instance
+audio_retention_engine = AudioRetentionEngine()
+
+__all__ = [
+    "RETENTION_TABLES",
+    "AudioRetentionEngine",
+    "AudioRetentionResult",
+    "audio_retention_engine",
+]
@@ -30,6 +30,7 @@ class AudioChunk(BaseModel):
         Index("ix_audio_chunks_campaign", "campaign_id", "created_at"),
         Index("ix_audio_chunks_request", "request_id", "sequence_number"),
         Index("ix_audio_chunks_status", "campaign_id", "status"),
+        Index("ix_audio_chunks_played_at", "played_at"),
     )
 
     chunk_id: Mapped[uuid.UUID] = _uuid_column(primary_key=True)
@@ -27,6 +27,11 @@ class AudioPlaybackRequest(BaseModel):
     __table_args__ = (
         Index("ix_audio_playback_requests_campaign", "campaign_id", "requested_at"),
         Index("ix_audio_playback_requests_status", "campaign_id", "status"),
+        Index("ix_audio_playback_requests_completed", "completed_at"),
+        # Queue advancement: next PENDING request for a campaign in FIFO order
+        Index("ix_audio_playback_requests_queue", "campaign_id", "status", "requested_at"),
+        # Playback state reconciler sweeps by status across all campaigns
+        Index("ix_audio_playback_requests_active", "status", "requested_at"),
     )
 
     request_id: Mapped[uuid.UUID] = _uuid_column(primary_key=True)
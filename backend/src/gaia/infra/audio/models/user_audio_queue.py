@@ -40,6 +40,7 @@ class UserAudioQueue(BaseModel):
         Index("ix_user_queue_chunk", "chunk_id"),
         Index("ix_user_queue_request", "request_id"),
         Index("ix_user_queue_delivered", "user_id", "campaign_id", "delivered_at"),
+        Index("ix_user_queue_played_at", "played_at"),
     )
 
     # Identity
@@ -0,0 +1,146 @@
+"""Background repair of audio playback requests that stopped making progress."""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import Counter
+from datetime import datetime, timezone, timedelta
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import and_, exists, update
+from sqlalchemy.orm import Session
+
+from db.src.connection import db_manager
+from gaia.infra.audio.audio_models import (
+    AudioChunk,
+    AudioPlaybackRequest,
+    PlaybackStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# Requests never finalized with a chunk count are abandoned after this long
+UNFINALIZED_REQUEST_TIMEOUT_MINUTES = int(
+    os.getenv("AUDIO_UNFINALIZED_REQUEST_TIMEOUT_MINUTES", "5")
+)
+# Streaming requests with no played chunk are abandoned after this long
+NO_PROGRESS_TIMEOUT_MINUTES = int(os.getenv("AUDIO_NO_PROGRESS_TIMEOUT_MINUTES", "3"))
+
+_ACTIVE_STATUSES = (
+    PlaybackStatus.PENDING,
+    PlaybackStatus.GENERATING,
+    PlaybackStatus.GENERATED,
+)
+_STREAMING_STATUSES = (PlaybackStatus.GENERATING, PlaybackStatus.GENERATED)
+
+
+class PlaybackStateReconciler:
+    """Mark stuck playback requests as FAILED with set-based UPDATEs.
+
+    Queue reads used to repair state inline, so every client poll did write
+    work and loaded chunk collections. The rules now live here and run from
+    the audio cleanup task; readers apply the equivalent filters read-only.
+
+    Rules (each a single UPDATE across all campaigns):
+        - unfinalized: active request with total_chunks unset after
+          UNFINALIZED_REQUEST_TIMEOUT_MINUTES
+        - empty: active request finalized with total_chunks = 0
+        - no_progress: GENERATING/GENERATED request started more than
+          NO_PROGRESS_TIMEOUT_MINUTES ago with no chunk played
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None) -> None:
+        self._session_factory = session_factory
+        self.metrics: Counter[str] = Counter()
+
+    def _open_session(self) -> Optional[Session]:
+        factory = self._session_factory or getattr(db_manager, "sync_session_factory", None)
+        if factory is None:
+            return None
+        return factory()
+
+    def reconcile(self, campaign_id: Optional[str] = None) -> Dict[str, int]:
+        """Run every repair rule once.
+
+        Args:
+            campaign_id: Optionally restrict the repair to one campaign
+
+        Returns:
+            Number of requests marked FAILED per rule
+        """
+        counts = {"unfinalized": 0, "empty": 0, "no_progress": 0}
+        session = self._open_session()
+        if session is None:
+            return counts
+
+        now = datetime.now(timezone.utc)
+        scope = []
+        if campaign_id is not None:
+            scope.append(AudioPlaybackRequest.campaign_id == campaign_id)
+
+        has_progress = exists().where(
+            and_(
+                AudioChunk.request_id == AudioPlaybackRequest.request_id,
+                AudioChunk.played_at.isnot(None),
+            )
+        )
+        rules = {
+            "unfinalized": [
+                AudioPlaybackRequest.status.in_(_ACTIVE_STATUSES),
+                AudioPlaybackRequest.total_chunks.is_(None),
+                AudioPlaybackRequest.requested_at
+                < now - timedelta(minutes=UNFINALIZED_REQUEST_TIMEOUT_MINUTES),
+            ],
+            "empty": [
+                AudioPlaybackRequest.status.in_(_ACTIVE_STATUSES),
+                AudioPlaybackRequest.total_chunks == 0,
+            ],
+            "no_progress": [
+                AudioPlaybackRequest.status.in_(_STREAMING_STATUSES),
+                AudioPlaybackRequest.started_at
+                < now - timedelta(minutes=NO_PROGRESS_TIMEOUT_MINUTES),
+                ~has_progress,
+            ],
+        }
+
+        try:
+            for rule, conditions in rules.items():
+                stmt = (
+                    update(AudioPlaybackRequest)
+                    .where(and_(*conditions, *scope))
+                    .values(status=PlaybackStatus.FAILED, completed_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+                counts[rule] = session.execute(stmt).rowcount or 0
+            session.commit()
+        except Exception as exc:
+            logger.error("[AUDIO_RECONCILE] Failed to reconcile playback state: %s", exc)
+            session.rollback()
+            self.metrics["reconcile_failures_total"] += 1
+            return {rule: 0 for rule in counts}
+        finally:
+            session.close()
+
+        self.metrics["reconcile_runs_total"] += 1
+        for rule, count in counts.items():
+            self.metrics[f"requests_failed_{rule}_total"] += count
+        if any(counts.values()):
+            logger.warning(
+                "[AUDIO_RECONCILE] Marked stuck requests as FAILED: unfinalized=%d empty=%d no_progress=%d",
+                counts["unfinalized"],
+                counts["empty"],
+                counts["no_progress"],
+            )
+        return counts
+
+
+# Global singleton instance
+playback_state_reconciler = PlaybackStateReconciler()
+
+__all__ = [
+    "NO_PROGRESS_TIMEOUT_MINUTES",
+    "UNFINALIZED_REQUEST_TIMEOUT_MINUTES",
+    "PlaybackStateReconciler",
+    "playback_state_reconciler",
+]
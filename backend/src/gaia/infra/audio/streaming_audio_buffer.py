@@ -8,12 +8,33 @@ import asyncio
 import logging
 import re
 import uuid
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, Tuple
 
 from gaia.infra.audio.playback_request_writer import PlaybackRequestWriter
+from gaia.infra.audio.voice_and_tts_config import (
+    STREAMING_TTS_WORKERS,
+    TTS_PROVIDER_MAX_CONCURRENCY,
+)
 
 logger = logging.getLogger(__name__)
 
+# Sentence endings: ". ", "! ", "? ", ".\n", etc. (terminator followed by whitespace)
+_SENTENCE_BOUNDARY = re.compile(r'[.!?](?=\s)')
+
+# Process-wide cap on in-flight TTS provider calls, shared by all buffers
+_provider_semaphore: Optional[asyncio.Semaphore] = None
+_provider_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_tts_provider_semaphore() -> asyncio.Semaphore:
+    """Return the global TTS provider semaphore for the running loop."""
+    global _provider_semaphore, _provider_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _provider_semaphore is None or _provider_semaphore_loop is not loop:
+        _provider_semaphore = asyncio.Semaphore(TTS_PROVIDER_MAX_CONCURRENCY)
+        _provider_semaphore_loop = loop
+    return _provider_semaphore
+
 
 class StreamingAudioBuffer:
     """Buffers streaming text chunks and generates audio at semantic boundaries.
@@ -22,10 +43,10 @@ class StreamingAudioBuffer:
     is still being generated, rather than waiting for the complete narrative.
 
     Features:
-    - Detects sentence boundaries for natural prosody
+    - Detects sentence boundaries for natural prosody (incremental scan)
     - Assigns sequence numbers for ordered playback
-    - Fires parallel audio generation tasks
-    - Broadcasts chunks as they complete
+    - Generates audio on a bounded pool of workers, capped globally per provider
+    - Releases chunks to the writer strictly in sequence order
     """
 
     def __init__(
@@ -34,6 +55,7 @@ class StreamingAudioBuffer:
         broadcaster,
         tts_generator: Callable[[str, str, bool], Any],
         playback_group: str = "narrative",
+        max_workers: Optional[int] = None,
     ):
         """Initialize streaming audio buffer.
 
@@ -42,6 +64,7 @@ class StreamingAudioBuffer:
             broadcaster: WebSocket broadcaster for audio chunks
             tts_generator: Async function that generates audio (text, session_id, return_artifact) -> artifact
             playback_group: Group identifier for frontend playback sequencing
+            max_workers: Concurrent TTS generations for this buffer (default STREAMING_TTS_WORKERS)
         """
         self.session_id = session_id
         self.tts_generator = tts_generator
@@ -52,6 +75,17 @@ class StreamingAudioBuffer:
         self.sequence_number = 0
         self.pending_tasks: List[asyncio.Task] = []
         self.finalized = False
+        self.max_workers = max(1, max_workers or STREAMING_TTS_WORKERS)
+
+        # Incremental boundary scan: buffer offset already scanned and last boundary found
+        self._scan_pos = 0
+        self._boundary_end: Optional[int] = None
+
+        # Bounded worker pool and reorder stage
+        self._jobs: "asyncio.Queue[Tuple[int, str]]" = asyncio.Queue()
+        self._completed: Dict[int, Optional[Tuple[Dict[str, Any], str]]] = {}
+        self._next_release = 0
+        self._release_lock = asyncio.Lock()
 
         # Generate unique response ID to scope audio sequences per DM response
         # This prevents watermark collisions when new responses start mid-playback
@@ -94,56 +128,47 @@ class StreamingAudioBuffer:
             sentences = self._extract_complete_sentences()
 
             if sentences:
-                # Capture sequence number NOW (before incrementing) to avoid race condition
-                seq = self.sequence_number
-                self.sequence_number += 1
-
-                # Fire audio generation task (non-blocking) with captured sequence
-                task = asyncio.create_task(
-                    self._generate_and_broadcast_audio(sentences, seq)
-                )
-                self.pending_tasks.append(task)
+                seq = self._submit(sentences)
 
                 logger.debug(
-                    "[AUDIO_DEBUG] 🎤 Queued audio generation | session=%s seq=%d text_preview='%s' pending_tasks=%d",
+                    "[AUDIO_DEBUG] 🎤 Queued audio generation | session=%s seq=%d text_preview='%s' queued=%d",
                     self.session_id,
                     seq,
                     sentences[:100].replace('\n', ' '),
-                    len(self.pending_tasks)
+                    self._jobs.qsize()
                 )
 
         if is_final:
             self.finalized = True
             # Process any remaining buffer
             if self.buffer.strip():
-                # Capture sequence number NOW (before incrementing)
-                seq = self.sequence_number
-                self.sequence_number += 1
-
-                task = asyncio.create_task(
-                    self._generate_and_broadcast_audio(self.buffer, seq)
-                )
-                self.pending_tasks.append(task)
+                seq = self._submit(self.buffer)
                 logger.debug(
-                    "[AUDIO_DEBUG] 🏁 Queued FINAL audio chunk | session=%s seq=%d text_preview='%s' pending_tasks=%d",
+                    "[AUDIO_DEBUG] 🏁 Queued FINAL audio chunk | session=%s seq=%d text_preview='%s' queued=%d",
                     self.session_id,
                     seq,
                     self.buffer[:100].replace('\n', ' '),
-                    len(self.pending_tasks)
+                    self._jobs.qsize()
                 )
                 self.buffer = ""
+                self._reset_scan()
 
     def _has_semantic_break(self) -> bool:
         """Check if buffer contains a sentence boundary.
 
+        Only text added since the previous call is scanned (plus one character,
+        so a terminator that arrived before its trailing space is still seen).
+
         Returns:
-            True if buffer ends with sentence terminator + space/newline
+            True if buffer contains a sentence terminator + space/newline
         """
         if len(self.buffer) < 2:
             return False
 
-        # Check for sentence endings: ". ", "! ", "? ", ".\n", etc.
-        return bool(re.search(r'[.!?][\s\n]', self.buffer))
+        for match in _SENTENCE_BOUNDARY.finditer(self.buffer, max(self._scan_pos - 1, 0)):
+            self._boundary_end = match.end()
+        self._scan_pos = len(self.buffer)
+        return self._boundary_end is not None
 
     def _extract_complete_sentences(self) -> str:
         """Extract complete sentences from buffer, leaving remainder.
@@ -151,42 +176,68 @@ class StreamingAudioBuffer:
         Returns:
             Complete sentences ready for TTS
         """
-        # Find the last sentence boundary
-        match = None
-        for match in re.finditer(r'[.!?](?=[\s\n])', self.buffer):
-            pass  # Find last match
+        # Make sure the tail of the buffer has been scanned for the last boundary
+        self._has_semantic_break()
 
-        if match:
-            end_idx = match.end()
+        if self._boundary_end is not None:
+            end_idx = self._boundary_end
             sentences = self.buffer[:end_idx]
             self.buffer = self.buffer[end_idx:].lstrip()
+            self._reset_scan()
             return sentences
 
         return ""
 
+    def _reset_scan(self) -> None:
+        self._scan_pos = 0
+        self._boundary_end = None
+
+    def _submit(self, text: str) -> int:
+        """Queue text for generation and return its sequence number."""
+        # Capture sequence number NOW (before incrementing) so order follows the text stream
+        seq = self.sequence_number
+        self.sequence_number += 1
+        self._jobs.put_nowait((seq, text))
+        # Workers exit once the queue is drained, so start a fresh one if a slot is free
+        self.pending_tasks = [task for task in self.pending_tasks if not task.done()]
+        if len(self.pending_tasks) < self.max_workers:
+            self.pending_tasks.append(asyncio.create_task(self._worker()))
+        return seq
+
+    async def _worker(self) -> None:
+        # Never park on an empty queue: an abandoned stream must not leave idle tasks behind
+        while True:
+            try:
+                seq, text = self._jobs.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await self._generate_and_broadcast_audio(text, seq)
+
     async def _generate_and_broadcast_audio(self, text: str, sequence_number: int) -> None:
-        """Generate audio for text and broadcast when ready.
+        """Generate audio for text and hand it to the reorder stage.
 
         Args:
             text: Text to convert to speech
-            sequence_number: Sequence number for this chunk (captured at task creation)
+            sequence_number: Sequence number for this chunk (captured at submission)
 
         Note:
-            If this method returns early (empty text, TTS failure), the sequence number
-            will be "skipped" since it was already assigned before calling this method.
-            This can result in sequence gaps (e.g., chunks 0, 2 instead of 0, 1).
-            The playback system handles gaps gracefully by ordering by sequence number.
+            If generation yields nothing (empty text, TTS failure), the sequence number
+            is released as a gap so later chunks are not held back. This can result in
+            sequence gaps (e.g., chunks 0, 2 instead of 0, 1). The playback system
+            handles gaps gracefully by ordering by sequence number.
         """
+        seq = sequence_number
+        result: Optional[Tuple[Dict[str, Any], str]] = None
+
         if not text.strip():
             logger.warning(
                 "[StreamAudio] Session %s: Skipping audio chunk %d - empty/whitespace text (sequence gap created)",
                 self.session_id,
-                sequence_number,
+                seq,
             )
+            await self._release(seq, None)
             return
 
-        seq = sequence_number
-
         try:
             logger.debug(
                 "[StreamAudio] Session %s: Generating audio chunk %d (%d chars): %s",
@@ -196,12 +247,13 @@ class StreamingAudioBuffer:
                 text[:80] + "..." if len(text) > 80 else text
             )
 
-            # Generate audio artifact
-            artifact = await self.tts_generator(
-                text,
-                self.session_id,
-                return_artifact=True
-            )
+            # Generate audio artifact (bounded across all buffers)
+            async with get_tts_provider_semaphore():
+                artifact = await self.tts_generator(
+                    text,
+                    self.session_id,
+                    return_artifact=True
+                )
 
             if not isinstance(artifact, dict):
                 logger.error(
@@ -210,19 +262,14 @@ class StreamingAudioBuffer:
                     seq,
                     type(artifact)
                 )
-                return
-
-            # Add response ID metadata for watermark collision prevention
-            artifact["response_id"] = self.response_id
-            artifact["chunk_number"] = seq + 1  # 1-indexed for display
-
-            # Use writer to persist chunk, broadcast, and trigger streaming
-            await self.writer.add_chunk(
-                artifact=artifact,
-                sequence_number=seq,
-                text_preview=text,
-            )
-
+            else:
+                # Add response ID metadata for watermark collision prevention
+                artifact["response_id"] = self.response_id
+                artifact["chunk_number"] = seq + 1  # 1-indexed for display
+                result = (artifact, text)
+
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(
                 "[StreamAudio] Session %s: Failed to generate audio chunk %d: %s (sequence gap created)",
@@ -232,24 +279,52 @@ class StreamingAudioBuffer:
                 exc_info=True
             )
 
+        await self._release(seq, result)
+
+    async def _release(self, seq: int, result: Optional[Tuple[Dict[str, Any], str]]) -> None:
+        """Record a finished chunk and emit every contiguous chunk in sequence order."""
+        self._completed[seq] = result
+        async with self._release_lock:
+            while self._next_release in self._completed:
+                ready = self._completed.pop(self._next_release)
+                release_seq = self._next_release
+                self._next_release += 1
+                if ready is None:
+                    continue
+                artifact, text = ready
+                try:
+                    # Use writer to persist chunk, broadcast, and trigger streaming
+                    await self.writer.add_chunk(
+                        artifact=artifact,
+                        sequence_number=release_seq,
+                        text_preview=text,
+                    )
+                except Exception as e:  # noqa: BLE001
+                    logger.error(
+                        "[StreamAudio] Session %s: Failed to publish audio chunk %d: %s",
+                        self.session_id,
+                        release_seq,
+                        e,
+                        exc_info=True
+                    )
+
     async def finalize(self) -> None:
-        """Wait for all pending audio generation tasks to complete."""
+        """Wait for all pending audio generation to complete and be released."""
         if not self.finalized:
             self.finalized = True
 
             # Process any remaining buffer
             if self.buffer.strip():
-                # Capture sequence number for final chunk
-                seq = self.sequence_number
-                self.sequence_number += 1
-                await self._generate_and_broadcast_audio(self.buffer, seq)
+                self._submit(self.buffer)
                 self.buffer = ""
+                self._reset_scan()
 
-        # Wait for all tasks
+        # Wait for all workers to drain the queue
         if self.pending_tasks:
             logger.debug(
-                "[StreamAudio] Session %s: Waiting for %d audio generation tasks to complete",
+                "[StreamAudio] Session %s: Waiting for %d queued audio chunks on %d workers",
                 self.session_id,
+                self._jobs.qsize(),
                 len(self.pending_tasks)
             )
             await asyncio.gather(*self.pending_tasks, return_exceptions=True)
@@ -92,6 +92,11 @@ AUTO_TTS_OUTPUT = get_auto_tts_output()  # auto/unix/windows/windows_legacy
 # "windows_direct" = Use generic audio_utils.py Windows method (new method with WSL network paths)
 WINDOWS_AUDIO_ROUTING = "windows_utils"  # windows_utils/windows_direct
 
+# Concurrent TTS requests per streaming response (StreamingAudioBuffer workers)
+STREAMING_TTS_WORKERS = max(1, int(os.getenv("STREAMING_TTS_WORKERS", "3")))
+# Concurrent TTS provider calls across all streaming responses in this process
+TTS_PROVIDER_MAX_CONCURRENCY = max(1, int(os.getenv("TTS_PROVIDER_MAX_CONCURRENCY", "8")))
+
 # ==============================================================================
 # AUDIO PATHS
 # ==============================================================================
@@ -1,14 +1,33 @@
-"""WebM audio decoder for voice activity detection."""
+"""WebM audio decoder for voice activity detection.
+
+``decode_webm_chunk`` decodes a self-contained WebM blob through a one-shot
+ffmpeg run (temp files plus a fork/exec per call). Live microphone audio
+should use a :class:`StreamingWebMDecoder` per session instead: one
+long-lived ffmpeg process fed through a pipe, so each chunk costs a pipe
+write and a read rather than a process launch and two disk round trips.
+MediaRecorder only sends the WebM header with the first chunk, so a
+continuous stream is also the only way later chunks decode at all.
+"""
 
 import subprocess
 import tempfile
 import os
+import threading
+import time
+from collections import OrderedDict
 import numpy as np
 import logging
-from typing import Tuple, Optional
+from typing import Tuple, Optional, List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+WEBM_DECODER_SAMPLE_RATE = 48000
+WEBM_DECODER_MAX_SESSIONS = int(os.getenv("WEBM_DECODER_MAX_SESSIONS", "64"))
+WEBM_DECODER_IDLE_SECONDS = float(os.getenv("WEBM_DECODER_IDLE_SECONDS", "60"))
+# How long to wait for PCM after feeding a chunk, and for trailing output to settle
+WEBM_DECODER_READ_TIMEOUT = float(os.getenv("WEBM_DECODER_READ_TIMEOUT", "0.25"))
+WEBM_DECODER_SETTLE_SECONDS = float(os.getenv("WEBM_DECODER_SETTLE_SECONDS", "0.01"))
+
 def decode_webm_chunk(webm_data: bytes) -> Optional[np.ndarray]:
     """
     Decode WebM chunk to raw PCM audio for analysis.
@@ -71,6 +90,239 @@ def decode_webm_chunk(webm_data: bytes) -> Optional[np.ndarray]:
         return None
 
 
+
+def _ffmpeg_stream_command(sample_rate: int, channels: int) -> List[str]:
+    return [
+        'ffmpeg', '-hide_banner', '-loglevel', 'error',
+        # Decode as data arrives instead of buffering for stream probing
+        '-fflags', 'nobuffer', '-analyzeduration', '0',
+        '-f', 'webm', '-i', 'pipe:0',
+        '-f', 's16le', '-ar', str(sample_rate), '-ac', str(channels),
+        '-flush_packets', '1',
+        'pipe:1',
+    ]
+
+
+class StreamingWebMDecoder:
+    """Long-lived WebM/Opus -> PCM decoder for one audio stream.
+
+    Bytes go in with :meth:`feed`, int16 samples come out of :meth:`read`.
+    A reader thread drains ffmpeg's stdout into an in-memory buffer so the
+    pipe never stalls; nothing touches the disk.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = WEBM_DECODER_SAMPLE_RATE,
+        channels: int = 1,
+        command: Optional[List[str]] = None,
+    ):
+        """Create the decoder; the ffmpeg process starts on first use.
+
+        Args:
+            sample_rate: Output sample rate in Hz
+            channels: Output channel count (samples are interleaved)
+            command: Override the decoder command (must read stdin, write s16le to stdout)
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.command = command or _ffmpeg_stream_command(sample_rate, channels)
+        self.last_used = time.monotonic()
+        self.bytes_in = 0
+        self.samples_out = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        self._pcm = bytearray()
+        self._cond = threading.Condition()
+        self._eof = False
+        self._closed = False
+        self._write_lock = threading.Lock()
+
+    @property
+    def is_alive(self) -> bool:
+        """True until the decoder is closed or the ffmpeg process exits."""
+        if self._closed:
+            return False
+        return self._process is None or self._process.poll() is None
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._process is None:
+            self._process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+            self._reader = threading.Thread(
+                target=self._read_loop, name="webm-decoder-reader", daemon=True
+            )
+            self._reader.start()
+        return self._process
+
+    def _read_loop(self) -> None:
+        stdout = self._process.stdout
+        try:
+            while True:
+                data = stdout.read(65536)
+                if not data:
+                    break
+                with self._cond:
+                    self._pcm.extend(data)
+                    self._cond.notify_all()
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._cond:
+                self._eof = True
+                self._cond.notify_all()
+
+    def feed(self, webm_data: bytes) -> bool:
+        """Send encoded bytes to the decoder. Returns False if it is no longer running."""
+        if not self.is_alive:
+            return False
+        try:
+            process = self._ensure_started()
+        except OSError as exc:
+            logger.warning("Streaming WebM decoder could not start: %s", exc)
+            self._closed = True
+            return False
+        self.last_used = time.monotonic()
+        try:
+            with self._write_lock:
+                process.stdin.write(webm_data)
+                process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as exc:
+            logger.debug("Streaming WebM decoder stopped accepting input: %s", exc)
+            return False
+        self.bytes_in += len(webm_data)
+        return True
+
+    def read(
+        self,
+        timeout: float = WEBM_DECODER_READ_TIMEOUT,
+        settle: float = WEBM_DECODER_SETTLE_SECONDS,
+    ) -> Optional[np.ndarray]:
+        """Return the samples decoded since the last read.
+
+        Waits up to ``timeout`` for the first output, then keeps collecting
+        until no new output arrives for ``settle`` seconds. Only whole
+        frames are returned; a partial frame stays buffered. Returns None
+        once the decoder's output has ended and nothing is left to return.
+        """
+        frame_bytes = 2 * self.channels
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while not self._pcm and not self._eof:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            size = len(self._pcm)
+            while size and not self._eof and settle > 0:
+                self._cond.wait(settle)
+                if len(self._pcm) == size:
+                    break
+                size = len(self._pcm)
+            usable = len(self._pcm) - len(self._pcm) % frame_bytes
+            if not usable and (self._eof or not self.is_alive):
+                return None
+            data = bytes(self._pcm[:usable])
+            del self._pcm[:usable]
+        self.samples_out += usable // 2
+        return np.frombuffer(data, dtype=np.int16)
+
+    def decode(self, webm_data: bytes, timeout: float = WEBM_DECODER_READ_TIMEOUT) -> Optional[np.ndarray]:
+        """Feed one chunk and return the samples it produced (None if the decoder died)."""
+        if not self.feed(webm_data):
+            return None
+        return self.read(timeout=timeout)
+
+    def close(self) -> None:
+        """Stop ffmpeg and the reader thread."""
+        if self._closed:
+            return
+        self._closed = True
+        process = self._process
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if self._reader is not None:
+            self._reader.join(timeout=1)
+        if process.stdout is not None:
+            process.stdout.close()
+
+
+_session_decoders: "OrderedDict[str, StreamingWebMDecoder]" = OrderedDict()
+_session_decoders_lock = threading.Lock()
+
+
+def get_session_decoder(session_id: str) -> StreamingWebMDecoder:
+    """Return the streaming decoder for a session, creating it if needed.
+
+    Idle decoders and, past WEBM_DECODER_MAX_SESSIONS, the least recently
+    used ones are closed to bound the number of ffmpeg processes.
+    """
+    to_close: List[StreamingWebMDecoder] = []
+    now = time.monotonic()
+    with _session_decoders_lock:
+        decoder = _session_decoders.get(session_id)
+        if decoder is not None and not decoder.is_alive:
+            to_close.append(_session_decoders.pop(session_id))
+            decoder = None
+        if decoder is None:
+            decoder = StreamingWebMDecoder()
+            _session_decoders[session_id] = decoder
+        _session_decoders.move_to_end(session_id)
+        for other_id, other in list(_session_decoders.items()):
+            if other_id != session_id and now - other.last_used > WEBM_DECODER_IDLE_SECONDS:
+                to_close.append(_session_decoders.pop(other_id))
+        while len(_session_decoders) > WEBM_DECODER_MAX_SESSIONS:
+            _, oldest = _session_decoders.popitem(last=False)
+            to_close.append(oldest)
+    for stale in to_close:
+        stale.close()
+    return decoder
+
+
+def release_session_decoder(session_id: str) -> None:
+    """Close a session's decoder, e.g. when its recording ends."""
+    with _session_decoders_lock:
+        decoder = _session_decoders.pop(session_id, None)
+    if decoder is not None:
+        decoder.close()
+
+
+def close_all_decoders() -> None:
+    with _session_decoders_lock:
+        decoders = list(_session_decoders.values())
+        _session_decoders.clear()
+    for decoder in decoders:
+        decoder.close()
+
+
+def decode_session_chunk(session_id: str, webm_data: bytes) -> Optional[np.ndarray]:
+    """Decode the next chunk of a session's continuous WebM stream.
+
+    Falls back to a one-shot :func:`decode_webm_chunk` when the streaming
+    decoder cannot take input or its output has ended (e.g. ffmpeg
+    rejected the stream or could not be started).
+    """
+    decoder = get_session_decoder(session_id)
+    audio = decoder.decode(webm_data)
+    if audio is None:
+        release_session_decoder(session_id)
+        return decode_webm_chunk(webm_data)
+    return audio
+
 def analyze_audio_chunk(audio_array: np.ndarray, sample_rate: int = 48000) -> Tuple[bool, float, dict]:
     """
     Analyze audio chunk for voice activity using frequency analysis.
@@ -121,4 +373,60 @@ def analyze_audio_chunk(audio_array: np.ndarray, sample_rate: int = 48000) -> Tu
         'dominant_freq': dominant_freq
     }
     
-    return has_voice, confidence, analysis_data
\ No newline at end of file
+    return has_voice, confidence, analysis_data
+
+
+def _cpu_seconds() -> float:
+    import resource
+
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def benchmark_decoders(webm_data: bytes, chunk_bytes: int = 4000) -> Dict[str, Any]:
+    """Compare one-shot and streaming decoding of a recording split into chunks.
+
+    Chunks mimic MediaRecorder output (only the first carries the header).
+    Throughput is reported per CPU second, counting ffmpeg child processes.
+    """
+    chunks = [webm_data[i:i + chunk_bytes] for i in range(0, len(webm_data), chunk_bytes)]
+    results: Dict[str, Any] = {"chunks": len(chunks), "chunk_bytes": chunk_bytes}
+
+    cpu_start, wall_start = _cpu_seconds(), time.perf_counter()
+    decoded = sum(1 for chunk in chunks if decode_webm_chunk(chunk) is not None)
+    cpu, wall = _cpu_seconds() - cpu_start, time.perf_counter() - wall_start
+    results["one_shot"] = {
+        "decoded_chunks": decoded,
+        "chunks_per_cpu_second": round(len(chunks) / cpu, 1) if cpu else None,
+        "wall_seconds": round(wall, 3),
+    }
+
+    decoder = StreamingWebMDecoder()
+    cpu_start, wall_start = _cpu_seconds(), time.perf_counter()
+    samples = 0
+    try:
+        for chunk in chunks:
+            audio = decoder.decode(chunk, timeout=0.05)
+            samples += 0 if audio is None else len(audio)
+    finally:
+        decoder.close()
+    cpu, wall = _cpu_seconds() - cpu_start, time.perf_counter() - wall_start
+    results["streaming"] = {
+        "decoded_samples": samples,
+        "chunks_per_cpu_second": round(len(chunks) / cpu, 1) if cpu else None,
+        "wall_seconds": round(wall, 3),
+    }
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Benchmark WebM decoding for voice detection")
+    parser.add_argument("path", help="WebM/Opus recording to split into chunks")
+    parser.add_argument("--chunk-bytes", type=int, default=4000)
+    args = parser.parse_args()
+    with open(args.path, "rb") as f:
+        print(json.dumps(benchmark_decoders(f.read(), args.chunk_bytes), indent=2))
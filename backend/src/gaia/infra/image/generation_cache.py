@@ -0,0 +1,276 @@
+"""Content-addressed cache of image generation results.
+
+Pregenerated portraits and retried scene images frequently ask a provider for
+exactly the same picture again. ``ImageGenerationCache`` keys results on the
+normalized generation parameters (provider, model, prompt, size, seed, ...)
+and coalesces identical in-flight requests so concurrent callers share one
+provider call. Only requests whose result may be stored (seeded ones, by
+default) take part; identical unseeded requests are meant to produce distinct
+images and always reach the provider.
+
+Configuration is read from the environment:
+
+    IMAGE_CACHE_ENABLED        Enable caching and coalescing (default true)
+    IMAGE_CACHE_TTL_SECONDS    Entry lifetime in seconds (default 3600)
+    IMAGE_CACHE_MAX_ENTRIES    Maximum number of cached results (default 256)
+    IMAGE_CACHE_MAX_BYTES      Maximum base64 payload held in memory across
+                               all entries (default 64 MiB)
+    IMAGE_CACHE_UNSEEDED       Also cache and coalesce requests without a seed
+                               (default false); otherwise they bypass the
+                               cache, so "regenerate" and parallel variations
+                               still produce new images
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Keys of a provider result image that hold a local file path
+_PATH_KEYS = ("path", "local_path")
+
+
+def _as_bool(value: Optional[str], default: bool = False) -> bool:
+    """Parse truthy strings from environment variables."""
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "t", "yes", "y", "on"}
+
+
+def _normalize_text(text: Optional[str]) -> Optional[str]:
+    if text is None:
+        return None
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def generation_cache_key(
+    *,
+    provider: str,
+    prompt: str,
+    model: Optional[str] = None,
+    width: int = 1024,
+    height: int = 1024,
+    n: int = 1,
+    response_format: str = "b64_json",
+    negative_prompt: Optional[str] = None,
+    seed: Optional[int] = None,
+    guidance_scale: Optional[float] = None,
+    num_inference_steps: Optional[int] = None,
+    **kwargs: Any,
+) -> str:
+    """Build a stable key from normalized generation parameters."""
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "prompt": _normalize_text(prompt),
+            "negative_prompt": _normalize_text(negative_prompt),
+            "width": int(width),
+            "height": int(height),
+            "n": int(n),
+            "response_format": response_format,
+            "seed": None if seed is None else int(seed),
+            "guidance_scale": None if guidance_scale is None else float(guidance_scale),
+            "num_inference_steps": None if num_inference_steps is None else int(num_inference_steps),
+            "extra": kwargs,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _CacheEntry:
+    result: Dict[str, Any]
+    expires_at: float
+    # In-memory base64 payload size counted against ``max_bytes``
+    size_bytes: int = 0
+
+
+def _payload_size(result: Dict[str, Any]) -> int:
+    return sum(
+        len(image.get("b64_json") or "")
+        for image in result.get("images") or []
+        if isinstance(image, dict)
+    )
+
+
+class ImageGenerationCache:
+    """Bounded TTL cache plus in-flight coalescing for image generation."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_unseeded: bool = False,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self._bytes = 0
+        self.cache_unseeded = cache_unseeded
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.metrics: Counter = Counter()
+
+    @classmethod
+    def from_env(cls) -> "ImageGenerationCache":
+        """Build a cache from ``IMAGE_CACHE_*`` environment variables."""
+        return cls(
+            enabled=_as_bool(os.getenv("IMAGE_CACHE_ENABLED"), True),
+            ttl_seconds=float(os.getenv("IMAGE_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+            max_entries=int(os.getenv("IMAGE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            max_bytes=int(os.getenv("IMAGE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+            cache_unseeded=_as_bool(os.getenv("IMAGE_CACHE_UNSEEDED"), False),
+        )
+
+    def should_store(self, seed: Optional[int]) -> bool:
+        """Return True if a result for this request may be kept after it completes."""
+        return self.enabled and (seed is not None or self.cache_unseeded)
+
+    async def get_or_generate(
+        self,
+        key: str,
+        generate: Callable[[], Awaitable[Dict[str, Any]]],
+        store: bool = True,
+    ) -> Dict[str, Any]:
+        """Serve ``key`` from the cache, join an identical in-flight call, or run ``generate``.
+
+        Only requests with ``store`` True are cached or coalesced; the rest
+        call ``generate`` directly so identical requests get distinct results.
+        Every cached or coalesced dict is a private copy carrying
+        ``cache_key`` and ``cache_status`` ("hit", "coalesced" or "miss").
+        """
+        if not self.enabled or not store:
+            return await generate()
+
+        cached = await self._lookup(key)
+        if cached is not None:
+            self.metrics["hits"] += 1
+            return cached
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.metrics["coalesced"] += 1
+            result = await asyncio.shield(task)
+            return self._copy(result, key, "coalesced")
+
+        self.metrics["misses"] += 1
+        task = asyncio.ensure_future(generate())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        # Shielded so a cancelled caller doesn't cancel the call others are sharing
+        result = await asyncio.shield(task)
+        return self._copy(result, key, "miss")
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if result.get("success"):
+            self._put(key, result)
+
+    def _put(self, key: str, result: Dict[str, Any]) -> None:
+        size = _payload_size(result)
+        if size > self.max_bytes:
+            self.metrics["too_large"] += 1
+            return
+        self._remove(key)
+        self._entries[key] = _CacheEntry(
+            result=copy.deepcopy(result),
+            expires_at=time.monotonic() + self.ttl_seconds,
+            size_bytes=size,
+        )
+        self._bytes += size
+        self.metrics["stores"] += 1
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.metrics["evictions"] += 1
+
+    def _remove(self, key: str) -> Optional[_CacheEntry]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size_bytes
+        return entry
+
+    async def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.metrics["expired"] += 1
+            return None
+
+        result = self._copy(entry.result, key, "hit")
+        if not all(
+            Path(image[path_key]).exists()
+            for image in result.get("images", [])
+            if isinstance(image, dict)
+            for path_key in _PATH_KEYS
+            if image.get(path_key)
+        ):
+            self._drop(key, "stale")
+            return None
+
+        self._entries.move_to_end(key)
+        return result
+
+    def _drop(self, key: str, reason: str) -> None:
+        if self._remove(key) is not None:
+            self.metrics[reason] += 1
+
+    @staticmethod
+    def _copy(result: Dict[str, Any], key: str, status: str) -> Dict[str, Any]:
+        result = copy.deepcopy(result)
+        result["cache_key"] = key
+        result["cache_status"] = status
+        return result
+
+    def invalidate(self, key: str) -> None:
+        self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all cached results and reset counters (in-flight calls continue)."""
+        self._entries.clear()
+        self._bytes = 0
+        self.metrics.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics for diagnostics endpoints and logs."""
+        lookups = self.metrics["hits"] + self.metrics["coalesced"] + self.metrics["misses"]
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "cache_unseeded": self.cache_unseeded,
+            "in_flight": len(self._in_flight),
+            "hit_rate": round(self.metrics["hits"] / lookups, 4) if lookups else 0.0,
+            "provider_calls_saved": self.metrics["hits"] + self.metrics["coalesced"],
+            "metrics": dict(self.metrics),
+        }
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import socket
+import threading
 import uuid
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+from gaia.utils.lazy_imports import lazy_module, module_available
 
 logger = logging.getLogger(__name__)
 
@@ -48,12 +53,12 @@ class ImageStorageType(str, Enum):
         """Return all directory names (plural forms)."""
         return [t.directory for t in cls]
 
+# google-cloud-storage is heavy; only import it once a bucket client is created
+storage = lazy_module("google.cloud.storage")
 try:
-    from google.cloud import storage  # type: ignore
     from google.auth.exceptions import DefaultCredentialsError  # type: ignore
-    _GCS_AVAILABLE = True
+    _GCS_AVAILABLE = module_available("google.cloud.storage")
 except Exception:  # pragma: no cover - import guard
-    storage = None
     DefaultCredentialsError = Exception  # type: ignore
     _GCS_AVAILABLE = False
 
@@ -73,6 +78,8 @@ class ImageArtifact:
     storage_path: str
     bucket: Optional[str]
     image_type: str  # "portrait", "scene", etc.
+    # Responsive derivatives keyed by width (as a string, JSON friendly)
+    variants: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def to_payload(self) -> Dict[str, Any]:
         return {
@@ -86,6 +93,7 @@ class ImageArtifact:
             "storage_path": self.storage_path,
             "bucket": self.bucket,
             "image_type": self.image_type,
+            "variants": self.variants,
         }
 
 
@@ -95,15 +103,60 @@ def get_client_image_config() -> Dict[str, Any]:
     bucket = os.getenv("IMAGE_STORAGE_BUCKET") or os.getenv("CLIENT_AUDIO_BUCKET", "")
     local_root = os.getenv("IMAGE_STORAGE_PATH", "/tmp/gaia_images")
 
+    variant_widths = [
+        int(width)
+        for width in os.getenv("IMAGE_VARIANT_WIDTHS", "256,512,1024").split(",")
+        if width.strip().isdigit()
+    ]
+
     return {
         "enabled": True,  # Always enabled
         "bucket": bucket,
         "base_path": "media/images",
         "local_root": local_root,
         "url_ttl_seconds": 900,  # 15 minutes for signed URLs
+        "variants_enabled": os.getenv("IMAGE_VARIANTS_ENABLED", "true").lower() in {"1", "true", "yes"},
+        "variant_widths": variant_widths,
+        "variant_quality": int(os.getenv("IMAGE_VARIANT_QUALITY", "80")),
     }
 
 
+# Source formats that get responsive derivatives
+_VARIANT_SOURCE_MIME_TYPES = {"image/png", "image/jpeg", "image/jpg", "image/webp"}
+VARIANT_MIME_TYPE = "image/webp"
+# Recently persisted variants kept so metadata written right after persist can reference them
+_RECENT_VARIANTS_LIMIT = 512
+
+
+def variant_filename(filename: str, width: int) -> str:
+    """Return the stored filename of a derivative (e.g. portrait_x_w256.webp)."""
+    return f"{Path(filename).stem}_w{width}.webp"
+
+
+def select_image_variant(
+    variants: Optional[Dict[str, Dict[str, Any]]],
+    width: Optional[int] = None,
+    accept: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Pick the derivative to serve for a request, or None for the original.
+
+    Variants are only served to clients that list the variant type in their
+    Accept header. With ``width`` the smallest variant at least that wide is
+    chosen (the largest one when none is); without it the full-width variant
+    is served, which is still much smaller than the original PNG.
+    """
+    if not variants or not accept or VARIANT_MIME_TYPE not in accept.lower():
+        return None
+
+    ordered = sorted(variants.values(), key=lambda variant: int(variant.get("width", 0)))
+    if width is None:
+        return ordered[-1]
+    for variant in ordered:
+        if int(variant.get("width", 0)) >= width:
+            return variant
+    return ordered[-1]
+
+
 class ImageArtifactStore:
     """Persist generated images so they survive container restarts."""
 
@@ -115,6 +168,11 @@ class ImageArtifactStore:
         self.local_root = Path(config.get("local_root"))
         self.local_root.mkdir(parents=True, exist_ok=True)
         self.url_ttl_seconds: int = int(config.get("url_ttl_seconds", 900))
+        self.variants_enabled: bool = bool(config.get("variants_enabled", True))
+        self.variant_widths: List[int] = list(config.get("variant_widths") or [])
+        self.variant_quality: int = int(config.get("variant_quality", 80))
+        self._recent_variants: "OrderedDict[str, Dict[str, Dict[str, Any]]]" = OrderedDict()
+        self._recent_variants_lock = threading.Lock()
 
         self._client = None
         self._bucket = None
@@ -222,6 +280,9 @@ class ImageArtifactStore:
 
         When GCS is available, images are uploaded directly to GCS without writing to local disk.
         Local storage is only used as a fallback when GCS upload fails or GCS is unavailable.
+        Responsive WebP derivatives are only rendered by ``persist_image_async``
+        and ``add_variants_async``; resizing and encoding them here would block
+        async callers.
 
         Args:
             session_id: Campaign/session identifier
@@ -234,6 +295,70 @@ class ImageArtifactStore:
         Returns:
             ImageArtifact with proxy URL
         """
+        return self._persist(
+            session_id=session_id,
+            image_bytes=image_bytes,
+            image_type=image_type,
+            mime_type=mime_type,
+            skip_gcs_upload=skip_gcs_upload,
+            filename=filename,
+            rendered_variants=[],
+        )
+
+    async def persist_image_async(
+        self,
+        *,
+        session_id: str,
+        image_bytes: bytes,
+        image_type: str = "portrait",
+        mime_type: str = "image/png",
+        skip_gcs_upload: bool = False,
+        filename: Optional[str] = None,
+    ) -> ImageArtifact:
+        """Async variant of ``persist_image`` for request handlers.
+
+        Derivatives are rendered in the image processing pool and uploads run
+        in a worker thread, so the event loop is never blocked.
+        """
+        rendered: List[Tuple[int, int, bytes]] = []
+        if self._wants_variants(mime_type):
+            from gaia.infra.image.image_processing import image_processing_service
+
+            try:
+                rendered = await image_processing_service.render_variants(
+                    image_bytes, self.variant_widths, quality=self.variant_quality
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to render image variants: %s", exc)
+        return await asyncio.to_thread(
+            self._persist,
+            session_id=session_id,
+            image_bytes=image_bytes,
+            image_type=image_type,
+            mime_type=mime_type,
+            skip_gcs_upload=skip_gcs_upload,
+            filename=filename,
+            rendered_variants=rendered,
+        )
+
+    def _wants_variants(self, mime_type: str) -> bool:
+        return (
+            self.variants_enabled
+            and bool(self.variant_widths)
+            and mime_type.lower() in _VARIANT_SOURCE_MIME_TYPES
+        )
+
+    def _persist(
+        self,
+        *,
+        session_id: str,
+        image_bytes: bytes,
+        image_type: str,
+        mime_type: str,
+        skip_gcs_upload: bool,
+        filename: Optional[str],
+        rendered_variants: List[Tuple[int, int, bytes]],
+    ) -> ImageArtifact:
         if not self.enabled:
             raise RuntimeError("Image storage disabled; cannot persist artifact")
 
@@ -251,58 +376,178 @@ class ImageArtifactStore:
 
         size_bytes = len(image_bytes)
         created_at = datetime.utcnow()
-        storage_path = self._blob_path(session_id, chosen_name, image_type)
+        storage_path, bucket = self._store_bytes(
+            session_id, image_type, chosen_name, image_bytes, mime_type, skip_gcs_upload
+        )
 
         # Always expose backend proxy URL so clients fetch via API
         # Use the /api/images/{path} endpoint which resolves both local and GCS images
         url = f"/api/images/{storage_path}"
-        bucket = None
-        uploaded_to_gcs = False
+
+        variants = self._store_variants(
+            session_id, image_type, chosen_name, rendered_variants, skip_gcs_upload
+        )
+
+        return ImageArtifact(
+            id=artifact_id,
+            session_id=session_id,
+            url=url,
+            mime_type=mime_type,
+            size_bytes=size_bytes,
+            created_at=created_at,
+            storage_path=storage_path,
+            bucket=bucket,
+            image_type=image_type,
+            variants=variants,
+        )
+
+    def _store_variants(
+        self,
+        session_id: str,
+        image_type: str,
+        filename: str,
+        rendered_variants: List[Tuple[int, int, bytes]],
+        skip_gcs_upload: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        variants: Dict[str, Dict[str, Any]] = {}
+        for width, height, data in rendered_variants:
+            name = variant_filename(filename, width)
+            try:
+                variant_path, variant_bucket = self._store_bytes(
+                    session_id, image_type, name, data, VARIANT_MIME_TYPE, skip_gcs_upload
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to store image variant %s: %s", name, exc)
+                continue
+            variants[str(width)] = {
+                "width": width,
+                "height": height,
+                "filename": name,
+                "storage_path": variant_path,
+                "bucket": variant_bucket,
+                "url": f"/api/images/{variant_path}",
+                "mime_type": VARIANT_MIME_TYPE,
+                "size_bytes": len(data),
+            }
+        if variants:
+            self._remember_variants(filename, variants)
+        return variants
+
+    async def add_variants_async(
+        self,
+        *,
+        session_id: str,
+        filename: str,
+        image_type: str = "portrait",
+        mime_type: str = "image/png",
+        image_bytes: Optional[bytes] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Render and store responsive derivatives for an already persisted image.
+
+        Covers images written by ``persist_image`` or by a provider directly.
+        The source is read from storage unless ``image_bytes`` is given.
+
+        Returns:
+            Variant entries keyed by width (empty if variants are disabled)
+        """
+        filename = Path(filename).name
+        if not self.enabled or not self._wants_variants(mime_type):
+            return {}
+        existing = self.get_recent_variants(filename)
+        if existing:
+            return existing
+        if image_bytes is None:
+            image_bytes = await asyncio.to_thread(self.read_artifact_bytes, session_id, filename)
+
+        from gaia.infra.image.image_processing import image_processing_service
+
+        rendered = await image_processing_service.render_variants(
+            image_bytes, self.variant_widths, quality=self.variant_quality
+        )
+        return await asyncio.to_thread(self._store_variants, session_id, image_type, filename, rendered)
+
+    def _store_bytes(
+        self,
+        session_id: str,
+        image_type: str,
+        name: str,
+        data: bytes,
+        mime_type: str,
+        skip_gcs_upload: bool,
+    ) -> Tuple[str, Optional[str]]:
+        """Write one file to GCS, falling back to local storage.
+
+        Returns:
+            (storage_path, bucket) where bucket is None for local files
+        """
+        storage_path = self._blob_path(session_id, name, image_type)
 
         # Try GCS upload first if available
         if self.uses_gcs and not skip_gcs_upload:
             try:
                 blob = self._bucket.blob(storage_path)  # type: ignore[union-attr]
-                blob.upload_from_string(image_bytes, content_type=mime_type)
-                bucket = self.bucket_name
-                uploaded_to_gcs = True
+                blob.upload_from_string(data, content_type=mime_type)
                 logger.debug(
                     "✅ Uploaded %s to GCS: %s (session=%s, bytes=%d, path=%s)",
                     image_type,
-                    chosen_name,
+                    name,
                     session_id,
-                    size_bytes,
+                    len(data),
                     storage_path,
                 )
+                return storage_path, self.bucket_name
             except Exception as exc:
                 logger.error("Failed to upload image artifact to GCS, falling back to local storage: %s", exc)
 
         # Fall back to local storage if GCS upload failed or was skipped
-        if not uploaded_to_gcs:
-            session_dir = self.local_root / session_id
-            type_dir = session_dir / f"{image_type}s"
-            type_dir.mkdir(parents=True, exist_ok=True)
-            file_path = type_dir / chosen_name
-            file_path.write_bytes(image_bytes)
-            logger.debug(
-                "💾 Saved %s to local storage: %s (session=%s, bytes=%d)",
-                image_type,
-                chosen_name,
-                session_id,
-                size_bytes,
-            )
-
-        return ImageArtifact(
-            id=artifact_id,
-            session_id=session_id,
-            url=url,
-            mime_type=mime_type,
-            size_bytes=size_bytes,
-            created_at=created_at,
-            storage_path=storage_path,
-            bucket=bucket,
-            image_type=image_type,
+        session_dir = self.local_root / session_id
+        type_dir = session_dir / f"{image_type}s"
+        type_dir.mkdir(parents=True, exist_ok=True)
+        file_path = type_dir / name
+        file_path.write_bytes(data)
+        logger.debug(
+            "💾 Saved %s to local storage: %s (session=%s, bytes=%d)",
+            image_type,
+            name,
+            session_id,
+            len(data),
         )
+        return storage_path, None
+
+    def _remember_variants(self, filename: str, variants: Dict[str, Dict[str, Any]]) -> None:
+        with self._recent_variants_lock:
+            self._recent_variants[filename] = variants
+            self._recent_variants.move_to_end(filename)
+            while len(self._recent_variants) > _RECENT_VARIANTS_LIMIT:
+                self._recent_variants.popitem(last=False)
+
+    def get_recent_variants(self, filename: str) -> Dict[str, Dict[str, Any]]:
+        """Return variants generated for a recently persisted image, if any.
+
+        Lets metadata recorded after persisting (possibly by another caller)
+        pick up the derivatives without re-reading storage.
+        """
+        with self._recent_variants_lock:
+            return dict(self._recent_variants.get(Path(filename).name, {}))
+
+    def read_variant_bytes(self, session_id: str, variant: Dict[str, Any]) -> bytes:
+        """Read a derivative described by a variant entry.
+
+        Raises:
+            FileNotFoundError: If the variant is missing from its storage
+        """
+        storage_path = variant.get("storage_path")
+        if variant.get("bucket") and self.uses_gcs and storage_path:
+            blob = self._bucket.blob(storage_path)  # type: ignore[union-attr]
+            try:
+                return blob.download_as_bytes()
+            except Exception as exc:
+                raise FileNotFoundError(storage_path) from exc
+
+        local_path = self.resolve_local_path(session_id, variant.get("filename", ""))
+        if not local_path.exists():
+            raise FileNotFoundError(str(local_path))
+        return local_path.read_bytes()
 
     def resolve_local_path(self, session_id: str, filename: str) -> Path:
         """Resolve local filesystem path for an image."""
@@ -409,5 +654,8 @@ __all__ = [
     "ImageArtifact",
     "ImageArtifactStore",
     "ImageStorageType",
+    "VARIANT_MIME_TYPE",
     "image_artifact_store",
+    "select_image_variant",
+    "variant_filename",
 ]
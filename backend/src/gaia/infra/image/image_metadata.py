@@ -2,6 +2,7 @@
 Simple image metadata storage system for preserving prompts and other metadata.
 Stores metadata within campaign folders for better organization.
 """
+import asyncio
 import json
 import os
 import shutil
@@ -171,6 +172,10 @@ class ImageMetadataManager:
             metadata = dict(metadata)
             metadata.setdefault('storage_filename', Path(image_filename).name)
             metadata['campaign_id'] = campaign_id
+            if not metadata.get('variants'):
+                variants = image_artifact_store.get_recent_variants(metadata['storage_filename'])
+                if variants:
+                    metadata['variants'] = variants
             if 'timestamp' not in metadata:
                 metadata['timestamp'] = datetime.now().isoformat()
             artifact = None
@@ -238,6 +243,8 @@ class ImageMetadataManager:
                     metadata["proxy_url"] = artifact.url
                     metadata["gcs_uploaded"] = artifact.bucket is not None
                     metadata["storage_filename"] = Path(artifact.storage_path).name
+                    if artifact.variants:
+                        metadata["variants"] = artifact.variants
                 except Exception as exc:  # noqa: BLE001
                     logger.warning("Failed to persist image %s to media bucket: %s", image_filename, exc)
                     artifact = None
@@ -285,6 +292,56 @@ class ImageMetadataManager:
             logger.error("Error saving metadata: %s", e)
             return False
     
+    async def save_metadata_async(self, image_filename: str, metadata: Dict, campaign_id: str = "default") -> bool:
+        """Async ``save_metadata`` that also gives the image its responsive variants.
+
+        The record is written first; if it has no variants yet they are
+        rendered in the image processing pool and added to the record, so
+        portraits and generated images get WebP derivatives without blocking
+        the event loop.
+        """
+        saved = await asyncio.to_thread(self.save_metadata, image_filename, metadata, campaign_id)
+        if not saved or metadata.get("variants"):
+            return saved
+
+        storage_filename = metadata.get("storage_filename") or Path(image_filename).name
+        mime_type = metadata.get("mime_type") or mimetypes.guess_type(storage_filename)[0] or "image/png"
+        try:
+            variants = await image_artifact_store.add_variants_async(
+                session_id=campaign_id,
+                filename=storage_filename,
+                image_type=metadata.get("type") or ImageStorageType.SCENE.value,
+                mime_type=mime_type,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to render variants for %s: %s", storage_filename, exc)
+            return saved
+        if variants:
+            await asyncio.to_thread(self._record_variants, image_filename, variants, campaign_id)
+        return saved
+
+    def _record_variants(self, image_filename: str, variants: Dict, campaign_id: str) -> None:
+        """Add variant entries to an existing metadata record (local and store copies)."""
+        campaign_dir = self.storage.resolve_session_dir(campaign_id)
+        if campaign_dir is None:
+            return
+        base_name = Path(image_filename).stem
+        metadata_file = campaign_dir / "image_metadata" / f"{base_name}.json"
+        try:
+            with open(metadata_file, 'r') as f:
+                metadata = json.load(f)
+            metadata["variants"] = variants
+            with open(metadata_file, 'w') as f:
+                json.dump(metadata, f, indent=2)
+            if getattr(self.object_store, "enabled", False):
+                self.object_store.write_json(
+                    metadata,
+                    campaign_id,
+                    f"media/images/metadata/{base_name}.json",
+                )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to record variants for %s: %s", image_filename, exc)
+
     def get_metadata(self, image_filename: str, campaign_id: Optional[str] = None) -> Optional[Dict]:
         """Get metadata for an image from a specific campaign or search all campaigns."""
         try:
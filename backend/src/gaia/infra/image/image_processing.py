@@ -0,0 +1,381 @@
+"""Off-event-loop image processing backed by a worker process pool.
+
+PIL decoding, resizing and encoding are CPU bound and hold the GIL, so doing
+them inside an async handler stalls every other coroutine on the loop
+(Socket.IO traffic included). All PIL work goes through
+``image_processing_service``, which runs it in a process pool with a bounded
+number of outstanding jobs, a per-job timeout and basic metrics.
+
+Worker functions are module level so they can be pickled; they take and
+return plain bytes/str/tuples only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _as_bool(value: Optional[str], default: bool) -> bool:
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+IMAGE_PROCESSING_WORKERS = int(
+    os.getenv("IMAGE_PROCESSING_WORKERS", str(min(2, os.cpu_count() or 1)))
+)
+IMAGE_PROCESSING_MAX_PENDING = int(os.getenv("IMAGE_PROCESSING_MAX_PENDING", "16"))
+IMAGE_PROCESSING_TIMEOUT_SECONDS = float(os.getenv("IMAGE_PROCESSING_TIMEOUT_SECONDS", "30"))
+IMAGE_PROCESSING_USE_PROCESSES = _as_bool(os.getenv("IMAGE_PROCESSING_USE_PROCESSES"), True)
+
+
+class ImageProcessingError(RuntimeError):
+    """Raised when an image processing job fails or cannot be scheduled."""
+
+
+class ImageProcessingBusyError(ImageProcessingError):
+    """Raised when the processing queue is full."""
+
+
+class ImageProcessingTimeoutError(ImageProcessingError):
+    """Raised when a job does not finish within its timeout."""
+
+
+# ---------------------------------------------------------------------------
+# Worker functions (run inside the pool)
+# ---------------------------------------------------------------------------
+
+def _composite_horizontal(
+    images: Sequence[bytes],
+    target_height: int,
+) -> Optional[Tuple[bytes, int, int, int]]:
+    """Resize images to a shared height and paste them side by side.
+
+    Images that fail to decode are skipped.
+
+    Returns:
+        (png_bytes, width, height, images_used) or None if nothing decoded
+    """
+    from PIL import Image
+
+    resized_images = []
+    for data in images:
+        try:
+            img = Image.open(BytesIO(data))
+            # Convert to RGB if needed (in case of RGBA/P mode)
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+        except Exception:
+            continue
+        aspect = img.width / img.height
+        new_width = int(target_height * aspect)
+        resized_images.append(img.resize((new_width, target_height), Image.Resampling.LANCZOS))
+
+    if not resized_images:
+        return None
+
+    total_width = sum(img.width for img in resized_images)
+    composite = Image.new("RGB", (total_width, target_height))
+    x_offset = 0
+    for img in resized_images:
+        composite.paste(img, (x_offset, 0))
+        x_offset += img.width
+
+    output = BytesIO()
+    composite.save(output, format="PNG", optimize=True)
+    return output.getvalue(), total_width, target_height, len(resized_images)
+
+
+def _save_base64_image(
+    b64_data: str,
+    filepath: str,
+    image_format: Optional[str],
+    quality: Optional[int],
+) -> str:
+    """Decode base64 image data and write it to ``filepath``.
+
+    When ``image_format`` is None the decoded bytes are written as-is;
+    otherwise the image is decoded with PIL and re-encoded in that format.
+    """
+    image_bytes = base64.b64decode(b64_data)
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if image_format is None:
+        path.write_bytes(image_bytes)
+        return str(path)
+
+    from PIL import Image
+
+    image = Image.open(BytesIO(image_bytes))
+    save_kwargs: Dict[str, Any] = {"format": image_format}
+    if image_format.upper() in {"JPEG", "JPG"}:
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        save_kwargs["quality"] = quality or 95
+    elif quality is not None:
+        save_kwargs["quality"] = quality
+    image.save(path, **save_kwargs)
+    return str(path)
+
+
+def render_image_variants(
+    image_bytes: bytes,
+    widths: Sequence[int],
+    image_format: str = "WEBP",
+    quality: int = 80,
+) -> List[Tuple[int, int, bytes]]:
+    """Encode downscaled copies of an image for responsive serving.
+
+    One variant is produced for every requested width smaller than the
+    original, plus one at the original width so clients that accept the
+    variant format can skip the full-size original entirely.
+
+    Returns:
+        List of (width, height, encoded_bytes), smallest first
+    """
+    from PIL import Image
+
+    image = Image.open(BytesIO(image_bytes))
+    image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = image.mode in ("LA", "PA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    original_width, original_height = image.size
+    targets = sorted({w for w in widths if 0 < w < original_width} | {original_width})
+
+    variants: List[Tuple[int, int, bytes]] = []
+    for width in targets:
+        height = max(1, round(original_height * width / original_width))
+        resized = image if width == original_width else image.resize(
+            (width, height), Image.Resampling.LANCZOS
+        )
+        output = BytesIO()
+        resized.save(output, format=image_format, quality=quality)
+        variants.append((width, height, output.getvalue()))
+    return variants
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+class ImageProcessingService:
+    """Run PIL work in a worker pool with bounded admission and timeouts."""
+
+    def __init__(
+        self,
+        max_workers: int = IMAGE_PROCESSING_WORKERS,
+        max_pending: int = IMAGE_PROCESSING_MAX_PENDING,
+        timeout_seconds: float = IMAGE_PROCESSING_TIMEOUT_SECONDS,
+        use_processes: bool = IMAGE_PROCESSING_USE_PROCESSES,
+    ) -> None:
+        """Initialize the service; the pool itself is created on first use.
+
+        Args:
+            max_workers: Worker processes (or threads) in the pool
+            max_pending: Jobs allowed in flight or waiting; further submissions
+                wait for a slot and fail with ImageProcessingBusyError if none
+                frees up within the timeout
+            timeout_seconds: Default time limit for a job, including queueing
+            use_processes: Use a process pool (threads when False)
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(self.max_workers, max_pending)
+        self.timeout_seconds = timeout_seconds
+        self.use_processes = use_processes
+        self.metrics: Counter[str] = Counter()
+        self._busy_seconds = 0.0
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pending = 0
+        self._stats_lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._executor_lock:
+            if self._executor is None:
+                if self.use_processes:
+                    try:
+                        # spawn: forking a multi-threaded server process is unsafe
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            mp_context=multiprocessing.get_context("spawn"),
+                        )
+                    except (OSError, NotImplementedError) as exc:
+                        logger.warning(
+                            "Process pool unavailable for image processing (%s); using threads",
+                            exc,
+                        )
+                        self.use_processes = False
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="image-processing",
+                    )
+            return self._executor
+
+    async def _acquire_slot(self, timeout: float) -> None:
+        if self._slots.acquire(blocking=False):
+            return
+        # Queue is full: wait off-loop for a slot rather than blocking the loop
+        waiter = asyncio.ensure_future(asyncio.to_thread(self._slots.acquire, True, timeout))
+        try:
+            acquired = await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            # The waiting thread can't be interrupted; hand back any slot it gets
+            def _give_back(done) -> None:
+                if not done.cancelled() and done.exception() is None and done.result():
+                    self._slots.release()
+
+            waiter.add_done_callback(_give_back)
+            raise
+        if not acquired:
+            self.metrics["jobs_rejected_total"] += 1
+            raise ImageProcessingBusyError(
+                f"Image processing queue full ({self.max_pending} jobs pending)"
+            )
+
+    async def run(self, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """Run ``func(*args)`` in the pool and return its result.
+
+        Raises:
+            ImageProcessingBusyError: No queue slot became free in time
+            ImageProcessingTimeoutError: The job exceeded its timeout
+            ImageProcessingError: The job raised or the pool broke
+        """
+        timeout = self.timeout_seconds if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        await self._acquire_slot(timeout)
+
+        with self._stats_lock:
+            self._pending += 1
+        self.metrics["jobs_submitted_total"] += 1
+        started = time.monotonic()
+        try:
+            future = self._get_executor().submit(func, *args)
+        except (BrokenProcessPool, RuntimeError) as exc:
+            with self._stats_lock:
+                self._pending -= 1
+            self._slots.release()
+            self.shutdown()
+            self.metrics["jobs_failed_total"] += 1
+            raise ImageProcessingError(f"Image processing pool unavailable: {exc}") from exc
+
+        def _release(_future) -> None:
+            # The slot is held until the worker actually finishes, even if the
+            # caller timed out, so the bound reflects real pool load
+            with self._stats_lock:
+                self._pending -= 1
+                self._busy_seconds += time.monotonic() - started
+            self._slots.release()
+
+        future.add_done_callback(_release)
+
+        try:
+            remaining = max(0.0, deadline - time.monotonic())
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=remaining)
+        except asyncio.TimeoutError as exc:
+            future.cancel()
+            self.metrics["jobs_timed_out_total"] += 1
+            raise ImageProcessingTimeoutError(
+                f"{getattr(func, '__name__', 'image job')} exceeded {timeout:.1f}s"
+            ) from exc
+        except BrokenProcessPool as exc:
+            self.shutdown()
+            self.metrics["jobs_failed_total"] += 1
+            raise ImageProcessingError(f"Image processing worker crashed: {exc}") from exc
+        except Exception as exc:
+            self.metrics["jobs_failed_total"] += 1
+            raise ImageProcessingError(str(exc)) from exc
+
+        self.metrics["jobs_completed_total"] += 1
+        return result
+
+    async def composite_horizontal(
+        self,
+        images: List[bytes],
+        target_height: int = 512,
+    ) -> Optional[Tuple[bytes, int, int, int]]:
+        """Build a horizontal PNG composite; see ``_composite_horizontal``."""
+        return await self.run(_composite_horizontal, list(images), target_height)
+
+    async def render_variants(
+        self,
+        image_bytes: bytes,
+        widths: Sequence[int],
+        image_format: str = "WEBP",
+        quality: int = 80,
+    ) -> List[Tuple[int, int, bytes]]:
+        """Render responsive variants; see ``render_image_variants``."""
+        return await self.run(render_image_variants, image_bytes, list(widths), image_format, quality)
+
+    async def save_base64_image(
+        self,
+        b64_data: str,
+        filepath: str,
+        image_format: Optional[str] = "PNG",
+        quality: Optional[int] = None,
+    ) -> str:
+        """Decode base64 image data and write it to disk in a worker.
+
+        Args:
+            b64_data: Base64-encoded image data
+            filepath: Destination path (parent directories are created)
+            image_format: PIL format to re-encode to, or None to write the
+                decoded bytes unchanged
+            quality: Encoder quality for lossy formats
+
+        Returns:
+            The path written
+        """
+        return await self.run(_save_base64_image, b64_data, filepath, image_format, quality)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return counters plus current pool state."""
+        metrics: Dict[str, Any] = dict(self.metrics)
+        metrics.update(
+            {
+                "pending_jobs": self._pending,
+                "max_pending": self.max_pending,
+                "workers": self.max_workers,
+                "mode": "process" if self.use_processes else "thread",
+                "busy_seconds_total": round(self._busy_seconds, 3),
+            }
+        )
+        return metrics
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pool; it is recreated on the next job."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global singleton instance
+image_processing_service = ImageProcessingService()
+
+__all__ = [
+    "ImageProcessingBusyError",
+    "ImageProcessingError",
+    "ImageProcessingService",
+    "ImageProcessingTimeoutError",
+    "image_processing_service",
+    "render_image_variants",
+]
@@ -8,6 +8,7 @@ import logging
 from typing import Optional, Dict, Any, List
 from gaia.infra.image.image_provider import ImageProvider
 from gaia.infra.image.image_config import get_image_config
+from gaia.infra.image.generation_cache import ImageGenerationCache, generation_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,7 @@ class ImageServiceManager:
         self.providers: Dict[str, ImageProvider] = {}
         self._providers_initialized = False
         self._runware_pool = None  # Lazy-initialized pool for parallel generation
+        self.generation_cache = ImageGenerationCache.from_env()
         self._register_providers()
 
     def _register_providers(self):
@@ -174,12 +176,15 @@ class ImageServiceManager:
         guidance_scale: Optional[float] = None,
         num_inference_steps: Optional[int] = None,
         model: Optional[str] = None,
+        use_cache: bool = True,
         **kwargs
     ) -> Dict[str, Any]:
         """
         Generate image using the appropriate provider.
 
         Routes to provider based on model parameter or current configuration.
+        Identical concurrent requests share one provider call, and seeded
+        requests are served from the generation cache when possible.
 
         Args:
             prompt: Text description of the image
@@ -192,6 +197,7 @@ class ImageServiceManager:
             guidance_scale: How closely to follow the prompt (optional)
             num_inference_steps: Number of denoising steps (optional)
             model: Specific model to use (optional - will use config if not specified)
+            use_cache: Set False to always call the provider
             **kwargs: Provider-specific additional parameters
 
         Returns:
@@ -201,7 +207,9 @@ class ImageServiceManager:
                 "images": [...],
                 "provider": str,
                 "model": str,
-                "error": str (if success=False)
+                "error": str (if success=False),
+                "cache_key": str, "cache_status": str (when the cache is enabled),
+                "artifact": dict (cache hits that point at a stored artifact)
             }
         """
         # Resolve model_key if not specified
@@ -220,21 +228,33 @@ class ImageServiceManager:
                 "provider": "none"
             }
 
+        params = dict(
+            prompt=prompt,
+            width=width,
+            height=height,
+            n=n,
+            response_format=response_format,
+            negative_prompt=negative_prompt,
+            seed=seed,
+            guidance_scale=guidance_scale,
+            num_inference_steps=num_inference_steps,
+            model=model_key,
+            **kwargs
+        )
+        if not use_cache:
+            return await self._generate_with_provider(provider, params)
+
+        key = generation_cache_key(provider=provider.get_provider_name(), **params)
+        return await self.generation_cache.get_or_generate(
+            key,
+            lambda: self._generate_with_provider(provider, params),
+            store=self.generation_cache.should_store(seed),
+        )
+
+    async def _generate_with_provider(self, provider: ImageProvider, params: Dict[str, Any]) -> Dict[str, Any]:
         # Route to provider with the resolved model_key
         try:
-            result = await provider.generate_image(
-                prompt=prompt,
-                width=width,
-                height=height,
-                n=n,
-                response_format=response_format,
-                negative_prompt=negative_prompt,
-                seed=seed,
-                guidance_scale=guidance_scale,
-                num_inference_steps=num_inference_steps,
-                model=model_key,
-                **kwargs
-            )
+            result = await provider.generate_image(**params)
             return result
         except Exception as e:
             logger.error(f"Error generating image: {e}")
@@ -448,7 +468,9 @@ class ImageServiceManager:
         if pool and pool.is_available():
             # Use the pool for parallel generation
             logger.debug("Using Runware pool for parallel generation")
-            return await pool.generate_images_parallel(requests)
+            if not self.generation_cache.enabled:
+                return await pool.generate_images_parallel(requests)
+            return await asyncio.gather(*[self._generate_with_pool(pool, req) for req in requests])
 
         # Fallback: use asyncio.gather with the standard provider
         # Note: This may still be serialized if the provider has a semaphore
@@ -476,6 +498,34 @@ class ImageServiceManager:
 
         return results
 
+    async def _generate_with_pool(self, pool, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate one pooled request through the generation cache."""
+        request = dict(request)
+        use_cache = request.pop("use_cache", True)
+
+        async def generate() -> Dict[str, Any]:
+            try:
+                return await pool.generate_image(**request)
+            except Exception as e:
+                logger.error(f"Pooled image generation failed: {e}")
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "images": [],
+                    "provider": "runware"
+                }
+
+        if not use_cache:
+            return await generate()
+        key = generation_cache_key(provider="runware", **request)
+        return await self.generation_cache.get_or_generate(
+            key, generate, store=self.generation_cache.should_store(request.get("seed"))
+        )
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit rates and sizes of the generation cache."""
+        return self.generation_cache.stats()
+
     async def disconnect_pools(self) -> None:
         """Disconnect any active client pools.
 
@@ -17,10 +17,10 @@ import asyncio
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import warnings
-from PIL import Image
 import io
 from dataclasses import dataclass, field
 from gaia.infra.image.image_provider import ImageProvider, ProviderCapabilities
+from gaia.infra.image.image_processing import image_processing_service
 
 logger = logging.getLogger(__name__)
 
@@ -717,16 +717,12 @@ class FluxLocalImageService(ImageProvider):
             # Create output directory
             Path(output_dir).mkdir(parents=True, exist_ok=True)
             
-            # Decode base64 to image
-            image_bytes = base64.b64decode(b64_data)
-            image = Image.open(io.BytesIO(image_bytes))
-            
             # Generate filename
             filename = f"flux_image_{int(time.time() * 1000)}.png"
             filepath = Path(output_dir) / filename
             
-            # Save image
-            image.save(filepath, format='PNG')
+            # Decode and re-encode in the image processing pool (off the event loop)
+            await image_processing_service.save_base64_image(b64_data, str(filepath), image_format="PNG")
             
             logger.info(f"Saved image to: {filepath}")
             return str(filepath)
@@ -28,6 +28,7 @@ import io
 from PIL import Image
 from io import BytesIO
 from gaia.infra.image.image_provider import ImageProvider, ProviderCapabilities
+from gaia.infra.image.image_processing import image_processing_service
 
 logger = logging.getLogger(__name__)
 
@@ -407,10 +408,8 @@ Enhanced prompt (be specific and visual):"""
             filename = f"gemini_image_{int(time.time() * 1000)}.png"
             filepath = Path(output_dir) / filename
             
-            # Decode and save
-            image_data = base64.b64decode(b64_data)
-            with open(filepath, 'wb') as f:
-                f.write(image_data)
+            # Decode and save in the image processing pool (off the event loop)
+            await image_processing_service.save_base64_image(b64_data, str(filepath), image_format=None)
             
             logger.info(f"Saved base64 image to: {filepath}")
             return str(filepath)
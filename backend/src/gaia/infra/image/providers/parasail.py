@@ -5,11 +5,11 @@ Handles image generation using Parasail API via OpenAI Batch
 
 import os
 import logging
-import base64
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import time
 from openai import AsyncOpenAI
+from gaia.infra.image.image_processing import image_processing_service
 
 logger = logging.getLogger(__name__)
 
@@ -99,10 +99,8 @@ class ParasailImageService:
             filename = f"parasail_image_{int(time.time() * 1000)}.png"
             filepath = Path(output_dir) / filename
             
-            # Decode and save
-            image_data = base64.b64decode(b64_data)
-            with open(filepath, 'wb') as f:
-                f.write(image_data)
+            # Decode and save in the image processing pool (off the event loop)
+            await image_processing_service.save_base64_image(b64_data, str(filepath), image_format=None)
             
             logger.info(f"Saved base64 image to: {filepath}")
             return str(filepath)
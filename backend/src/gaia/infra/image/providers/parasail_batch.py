@@ -5,15 +5,13 @@ Handles image generation using Parasail Batch API with OmniGen model
 
 import os
 import logging
-import base64
 import json
 import time
 import asyncio
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 from openai import AsyncOpenAI
-from PIL import Image
-import io
+from gaia.infra.image.image_processing import image_processing_service
 
 logger = logging.getLogger(__name__)
 
@@ -275,18 +273,14 @@ class ParasailBatchImageService:
             # Create output directory
             Path(output_dir).mkdir(parents=True, exist_ok=True)
             
-            # Decode base64 to image
-            image_bytes = base64.b64decode(b64_data)
-            image = Image.open(io.BytesIO(image_bytes))
-            
             # Generate filename
             filename = f"parasail_batch_image_{int(time.time() * 1000)}.jpg"
             filepath = Path(output_dir) / filename
             
-            # Convert to RGB if necessary and save as JPEG
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            image.save(filepath, format='JPEG', quality=95)
+            # Convert to RGB and save as JPEG in the image processing pool
+            await image_processing_service.save_base64_image(
+                b64_data, str(filepath), image_format="JPEG", quality=95
+            )
             
             logger.info(f"Saved image to: {filepath}")
             return str(filepath)
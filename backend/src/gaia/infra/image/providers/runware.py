@@ -16,11 +16,11 @@ from typing import Optional, Dict, Any, List
 from pathlib import Path
 import time
 import base64
-from io import BytesIO
-from PIL import Image
 import aiohttp
 from dataclasses import dataclass, field
 from gaia.infra.image.image_provider import ImageProvider, ProviderCapabilities
+from gaia.infra.image.image_processing import image_processing_service
+from gaia.utils.lazy_imports import lazy_module, module_available
 
 logger = logging.getLogger(__name__)
 
@@ -89,22 +89,11 @@ RUNWARE_PROVIDER = RunwareProviderInfo(
     models=RUNWARE_MODELS
 )
 
-# Import Runware SDK
-try:
-    from runware import Runware, IImageInference, IImageUpscale, IImageBackgroundRemoval
-    RUNWARE_AVAILABLE = True
-except ImportError:
+# Runware SDK (and its websocket stack) is imported on first connection
+_runware = lazy_module("runware")
+RUNWARE_AVAILABLE = module_available("runware")
+if not RUNWARE_AVAILABLE:
     logger.warning("Runware SDK not available. Install with: pip install runware")
-    RUNWARE_AVAILABLE = False
-    # Create dummy classes for type hints
-    class Runware:
-        pass
-    class IImageInference:
-        pass
-    class IImageUpscale:
-        pass
-    class IImageBackgroundRemoval:
-        pass
 
 
 class RunwareImageService(ImageProvider):
@@ -205,7 +194,7 @@ class RunwareImageService(ImageProvider):
 
             # Create new client and connect
             logger.debug("Establishing new Runware WebSocket connection...")
-            self.client = Runware(api_key=self.api_key)
+            self.client = _runware.Runware(api_key=self.api_key)
             await self.client.connect()
 
             # Verify authentication succeeded
@@ -432,7 +421,7 @@ class RunwareImageService(ImageProvider):
                     request_params["outputQuality"] = resolved_output_quality
 
                 logger.info(f"Request params: {request_params}")
-                request = IImageInference(**request_params)
+                request = _runware.IImageInference(**request_params)
 
                 # Generate images
                 start_time = time.time()
@@ -555,7 +544,7 @@ class RunwareImageService(ImageProvider):
         try:
             await self.connect()
             
-            request = IImageUpscale(
+            request = _runware.IImageUpscale(
                 inputImage=image_url,
                 upscaleFactor=upscale_factor
             )
@@ -596,7 +585,7 @@ class RunwareImageService(ImageProvider):
         try:
             await self.connect()
             
-            request = IImageBackgroundRemoval(
+            request = _runware.IImageBackgroundRemoval(
                 image_initiator=image_path
             )
             
@@ -782,16 +771,12 @@ class RunwareImageService(ImageProvider):
             # Create output directory
             Path(output_dir).mkdir(parents=True, exist_ok=True)
             
-            # Decode base64 to image
-            image_bytes = base64.b64decode(b64_data)
-            image = Image.open(BytesIO(image_bytes))
-            
             # Generate filename
             filename = f"runware_image_{int(time.time() * 1000)}.png"
             filepath = Path(output_dir) / filename
             
-            # Save image
-            image.save(filepath, format='PNG')
+            # Decode and re-encode in the image processing pool (off the event loop)
+            await image_processing_service.save_base64_image(b64_data, str(filepath), image_format="PNG")
             
             logger.info(f"Saved image to: {filepath}")
             return str(filepath)
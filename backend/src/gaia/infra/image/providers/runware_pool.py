@@ -10,13 +10,55 @@ parallelism instead of serialized requests through a single connection.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
 
 from gaia.infra.image.providers.runware import RunwareImageService, RUNWARE_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PooledClient:
+    """A pool client plus its checkout bookkeeping."""
+    index: int
+    client: RunwareImageService
+    created_at: float = field(default_factory=time.monotonic)
+    in_use: bool = False
+    retired: bool = False
+    checkouts: int = 0
+    busy_seconds: float = 0.0
+    _busy_since: Optional[float] = None
+
+    def mark_busy(self) -> None:
+        self.in_use = True
+        self.checkouts += 1
+        self._busy_since = time.monotonic()
+
+    def mark_idle(self) -> None:
+        if self._busy_since is not None:
+            self.busy_seconds += time.monotonic() - self._busy_since
+        self.in_use = False
+        self._busy_since = None
+
+    def status(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        busy = self.busy_seconds + (now - self._busy_since if self._busy_since else 0.0)
+        lifetime = max(now - self.created_at, 1e-9)
+        return {
+            "index": self.index,
+            "in_use": self.in_use,
+            "retired": self.retired,
+            "checkouts": self.checkouts,
+            "busy_seconds": round(busy, 3),
+            "utilization": round(min(1.0, busy / lifetime), 3),
+        }
+
+
 class RunwareClientPool:
     """Pool of Runware clients for parallel image generation.
 
@@ -24,6 +66,12 @@ class RunwareClientPool:
     single connection. This pool maintains multiple independent clients,
     each with its own WebSocket connection, enabling true parallel generation.
 
+    Each call checks out exactly one idle client, preferring the least
+    loaded (lowest cumulative busy time). When every client is busy, callers
+    wait in FIFO order and a returning client is handed straight to the
+    oldest waiter, so no client is ever shared and none sits idle while
+    requests wait.
+
     Usage:
         pool = RunwareClientPool(pool_size=3)
 
@@ -39,29 +87,47 @@ class RunwareClientPool:
         clients: List of initialized RunwareImageService instances
     """
 
-    DEFAULT_POOL_SIZE = 3
+    DEFAULT_POOL_SIZE = int(os.getenv("RUNWARE_POOL_SIZE", "3"))
 
     def __init__(self, pool_size: Optional[int] = None):
         """Initialize the client pool.
 
         Args:
-            pool_size: Number of clients in the pool. Defaults to 3.
-                      More clients = more parallelism but more connections.
+            pool_size: Number of clients in the pool. Defaults to
+                      RUNWARE_POOL_SIZE (3). More clients = more parallelism
+                      but more connections. Can be changed with resize().
         """
         self.pool_size = pool_size or self.DEFAULT_POOL_SIZE
-        self.clients: List[RunwareImageService] = []
-        self._client_locks: List[asyncio.Lock] = []
+        self._slots: List[_PooledClient] = []
+        self._waiters: Deque[asyncio.Future] = deque()
         self._pool_lock = asyncio.Lock()
         self._initialized = False
+        self._next_index = 0
 
         logger.info(f"RunwareClientPool created with pool_size={self.pool_size}")
 
+    @property
+    def clients(self) -> List[RunwareImageService]:
+        return [slot.client for slot in self._slots]
+
     def is_available(self) -> bool:
         """Check if Runware is available (SDK installed and API key configured)."""
         # Create a temporary client to check availability
         temp_client = RunwareImageService()
         return temp_client.is_available()
 
+    def _add_clients(self, count: int) -> int:
+        added = 0
+        for _ in range(count):
+            client = RunwareImageService()
+            if not client.is_available():
+                logger.warning(f"Could not create Runware client {self._next_index + 1} - not available")
+                break
+            self._slots.append(_PooledClient(index=self._next_index, client=client))
+            self._next_index += 1
+            added += 1
+        return added
+
     async def _ensure_initialized(self) -> None:
         """Lazily initialize the client pool on first use."""
         if self._initialized:
@@ -73,50 +139,116 @@ class RunwareClientPool:
                 return
 
             logger.info(f"Initializing Runware client pool with {self.pool_size} clients...")
+            self._add_clients(self.pool_size)
 
-            for i in range(self.pool_size):
-                client = RunwareImageService()
-                if client.is_available():
-                    self.clients.append(client)
-                    self._client_locks.append(asyncio.Lock())
-                    logger.debug(f"Created Runware client {i + 1}/{self.pool_size}")
-                else:
-                    logger.warning(f"Could not create Runware client {i + 1} - not available")
-                    break
-
-            if self.clients:
-                logger.info(f"✅ Runware client pool initialized with {len(self.clients)} clients")
+            if self._slots:
+                logger.info(f"✅ Runware client pool initialized with {len(self._slots)} clients")
             else:
                 logger.warning("⚠️ No Runware clients available in pool")
 
             self._initialized = True
 
-    async def _get_available_client(self) -> tuple[int, RunwareImageService, asyncio.Lock]:
-        """Get the next available client from the pool.
+    def _pick_idle(self) -> Optional[_PooledClient]:
+        idle = [slot for slot in self._slots if not slot.in_use and not slot.retired]
+        if not idle:
+            return None
+        return min(idle, key=lambda slot: (slot.busy_seconds, slot.checkouts, slot.index))
+
+    def _serve_waiters(self) -> None:
+        """Hand idle clients to waiting callers, oldest first."""
+        while self._waiters:
+            slot = self._pick_idle()
+            if slot is None:
+                return
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue  # Caller was cancelled while waiting
+            slot.mark_busy()
+            waiter.set_result(slot)
 
-        Uses a simple strategy: try to acquire locks in order, use first available.
-        If all are busy, wait for the first one.
-
-        Returns:
-            Tuple of (client_index, client, lock)
+    async def _checkout(self) -> _PooledClient:
+        """Check out the least-loaded idle client, waiting if all are busy.
 
         Raises:
             RuntimeError: If no clients are available in the pool
         """
         await self._ensure_initialized()
 
-        if not self.clients:
+        if not self._slots:
             raise RuntimeError("No Runware clients available in pool")
 
-        # Try to find an immediately available client
-        for i, (client, lock) in enumerate(zip(self.clients, self._client_locks)):
-            if not lock.locked():
-                return (i, client, lock)
-
-        # All clients busy - wait for the first one
-        # This ensures fair queuing
-        lock = self._client_locks[0]
-        return (0, self.clients[0], lock)
+        # Don't overtake callers that are already waiting
+        slot = None if self._waiters else self._pick_idle()
+        if slot is not None:
+            slot.mark_busy()
+            return slot
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Got a client just as we were cancelled; give it back
+                self._checkin(waiter.result())
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def _checkin(self, slot: _PooledClient) -> None:
+        slot.mark_idle()
+        if slot.retired:
+            self._drop(slot)
+        self._serve_waiters()
+
+    def _drop(self, slot: _PooledClient) -> None:
+        if slot in self._slots:
+            self._slots.remove(slot)
+            asyncio.get_running_loop().create_task(self._disconnect(slot))
+
+    @staticmethod
+    async def _disconnect(slot: _PooledClient) -> None:
+        try:
+            await slot.client.disconnect()
+            logger.debug(f"Disconnected pool client {slot.index}")
+        except Exception as e:
+            logger.warning(f"Error disconnecting pool client {slot.index}: {e}")
+
+    @asynccontextmanager
+    async def _lease(self) -> AsyncIterator[_PooledClient]:
+        slot = await self._checkout()
+        try:
+            yield slot
+        finally:
+            self._checkin(slot)
+
+    async def resize(self, pool_size: int) -> None:
+        """Change the number of clients while the pool is in use.
+
+        Growing connects new clients and hands them to waiting callers.
+        Shrinking retires the surplus clients; busy ones finish their
+        current request first.
+        """
+        pool_size = max(1, pool_size)
+        await self._ensure_initialized()
+        async with self._pool_lock:
+            self.pool_size = pool_size
+            active = [slot for slot in self._slots if not slot.retired]
+            if pool_size > len(active):
+                added = self._add_clients(pool_size - len(active))
+                logger.info(f"Runware pool grown by {added} to {len(active) + added} clients")
+            elif pool_size < len(active):
+                # Retire idle clients first, then the most recently added
+                surplus = sorted(active, key=lambda slot: (slot.in_use, -slot.index))[:len(active) - pool_size]
+                for slot in surplus:
+                    slot.retired = True
+                    if not slot.in_use:
+                        self._drop(slot)
+                logger.info(f"Runware pool shrunk to {pool_size} clients")
+            self._serve_waiters()
 
     async def generate_image(
         self,
@@ -157,12 +289,11 @@ class RunwareClientPool:
             - provider: "runware"
             - client_index: which pool client was used (for debugging)
         """
-        client_idx, client, lock = await self._get_available_client()
-
-        async with lock:
+        async with self._lease() as slot:
+            client_idx = slot.index
             logger.debug(f"🎨 Pool client {client_idx} generating: {prompt[:50]}...")
 
-            result = await client.generate_image(
+            result = await slot.client.generate_image(
                 prompt=prompt,
                 width=width,
                 height=height,
@@ -240,15 +371,15 @@ class RunwareClientPool:
         """
         logger.info("Disconnecting all Runware pool clients...")
 
-        for i, client in enumerate(self.clients):
-            try:
-                await client.disconnect()
-                logger.debug(f"Disconnected pool client {i}")
-            except Exception as e:
-                logger.warning(f"Error disconnecting pool client {i}: {e}")
+        for slot in self._slots:
+            await self._disconnect(slot)
+
+        waiters, self._waiters = self._waiters, deque()
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(RuntimeError("Runware client pool was shut down"))
 
-        self.clients = []
-        self._client_locks = []
+        self._slots = []
         self._initialized = False
 
         logger.info("All Runware pool clients disconnected")
@@ -257,16 +388,20 @@ class RunwareClientPool:
         """Get current status of the client pool.
 
         Returns:
-            Dict with pool status information
+            Dict with pool status information, including per-client
+            checkouts, busy time and utilization
         """
-        busy_count = sum(1 for lock in self._client_locks if lock.locked())
+        active = [slot for slot in self._slots if not slot.retired]
+        busy_count = sum(1 for slot in active if slot.in_use)
 
         return {
             "pool_size": self.pool_size,
             "initialized": self._initialized,
-            "active_clients": len(self.clients),
+            "active_clients": len(active),
             "busy_clients": busy_count,
-            "available_clients": len(self.clients) - busy_count,
+            "available_clients": len(active) - busy_count,
+            "waiting_requests": sum(1 for waiter in self._waiters if not waiter.done()),
+            "clients": [slot.status() for slot in self._slots],
             "sdk_available": RUNWARE_AVAILABLE,
         }
 
@@ -13,6 +13,7 @@ for fast access during active sessions.
 
 import json
 import logging
+import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -21,9 +22,14 @@ from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
 from gaia_private.session.session_storage import SessionStorage
+from gaia.utils.bounded_cache import BoundedCache
 
 logger = logging.getLogger(__name__)
 
+# Campaigns whose sets are kept in memory; others are reloaded from disk on demand
+SCENE_IMAGE_SET_CACHE_CAMPAIGNS = int(os.getenv("SCENE_IMAGE_SET_CACHE_CAMPAIGNS", "200"))
+SCENE_IMAGE_SET_CACHE_TTL_SECONDS = float(os.getenv("SCENE_IMAGE_SET_CACHE_TTL_SECONDS", "3600"))
+
 
 class ImageType(str, Enum):
     """Scene image types generated by the Visual Narrator.
@@ -190,10 +196,24 @@ class SceneImageSetManager:
     def __init__(self) -> None:
         """Initialize the manager with empty in-memory cache."""
         self._sets: Dict[str, SceneImageSet] = {}  # set_id -> SceneImageSet
-        self._campaign_sets: Dict[str, List[str]] = {}  # campaign_id -> [set_ids]
+        # campaign_id -> [set_ids]; evicting a campaign drops its sets too
+        self._campaign_sets: BoundedCache[str, List[str]] = BoundedCache(
+            "scene_image_set_campaigns",
+            max_entries=SCENE_IMAGE_SET_CACHE_CAMPAIGNS,
+            ttl_seconds=SCENE_IMAGE_SET_CACHE_TTL_SECONDS,
+        )
+        self._campaign_sets.add_invalidation_hook(self._forget_campaign)
         self._loaded_campaigns: set[str] = set()  # Track which campaigns we've loaded
         self._storage = SessionStorage(ensure_legacy_dirs=True)
 
+    def _forget_campaign(self, campaign_id: str, set_ids: List[str], reason: str) -> None:
+        """Drop a campaign's sets from memory; they are persisted and reload on demand."""
+        if reason == "replaced":
+            return
+        for set_id in set_ids:
+            self._sets.pop(set_id, None)
+        self._loaded_campaigns.discard(campaign_id)
+
     def _get_sets_dir(self, campaign_id: str) -> Optional[Path]:
         """Get the scene_image_sets directory for a campaign."""
         campaign_dir = self._storage.resolve_session_dir(campaign_id, create=True)
@@ -234,7 +254,7 @@ class SceneImageSetManager:
 
     def _load_campaign_sets(self, campaign_id: str) -> None:
         """Load all scene image sets for a campaign from disk into memory."""
-        if campaign_id in self._loaded_campaigns:
+        if campaign_id in self._loaded_campaigns and campaign_id in self._campaign_sets:
             return  # Already loaded
 
         sets_dir = self._get_sets_dir(campaign_id)
@@ -257,14 +277,13 @@ class SceneImageSetManager:
         loaded_sets.sort(key=lambda s: s.created_at)
 
         # Populate in-memory cache
-        if campaign_id not in self._campaign_sets:
-            self._campaign_sets[campaign_id] = []
+        campaign_set_ids = self._campaign_sets.setdefault(campaign_id, [])
 
         for image_set in loaded_sets:
             if image_set.set_id not in self._sets:
                 self._sets[image_set.set_id] = image_set
-                if image_set.set_id not in self._campaign_sets[campaign_id]:
-                    self._campaign_sets[campaign_id].append(image_set.set_id)
+                if image_set.set_id not in campaign_set_ids:
+                    campaign_set_ids.append(image_set.set_id)
 
         self._loaded_campaigns.add(campaign_id)
         logger.info(f"Loaded {len(loaded_sets)} scene image sets for campaign {campaign_id}")
@@ -319,9 +338,7 @@ class SceneImageSetManager:
         self._sets[set_id] = image_set
 
         # Track by campaign
-        if campaign_id not in self._campaign_sets:
-            self._campaign_sets[campaign_id] = []
-        self._campaign_sets[campaign_id].append(set_id)
+        self._campaign_sets.setdefault(campaign_id, []).append(set_id)
 
         # Persist to disk
         self._persist_set(image_set)
@@ -360,10 +377,9 @@ class SceneImageSetManager:
                     image_set = SceneImageSet.from_dict(data)
                     # Cache it
                     self._sets[set_id] = image_set
-                    if session_id not in self._campaign_sets:
-                        self._campaign_sets[session_id] = []
-                    if set_id not in self._campaign_sets[session_id]:
-                        self._campaign_sets[session_id].append(set_id)
+                    campaign_set_ids = self._campaign_sets.setdefault(session_id, [])
+                    if set_id not in campaign_set_ids:
+                        campaign_set_ids.append(set_id)
                     return image_set
                 except Exception as e:
                     logger.warning(f"Failed to load scene image set {set_id}: {e}")
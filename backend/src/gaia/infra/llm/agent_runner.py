@@ -1,13 +1,16 @@
 """
 Generic agent runner that handles agent execution with proper model configuration.
 """
+import json
 import logging
 from typing import Any, Optional, Dict, TypeVar
 from agents import Agent, ModelSettings, Runner, RunConfig
 from pydantic import ValidationError
 from pydantic.type_adapter import TypeAdapter
 from gaia.infra.llm.model_manager import create_model_provider_for_model
+from gaia.infra.llm.response_cache import llm_response_cache
 from gaia.utils.json_sanitizer import sanitize_json_string
+from gaia.utils.streaming_json import repair_json_object
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +45,13 @@ class AgentRunner:
                         if "Invalid JSON" in str(e) or "control character" in str(e):
                             logger.debug(f"JSON validation failed, attempting sanitization: {str(e)[:200]}")
                             try:
-                                sanitized_json = sanitize_json_string(json_str)
+                                # Single-pass repair for complete object documents;
+                                # anything else (arrays, truncated output) goes to the sanitizer
+                                repaired = repair_json_object(json_str)
+                                if repaired is not None:
+                                    sanitized_json = json.dumps(repaired, ensure_ascii=False)
+                                else:
+                                    sanitized_json = sanitize_json_string(json_str)
                                 logger.debug("JSON sanitized successfully, retrying validation")
                                 return agents_json._original_validate_json(sanitized_json, type_adapter, partial)
                             except Exception as e2:
@@ -72,6 +81,7 @@ class AgentRunner:
         parallel_tool_calls: bool = False,
         max_turns: Optional[int] = None,
         context: Optional[Any] = None,
+        bypass_cache: bool = False,
         **kwargs
     ) -> Any:
         """Run an agent using the Runner pattern with proper model configuration.
@@ -85,10 +95,15 @@ class AgentRunner:
             parallel_tool_calls: Whether to allow parallel tool calls
             max_turns: Maximum number of turns for the agent (default None uses Runner's default)
             context: Optional context object to pass to tools and hooks
+            bypass_cache: Skip the response cache for this call even if enabled
             **kwargs: Additional keyword arguments for ModelSettings
 
         Returns:
             The result from the agent run
+
+        Note:
+            When ``llm_response_cache`` is enabled, runs without a context object
+            are served from the cache if an identical call was made recently.
         """
         # Apply JSON sanitization patch to agents library
         AgentRunner._patch_json_validation()
@@ -125,7 +140,26 @@ class AgentRunner:
             model_provider=model_provider,
             model_settings=ModelSettings(**model_settings_kwargs)
         )
-        
+
+        # Serve deterministic repeat calls from the response cache
+        agent_name = getattr(agent, 'name', None)
+        cache_key = None
+        if context is None and llm_response_cache.is_cacheable(agent_name, bypass_cache):
+            cache_key = llm_response_cache.make_key(
+                agent_name,
+                resolved_model,
+                prompt,
+                settings={
+                    "model_settings": model_settings_kwargs,
+                    "max_turns": max_turns,
+                    "instructions": AgentRunner._instructions_fingerprint(agent),
+                },
+            )
+            cached = llm_response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Response cache hit for agent {agent_name} with model {resolved_model}")
+                return cached
+
         # Run the agent
         try:
             logger.debug(f"Running agent {agent.name if hasattr(agent, 'name') else 'Unknown'} with model {resolved_model}")
@@ -146,6 +180,8 @@ class AgentRunner:
                 prompt,
                 **run_kwargs
             )
+            if cache_key is not None:
+                llm_response_cache.set(cache_key, result)
             return result
         except Exception as e:
             # Prepare error context - be careful not to hide the actual error
@@ -356,6 +392,20 @@ class AgentRunner:
 
         return None
 
+    @staticmethod
+    def _instructions_fingerprint(agent: Agent) -> Optional[str]:
+        """Return a stable identifier for the agent's instructions and output type.
+
+        Prompts are loaded from the database, so edits must invalidate cached
+        responses even when the agent name and user prompt are unchanged.
+        """
+        instructions = getattr(agent, 'instructions', None)
+        output_type = getattr(agent, 'output_type', None)
+        output_name = getattr(output_type, '__name__', None) if output_type is not None else None
+        if isinstance(instructions, str):
+            return f"{output_name}:{instructions}"
+        return output_name
+
     @staticmethod
     def _safe_preview(value: Any, max_len: int = 800) -> Optional[str]:
         """Generate a safe, truncated string preview for logging."""
@@ -0,0 +1,154 @@
+"""Opt-in response cache for deterministic LLM calls.
+
+Scene analyzers, player options agents and the campaign summarizer are often
+invoked with an identical prompt and model (test-turn replays, regenerated
+turns, repeated ``analyze-current-scene`` calls). This cache lets
+``AgentRunner.run`` and ``StreamingLLMClient.complete`` short-circuit those
+calls without touching the provider.
+
+The cache is disabled by default. Configuration is read from the environment:
+
+    LLM_RESPONSE_CACHE_ENABLED       Enable the cache ("true"/"1"/"yes")
+    LLM_RESPONSE_CACHE_TTL_SECONDS   Entry lifetime in seconds (default 600)
+    LLM_RESPONSE_CACHE_MAX_ENTRIES   Maximum number of cached responses (default 256)
+    LLM_RESPONSE_CACHE_AGENTS        Comma-separated allowlist of agent names;
+                                     empty means every agent is cacheable
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, Iterable, Optional
+
+from gaia.utils.bounded_cache import BoundedCache
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+DEFAULT_TTL_SECONDS = 600.0
+DEFAULT_MAX_ENTRIES = 256
+
+
+def _as_bool(value: Optional[str], default: bool = False) -> bool:
+    """Parse truthy strings from environment variables."""
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "t", "yes", "y", "on"}
+
+
+def normalize_prompt(prompt: Any) -> str:
+    """Collapse whitespace so cosmetic prompt differences share a cache entry."""
+    if not isinstance(prompt, str):
+        prompt = json.dumps(prompt, sort_keys=True, default=str)
+    return _WHITESPACE_RE.sub(" ", prompt or "").strip()
+
+
+class LLMResponseCache:
+    """Bounded, TTL-based in-memory cache of LLM responses.
+
+    Entries are keyed by a hash of (agent name, model, settings, normalized
+    prompt) and evicted least-recently-used once ``max_entries`` is reached.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        allowed_agents: Optional[Iterable[str]] = None,
+    ):
+        self.enabled = enabled
+        self.allowed_agents = {name for name in (allowed_agents or []) if name}
+        self._entries: BoundedCache[str, Any] = BoundedCache(
+            "llm_responses", max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._entries.ttl_seconds
+
+    @property
+    def max_entries(self) -> int:
+        return self._entries.max_entries
+
+    @property
+    def hits(self) -> int:
+        return self._entries.metrics["hits"]
+
+    @property
+    def misses(self) -> int:
+        return self._entries.metrics["misses"]
+
+    @classmethod
+    def from_env(cls) -> "LLMResponseCache":
+        """Build a cache from ``LLM_RESPONSE_CACHE_*`` environment variables."""
+        agents = os.getenv("LLM_RESPONSE_CACHE_AGENTS", "")
+        return cls(
+            enabled=_as_bool(os.getenv("LLM_RESPONSE_CACHE_ENABLED"), False),
+            ttl_seconds=float(os.getenv("LLM_RESPONSE_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+            max_entries=int(os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            allowed_agents=[name.strip() for name in agents.split(",")],
+        )
+
+    def is_cacheable(self, agent_name: Optional[str], bypass: bool = False) -> bool:
+        """Return True if a call for ``agent_name`` may be served from or stored in the cache."""
+        if not self.enabled or bypass:
+            return False
+        if self.allowed_agents and agent_name not in self.allowed_agents:
+            return False
+        return True
+
+    @staticmethod
+    def make_key(
+        agent_name: Optional[str],
+        model: str,
+        prompt: Any,
+        settings: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build a stable cache key from the call parameters."""
+        payload = json.dumps(
+            {
+                "agent": agent_name or "",
+                "model": model,
+                "settings": settings or {},
+                "prompt": hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for ``key`` or None if missing/expired."""
+        return self._entries.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entries past the size cap."""
+        if value is None:
+            return
+        self._entries.set(key, value)
+
+    def clear(self) -> None:
+        """Drop all cached responses and reset counters."""
+        self._entries.clear(reset_metrics=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics for diagnostics endpoints and logs."""
+        entries = self._entries.stats()
+        return {
+            "enabled": self.enabled,
+            "entries": entries["entries"],
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "allowed_agents": sorted(self.allowed_agents),
+            "hits": entries["hits"],
+            "misses": entries["misses"],
+            "evictions": entries["evictions"],
+        }
+
+
+# Process-wide cache shared by AgentRunner and StreamingLLMClient
+llm_response_cache = LLMResponseCache.from_env()
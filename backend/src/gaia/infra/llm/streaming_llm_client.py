@@ -4,9 +4,11 @@ Provides streaming and non-streaming completion methods for LLM providers.
 """
 
 import logging
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Optional, Set
 
 from gaia.infra.llm.model_manager import get_model_provider_for_resolved_model
+from gaia.infra.llm.response_cache import llm_response_cache
+from gaia.utils.streaming_json import JSONStreamEvent, stream_json_events
 
 logger = logging.getLogger(__name__)
 
@@ -81,12 +83,49 @@ class StreamingLLMClient:
             logger.error(f"❌ Error in streaming completion: {e}", exc_info=True)
             raise
 
+    async def stream_structured_completion(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stream_fields: Optional[Set[str]] = None,
+    ) -> AsyncGenerator[JSONStreamEvent, None]:
+        """Stream a JSON completion as field-level events.
+
+        Chunks from ``stream_completion`` are parsed incrementally, so string
+        fields such as ``narrative`` are available while the rest of the
+        structured payload is still being generated.
+
+        Args:
+            prompt: The prompt to complete
+            model: Model identifier (e.g., "parasail-kimi-k2-instruct-0905")
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            stream_fields: Dotted field names to emit ``string_delta`` events for
+                (None streams every string field)
+
+        Yields:
+            JSONStreamEvent: ``string_delta``/``value`` events, then a final
+            ``complete`` event carrying the parsed object
+        """
+        chunks = self.stream_completion(
+            prompt,
+            model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        async for event in stream_json_events(chunks, stream_fields=stream_fields):
+            yield event
+
     async def complete(
         self,
         prompt: str,
         model: str,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        cache_name: str = "streaming_llm_client",
+        bypass_cache: bool = False,
     ) -> str:
         """Generate non-streaming completion from LLM.
 
@@ -95,10 +134,25 @@ class StreamingLLMClient:
             model: Model identifier (e.g., "parasail-kimi-k2-instruct-0905")
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            cache_name: Name used for the response cache key and allowlist
+            bypass_cache: Skip the response cache for this call even if enabled
 
         Returns:
             str: Complete generated text
         """
+        cache_key = None
+        if llm_response_cache.is_cacheable(cache_name, bypass_cache):
+            cache_key = llm_response_cache.make_key(
+                cache_name,
+                model,
+                prompt,
+                settings={"temperature": temperature, "max_tokens": max_tokens},
+            )
+            cached = llm_response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"⚡ Completion served from response cache: {len(cached)} chars")
+                return cached
+
         try:
             # Get provider for this model
             provider = get_model_provider_for_resolved_model(model)
@@ -128,6 +182,8 @@ class StreamingLLMClient:
             if response.choices and len(response.choices) > 0:
                 content = response.choices[0].message.content or ""
                 logger.info(f"✅ Completion generated: {len(content)} chars")
+                if cache_key is not None and content:
+                    llm_response_cache.set(cache_key, content)
                 return content
 
             logger.warning("⚠️ Empty response from LLM")
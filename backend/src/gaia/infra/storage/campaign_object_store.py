@@ -14,14 +14,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Generator, Iterable, Optional, Tuple
 
+from gaia.utils.atomic_write import atomic_write_json
+from gaia.utils.lazy_imports import lazy_module, module_available
+
 logger = logging.getLogger(__name__)
 
-try:  # Optional import; guarded for local development
-    from google.cloud import storage  # type: ignore
-    _GCS_AVAILABLE = True
-except Exception:  # pragma: no cover - environment specific
-    storage = None  # type: ignore
-    _GCS_AVAILABLE = False
+# Optional dependency; imported on first client creation to keep startup light
+storage = lazy_module("google.cloud.storage")
+_GCS_AVAILABLE = module_available("google.cloud.storage")
 
 
 def _env_name() -> str:
@@ -265,9 +265,8 @@ class PregeneratedContentStore:
     def _write_local_json(self, payload: Any, filename: str) -> bool:
         path = self.local_path(filename)
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open("w", encoding="utf-8") as fh:
-                json.dump(payload, fh, ensure_ascii=False, indent=2)
+            # Atomic so readers never load a half-written pregenerated file
+            atomic_write_json(path, payload)
             return True
         except Exception as exc:  # noqa: BLE001
             logger.warning("PregeneratedContentStore: failed to write %s: %s", path, exc)
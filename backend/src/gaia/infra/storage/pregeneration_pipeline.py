@@ -0,0 +1,230 @@
+"""Concurrent pipeline for pregenerated campaigns, characters and portraits.
+
+``scripts/backend/pregenerate_content.py`` used to generate every item one
+after another. The pipeline runs each item as a job, bounded by a
+per-provider concurrency limit (LLM calls and image calls are limited
+separately), and lets jobs depend on each other (a portrait needs its
+character first).
+
+Finished jobs are recorded in a checkpoint file, so a run that fails part way
+resumes where it stopped instead of starting over. Job outputs and the
+checkpoint are written atomically (temp file + ``os.replace``) so readers such
+as ``CharacterStorage.load_pregenerated_characters`` never see a partially
+written file.
+
+Configuration is read from the environment:
+
+    PREGEN_LLM_CONCURRENCY     Concurrent LLM generations (default 3)
+    PREGEN_IMAGE_CONCURRENCY   Concurrent image generations (default 2)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from gaia.utils.atomic_write import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+PREGEN_LLM_CONCURRENCY = int(os.getenv("PREGEN_LLM_CONCURRENCY", "3"))
+PREGEN_IMAGE_CONCURRENCY = int(os.getenv("PREGEN_IMAGE_CONCURRENCY", "2"))
+
+CHECKPOINT_VERSION = 1
+
+
+def default_concurrency() -> Dict[str, int]:
+    """Per-provider limits from the environment."""
+    return {"llm": PREGEN_LLM_CONCURRENCY, "image": PREGEN_IMAGE_CONCURRENCY}
+
+
+@dataclass
+class PregenerationJob:
+    """One unit of pregeneration work.
+
+    ``run`` receives the results of ``depends_on`` jobs keyed by job key.
+    When ``output_path`` is set, the (JSON) result is written there
+    atomically once the job succeeds. ``fingerprint`` identifies the job's
+    inputs; a checkpointed result is only reused if it still matches.
+    """
+    key: str
+    provider: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    output_path: Optional[Path] = None
+    fingerprint: str = ""
+    required: bool = True
+
+
+class PregenerationCheckpoint:
+    """Results of finished jobs, persisted after every completion."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # Jobs finish concurrently; one writer at a time
+        self._lock = threading.Lock()
+
+    def load(self) -> int:
+        """Read an existing checkpoint; returns the number of finished jobs in it."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return 0
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Ignoring unreadable pregeneration checkpoint %s: %s", self.path, exc)
+            return 0
+        if payload.get("version") != CHECKPOINT_VERSION:
+            return 0
+        self._entries = dict(payload.get("jobs") or {})
+        return len(self._entries)
+
+    def get(self, job: PregenerationJob) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(job.key)
+        if entry is None or entry.get("fingerprint") != job.fingerprint:
+            return None
+        return entry
+
+    def record(self, job: PregenerationJob, result: Any) -> None:
+        with self._lock:
+            self._entries[job.key] = {
+                "fingerprint": job.fingerprint,
+                "result": result,
+                "completed_at": time.time(),
+            }
+            atomic_write_json(self.path, {"version": CHECKPOINT_VERSION, "jobs": self._entries})
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self.path.unlink(missing_ok=True)
+
+
+@dataclass
+class PregenerationReport:
+    """Outcome and throughput of a pipeline run."""
+    results: Dict[str, Any] = field(default_factory=dict)
+    resumed: List[str] = field(default_factory=list)
+    completed: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    # Failed or skipped jobs marked ``required``; the run is incomplete
+    incomplete: List[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    busy_seconds: Counter = field(default_factory=Counter)
+
+    @property
+    def jobs_per_second(self) -> float:
+        return len(self.completed) / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "completed": len(self.completed),
+            "resumed": len(self.resumed),
+            "failed": len(self.failed),
+            "skipped": len(self.skipped),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "jobs_per_second": round(self.jobs_per_second, 3),
+            # Busy time / wall time: how well each provider's limit was used
+            "provider_utilization": {
+                provider: round(busy / self.elapsed_seconds, 3) if self.elapsed_seconds > 0 else 0.0
+                for provider, busy in self.busy_seconds.items()
+            },
+        }
+
+
+class PregenerationPipeline:
+    """Runs pregeneration jobs concurrently within per-provider limits."""
+
+    def __init__(
+        self,
+        jobs: Sequence[PregenerationJob],
+        concurrency: Optional[Dict[str, int]] = None,
+        checkpoint: Optional[PregenerationCheckpoint] = None,
+    ):
+        keys = [job.key for job in jobs]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Pregeneration job keys must be unique")
+        for job in jobs:
+            missing = [dep for dep in job.depends_on if dep not in keys]
+            if missing:
+                raise ValueError(f"Job {job.key} depends on unknown jobs: {missing}")
+        self.jobs = list(jobs)
+        self.concurrency = {**default_concurrency(), **(concurrency or {})}
+        self.checkpoint = checkpoint
+
+    async def run(self) -> PregenerationReport:
+        """Run every job; failures are reported, not raised."""
+        report = PregenerationReport()
+        semaphores = {
+            provider: asyncio.Semaphore(max(1, self.concurrency.get(provider, 1)))
+            for provider in {job.provider for job in self.jobs}
+        }
+        loop = asyncio.get_running_loop()
+        outcomes: Dict[str, asyncio.Future] = {job.key: loop.create_future() for job in self.jobs}
+
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            self._run_job(job, semaphores[job.provider], outcomes, report)
+            for job in self.jobs
+        ))
+        report.elapsed_seconds = time.perf_counter() - started
+        # Keep job order, not completion order
+        report.results = {job.key: report.results[job.key] for job in self.jobs if job.key in report.results}
+        return report
+
+    async def _run_job(
+        self,
+        job: PregenerationJob,
+        semaphore: asyncio.Semaphore,
+        outcomes: Dict[str, asyncio.Future],
+        report: PregenerationReport,
+    ) -> None:
+        outcome = outcomes[job.key]
+        try:
+            dependencies = {}
+            for dep in job.depends_on:
+                ok, value = await asyncio.shield(outcomes[dep])
+                if not ok:
+                    report.skipped.append(job.key)
+                    if job.required:
+                        report.incomplete.append(job.key)
+                    logger.warning("⏭️ Skipping %s: dependency %s did not finish", job.key, dep)
+                    outcome.set_result((False, None))
+                    return
+                dependencies[dep] = value
+
+            cached = self.checkpoint.get(job) if self.checkpoint else None
+            if cached is not None:
+                result = cached["result"]
+                report.resumed.append(job.key)
+                logger.info("♻️ Resumed %s from checkpoint", job.key)
+            else:
+                async with semaphore:
+                    job_started = time.perf_counter()
+                    try:
+                        result = await job.run(dependencies)
+                    finally:
+                        report.busy_seconds[job.provider] += time.perf_counter() - job_started
+                if job.output_path is not None:
+                    await asyncio.to_thread(atomic_write_json, job.output_path, result)
+                if self.checkpoint is not None:
+                    await asyncio.to_thread(self.checkpoint.record, job, result)
+                report.completed.append(job.key)
+
+            report.results[job.key] = result
+            outcome.set_result((True, result))
+        except Exception as exc:  # noqa: BLE001
+            report.failed[job.key] = str(exc)
+            if job.required:
+                report.incomplete.append(job.key)
+            logger.error("❌ Pregeneration job %s failed: %s", job.key, exc)
+            if not outcome.done():
+                outcome.set_result((False, None))
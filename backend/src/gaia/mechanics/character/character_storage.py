@@ -1,10 +1,18 @@
 """
 Character Storage System - Manages persistent storage of characters across campaigns
+
+Listings are served from a summary index (``character_index.json``) holding
+each character's listing fields plus the mtime and size of its file; the
+reverse campaign -> character ids mapping is derived from it in memory.
+``save_character`` (and therefore ``link_character_to_campaign``) keeps the
+in-memory index current and the file is rewritten on the next listing; files
+changed outside this class are detected by stat and re-read individually.
 """
 import json
 import logging
 import os
 import shutil
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -12,9 +20,16 @@ from datetime import datetime
 from gaia.utils.singleton import SingletonMeta
 from gaia_private.session.session_storage import SessionStorage
 from gaia.infra.storage.campaign_store import get_campaign_store
+from gaia.utils.atomic_write import atomic_write_json
 
 logger = logging.getLogger(__name__)
 
+CHARACTER_INDEX_FILE = "character_index.json"
+CHARACTER_INDEX_VERSION = 1
+
+# Index bookkeeping fields that are not part of a listing summary
+_INDEX_STAT_FIELDS = ("mtime_ns", "size")
+
 
 class CharacterStorage(metaclass=SingletonMeta):
     """Manages character storage with unique identifiers and cross-campaign support."""
@@ -58,6 +73,13 @@ class CharacterStorage(metaclass=SingletonMeta):
         # Unified campaign store (local + GCS hybrid) for campaign-scoped character state
         self._session_storage = SessionStorage(str(self.base_path), ensure_legacy_dirs=True)
         self._store = get_campaign_store(self._session_storage)
+        # Character summary index, loaded lazily (character_id -> summary + file stat)
+        self.index_path = self.base_path / CHARACTER_INDEX_FILE
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._campaign_index: Dict[str, List[str]] = {}
+        # True when the in-memory index has changes not yet written to index_path
+        self._index_dirty = False
+        self._index_lock = threading.RLock()
     
     
     def save_character(self, character_data: Dict[str, Any], character_id: Optional[str] = None) -> str:
@@ -86,6 +108,7 @@ class CharacterStorage(metaclass=SingletonMeta):
             char_file = self.characters_path / f"{final_id}.json"
             with open(char_file, 'w', encoding='utf-8') as f:
                 json.dump(character_data, f, indent=2, ensure_ascii=False, default=str)
+            self._update_index_entry(final_id, character_data, char_file)
             
             return final_id
             
@@ -124,23 +147,12 @@ class CharacterStorage(metaclass=SingletonMeta):
         Returns:
             List of character summaries
         """
-        characters = []
-        
-        for char_file in self.characters_path.glob("*.json"):
-            try:
-                with open(char_file, 'r', encoding='utf-8') as f:
-                    char_data = json.load(f)
-                    characters.append({
-                        'id': char_data.get('id', char_file.stem),
-                        'name': char_data.get('name', 'Unknown'),
-                        'class': char_data.get('class', 'Unknown'),
-                        'race': char_data.get('race', 'Unknown'),
-                        'level': char_data.get('level', 1),
-                        'last_modified': char_data.get('last_modified'),
-                        'campaigns': char_data.get('campaigns', [])
-                    })
-            except Exception as e:
-                logger.error(f"Error reading character file {char_file}: {e}")
+        with self._index_lock:
+            index = self._refresh_index()
+            characters = [
+                {k: v for k, v in entry.items() if k not in _INDEX_STAT_FIELDS}
+                for entry in index.values()
+            ]
         
         logger.info(f"📋 Found {len(characters)} characters")
         return characters
@@ -188,13 +200,139 @@ class CharacterStorage(metaclass=SingletonMeta):
         Returns:
             List of character IDs
         """
-        character_ids = []
-        
-        for char_summary in self.list_characters():
-            if campaign_id in char_summary.get('campaigns', []):
-                character_ids.append(char_summary['id'])
+        with self._index_lock:
+            self._refresh_index()
+            return list(self._campaign_index.get(campaign_id, []))
+
+    def rebuild_index(self) -> int:
+        """Rebuild the character index from every character file.
         
-        return character_ids
+        Returns:
+            Number of indexed characters
+        """
+        with self._index_lock:
+            self._index = {}
+            self._campaign_index = {}
+            self._refresh_index()
+            return len(self._index)
+
+    # ------------------------------------------------------------------ #
+    # Character summary index
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _summarize(character_id: str, char_data: Dict[str, Any], stat: os.stat_result) -> Dict[str, Any]:
+        """Listing summary for a character plus the stat it was read at."""
+        return {
+            'id': char_data.get('id', character_id),
+            'name': char_data.get('name', 'Unknown'),
+            'class': char_data.get('class', 'Unknown'),
+            'race': char_data.get('race', 'Unknown'),
+            'level': char_data.get('level', 1),
+            'last_modified': char_data.get('last_modified'),
+            'campaigns': list(char_data.get('campaigns', [])),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+        }
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Return the in-memory index, reading the index file on first use."""
+        if self._index is None:
+            self._index = {}
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    payload = json.load(f)
+                if payload.get('version') == CHARACTER_INDEX_VERSION:
+                    self._index = dict(payload.get('characters') or {})
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"⚠️ Ignoring unreadable character index {self.index_path}: {e}")
+            self._rebuild_campaign_index()
+        return self._index
+
+    def _rebuild_campaign_index(self) -> None:
+        campaign_index: Dict[str, List[str]] = {}
+        for character_id, entry in (self._index or {}).items():
+            for campaign_id in entry.get('campaigns', []):
+                campaign_index.setdefault(campaign_id, []).append(character_id)
+        self._campaign_index = campaign_index
+
+    def _set_index_entry(self, character_id: str, summary: Optional[Dict[str, Any]]) -> None:
+        """Replace (or with ``None`` remove) one entry, keeping the campaign map in step."""
+        previous = self._index.pop(character_id, None)
+        for campaign_id in previous.get('campaigns', []) if previous else []:
+            members = self._campaign_index.get(campaign_id)
+            if members and character_id in members:
+                members.remove(character_id)
+                if not members:
+                    del self._campaign_index[campaign_id]
+        if summary is None:
+            return
+        self._index[character_id] = summary
+        for campaign_id in summary.get('campaigns', []):
+            members = self._campaign_index.setdefault(campaign_id, [])
+            if character_id not in members:
+                members.append(character_id)
+
+    def _write_index(self) -> None:
+        payload = {
+            'version': CHARACTER_INDEX_VERSION,
+            'characters': self._index,
+        }
+        try:
+            atomic_write_json(self.index_path, payload)
+            self._index_dirty = False
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to write character index: {e}")
+
+    def _refresh_index(self) -> Dict[str, Dict[str, Any]]:
+        """Validate the index against file mtimes/sizes; re-read only changed files."""
+        index = self._load_index()
+        changed = self._index_dirty
+        seen = set()
+        with os.scandir(self.characters_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+                character_id = entry.name[:-len('.json')]
+                seen.add(character_id)
+                stat = entry.stat()
+                cached = index.get(character_id)
+                if cached and cached.get('mtime_ns') == stat.st_mtime_ns and cached.get('size') == stat.st_size:
+                    continue
+                try:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        char_data = json.load(f)
+                except Exception as e:
+                    logger.error(f"Error reading character file {entry.path}: {e}")
+                    if character_id in index:
+                        self._set_index_entry(character_id, None)
+                        changed = True
+                    continue
+                self._set_index_entry(character_id, self._summarize(character_id, char_data, stat))
+                changed = True
+        for character_id in [cid for cid in index if cid not in seen]:
+            self._set_index_entry(character_id, None)
+            changed = True
+        if changed:
+            self._write_index()
+        return index
+
+    def _update_index_entry(self, character_id: str, char_data: Dict[str, Any], char_file: Path) -> None:
+        """Record a just-written character without re-reading its file.
+
+        Only the in-memory index changes here; the next listing writes the
+        file, so a burst of saves costs one index write.
+        """
+        try:
+            stat = char_file.stat()
+            with self._index_lock:
+                self._load_index()
+                self._set_index_entry(character_id, self._summarize(character_id, char_data, stat))
+                self._index_dirty = True
+        except Exception as e:
+            # The next listing re-reads the file when the index is stale
+            logger.warning(f"⚠️ Failed to update character index for {character_id}: {e}")
 
     # ------------------------------------------------------------------ #
     # Pregenerated content helpers
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from gaia.models.character.npc_profile import NpcProfile
 from gaia.utils.singleton import SingletonMeta
@@ -14,6 +17,15 @@ from gaia.infra.storage.campaign_store import get_campaign_store
 
 logger = logging.getLogger(__name__)
 
+NAME_INDEX_FILENAME = "npc_profile_index.json"
+# v2 keys entries by npc_id so instances can merge their indexes
+NAME_INDEX_VERSION = 2
+
+# Minimum seconds between re-reading the shared index (or listing shared
+# profiles) from the store on a miss, and between merging this instance's
+# index into the store copy on save
+STORE_INDEX_REFRESH_SECONDS = 30.0
+
 
 class NpcProfileStorage(metaclass=SingletonMeta):
     """Stores NPC profiles separately from full character sheets with hybrid local+GCS storage."""
@@ -40,8 +52,209 @@ class NpcProfileStorage(metaclass=SingletonMeta):
         self._storage = SessionStorage(str(self.base_path), ensure_legacy_dirs=True)
         self._store = get_campaign_store(self._storage)
 
+        # npc_id -> lowercase display name, persisted next to the profiles, and
+        # the derived lowercase display name -> npc_id lookup
+        self.index_path = self.base_path / NAME_INDEX_FILENAME
+        self._profile_names: Dict[str, str] = {}
+        self._name_index: Optional[Dict[str, str]] = None
+        self._index_lock = threading.RLock()
+        self._store_index_checked_at = float("-inf")
+        self._store_listing_checked_at = float("-inf")
+        self._store_index_flushed_at = float("-inf")
+        self._store_index_dirty = False
+        # Shared profile files already read while looking for unindexed
+        # profiles; unreadable ones are not fetched again until a rebuild
+        self._checked_store_profiles: set[str] = set()
+
         self._initialized = True
 
+    # ------------------------------------------------------------------
+    # Name index
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        return str(name or "").strip().lower()
+
+    def _ensure_name_index(self) -> Dict[str, str]:
+        """Load the persisted name index, rebuilding it if missing or unreadable."""
+        with self._index_lock:
+            if self._name_index is not None:
+                return self._name_index
+
+            data = None
+            if self.index_path.exists():
+                try:
+                    with open(self.index_path, "r", encoding="utf-8") as handle:
+                        data = json.load(handle)
+                except Exception:
+                    logger.warning("Failed to read NPC name index %s; rebuilding", self.index_path, exc_info=True)
+            if isinstance(data, dict) and data.get("version") == NAME_INDEX_VERSION:
+                self._set_profile_names(dict(data.get("profiles", {})))
+                return self._name_index
+
+            return self.rebuild_name_index()
+
+    def _set_profile_names(self, profile_names: Dict[str, str]) -> None:
+        self._profile_names = profile_names
+        self._name_index = {}
+        for npc_id, key in profile_names.items():
+            if key:
+                self._name_index.setdefault(key, npc_id)
+
+    def _set_profile_name(self, npc_id: str, key: str) -> bool:
+        """Point ``key`` at ``npc_id``, dropping the profile's previous name. O(1)."""
+        previous = self._profile_names.get(npc_id)
+        if previous == key and (not key or self._name_index.get(key) == npc_id):
+            return False
+        if previous and self._name_index.get(previous) == npc_id:
+            del self._name_index[previous]
+        self._profile_names[npc_id] = key
+        if key:
+            self._name_index[key] = npc_id
+        return True
+
+    def rebuild_name_index(self) -> Dict[str, str]:
+        """Rebuild the name index from every local and shared NPC profile.
+
+        Returns:
+            The rebuilt index mapping lowercase display names to npc_ids
+        """
+        profile_names = {
+            profile.npc_id: self._normalize_name(profile.display_name)
+            for profile in self.list_profiles()
+        }
+
+        with self._index_lock:
+            self._set_profile_names(profile_names)
+            self._checked_store_profiles.clear()
+            self._persist_name_index(replace_store=True)
+            index = self._name_index
+        logger.info("Rebuilt NPC name index with %d entries", len(index))
+        return index
+
+    def _persist_name_index(self, replace_store: bool = False) -> None:
+        """Write the index locally (atomically) and merge it into the store copy.
+
+        Other instances write the same shared index, so entries are merged per
+        profile rather than overwritten; profiles only known to the store copy
+        are also picked up locally. The store round-trip happens at most every
+        ``STORE_INDEX_REFRESH_SECONDS``; changes in between are carried by the
+        next merge (other instances find them through the store listing
+        meanwhile). ``replace_store`` is for full rebuilds and always writes.
+        """
+        now = time.monotonic()
+        sync_store = bool(self._store) and (
+            replace_store or now - self._store_index_flushed_at >= STORE_INDEX_REFRESH_SECONDS
+        )
+        if self._store and not sync_store:
+            self._store_index_dirty = True
+        if sync_store and not replace_store:
+            try:
+                data = self._store.read_json("shared", NAME_INDEX_FILENAME)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("NPC name index store read failed: %s", exc)
+                data = None
+            if isinstance(data, dict) and data.get("version") == NAME_INDEX_VERSION:
+                for npc_id, key in (data.get("profiles") or {}).items():
+                    if npc_id not in self._profile_names:
+                        self._set_profile_name(npc_id, key)
+
+        payload = {"version": NAME_INDEX_VERSION, "profiles": self._profile_names}
+        tmp_path = self.index_path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to persist NPC name index: %s", exc)
+
+        if sync_store:
+            self._store_index_flushed_at = now
+            self._store_index_dirty = False
+            try:
+                self._store.write_json(payload, "shared", NAME_INDEX_FILENAME)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("NPC name index store mirror failed: %s", exc)
+
+    def _index_profile(self, profile: NpcProfile) -> None:
+        """Point the profile's display name at its npc_id, dropping any previous name."""
+        with self._index_lock:
+            self._ensure_name_index()
+            if self._set_profile_name(profile.npc_id, self._normalize_name(profile.display_name)):
+                self._persist_name_index()
+
+    def _refresh_index_from_store(self) -> bool:
+        """Merge names saved by other instances from the shared store index."""
+        if not self._store:
+            return False
+        now = time.monotonic()
+        if now - self._store_index_checked_at < STORE_INDEX_REFRESH_SECONDS:
+            return False
+        self._store_index_checked_at = now
+        try:
+            data = self._store.read_json("shared", NAME_INDEX_FILENAME)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("NPC name index store read failed: %s", exc)
+            return False
+        if not isinstance(data, dict) or data.get("version") != NAME_INDEX_VERSION:
+            return False
+        with self._index_lock:
+            self._ensure_name_index()
+            added = [
+                self._set_profile_name(npc_id, key)
+                for npc_id, key in (data.get("profiles") or {}).items()
+                if npc_id not in self._profile_names
+            ]
+            if not any(added):
+                if self._store_index_dirty:
+                    self._persist_name_index()
+                return False
+            self._persist_name_index()
+        return True
+
+    def _index_unknown_store_profiles(self) -> bool:
+        """Index shared profiles missing from the index (e.g. saved by another
+        instance before its index write landed). Reads only unknown profiles.
+
+        Throttled like :meth:`_refresh_index_from_store`, since misses are the
+        common case for newly extracted NPCs.
+        """
+        if not self._store:
+            return False
+        now = time.monotonic()
+        if now - self._store_listing_checked_at < STORE_INDEX_REFRESH_SECONDS:
+            return False
+        self._store_listing_checked_at = now
+        try:
+            names = self._store.list_json_prefix("shared", "npc_profiles")
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("NPC profile store listing failed: %s", exc)
+            return False
+        with self._index_lock:
+            self._ensure_name_index()
+            unknown = [
+                name for name in names
+                if Path(name).stem not in self._profile_names and name not in self._checked_store_profiles
+            ]
+        added = False
+        for json_name in unknown:
+            self._checked_store_profiles.add(json_name)
+            try:
+                data = self._store.read_json("shared", f"npc_profiles/{json_name}")
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("NPC profile store read failed for %s: %s", json_name, exc)
+                continue
+            if data:
+                profile = NpcProfile.from_dict(data)
+                with self._index_lock:
+                    added = self._set_profile_name(
+                        profile.npc_id, self._normalize_name(profile.display_name)
+                    ) or added
+        if added:
+            with self._index_lock:
+                self._persist_name_index()
+        return added
+
     def save_profile(self, profile: NpcProfile) -> str:
         profile_data = profile.to_dict()
 
@@ -58,32 +271,31 @@ class NpcProfileStorage(metaclass=SingletonMeta):
             except Exception as exc:  # noqa: BLE001
                 logger.debug("NPC profile store mirror failed for %s: %s", profile.npc_id, exc)
 
+        self._index_profile(profile)
         return profile.npc_id
 
     def get_profile_by_name(self, name: str) -> Optional[NpcProfile]:
-        # Search local profiles first
-        for file_path in self.profiles_path.glob("*.json"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as handle:
-                    data = json.load(handle)
-                if str(data.get("display_name", "")).lower() == name.lower():
-                    return NpcProfile.from_dict(data)
-            except Exception:
-                logger.warning("Failed to read NPC profile %s", file_path, exc_info=True)
-                continue
+        """Resolve an NPC profile by display name (case-insensitive) via the name index."""
+        key = self._normalize_name(name)
+        if not key:
+            return None
 
-        # Fallback to GCS if not found locally
-        if self._store:
-            try:
-                for json_name in self._store.list_json_prefix("shared", "npc_profiles"):
-                    data = self._store.read_json("shared", f"npc_profiles/{json_name}")
-                    if data and str(data.get("display_name", "")).lower() == name.lower():
-                        logger.debug("Loaded NPC profile %s from store", name)
-                        return NpcProfile.from_dict(data)
-            except Exception as exc:  # noqa: BLE001
-                logger.debug("NPC profile store search failed: %s", exc)
+        npc_id = self._ensure_name_index().get(key)
+        if npc_id is None and self._refresh_index_from_store():
+            npc_id = self._ensure_name_index().get(key)
+        if npc_id is None and self._index_unknown_store_profiles():
+            npc_id = self._ensure_name_index().get(key)
+        if npc_id is None:
+            return None
 
-        return None
+        profile = self.load_profile(npc_id)
+        if profile and self._normalize_name(profile.display_name) == key:
+            return profile
+
+        # Index entry is stale (profile deleted or renamed elsewhere); rebuild once
+        logger.info("NPC name index entry for %s is stale; rebuilding", name)
+        npc_id = self.rebuild_name_index().get(key)
+        return self.load_profile(npc_id) if npc_id else None
 
     def save_profile_dict(self, profile_dict: dict) -> str:
         profile = NpcProfile.from_dict(profile_dict)
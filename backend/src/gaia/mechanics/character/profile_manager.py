@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, Optional
 import logging
+import os
 from pathlib import Path
 
 from gaia.models.character import CharacterProfile, CharacterInfo
@@ -10,9 +11,14 @@ from gaia.models.character.enums import CharacterType
 from gaia.mechanics.character.profile_storage import ProfileStorage
 from gaia.mechanics.character.profile_updater import ProfileUpdater
 from gaia.infra.image.image_metadata import get_metadata_manager
+from gaia.utils.bounded_cache import BoundedCache
 
 logger = logging.getLogger(__name__)
 
+PROFILE_CACHE_MAX_ENTRIES = int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "512"))
+PROFILE_CACHE_MAX_BYTES = int(os.getenv("PROFILE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+PROFILE_CACHE_TTL_SECONDS = float(os.getenv("PROFILE_CACHE_TTL_SECONDS", "1800"))
+
 
 class ProfileManager:
     """Manages character profile operations with caching and orchestration.
@@ -26,7 +32,13 @@ class ProfileManager:
         """Initialize the profile manager."""
         self.storage = ProfileStorage()
         self.updater = ProfileUpdater()
-        self._cache: Dict[str, CharacterProfile] = {}
+        # Bounded so profiles of finished campaigns don't accumulate for the process lifetime
+        self._cache: BoundedCache[str, CharacterProfile] = BoundedCache(
+            "character_profiles",
+            max_entries=PROFILE_CACHE_MAX_ENTRIES,
+            max_bytes=PROFILE_CACHE_MAX_BYTES,
+            ttl_seconds=PROFILE_CACHE_TTL_SECONDS,
+        )
 
     # ------------------------------------------------------------------
     # Cache Management
@@ -45,8 +57,9 @@ class ProfileManager:
             ValueError: If profile not found
         """
         # Check cache first
-        if profile_id in self._cache:
-            return self._cache[profile_id]
+        cached = self._cache.get(profile_id)
+        if cached is not None:
+            return cached
 
         # Load from storage
         profile = self.storage.load_profile(profile_id)
@@ -64,8 +77,7 @@ class ProfileManager:
         Args:
             profile_id: The profile ID to invalidate
         """
-        if profile_id in self._cache:
-            self._cache.pop(profile_id)
+        if self._cache.pop(profile_id) is not None:
             logger.debug(f"Invalidated cache for profile {profile_id}")
 
     # ------------------------------------------------------------------
@@ -313,7 +325,7 @@ class ProfileManager:
                         "model": result.get("model"),
                         "character_id": character_id,
                     }
-                    metadata_manager.save_metadata(
+                    await metadata_manager.save_metadata_async(
                         storage_filename,
                         metadata_payload,
                         campaign_id=campaign_ref,
@@ -1,8 +1,29 @@
-"""Combat persistence system for saving and loading combat sessions."""
+"""Combat persistence system for saving and loading combat sessions.
+
+Active sessions are persisted as a snapshot (``active/<session_id>.json``) plus
+an append-only event log (``active/<session_id>.events.jsonl``) holding one
+compact record per processed action: the new ``CombatAction`` entries, the
+combatants whose state changed and the updated turn/round fields. Snapshots are
+rewritten every ``COMBAT_SNAPSHOT_INTERVAL`` events, so per-action persistence
+cost no longer grows with the length of the combat. Loading replays the log on
+top of the latest snapshot; archiving compacts everything into a single
+history file and drops the log.
+
+Each archive also appends its summary to ``history_index.jsonl``, so history
+listings read one small index instead of parsing every archived session.
+
+Campaigns with an active session are tracked in ``combat_registry.json`` at
+the campaign storage root, so startup recovery only loads those campaigns
+rather than scanning every campaign ever created.
+"""
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 from datetime import datetime
 
 from gaia.models.combat import (
@@ -18,6 +39,119 @@ from gaia.infra.storage.campaign_store import get_campaign_store
 
 logger = logging.getLogger(__name__)
 
+# Events appended to the log before the snapshot is rewritten
+COMBAT_SNAPSHOT_INTERVAL = int(os.getenv("COMBAT_SNAPSHOT_INTERVAL", "25"))
+
+# Number of combat log entries kept in snapshots
+SNAPSHOT_COMBAT_LOG_LIMIT = 100
+
+_COMPACT_SEPARATORS = (",", ":")
+
+# Per-campaign summary index of archived sessions (one JSON line per archive)
+HISTORY_INDEX_FILE = "history_index.jsonl"
+_STORE_HISTORY_INDEX = "data/combat/history_index.json"
+
+# Registry of campaigns with active sessions, at the campaign storage root
+ACTIVE_COMBAT_REGISTRY_FILE = "combat_registry.json"
+
+# Campaigns loaded concurrently during startup recovery
+COMBAT_RECOVERY_WORKERS = int(os.getenv("COMBAT_RECOVERY_WORKERS", "8"))
+
+
+@dataclass
+class _SessionLogState:
+    """What has already been persisted for an active session."""
+    campaign_id: str
+    event_seq: int = 0
+    events_since_snapshot: int = 0
+    action_count: int = 0
+    turn_order: List[str] = field(default_factory=list)
+    battlefield_fingerprint: Optional[str] = None
+    combatant_fingerprints: Dict[str, str] = field(default_factory=dict)
+    # Mirrored event objects; None when unknown (e.g. loaded from local files)
+    store_event_names: Optional[List[str]] = field(default_factory=list)
+
+
+class _ActiveCombatRegistry:
+    """Campaign -> active session ids, persisted as one small JSON file.
+
+    Only snapshot writes and removals touch the registry, and it is rewritten
+    only when its contents change, so per-action saves stay append-only. The
+    registry is ``complete`` once a full campaign scan has seeded it; until
+    then it may be missing sessions saved before it existed.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> Tuple[Dict[str, List[str]], bool]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return {}, False
+        except Exception as exc:
+            logger.warning(f"Ignoring unreadable combat registry {self.path}: {exc}")
+            return {}, False
+        if not isinstance(payload, dict):
+            return {}, False
+        campaigns = {
+            cid: list(entry.get("sessions", []))
+            for cid, entry in payload.get("campaigns", {}).items()
+        }
+        return campaigns, bool(payload.get("complete"))
+
+    def load(self) -> Dict[str, List[str]]:
+        return self._read()[0]
+
+    def is_complete(self) -> bool:
+        return self._read()[1]
+
+    def add(self, campaign_id: str, session_id: str) -> None:
+        with self._lock:
+            campaigns, complete = self._read()
+            sessions = campaigns.setdefault(campaign_id, [])
+            if session_id in sessions:
+                return
+            sessions.append(session_id)
+            self._write(campaigns, complete)
+
+    def discard(self, campaign_id: str, session_id: Optional[str] = None) -> None:
+        """Remove one session, or the whole campaign when ``session_id`` is None."""
+        with self._lock:
+            campaigns, complete = self._read()
+            sessions = campaigns.get(campaign_id)
+            if sessions is None or (session_id is not None and session_id not in sessions):
+                return
+            if session_id is not None:
+                sessions.remove(session_id)
+            if session_id is None or not sessions:
+                campaigns.pop(campaign_id, None)
+            self._write(campaigns, complete)
+
+    def seed(self, campaigns: Dict[str, List[str]]) -> None:
+        """Merge the result of a full scan and mark the registry complete."""
+        with self._lock:
+            current, _complete = self._read()
+            for campaign_id, sessions in campaigns.items():
+                merged = current.setdefault(campaign_id, [])
+                merged.extend(sid for sid in sessions if sid not in merged)
+            self._write(current, True)
+
+    def _write(self, campaigns: Dict[str, List[str]], complete: bool) -> None:
+        payload = {
+            "version": 1,
+            "complete": complete,
+            "updated_at": datetime.now().isoformat(),
+            "campaigns": {cid: {"sessions": sessions} for cid, sessions in campaigns.items()},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.path.with_suffix(".json.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=_COMPACT_SEPARATORS, ensure_ascii=False)
+        os.replace(tmp_file, self.path)
+
 
 class CombatPersistenceManager:
     """Manages persistence of combat sessions to disk."""
@@ -29,11 +163,39 @@ class CombatPersistenceManager:
             campaign_manager: Campaign manager for accessing storage paths
         """
         self.campaign_manager = campaign_manager
+        self.snapshot_interval = max(1, COMBAT_SNAPSHOT_INTERVAL)
+        # Per-session bookkeeping for the event log, keyed by session_id
+        self._log_state: Dict[str, _SessionLogState] = {}
         # Unified store derived from the campaign manager's session storage
         try:
             self._store = get_campaign_store(self.campaign_manager.storage)
         except Exception:
             self._store = None
+        self._registry = self._create_registry()
+
+    def _create_registry(self) -> Optional[_ActiveCombatRegistry]:
+        """Registry at the campaign storage root, if the manager exposes one."""
+        for attr in ("base_path", "campaign_storage_path"):
+            root = getattr(self.campaign_manager, attr, None)
+            if isinstance(root, (str, Path)):
+                return _ActiveCombatRegistry(Path(root) / ACTIVE_COMBAT_REGISTRY_FILE)
+        return None
+
+    def _register_active(self, campaign_id: str, session_id: str) -> None:
+        if self._registry is None:
+            return
+        try:
+            self._registry.add(campaign_id, session_id)
+        except Exception as exc:
+            logger.warning(f"Failed to register active combat {session_id}: {exc}")
+
+    def _deregister_active(self, campaign_id: str, session_id: Optional[str] = None) -> None:
+        if self._registry is None:
+            return
+        try:
+            self._registry.discard(campaign_id, session_id)
+        except Exception as exc:
+            logger.warning(f"Failed to deregister active combat for {campaign_id}: {exc}")
 
     def get_combat_path(self, campaign_id: str) -> Optional[Path]:
         """Get the combat directory path for a campaign.
@@ -58,8 +220,23 @@ class CombatPersistenceManager:
 
         return combat_path
 
+    @staticmethod
+    def _events_file(combat_path: Path, session_id: str) -> Path:
+        """Path of the append-only event log for an active session."""
+        return combat_path / "active" / f"{session_id}.events.jsonl"
+
+    @staticmethod
+    def _store_events_prefix(session_id: str) -> str:
+        """Store prefix holding one object per event for an active session."""
+        return f"data/combat/active/{session_id}_events"
+
     def save_combat_session(self, campaign_id: str, session: CombatSession) -> bool:
-        """Save a combat session to disk.
+        """Persist the latest state of a combat session.
+
+        Appends one compact event record describing what changed since the
+        previous save. A full snapshot is written instead when the session has
+        no snapshot yet, the snapshot interval has elapsed, or the change
+        cannot be expressed as an event (e.g. a trimmed combat log).
 
         Args:
             campaign_id: Campaign identifier
@@ -73,38 +250,179 @@ class CombatPersistenceManager:
             if not combat_path:
                 return False
 
-            # Save to active combat file
-            active_file = combat_path / "active" / f"{session.session_id}.json"
-
-            # Serialize the session
-            session_data = self._serialize_session(session)
-
-            # Add metadata
-            session_data["_metadata"] = {
-                "campaign_id": campaign_id,
-                "last_saved": datetime.now().isoformat(),
-                "version": "1.0"
-            }
-
-            # Write to file
-            with open(active_file, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            state = self._log_state.get(session.session_id)
+            if (
+                state is None
+                or state.campaign_id != campaign_id
+                or state.events_since_snapshot >= self.snapshot_interval
+            ):
+                return self._write_snapshot(campaign_id, combat_path, session)
+
+            built = self._build_event_record(session, state)
+            if built is None:
+                return self._write_snapshot(campaign_id, combat_path, session)
+            record, fingerprints = built
+
+            line = json.dumps(record, separators=_COMPACT_SEPARATORS, ensure_ascii=False, default=str)
+            with open(self._events_file(combat_path, session.session_id), "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+            state.event_seq = record["seq"]
+            state.events_since_snapshot += 1
+            state.action_count = len(session.combat_log)
+            state.turn_order = list(session.turn_order)
+            state.combatant_fingerprints = fingerprints
+            logger.debug(
+                "Appended combat event %s for session %s", record["seq"], session.session_id
+            )
 
-            logger.info(f"Saved combat session {session.session_id} to {active_file}")
             # Mirror to store when available for stateless environments
             if self._store is not None:
+                name = f"{record['seq']:08d}.json"
                 try:
-                    self._store.write_json(session_data, campaign_id, f"data/combat/active/{session.session_id}.json")
+                    self._store.write_json(
+                        record, campaign_id, f"{self._store_events_prefix(session.session_id)}/{name}"
+                    )
+                    if state.store_event_names is not None:
+                        state.store_event_names.append(name)
                 except Exception as exc:
-                    logger.warning("Combat store mirror (active) failed: %s", exc)
+                    logger.warning("Combat store mirror (event) failed: %s", exc)
             return True
 
         except Exception as e:
             logger.error(f"Failed to save combat session: {e}")
             return False
 
+    def _write_snapshot(self, campaign_id: str, combat_path: Path, session: CombatSession) -> bool:
+        """Write a full snapshot of the session and truncate its event log."""
+        previous = self._log_state.get(session.session_id)
+        event_seq = previous.event_seq if previous and previous.campaign_id == campaign_id else 0
+
+        active_file = combat_path / "active" / f"{session.session_id}.json"
+        session_data = self._serialize_session(session)
+        session_data["_metadata"] = {
+            "campaign_id": campaign_id,
+            "last_saved": datetime.now().isoformat(),
+            "event_seq": event_seq,
+            "version": "2.0"
+        }
+
+        # Write atomically so a crash never leaves a half-written snapshot
+        tmp_file = active_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(session_data, f, separators=_COMPACT_SEPARATORS, ensure_ascii=False)
+        os.replace(tmp_file, active_file)
+
+        # Events up to event_seq are now part of the snapshot
+        events_file = self._events_file(combat_path, session.session_id)
+        if events_file.exists():
+            events_file.unlink()
+
+        state = self._capture_state(campaign_id, session, event_seq)
+        self._register_active(campaign_id, session.session_id)
+        logger.info(f"Saved combat session snapshot {session.session_id} to {active_file}")
+
+        # Mirror to store when available for stateless environments
+        if self._store is not None:
+            try:
+                self._store.write_json(session_data, campaign_id, f"data/combat/active/{session.session_id}.json")
+            except Exception as exc:
+                logger.warning("Combat store mirror (active) failed: %s", exc)
+            # Every mirrored event is now part of the snapshot; list them when untracked
+            self._delete_store_events(
+                campaign_id, session.session_id, previous.store_event_names if previous else None
+            )
+        self._log_state[session.session_id] = state
+        return True
+
+    def _capture_state(self, campaign_id: str, session: CombatSession, event_seq: int) -> _SessionLogState:
+        """Record the persisted view of a session after writing a snapshot."""
+        return _SessionLogState(
+            campaign_id=campaign_id,
+            event_seq=event_seq,
+            events_since_snapshot=0,
+            action_count=len(session.combat_log),
+            turn_order=list(session.turn_order),
+            battlefield_fingerprint=self._battlefield_fingerprint(session),
+            combatant_fingerprints={
+                cid: self._fingerprint(self._serialize_combatant(combatant))
+                for cid, combatant in session.combatants.items()
+            },
+        )
+
+    def _build_event_record(
+        self, session: CombatSession, state: _SessionLogState
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, str]]]:
+        """Describe changes since the last save.
+
+        Returns:
+            Tuple of (event record, combatant fingerprints), or None if a
+            snapshot is required instead
+        """
+        if len(session.combat_log) < state.action_count:
+            return None
+        if self._battlefield_fingerprint(session) != state.battlefield_fingerprint:
+            return None
+
+        changed: Dict[str, Any] = {}
+        fingerprints: Dict[str, str] = {}
+        for cid, combatant in session.combatants.items():
+            data = self._serialize_combatant(combatant)
+            fingerprint = self._fingerprint(data)
+            fingerprints[cid] = fingerprint
+            if state.combatant_fingerprints.get(cid) != fingerprint:
+                changed[cid] = data
+        removed = [cid for cid in state.combatant_fingerprints if cid not in session.combatants]
+
+        session_fields: Dict[str, Any] = {
+            "status": session.status.value if isinstance(session.status, CombatStatus) else session.status,
+            "round_number": session.round_number,
+            "current_turn_index": session.current_turn_index,
+        }
+        if session.turn_order != state.turn_order:
+            session_fields["turn_order"] = list(session.turn_order)
+        updated_at = getattr(session, "updated_at", None)
+        if isinstance(updated_at, datetime):
+            session_fields["updated_at"] = updated_at.isoformat()
+
+        record = {
+            "seq": state.event_seq + 1,
+            "ts": datetime.now().isoformat(),
+            "session": session_fields,
+            "actions": [action.to_dict() for action in session.combat_log[state.action_count:]],
+            "combatants": changed,
+        }
+        if removed:
+            record["removed"] = removed
+        return record, fingerprints
+
+    @staticmethod
+    def _fingerprint(data: Any) -> str:
+        return json.dumps(data, sort_keys=True, separators=_COMPACT_SEPARATORS, default=str)
+
+    def _battlefield_fingerprint(self, session: CombatSession) -> Optional[str]:
+        if not session.battlefield:
+            return None
+        try:
+            return self._fingerprint(session.battlefield.to_dict())
+        except Exception:
+            return None
+
+    def _delete_store_events(self, campaign_id: str, session_id: str, names: Optional[List[str]] = None) -> None:
+        """Delete mirrored event objects for a session from the store."""
+        if self._store is None:
+            return
+        prefix = self._store_events_prefix(session_id)
+        try:
+            if names is None:
+                names = self._store.list_json_prefix(campaign_id, prefix)
+            for name in names:
+                self._store.delete(campaign_id, f"{prefix}/{name}")
+        except Exception as exc:
+            logger.debug("Combat store event cleanup failed: %s", exc)
+
     def remove_active_combat_session(self, campaign_id: str, session_id: str) -> bool:
-        """Remove the active combat file for a given session if it exists.
+        """Remove the active combat snapshot and event log for a session if they exist.
 
         Args:
             campaign_id: Campaign identifier
@@ -121,11 +439,19 @@ class CombatPersistenceManager:
             active_file = combat_path / "active" / f"{session_id}.json"
             if active_file.exists():
                 active_file.unlink()
+            events_file = self._events_file(combat_path, session_id)
+            if events_file.exists():
+                events_file.unlink()
+            state = self._log_state.pop(session_id, None)
+            self._deregister_active(campaign_id, session_id)
             if self._store is not None:
                 try:
                     self._store.delete(campaign_id, f"data/combat/active/{session_id}.json")
                 except Exception:
                     pass
+                self._delete_store_events(
+                    campaign_id, session_id, state.store_event_names if state else None
+                )
                 logger.info(f"Removed active combat file {active_file}")
             return True
         except Exception as exc:
@@ -135,6 +461,9 @@ class CombatPersistenceManager:
     def load_active_combat(self, campaign_id: str) -> Optional[CombatSession]:
         """Load the active combat session for a campaign.
 
+        The latest snapshot is loaded and any newer events in its log are
+        replayed on top of it.
+
         Args:
             campaign_id: Campaign identifier
 
@@ -163,24 +492,26 @@ class CombatPersistenceManager:
                                     latest_ts = ts
                                     latest_payload = payload
                         if latest_payload:
-                            return self._deserialize_session(latest_payload)
+                            return self._load_from_store_payload(campaign_id, latest_payload)
                     except Exception as exc:
                         logger.debug("Combat store load (active) failed: %s", exc)
                 return None
 
-            # Find the most recent active combat file
+            # Find the most recent active combat snapshot
             combat_files = list(active_dir.glob("*.json"))
             if not combat_files:
                 return None
 
-            # Get the most recently modified file
-            latest_file = max(combat_files, key=lambda f: f.stat().st_mtime)
-
-            with open(latest_file, "r", encoding="utf-8") as f:
-                session_data = json.load(f)
+            # Appending events does not touch the snapshot, so consider the log's mtime too
+            def _last_modified(snapshot: Path) -> float:
+                events_file = self._events_file(combat_path, snapshot.stem)
+                mtime = snapshot.stat().st_mtime
+                if events_file.exists():
+                    mtime = max(mtime, events_file.stat().st_mtime)
+                return mtime
 
-            # Deserialize the session
-            session = self._deserialize_session(session_data)
+            latest_file = max(combat_files, key=_last_modified)
+            session = self._load_snapshot_with_events(campaign_id, combat_path, latest_file)
 
             logger.info(f"Loaded active combat session from {latest_file}")
             return session
@@ -211,25 +542,125 @@ class CombatPersistenceManager:
                     try:
                         payload = self._store.read_json(campaign_id, f"data/combat/active/{session_id}.json")
                         if isinstance(payload, dict):
-                            return self._deserialize_session(payload)
+                            return self._load_from_store_payload(campaign_id, payload)
                     except Exception as exc:
                         logger.debug("Combat store read (by id) failed: %s", exc)
                 return None
 
-            with open(active_file, "r", encoding="utf-8") as f:
-                session_data = json.load(f)
-
-            session = self._deserialize_session(session_data)
+            session = self._load_snapshot_with_events(campaign_id, combat_path, active_file)
             logger.info(f"Loaded combat session {session_id} from {active_file}")
             return session
         except Exception as exc:
             logger.error(f"Failed to load combat session {session_id} for campaign {campaign_id}: {exc}")
             return None
 
+    def _load_snapshot_with_events(self, campaign_id: str, combat_path: Path, snapshot_file: Path) -> CombatSession:
+        """Load a local snapshot and replay its event log."""
+        with open(snapshot_file, "r", encoding="utf-8") as f:
+            session_data = json.load(f)
+
+        session = self._deserialize_session(session_data)
+        snapshot_seq = session_data.get("_metadata", {}).get("event_seq", 0)
+
+        events_file = self._events_file(combat_path, session.session_id)
+        last_seq = snapshot_seq
+        replayed = 0
+        if events_file.exists():
+            with open(events_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A crash mid-append can leave a partial final line
+                        logger.warning(f"Skipping corrupt combat event in {events_file}")
+                        continue
+                    if record.get("seq", 0) <= snapshot_seq:
+                        continue
+                    self._apply_event(session, record)
+                    last_seq = max(last_seq, record["seq"])
+                    replayed += 1
+            if replayed:
+                logger.debug(f"Replayed {replayed} combat events for session {session.session_id}")
+        self._seed_log_state(campaign_id, session, last_seq, replayed, store_event_names=None)
+        return session
+
+    def _load_from_store_payload(self, campaign_id: str, payload: Dict[str, Any]) -> CombatSession:
+        """Deserialize a store snapshot and replay mirrored events."""
+        session = self._deserialize_session(payload)
+        snapshot_seq = payload.get("_metadata", {}).get("event_seq", 0)
+        prefix = self._store_events_prefix(session.session_id)
+        try:
+            names = sorted(self._store.list_json_prefix(campaign_id, prefix))
+        except Exception as exc:
+            logger.debug("Combat store list (events) failed: %s", exc)
+            names = []
+        last_seq = snapshot_seq
+        replayed = 0
+        for name in names:
+            record = self._store.read_json(campaign_id, f"{prefix}/{name}")
+            if isinstance(record, dict) and record.get("seq", 0) > snapshot_seq:
+                self._apply_event(session, record)
+                last_seq = max(last_seq, record["seq"])
+                replayed += 1
+        self._seed_log_state(campaign_id, session, last_seq, replayed, store_event_names=names)
+        return session
+
+    def _seed_log_state(
+        self,
+        campaign_id: str,
+        session: CombatSession,
+        event_seq: int,
+        replayed: int,
+        store_event_names: Optional[List[str]],
+    ) -> None:
+        """Record the persisted view of a loaded session.
+
+        Without this, a restarted process would number new events from 0 and
+        leave older mirrored events behind to be replayed on the next load.
+        """
+        state = self._capture_state(campaign_id, session, event_seq)
+        state.events_since_snapshot = replayed
+        state.store_event_names = list(store_event_names) if store_event_names is not None else None
+        self._log_state[session.session_id] = state
+
+    def _apply_event(self, session: CombatSession, record: Dict[str, Any]) -> None:
+        """Apply one event record to a deserialized session."""
+        fields = record.get("session", {})
+        status = fields.get("status")
+        if isinstance(status, str):
+            try:
+                session.status = CombatStatus[status.upper()]
+            except KeyError:
+                pass
+        if "round_number" in fields:
+            session.round_number = fields["round_number"]
+        if "current_turn_index" in fields:
+            session.current_turn_index = fields["current_turn_index"]
+        if "turn_order" in fields:
+            session.turn_order = list(fields["turn_order"])
+        if fields.get("updated_at"):
+            session.updated_at = datetime.fromisoformat(fields["updated_at"])
+
+        for cid, combatant_data in record.get("combatants", {}).items():
+            session.combatants[cid] = self._deserialize_combatant(combatant_data)
+        for cid in record.get("removed", []):
+            session.combatants.pop(cid, None)
+
+        for action_data in record.get("actions", []):
+            action = self._deserialize_action(action_data)
+            if action:
+                session.combat_log.append(action)
+
     def archive_completed_combat(self, campaign_id: str,
                                 session: CombatSession) -> bool:
         """Archive a completed combat session.
 
+        The snapshot and event log are compacted into a single history file
+        and the active files are removed.
+
         Args:
             campaign_id: Campaign identifier
             session: Completed combat session
@@ -260,17 +691,20 @@ class CombatPersistenceManager:
 
             # Write archive file
             with open(archive_file, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+                json.dump(session_data, f, separators=_COMPACT_SEPARATORS, ensure_ascii=False)
             if self._store is not None:
                 try:
                     self._store.write_json(session_data, campaign_id, f"data/combat/history/{archive_file.name}")
                 except Exception as exc:
                     logger.warning("Combat store mirror (archive) failed: %s", exc)
 
-            # Remove from active
-            active_file = combat_path / "active" / f"{session.session_id}.json"
-            if active_file.exists():
-                active_file.unlink()
+            # Listings read the summary index instead of every archive file
+            self._append_history_index(
+                campaign_id, combat_path, self._history_summary(session_data, archive_file.name)
+            )
+
+            # Remove active snapshot and event log
+            self.remove_active_combat_session(campaign_id, session.session_id)
 
             logger.info(f"Archived combat session to {archive_file}")
             return True
@@ -279,11 +713,127 @@ class CombatPersistenceManager:
             logger.error(f"Failed to archive combat session: {e}")
             return False
 
-    def list_combat_history(self, campaign_id: str) -> List[Dict[str, Any]]:
-        """List all past combat sessions for a campaign.
+    @staticmethod
+    def _history_summary(data: Dict[str, Any], file_name: str) -> Dict[str, Any]:
+        """Build the listing summary for an archived session payload."""
+        metadata = data.get("_metadata", {})
+        return {
+            "session_id": data.get("session_id"),
+            "scene_id": data.get("scene_id"),
+            "archived_at": metadata.get("archived_at"),
+            "duration_seconds": metadata.get("duration_seconds", 0),
+            "rounds": data.get("round_number", 0),
+            "combatant_count": len(data.get("combatants", {})),
+            "status": data.get("status", "unknown"),
+            "file": file_name,
+        }
+
+    @staticmethod
+    def _history_index_file(combat_path: Path) -> Path:
+        """Path of the append-only history summary index for a campaign."""
+        return combat_path / HISTORY_INDEX_FILE
+
+    def _append_history_index(self, campaign_id: str, combat_path: Path, summary: Dict[str, Any]) -> None:
+        """Append an archived session's summary to the local and store indexes."""
+        line = json.dumps(summary, separators=_COMPACT_SEPARATORS, ensure_ascii=False, default=str)
+        with open(self._history_index_file(combat_path), "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+        if self._store is not None:
+            try:
+                entries = self._store.read_json(campaign_id, _STORE_HISTORY_INDEX)
+                entries = entries if isinstance(entries, list) else []
+                entries = [e for e in entries if e.get("file") != summary["file"]] + [summary]
+                self._store.write_json(entries, campaign_id, _STORE_HISTORY_INDEX)
+            except Exception as exc:
+                logger.warning("Combat store mirror (history index) failed: %s", exc)
+
+    def _read_history_index(self, combat_path: Path) -> Optional[List[Dict[str, Any]]]:
+        """Read the local history index; None when it does not exist yet."""
+        index_file = self._history_index_file(combat_path)
+        if not index_file.exists():
+            return None
+        entries: Dict[str, Dict[str, Any]] = {}
+        with open(index_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append can leave a partial final line
+                    logger.warning(f"Skipping corrupt combat history index entry in {index_file}")
+                    continue
+                entries[entry.get("file")] = entry
+        return list(entries.values())
+
+    def rebuild_combat_history_index(self, campaign_id: str) -> int:
+        """Rebuild a campaign's history index from its archived session files.
+
+        Used for campaigns archived before the index existed and to repair an
+        index that no longer matches the history directory.
+
+        Args:
+            campaign_id: Campaign identifier
+
+        Returns:
+            Number of archived sessions indexed
+        """
+        combat_path = self.get_combat_path(campaign_id)
+        if not combat_path:
+            return 0
+
+        history_dir = combat_path / "history"
+        summaries: List[Dict[str, Any]] = []
+        if history_dir.exists():
+            for combat_file in sorted(history_dir.glob("*.json")):
+                try:
+                    with open(combat_file, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    summaries.append(self._history_summary(data, combat_file.name))
+                except Exception as e:
+                    logger.error(f"Error reading combat file {combat_file}: {e}")
+        elif self._store is not None:
+            for name in self._store.list_json_prefix(campaign_id, "data/combat/history"):
+                data = self._store.read_json(campaign_id, f"data/combat/history/{name}")
+                if isinstance(data, dict):
+                    summaries.append(self._history_summary(data, name))
+        summaries.sort(key=lambda x: x.get("archived_at") or "")
+
+        if history_dir.exists():
+            index_file = self._history_index_file(combat_path)
+            tmp_file = index_file.with_suffix(".jsonl.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                for summary in summaries:
+                    f.write(json.dumps(summary, separators=_COMPACT_SEPARATORS, ensure_ascii=False, default=str) + "\n")
+            os.replace(tmp_file, index_file)
+        if self._store is not None:
+            try:
+                self._store.write_json(summaries, campaign_id, _STORE_HISTORY_INDEX)
+            except Exception as exc:
+                logger.warning("Combat store mirror (history index) failed: %s", exc)
+
+        logger.info(f"Rebuilt combat history index for campaign {campaign_id} ({len(summaries)} sessions)")
+        return len(summaries)
+
+    def list_combat_history(
+        self,
+        campaign_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """List past combat sessions for a campaign, newest first.
+
+        Summaries come from the campaign's history index, so archived session
+        files are not opened. The index is rebuilt when it is missing (e.g.
+        campaigns archived before it existed) or out of step with the history
+        directory.
 
         Args:
             campaign_id: Campaign identifier
+            limit: Maximum number of summaries to return (None for all)
+            offset: Number of summaries to skip
 
         Returns:
             List of combat summaries
@@ -294,61 +844,24 @@ class CombatPersistenceManager:
                 return []
 
             history_dir = combat_path / "history"
-            if not history_dir.exists():
-                # Try store listing
-                if self._store is not None:
-                    try:
-                        names = self._store.list_json_prefix(campaign_id, "data/combat/history")
-                        summaries: List[Dict[str, Any]] = []
-                        for name in names:
-                            data = self._store.read_json(campaign_id, f"data/combat/history/{name}")
-                            if not isinstance(data, dict):
-                                continue
-                            metadata = data.get("_metadata", {})
-                            summary = {
-                                "session_id": data.get("session_id"),
-                                "scene_id": data.get("scene_id"),
-                                "archived_at": metadata.get("archived_at"),
-                                "duration_seconds": metadata.get("duration_seconds", 0),
-                                "rounds": data.get("round_number", 0),
-                                "combatant_count": len(data.get("combatants", {})),
-                                "status": data.get("status", "unknown"),
-                                "file": name,
-                            }
-                            summaries.append(summary)
-                        summaries.sort(key=lambda x: x.get("archived_at", ""), reverse=True)
-                        return summaries
-                    except Exception as exc:
-                        logger.debug("Combat store list (history) failed: %s", exc)
+            if history_dir.exists():
+                summaries = self._read_history_index(combat_path)
+                archived_count = sum(1 for name in os.listdir(history_dir) if name.endswith(".json"))
+                if summaries is None or len(summaries) != archived_count:
+                    self.rebuild_combat_history_index(campaign_id)
+                    summaries = self._read_history_index(combat_path) or []
+            elif self._store is not None:
+                summaries = self._store.read_json(campaign_id, _STORE_HISTORY_INDEX)
+                if not isinstance(summaries, list):
+                    self.rebuild_combat_history_index(campaign_id)
+                    summaries = self._store.read_json(campaign_id, _STORE_HISTORY_INDEX) or []
+            else:
                 return []
 
-            summaries = []
-            for combat_file in history_dir.glob("*.json"):
-                try:
-                    with open(combat_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    metadata = data.get("_metadata", {})
-                    summary = {
-                        "session_id": data.get("session_id"),
-                        "scene_id": data.get("scene_id"),
-                        "archived_at": metadata.get("archived_at"),
-                        "duration_seconds": metadata.get("duration_seconds", 0),
-                        "rounds": data.get("round_number", 0),
-                        "combatant_count": len(data.get("combatants", {})),
-                        "status": data.get("status", "unknown"),
-                        "file": combat_file.name
-                    }
-                    summaries.append(summary)
-
-                except Exception as e:
-                    logger.error(f"Error reading combat file {combat_file}: {e}")
-                    continue
-
             # Sort by archived date (newest first)
-            summaries.sort(key=lambda x: x.get("archived_at", ""), reverse=True)
-
-            return summaries
+            summaries.sort(key=lambda x: x.get("archived_at") or "", reverse=True)
+            end = offset + limit if limit is not None else None
+            return summaries[offset:end]
 
         except Exception as e:
             logger.error(f"Failed to list combat history: {e}")
@@ -357,20 +870,42 @@ class CombatPersistenceManager:
     def recover_active_sessions(self) -> Dict[str, CombatSession]:
         """Recover all active combat sessions on startup.
 
+        Only campaigns listed in the active-combat registry are loaded, in
+        parallel, so recovery time does not grow with the number of campaigns.
+        Until the registry has been seeded (first start after upgrading) or
+        when the campaign manager has no storage root, every campaign is
+        scanned once and the registry is seeded from the result.
+
         Returns:
             Dictionary of campaign_id -> CombatSession
         """
-        recovered = {}
-
-        # Scan all campaigns for active combat
-        campaigns = self.campaign_manager.list_campaigns()
-        for campaign_info in campaigns.get("campaigns", []):
-            campaign_id = campaign_info["id"]
-
-            session = self.load_active_combat(campaign_id)
-            if session:
-                recovered[campaign_id] = session
-                logger.info(f"Recovered active combat for campaign {campaign_id}")
+        use_registry = self._registry is not None and self._registry.is_complete()
+        if use_registry:
+            campaign_ids = list(self._registry.load())
+        else:
+            campaigns = self.campaign_manager.list_campaigns()
+            campaign_ids = [info["id"] for info in campaigns.get("campaigns", [])]
+
+        recovered: Dict[str, CombatSession] = {}
+        if campaign_ids:
+            workers = max(1, min(COMBAT_RECOVERY_WORKERS, len(campaign_ids)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="combat-recovery") as pool:
+                sessions = list(pool.map(self.load_active_combat, campaign_ids))
+            for campaign_id, session in zip(campaign_ids, sessions):
+                if session:
+                    recovered[campaign_id] = session
+                    logger.info(f"Recovered active combat for campaign {campaign_id}")
+                elif use_registry:
+                    # Registered but nothing left to load; drop the stale entry
+                    self._deregister_active(campaign_id)
+
+        if self._registry is not None and not use_registry:
+            try:
+                self._registry.seed({
+                    campaign_id: [session.session_id] for campaign_id, session in recovered.items()
+                })
+            except Exception as exc:
+                logger.warning(f"Failed to write active combat registry: {exc}")
 
         return recovered
 
@@ -407,7 +942,7 @@ class CombatPersistenceManager:
             data["battlefield"] = session.battlefield.to_dict()
 
         # Serialize combat log (last 100 actions to avoid huge files)
-        for action in session.combat_log[-100:]:
+        for action in session.combat_log[-SNAPSHOT_COMBAT_LOG_LIMIT:]:
             data["combat_log"].append(action.to_dict())
 
         return data
@@ -565,8 +565,8 @@ class CombatStateManager:
                 logger.info(f"Combat ended: {victory}")
 
                 # Archive completed combat
-            if self.persistence and campaign_id:
-                self.persistence.archive_completed_combat(campaign_id, session)
+                if self.persistence and campaign_id:
+                    self.persistence.archive_completed_combat(campaign_id, session)
 
             if victory:
                 self.active_sessions.pop(session_id, None)
@@ -0,0 +1,412 @@
+"""Headless Monte-Carlo simulation of encounters for balance checks.
+
+Runs many complete fights between a party (non-hostile combatants) and a
+group of enemies (hostile combatants) without narration or persistence,
+using the same rules as live combat: attacks and spells go through
+``CombatEngine.resolve_attack``/``resolve_spell`` and downed player
+characters roll death saves through ``HPManager``. Combatants follow a
+simple targeting policy instead of an agent.
+
+Fights are split into batches and run in a process pool. Worker functions
+are module level so they can be pickled; they receive the roster templates
+and return plain tuples.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import random
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from gaia.mechanics.combat.combat_engine import CombatEngine
+from gaia.mechanics.combat.hp_manager import HPManager
+from gaia.models.combat import CombatantState
+
+logger = logging.getLogger(__name__)
+
+
+def _as_bool(value: Optional[str], default: bool) -> bool:
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+ENCOUNTER_SIM_WORKERS = int(os.getenv("ENCOUNTER_SIM_WORKERS", str(min(4, os.cpu_count() or 1))))
+ENCOUNTER_SIM_USE_PROCESSES = _as_bool(os.getenv("ENCOUNTER_SIM_USE_PROCESSES"), True)
+ENCOUNTER_SIM_MAX_ROUNDS = int(os.getenv("ENCOUNTER_SIM_MAX_ROUNDS", "50"))
+ENCOUNTER_SIM_DEFAULT_RUNS = int(os.getenv("ENCOUNTER_SIM_DEFAULT_RUNS", "2000"))
+
+PARTY_WIN = "party"
+ENEMY_WIN = "enemies"
+DRAW = "draw"
+
+
+@dataclass
+class CombatantLoadout:
+    """What a combatant does on its turn in a simulated fight.
+
+    Attributes:
+        weapon_damage: Damage dice for a weapon attack
+        spell_damage: Damage dice for an offensive spell, if any
+        save_type: Saving throw the spell calls for (None = no save)
+        save_dc: Spell DC; defaults to the caster's spell_save_dc
+        spell_uses: Times the spell is cast before falling back to the weapon
+    """
+    weapon_damage: str = "1d8"
+    spell_damage: Optional[str] = None
+    save_type: Optional[str] = None
+    save_dc: Optional[int] = None
+    spell_uses: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Targeting policies
+# ---------------------------------------------------------------------------
+
+def _focus_weakest(_actor: CombatantState, targets: List[CombatantState]) -> CombatantState:
+    return min(targets, key=lambda target: (target.hp, target.ac))
+
+
+def _focus_strongest(_actor: CombatantState, targets: List[CombatantState]) -> CombatantState:
+    return max(targets, key=lambda target: (target.hp, target.level))
+
+
+def _random_target(_actor: CombatantState, targets: List[CombatantState]) -> CombatantState:
+    return random.choice(targets)
+
+
+TARGET_POLICIES: Dict[str, Callable[[CombatantState, List[CombatantState]], CombatantState]] = {
+    "focus_weakest": _focus_weakest,
+    "focus_strongest": _focus_strongest,
+    "random": _random_target,
+}
+
+
+# ---------------------------------------------------------------------------
+# Worker functions (run inside the pool)
+# ---------------------------------------------------------------------------
+
+# (winner, rounds, hp lost per party member, party members killed)
+FightOutcome = Tuple[str, int, Tuple[int, ...], int]
+
+
+def _run_fight(
+    engine: CombatEngine,
+    roster: List[CombatantState],
+    loadouts: Dict[str, CombatantLoadout],
+    policy: Callable[[CombatantState, List[CombatantState]], CombatantState],
+    max_rounds: int,
+) -> FightOutcome:
+    hp_manager = HPManager()
+    party = [c for c in roster if not c.hostile]
+    enemies = [c for c in roster if c.hostile]
+    start_hp = [c.hp for c in party]
+    spells_left = {c.character_id: loadouts.get(c.character_id, CombatantLoadout()).spell_uses for c in roster}
+    dead: set = set()
+    stable: set = set()
+
+    for combatant in roster:
+        bonus = combatant.combat_stats.initiative_bonus if combatant.combat_stats else 0
+        combatant.initiative = engine.dice_roller.roll_initiative(dex_modifier=bonus)["total"]
+    order = sorted(roster, key=lambda c: c.initiative, reverse=True)
+
+    winner = DRAW
+    rounds = 0
+    while rounds < max_rounds and winner == DRAW:
+        rounds += 1
+        for actor in order:
+            if not actor.can_act():
+                # Downed player characters fight for their lives; NPCs are out
+                if (not actor.is_npc and actor.character_id not in dead
+                        and actor.character_id not in stable):
+                    roll = engine.dice_roller.roll("1d20")["total"]
+                    _, _, effects = hp_manager.make_death_save(actor, roll)
+                    if "death" in effects:
+                        dead.add(actor.character_id)
+                    elif "stabilized" in effects:
+                        stable.add(actor.character_id)
+                continue
+
+            opponents = [c for c in (party if actor.hostile else enemies) if c.can_act()]
+            if not opponents:
+                break
+            target = policy(actor, opponents)
+            loadout = loadouts.get(actor.character_id) or CombatantLoadout()
+            if loadout.spell_damage and spells_left[actor.character_id] > 0:
+                spells_left[actor.character_id] -= 1
+                engine.resolve_spell(
+                    actor,
+                    [target],
+                    spell_damage=loadout.spell_damage,
+                    save_type=loadout.save_type,
+                    save_dc=loadout.save_dc,
+                )
+            else:
+                engine.resolve_attack(actor, target, weapon_damage=loadout.weapon_damage)
+
+            if not target.can_act():
+                # A fresh knockout resets any earlier death-save progress
+                hp_manager.death_saves.pop(target.character_id, None)
+                stable.discard(target.character_id)
+
+        if not any(c.can_act() for c in enemies):
+            winner = PARTY_WIN
+        elif not any(c.can_act() for c in party):
+            winner = ENEMY_WIN
+
+    hp_lost = tuple(max(0, before - c.hp) for before, c in zip(start_hp, party))
+    return winner, rounds, hp_lost, len(dead)
+
+
+def _fresh_copy(template: CombatantState) -> CombatantState:
+    # Fights only rebind scalars and the effect list, so a shallow copy with
+    # its own list is enough (and far cheaper than deepcopy per fight)
+    return replace(template, status_effects=list(template.status_effects))
+
+
+def _simulate_batch(
+    roster: List[CombatantState],
+    loadouts: Dict[str, CombatantLoadout],
+    policy_name: str,
+    runs: int,
+    max_rounds: int,
+    seed: Optional[int],
+) -> List[FightOutcome]:
+    """Run ``runs`` fights of a roster; each fight starts from a fresh copy."""
+    if seed is not None:
+        random.seed(seed)
+    engine = CombatEngine()
+    policy = TARGET_POLICIES[policy_name]
+    return [
+        _run_fight(engine, [_fresh_copy(c) for c in roster], loadouts, policy, max_rounds)
+        for _ in range(runs)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+@dataclass
+class EncounterSimulationResult:
+    """Aggregate statistics over all simulated fights."""
+    runs: int
+    win_rate: float
+    loss_rate: float
+    draw_rate: float
+    expected_rounds: float
+    rounds_distribution: Dict[int, float]
+    party_hp_loss: Dict[str, float]
+    hp_loss_by_combatant: Dict[str, float]
+    party_death_rate: float
+    difficulty: str
+    policy: str
+    max_rounds: int
+    elapsed_ms: float = 0.0
+    metadata: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _rate_difficulty(win_rate: float, mean_hp_loss: float, death_rate: float) -> str:
+    """Map outcomes to the usual encounter difficulty labels."""
+    if win_rate < 0.6 or death_rate >= 0.25:
+        return "deadly"
+    if win_rate < 0.85 or mean_hp_loss >= 0.6:
+        return "hard"
+    if mean_hp_loss >= 0.35:
+        return "medium"
+    if mean_hp_loss >= 0.1:
+        return "easy"
+    return "trivial"
+
+
+def summarize_outcomes(
+    outcomes: Sequence[FightOutcome],
+    party: Sequence[CombatantState],
+    policy: str,
+    max_rounds: int,
+) -> EncounterSimulationResult:
+    """Aggregate per-fight outcomes into an EncounterSimulationResult."""
+    runs = len(outcomes)
+    winners = Counter(outcome[0] for outcome in outcomes)
+    rounds = Counter(outcome[1] for outcome in outcomes)
+    party_max_hp = sum(c.max_hp for c in party) or 1
+    loss_fractions = sorted(sum(outcome[2]) / party_max_hp for outcome in outcomes)
+    per_combatant = [
+        statistics.fmean(outcome[2][index] for outcome in outcomes) if runs else 0.0
+        for index in range(len(party))
+    ]
+    death_rate = sum(1 for outcome in outcomes if outcome[3]) / runs if runs else 0.0
+    win_rate = winners[PARTY_WIN] / runs if runs else 0.0
+    mean_loss = statistics.fmean(loss_fractions) if loss_fractions else 0.0
+
+    return EncounterSimulationResult(
+        runs=runs,
+        win_rate=win_rate,
+        loss_rate=winners[ENEMY_WIN] / runs if runs else 0.0,
+        draw_rate=winners[DRAW] / runs if runs else 0.0,
+        expected_rounds=statistics.fmean(outcome[1] for outcome in outcomes) if runs else 0.0,
+        rounds_distribution={r: count / runs for r, count in sorted(rounds.items())},
+        party_hp_loss={
+            "mean": mean_loss,
+            "p10": _percentile(loss_fractions, 0.1),
+            "p50": _percentile(loss_fractions, 0.5),
+            "p90": _percentile(loss_fractions, 0.9),
+        },
+        hp_loss_by_combatant={c.character_id: loss for c, loss in zip(party, per_combatant)},
+        party_death_rate=death_rate,
+        difficulty=_rate_difficulty(win_rate, mean_loss, death_rate),
+        policy=policy,
+        max_rounds=max_rounds,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Simulator
+# ---------------------------------------------------------------------------
+
+class EncounterSimulator:
+    """Runs encounter simulations across a worker pool."""
+
+    def __init__(
+        self,
+        max_workers: int = ENCOUNTER_SIM_WORKERS,
+        use_processes: bool = ENCOUNTER_SIM_USE_PROCESSES,
+        max_rounds: int = ENCOUNTER_SIM_MAX_ROUNDS,
+    ) -> None:
+        """Initialize the simulator; the pool itself is created on first use.
+
+        Args:
+            max_workers: Worker processes (or threads) in the pool
+            use_processes: Use a process pool (threads when False)
+            max_rounds: Fights still undecided after this many rounds are draws
+        """
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
+        self.max_rounds = max_rounds
+        self.metrics: Counter[str] = Counter()
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._executor_lock:
+            if self._executor is None:
+                if self.use_processes:
+                    try:
+                        # spawn: forking a multi-threaded server process is unsafe
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            mp_context=multiprocessing.get_context("spawn"),
+                        )
+                    except (OSError, NotImplementedError) as exc:
+                        logger.warning(
+                            "Process pool unavailable for encounter simulation (%s); using threads",
+                            exc,
+                        )
+                        self.use_processes = False
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="encounter-sim",
+                    )
+            return self._executor
+
+    def simulate(
+        self,
+        combatants: Sequence[CombatantState],
+        runs: int = ENCOUNTER_SIM_DEFAULT_RUNS,
+        loadouts: Optional[Dict[str, CombatantLoadout]] = None,
+        policy: str = "focus_weakest",
+        seed: Optional[int] = None,
+    ) -> EncounterSimulationResult:
+        """Simulate ``runs`` fights of the roster and summarize the outcomes.
+
+        Args:
+            combatants: Full roster; ``hostile`` decides the side. The
+                states are copied, never modified.
+            runs: Number of fights to simulate
+            loadouts: Per character_id actions; missing entries attack with 1d8
+            policy: Name of a targeting policy in TARGET_POLICIES
+            seed: Makes results reproducible (each batch gets seed + index).
+                Seeds the global ``random`` module of whichever process runs
+                the batch, so leave it unset outside tests and tooling.
+
+        Raises:
+            ValueError: If either side is empty, runs < 1 or the policy is unknown
+        """
+        roster = list(combatants)
+        party = [c for c in roster if not c.hostile]
+        if not party or len(party) == len(roster):
+            raise ValueError("Encounter needs at least one hostile and one non-hostile combatant")
+        if runs < 1:
+            raise ValueError("runs must be at least 1")
+        if policy not in TARGET_POLICIES:
+            raise ValueError(f"Unknown policy '{policy}'. Available: {', '.join(TARGET_POLICIES)}")
+
+        started = time.perf_counter()
+        loadouts = dict(loadouts or {})
+        batches = min(self.max_workers, runs)
+        sizes = [runs // batches + (1 if index < runs % batches else 0) for index in range(batches)]
+
+        if batches == 1:
+            outcomes = _simulate_batch(roster, loadouts, policy, runs, self.max_rounds, seed)
+        else:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(
+                    _simulate_batch,
+                    roster,
+                    loadouts,
+                    policy,
+                    size,
+                    self.max_rounds,
+                    None if seed is None else seed + index,
+                )
+                for index, size in enumerate(sizes)
+            ]
+            outcomes = [outcome for future in futures for outcome in future.result()]
+
+        result = summarize_outcomes(outcomes, party, policy, self.max_rounds)
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        result.metadata = {"batches": batches, "workers": self.max_workers}
+        self.metrics["simulations_total"] += 1
+        self.metrics["fights_total"] += runs
+        return result
+
+    async def simulate_async(
+        self,
+        combatants: Sequence[CombatantState],
+        runs: int = ENCOUNTER_SIM_DEFAULT_RUNS,
+        loadouts: Optional[Dict[str, CombatantLoadout]] = None,
+        policy: str = "focus_weakest",
+        seed: Optional[int] = None,
+    ) -> EncounterSimulationResult:
+        """Run :meth:`simulate` without blocking the event loop."""
+        return await asyncio.to_thread(self.simulate, combatants, runs, loadouts, policy, seed)
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+encounter_simulator = EncounterSimulator()
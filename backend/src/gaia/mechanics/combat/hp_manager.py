@@ -8,7 +8,8 @@ from typing import Optional, Tuple, Dict, Any, List
 from enum import Enum
 
 from gaia.models.combat.persistence.combatant_state import CombatantState
-from gaia.models.combat.persistence.status_effect import StatusEffect, StatusEffectType
+from gaia.models.combat.mechanics.status_effect import StatusEffect
+from gaia.models.combat.mechanics.enums import StatusEffectType
 
 
 class HealthStatus(Enum):
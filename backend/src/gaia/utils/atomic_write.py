@@ -0,0 +1,37 @@
+"""Atomic file writes (temp file + ``os.replace``).
+
+Readers of a file written with these helpers see either the previous or the
+new contents, never a partially written file. Used for the pregeneration
+outputs and checkpoint, the campaign object store's local mirror and the
+character summary index.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers see either the old or the new file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_json(path: Path, payload: Any) -> None:
+    """JSON variant of ``atomic_write_bytes``."""
+    data = json.dumps(payload, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+    atomic_write_bytes(path, data)
+
+
+__all__ = ["atomic_write_bytes", "atomic_write_json"]
@@ -0,0 +1,272 @@
+"""Bounded in-memory cache shared by long-lived managers.
+
+Process-wide singletons (``ProfileManager``, ``SceneImageSetManager``, the
+LLM response cache, ...) used to keep plain dicts that only ever grew, so
+backend RSS tracked the number of campaigns touched since startup.
+:class:`BoundedCache` is a thread-safe LRU with:
+
+* an entry limit and an optional byte budget (sizes from ``sizeof``,
+  :func:`approximate_size` by default),
+* an optional per-entry TTL,
+* hit / miss / eviction / expiration / invalidation counters,
+* invalidation hooks, called with ``(key, value, reason)`` whenever an entry
+  leaves the cache, so owners can drop derived state.
+
+Every named cache registers itself; :func:`cache_stats` reports all of them.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+InvalidationHook = Callable[[Any, Any, str], None]
+
+# Reasons passed to invalidation hooks
+EVICTED = "evicted"
+EXPIRED = "expired"
+INVALIDATED = "invalidated"
+REPLACED = "replaced"
+CLEARED = "cleared"
+
+_MISSING = object()
+
+_registry: "weakref.WeakValueDictionary[str, BoundedCache]" = weakref.WeakValueDictionary()
+
+
+def approximate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """Rough deep size of ``value`` in bytes (containers, dataclasses, models)."""
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value, 64)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, dict):
+        return size + sum(approximate_size(k, seen) + approximate_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(approximate_size(item, seen) for item in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return size + sum(approximate_size(getattr(value, f.name, None), seen) for f in fields(value))
+    attributes = getattr(value, "__dict__", None)
+    if isinstance(attributes, dict):
+        return size + approximate_size(attributes, seen)
+    return size
+
+
+class BoundedCache(Generic[K, V]):
+    """Thread-safe LRU cache with optional TTL and byte budget."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: Optional[int] = 1024,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        sizeof: Optional[Callable[[V], int]] = None,
+    ):
+        """
+        Args:
+            name: Name used in :func:`cache_stats`
+            max_entries: Maximum number of entries (None for no entry limit)
+            max_bytes: Optional budget for the summed entry sizes
+            ttl_seconds: Optional lifetime of an entry since it was set
+            sizeof: Entry size function; defaults to :func:`approximate_size`
+                (only evaluated when ``max_bytes`` is set)
+        """
+        self.name = name
+        self.max_entries = max(1, int(max_entries)) if max_entries else None
+        self.max_bytes = int(max_bytes) if max_bytes else None
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._sizeof = sizeof or approximate_size
+        # key -> (expires_at or None, size, value)
+        self._entries: "OrderedDict[K, Tuple[Optional[float], int, V]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._hooks: List[InvalidationHook] = []
+        self.metrics: Counter = Counter()
+        _registry[name] = self
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """Return the value for ``key`` (refreshing its recency) or ``default``."""
+        removed = []
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                removed.append(self._remove(key, EXPIRED))
+                entry = None
+            if entry is None:
+                self.metrics["misses"] += 1
+                value = default
+            else:
+                self._entries.move_to_end(key)
+                self.metrics["hits"] += 1
+                value = entry[2]
+        self._notify(removed)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[arg-type]
+            return entry is not None and not self._is_expired(entry)
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def keys(self) -> List[K]:
+        """Keys of live entries, least recently used first."""
+        with self._lock:
+            return [key for key, entry in self._entries.items() if not self._is_expired(entry)]
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        """Snapshot of live ``(key, value)`` pairs; does not refresh recency."""
+        with self._lock:
+            snapshot = [(key, entry[2]) for key, entry in self._entries.items() if not self._is_expired(entry)]
+        return iter(snapshot)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def set(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """Store ``value``, evicting least recently used entries past the limits."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        size = self._sizeof(value) if self.max_bytes else 0
+        removed = []
+        with self._lock:
+            if key in self._entries:
+                previous = self._remove(key, REPLACED)
+                if previous[1] is not value:
+                    removed.append(previous)
+            expires_at = time.monotonic() + ttl if ttl else None
+            self._entries[key] = (expires_at, size, value)
+            self._bytes += size
+            self.metrics["sets"] += 1
+            while self._entries and self._over_budget():
+                oldest = next(iter(self._entries))
+                if oldest == key and len(self._entries) == 1:
+                    break  # A single oversized entry is kept rather than dropped on insert
+                removed.append(self._remove(oldest, EVICTED))
+        self._notify(removed)
+
+    __setitem__ = set
+
+    def setdefault(self, key: K, default: V) -> V:
+        """Return the live value for ``key``, storing ``default`` first if missing."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            self.set(key, default)
+            value = default
+        return value
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        """Invalidate ``key``; returns its value (or ``default`` if absent)."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            removed = self._remove(key, INVALIDATED)
+        self._notify([removed])
+        return removed[1]
+
+    invalidate = pop
+
+    def invalidate_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Invalidate every entry for which ``predicate(key, value)`` is true."""
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if predicate(key, entry[2])]
+            removed = [self._remove(key, INVALIDATED) for key in keys]
+        self._notify(removed)
+        return len(removed)
+
+    def purge_expired(self) -> int:
+        """Drop expired entries now instead of on next access."""
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if self._is_expired(entry)]
+            removed = [self._remove(key, EXPIRED) for key in keys]
+        self._notify(removed)
+        return len(removed)
+
+    def clear(self, reset_metrics: bool = False) -> None:
+        with self._lock:
+            removed = [self._remove(key, CLEARED) for key in list(self._entries)]
+            if reset_metrics:
+                self.metrics.clear()
+        self._notify(removed)
+
+    def add_invalidation_hook(self, hook: InvalidationHook) -> None:
+        """Call ``hook(key, value, reason)`` whenever an entry leaves the cache."""
+        self._hooks.append(hook)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.metrics["hits"] + self.metrics["misses"]
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes if self.max_bytes else None,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hit_rate": round(self.metrics["hits"] / lookups, 4) if lookups else 0.0,
+                "hits": self.metrics["hits"],
+                "misses": self.metrics["misses"],
+                "evictions": self.metrics[EVICTED],
+                "expirations": self.metrics[EXPIRED],
+                "invalidations": self.metrics[INVALIDATED],
+            }
+
+    # ------------------------------------------------------------------
+    # Internals (call with the lock held)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_expired(entry: Tuple[Optional[float], int, Any]) -> bool:
+        return entry[0] is not None and entry[0] <= time.monotonic()
+
+    def _over_budget(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _remove(self, key: K, reason: str) -> Tuple[K, V, str]:
+        _expires_at, size, value = self._entries.pop(key)
+        self._bytes -= size
+        if reason != REPLACED:
+            self.metrics[reason] += 1
+        return key, value, reason
+
+    def _notify(self, removed: List[Tuple[K, V, str]]) -> None:
+        # Outside the lock so hooks may touch the cache again
+        for key, value, reason in removed:
+            for hook in self._hooks:
+                hook(key, value, reason)
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats of every live named cache, for diagnostics endpoints and logs."""
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
@@ -1,13 +1,34 @@
 """Dice utilities for D&D gameplay."""
 
+import os
 import random
 import re
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+try:  # Optional: vectorized batch rolling and fast convolution
+    import numpy as np  # type: ignore
+    _NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - environment specific
+    np = None  # type: ignore
+    _NUMPY_AVAILABLE = False
 
 
 # TODO We should not be returning dicts, we should be returning well formed structs
 
+# Number of recent rolls kept per roller (history is a ring buffer)
+DICE_HISTORY_SIZE = int(os.getenv("DICE_HISTORY_SIZE", "100"))
+
+_TOKEN_RE = re.compile(r'([+-]?[^+-]+)')
+# Dice term with an optional trailing damage type, e.g. 2d6fire
+_DICE_RE = re.compile(r'([+-]?)(\d*)d(\d+)([A-Za-z]\w*)?')
+_MODIFIER_RE = re.compile(r'([+-]?\d+)')
+_DAMAGE_TYPE_RE = re.compile(r"\d+d\d+(?:[+-]\d+)?\s+(\w+)")
+
+
 class DiceType(Enum):
     """Standard dice types in D&D."""
     D4 = 4
@@ -19,91 +40,190 @@ class DiceType(Enum):
     D100 = 100
 
 
+@dataclass(frozen=True)
+class DiceTerm:
+    """A group of identical dice within an expression (e.g. 2d6)."""
+    count: int
+    sides: int
+    damage_type: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CompiledDiceExpression:
+    """Parsed form of a dice expression, reused across rolls."""
+    expression: str
+    terms: Tuple[DiceTerm, ...]
+    modifier: int
+
+    @property
+    def dice_count(self) -> int:
+        return sum(term.count for term in self.terms)
+
+    @property
+    def damage_types(self) -> List[str]:
+        return [term.damage_type for term in self.terms if term.damage_type]
+
+
+@lru_cache(maxsize=1024)
+def compile_dice_expression(expression: str) -> CompiledDiceExpression:
+    """Parse a dice expression once; results are cached by expression text.
+
+    Raises:
+        ValueError: If the expression contains no dice or has invalid dice
+    """
+    tokens = _TOKEN_RE.findall(expression.replace(' ', ''))
+    if not tokens:
+        raise ValueError(f"Invalid dice expression: {expression}")
+
+    terms: List[DiceTerm] = []
+    modifier = 0
+    for token in tokens:
+        dice_match = _DICE_RE.match(token)
+        if dice_match:
+            _sign, count_str, die_str, damage_type = dice_match.groups()
+            dice_count = int(count_str) if count_str else 1
+            dice_type = int(die_str)
+            if dice_count <= 0 or dice_type <= 0:
+                raise ValueError(f"Invalid dice expression: {expression}")
+            terms.append(DiceTerm(dice_count, dice_type, damage_type))
+        elif _MODIFIER_RE.fullmatch(token):
+            # Modifier (e.g., +3 or -2) - must match the whole token
+            modifier += int(token)
+        # Other tokens (descriptive words) are ignored
+
+    if not terms:
+        raise ValueError(f"Invalid dice expression: {expression}")
+    return CompiledDiceExpression(expression, tuple(terms), modifier)
+
+
+def _die_pmf(sides: int, advantage: bool, disadvantage: bool) -> List[float]:
+    """Probability of each face (index 0 = total 1) for one die."""
+    square = sides * sides
+    if advantage and not disadvantage:
+        return [(k * k - (k - 1) * (k - 1)) / square for k in range(1, sides + 1)]
+    if disadvantage and not advantage:
+        return [((sides - k + 1) ** 2 - (sides - k) ** 2) / square for k in range(1, sides + 1)]
+    return [1.0 / sides] * sides
+
+
+def _convolve(a: Sequence[float], b: Sequence[float]) -> List[float]:
+    if _NUMPY_AVAILABLE:
+        return np.convolve(a, b).tolist()
+    out = [0.0] * (len(a) + len(b) - 1)
+    for i, pa in enumerate(a):
+        if pa:
+            for j, pb in enumerate(b):
+                out[i + j] += pa * pb
+    return out
+
+
+@lru_cache(maxsize=256)
+def _distribution(expression: str, advantage: bool, disadvantage: bool) -> Tuple[Tuple[int, float], ...]:
+    compiled = compile_dice_expression(expression)
+    pmf: List[float] = [1.0]
+    lowest = compiled.modifier
+    for term in compiled.terms:
+        die = _die_pmf(term.sides, advantage, disadvantage)
+        for _ in range(term.count):
+            pmf = _convolve(pmf, die)
+        lowest += term.count
+    return tuple((lowest + offset, p) for offset, p in enumerate(pmf) if p > 0)
+
+
+def dice_distribution(expression: str, advantage: bool = False,
+                      disadvantage: bool = False) -> Dict[int, float]:
+    """Exact probability of every total for an expression (via convolution).
+
+    Advantage/disadvantage apply per die, matching multi-die rolls in
+    ``DiceRoller.roll``.
+    """
+    return dict(_distribution(expression, advantage, disadvantage))
+
+
+def roll_many(expression: str, num_rolls: int, advantage: bool = False,
+              disadvantage: bool = False, seed: Optional[int] = None) -> List[int]:
+    """Roll an expression ``num_rolls`` times and return the totals.
+
+    Uses NumPy to roll every die of every sample in one call when available.
+    """
+    compiled = compile_dice_expression(expression)
+    twice = advantage != disadvantage
+
+    if _NUMPY_AVAILABLE:
+        rng = np.random.default_rng(seed)
+        totals = np.full(num_rolls, compiled.modifier, dtype=np.int64)
+        for term in compiled.terms:
+            rolls = rng.integers(1, term.sides + 1, size=(num_rolls, term.count))
+            if twice:
+                second = rng.integers(1, term.sides + 1, size=(num_rolls, term.count))
+                rolls = np.maximum(rolls, second) if advantage else np.minimum(rolls, second)
+            totals += rolls.sum(axis=1)
+        return totals.tolist()
+
+    rng = random.Random(seed)
+    totals = []
+    for _ in range(num_rolls):
+        total = compiled.modifier
+        for term in compiled.terms:
+            for _ in range(term.count):
+                roll = rng.randint(1, term.sides)
+                if twice:
+                    other = rng.randint(1, term.sides)
+                    roll = max(roll, other) if advantage else min(roll, other)
+                total += roll
+        totals.append(total)
+    return totals
+
+
 class DiceRoller:
     """Roll dice for D&D gameplay."""
 
-    def __init__(self):
-        self.roll_history = []
-    
-    # TODO The way this is defined is way too damn complicated, simplify
+    def __init__(self, history_size: int = DICE_HISTORY_SIZE):
+        # Ring buffer: the roller is long-lived (one per combat engine)
+        self.roll_history: deque = deque(maxlen=history_size)
+
     def roll(self, expression: str, advantage: bool = False, disadvantage: bool = False) -> Dict[str, Any]:
         """Roll dice based on expressions like '1d20+5', '2d8+1d6+3', or '2d6 fire damage'."""
-        # Split expression into tokens for + and -
-        tokens = re.findall(r'([+-]?[^+-]+)', expression.replace(' ', ''))
-        if not tokens:
-            raise ValueError(f"Invalid dice expression: {expression}")
-        
-        total = 0
+        compiled = compile_dice_expression(expression)
+
         all_rolls = []
         all_raw_rolls = []
         all_raw_rolls2 = []
-        modifier = 0
-        damage_types = []
         is_critical = False
         is_critical_fail = False
-        dice_found = False
-        valid_token_found = False
         single_adv_dis_total = None
-        for token in tokens:
-            dice_match = re.match(r'([+-]?)(\d*)d(\d+)', token)
-            if dice_match:
-                dice_found = True
-                valid_token_found = True
-                sign, count_str, die_str = dice_match.groups()
-                dice_count = int(count_str) if count_str else 1
-                dice_type = int(die_str)
-                
-                # Validate dice count and type
-                if dice_count <= 0:
-                    raise ValueError(f"Invalid dice expression: {expression}")
-                if dice_type <= 0:
-                    raise ValueError(f"Invalid dice expression: {expression}")
-                
-                # Check for damage type (e.g., 2d6fire)
-                dmg_type_match = re.match(r'.*d\d+(\w+)$', token)
-                if dmg_type_match:
-                    damage_types.append(dmg_type_match.group(1))
-                # Roll the dice
-                for _ in range(dice_count):
-                    roll1 = random.randint(1, dice_type)
-                    if advantage or disadvantage:
-                        roll2 = random.randint(1, dice_type)
-                        all_raw_rolls.append(roll1)
-                        all_raw_rolls2.append(roll2)
-                        if dice_count == 1:
-                            # For single die, include both rolls in 'rolls' and set total to max/min
-                            all_rolls.extend([roll1, roll2])
-                            single_adv_dis_total = max(roll1, roll2) if advantage else min(roll1, roll2)
-                        else:
-                            chosen = max(roll1, roll2) if advantage else min(roll1, roll2)
-                            all_rolls.append(chosen)
-                        # Critical check for d20
-                        if dice_type == 20:
-                            if roll1 == 20 or roll2 == 20:
-                                is_critical = True
-                            if roll1 == 1 or roll2 == 1:
-                                is_critical_fail = True
+        for term in compiled.terms:
+            dice_count = term.count
+            dice_type = term.sides
+            for _ in range(dice_count):
+                roll1 = random.randint(1, dice_type)
+                if advantage or disadvantage:
+                    roll2 = random.randint(1, dice_type)
+                    all_raw_rolls.append(roll1)
+                    all_raw_rolls2.append(roll2)
+                    if dice_count == 1:
+                        # For single die, include both rolls in 'rolls' and set total to max/min
+                        all_rolls.extend([roll1, roll2])
+                        single_adv_dis_total = max(roll1, roll2) if advantage else min(roll1, roll2)
                     else:
-                        all_raw_rolls.append(roll1)
-                        all_rolls.append(roll1)
-                        if dice_type == 20:
-                            if roll1 == 20:
-                                is_critical = True
-                            if roll1 == 1:
-                                is_critical_fail = True
-            else:
-                # Modifier (e.g., +3 or -2) - must match the whole token
-                mod_match = re.fullmatch(r'([+-]?\d+)', token)
-                if mod_match:
-                    modifier += int(mod_match.group(1))
-                    valid_token_found = True
+                        chosen = max(roll1, roll2) if advantage else min(roll1, roll2)
+                        all_rolls.append(chosen)
+                    # Critical check for d20
+                    if dice_type == 20:
+                        if roll1 == 20 or roll2 == 20:
+                            is_critical = True
+                        if roll1 == 1 or roll2 == 1:
+                            is_critical_fail = True
                 else:
-                    pass  # Don't raise yet, check after loop
-        # FINAL CHECK: If no valid dice or modifier tokens were found, raise ValueError
-        if not valid_token_found:
-            raise ValueError(f"Invalid dice expression: {expression}")
-        if not dice_found:
-            raise ValueError(f"Invalid dice expression: {expression}")
+                    all_raw_rolls.append(roll1)
+                    all_rolls.append(roll1)
+                    if dice_type == 20:
+                        if roll1 == 20:
+                            is_critical = True
+                        if roll1 == 1:
+                            is_critical_fail = True
+
+        modifier = compiled.modifier
         if single_adv_dis_total is not None:
             total = single_adv_dis_total + modifier
         else:
@@ -121,6 +241,7 @@ class DiceRoller:
         if advantage or disadvantage:
             result["raw_rolls"] = all_raw_rolls
             result["raw_rolls2"] = all_raw_rolls2
+        damage_types = compiled.damage_types
         if damage_types:
             result["damage_types"] = damage_types
         self.roll_history.append(result)
@@ -289,72 +410,33 @@ class DiceRoller:
         return self.roll_dice(DiceType.D20, 1, dex_modifier + initiative_bonus)
     
     def get_statistics(self, expression: str, num_rolls: int = 1000) -> Dict[str, Any]:
-        results = []
-        for _ in range(num_rolls):
-            result = self.roll(expression)
-            results.append(result["total"])
+        """Sample an expression in one batch; exact expectations come from the distribution."""
+        results = roll_many(expression, num_rolls)
+        distribution = dice_distribution(expression)
         return {
             "expression": expression,
             "num_rolls": num_rolls,
             "min": min(results),
             "max": max(results),
             "average": sum(results) / len(results),
+            "expected": sum(total * p for total, p in distribution.items()),
             "results": results
         }
 
 class DiceParser:
     """Parse dice expressions."""
     def parse(self, expression: str) -> Dict[str, Any]:
-        # Split expression into tokens for + and -
-        tokens = re.findall(r'([+-]?[^+-]+)', expression.replace(' ', ''))
-        if not tokens:
-            raise ValueError(f"Invalid dice expression: {expression}")
-        dice_sets = []
-        total_dice = 0
-        last_type = None
-        modifier = 0
-        dice_found = False
-        valid_token_found = False
-        for token in tokens:
-            dice_match = re.match(r'([+-]?)(\d*)d(\d+)', token)
-            if dice_match:
-                dice_found = True
-                valid_token_found = True
-                sign, count_str, die_str = dice_match.groups()
-                dice_count = int(count_str) if count_str else 1
-                dice_type = int(die_str)
-                
-                # Validate dice count and type
-                if dice_count <= 0:
-                    raise ValueError(f"Invalid dice expression: {expression}")
-                if dice_type <= 0:
-                    raise ValueError(f"Invalid dice expression: {expression}")
-                
-                dice_sets.append({"count": dice_count, "type": dice_type})
-                total_dice += dice_count
-                last_type = dice_type
-            else:
-                # Modifier (e.g., +3 or -2) - must match the whole token
-                mod_match = re.fullmatch(r'([+-]?\d+)', token)
-                if mod_match:
-                    modifier += int(mod_match.group(1))
-                    valid_token_found = True
-                else:
-                    pass  # Don't raise yet, check after loop
-        # FINAL CHECK: If no valid dice or modifier tokens were found, raise ValueError
-        if not valid_token_found:
-            raise ValueError(f"Invalid dice expression: {expression}")
-        if not dice_found:
-            raise ValueError(f"Invalid dice expression: {expression}")
+        compiled = compile_dice_expression(expression)
+        dice_sets = [{"count": term.count, "type": term.sides} for term in compiled.terms]
         result = {
-            "dice_count": total_dice,
-            "dice_type": last_type,
-            "modifier": modifier
+            "dice_count": compiled.dice_count,
+            "dice_type": compiled.terms[-1].sides,
+            "modifier": compiled.modifier
         }
         if len(dice_sets) > 1:
             result["dice_sets"] = dice_sets
         # Parse damage type if present
-        damage_type_match = re.search(r"\d+d\d+(?:[+-]\d+)?\s+(\w+)", expression)
+        damage_type_match = _DAMAGE_TYPE_RE.search(expression)
         if damage_type_match:
             result["damage_type"] = damage_type_match.group(1)
-        return result 
\ No newline at end of file
+        return result
@@ -0,0 +1,168 @@
+"""Import-time profile of the backend entry point.
+
+Runs ``python -X importtime`` in a fresh interpreter, summarizes the slowest
+imports and reports the worker's peak RSS after import. Optional budgets turn
+it into a regression guard for CI::
+
+    python -m gaia.utils.import_profile --top 25
+    python -m gaia.utils.import_profile --max-seconds 6 --max-rss-mb 400 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+DEFAULT_MODULE = "gaia.api.app"
+
+# Child program: import the target, then report peak RSS and loaded module names
+_CHILD_PROGRAM = """
+import json, resource, sys
+import {module}
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+sys.stdout.write(json.dumps({{"rss": rss, "modules": sorted(sys.modules)}}))
+"""
+
+
+@dataclass
+class ImportTiming:
+    """One ``-X importtime`` line (microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    """Summary of a profiled import."""
+
+    module: str
+    wall_seconds: float
+    peak_rss_mb: float
+    module_count: int
+    top_cumulative: List[ImportTiming] = field(default_factory=list)
+    top_self: List[ImportTiming] = field(default_factory=list)
+    loaded_modules: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, object]:
+        payload = asdict(self)
+        payload.pop("loaded_modules")
+        return payload
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse ``-X importtime`` stderr into timings, skipping unrelated lines."""
+    timings: List[ImportTiming] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        self_part, cumulative_part, name_part = parts
+        try:
+            self_us = int(self_part.strip())
+            cumulative_us = int(cumulative_part.strip())
+        except ValueError:
+            continue  # header line
+        stripped = name_part.lstrip(" ")
+        # Nesting is rendered as two spaces per level after the separator space
+        depth = max(0, (len(name_part) - len(stripped) - 1) // 2)
+        timings.append(ImportTiming(stripped.strip(), self_us, cumulative_us, depth))
+    return timings
+
+
+def profile_import(module: str = DEFAULT_MODULE, top: int = 20,
+                   env: Optional[Dict[str, str]] = None) -> ImportProfile:
+    """Import ``module`` in a fresh interpreter and summarize the cost."""
+    child_env = dict(os.environ if env is None else env)
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD_PROGRAM.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=child_env,
+    )
+    wall_seconds = time.perf_counter() - started
+    if completed.returncode != 0:
+        tail = "\n".join(completed.stderr.strip().splitlines()[-20:])
+        raise RuntimeError(f"Importing {module} failed:\n{tail}")
+
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    rss_kb = result["rss"] / 1024 if sys.platform == "darwin" else result["rss"]
+    timings = parse_importtime(completed.stderr)
+    return ImportProfile(
+        module=module,
+        wall_seconds=round(wall_seconds, 3),
+        peak_rss_mb=round(rss_kb / 1024, 1),
+        module_count=len(result["modules"]),
+        top_cumulative=sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top],
+        top_self=sorted(timings, key=lambda t: t.self_us, reverse=True)[:top],
+        loaded_modules=result["modules"],
+    )
+
+
+def _format_report(profile: ImportProfile) -> str:
+    lines = [
+        f"Import profile for {profile.module}",
+        f"  wall time:   {profile.wall_seconds:.3f}s",
+        f"  peak RSS:    {profile.peak_rss_mb:.1f} MB",
+        f"  modules:     {profile.module_count}",
+        "",
+        f"  {'cumulative ms':>14}  {'self ms':>9}  module",
+    ]
+    for timing in profile.top_cumulative:
+        lines.append(
+            f"  {timing.cumulative_us / 1000:>14.1f}  {timing.self_us / 1000:>9.1f}  {timing.module}"
+        )
+    lines.append("")
+    lines.append("  Slowest modules by self time:")
+    for timing in profile.top_self:
+        lines.append(f"  {timing.self_us / 1000:>14.1f}  {timing.module}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Profile backend import time and memory")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="Module to import (default: %(default)s)")
+    parser.add_argument("--top", type=int, default=20, help="Number of entries to show")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    parser.add_argument("--max-seconds", type=float, help="Fail if import wall time exceeds this")
+    parser.add_argument("--max-rss-mb", type=float, help="Fail if peak RSS exceeds this")
+    parser.add_argument(
+        "--forbid",
+        action="append",
+        default=[],
+        help="Fail if this module gets imported (repeatable), e.g. google.cloud.storage",
+    )
+    args = parser.parse_args(argv)
+
+    profile = profile_import(args.module, top=args.top)
+    if args.json:
+        print(json.dumps(profile.to_dict(), indent=2))
+    else:
+        print(_format_report(profile))
+
+    failures = []
+    if args.max_seconds is not None and profile.wall_seconds > args.max_seconds:
+        failures.append(f"wall time {profile.wall_seconds:.3f}s > {args.max_seconds}s")
+    if args.max_rss_mb is not None and profile.peak_rss_mb > args.max_rss_mb:
+        failures.append(f"peak RSS {profile.peak_rss_mb:.1f}MB > {args.max_rss_mb}MB")
+    loaded = set(profile.loaded_modules)
+    failures.extend(f"{name} imported eagerly" for name in args.forbid if name in loaded)
+    for failure in failures:
+        print(f"BUDGET EXCEEDED: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Helpers for deferring heavy optional imports until first use.
+
+Optional provider SDKs (google-cloud-storage, runware, ...) pull in large
+dependency trees. Importing them at module load makes every worker pay the
+cost even when the provider is never configured, so callers check
+availability with :func:`module_available` (no import) and bind the module
+through :func:`lazy_module`, which imports it on first attribute access.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import threading
+import types
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def module_available(name: str) -> bool:
+    """Return True if ``name`` can be imported, without importing it.
+
+    Parent packages are imported to resolve dotted names (``google.cloud``
+    is a cheap namespace package), the module itself is not.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._load(), item)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """Return a proxy for ``name`` that defers the import until it is used."""
+    return LazyModule(name)
+
+
+__all__ = ["LazyModule", "lazy_module", "module_available"]
@@ -0,0 +1,521 @@
+"""Incremental JSON extractor for structured LLM output.
+
+``sanitize_json_string`` and ``parse_json_with_fallbacks`` run several regex
+and replace passes over a response once it has finished streaming.
+``StreamingJSONExtractor`` instead consumes the response chunk by chunk in a
+single pass and emits field-level events while the payload is still being
+generated, so e.g. the ``narrative`` string can reach TTS and clients early.
+
+It tolerates the same malformed output the sanitizer handles:
+
+- leading/trailing prose or markdown fences around the JSON object
+- raw control characters inside strings (newline/tab/CR kept, others dropped)
+- trailing commas and unquoted object keys
+- truncated output (``finish`` closes open strings and containers)
+"""
+
+import json
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PathElement = Union[str, int]
+Path = Tuple[PathElement, ...]
+
+# Characters that end a run of plain string content
+_STRING_SPECIAL_RE = re.compile(r'["\\\x00-\x1f]')
+
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    '\\': '\\',
+    '/': '/',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+}
+
+_SCALAR_CHARS = set("+-0123456789.eEtruefalsnTRUEFALSN")
+
+# Event kinds
+STRING_DELTA = "string_delta"
+VALUE = "value"
+COMPLETE = "complete"
+
+
+@dataclass
+class JSONStreamEvent:
+    """A field-level event emitted while parsing streamed JSON.
+
+    Attributes:
+        kind: ``string_delta`` (new text for a string value), ``value`` (a
+            value finished parsing) or ``complete`` (the root object closed)
+        path: Keys/indices from the root object to the value
+        value: Delta text, completed value, or the full root object
+    """
+    kind: str
+    path: Path
+    value: Any = None
+
+    @property
+    def field(self) -> str:
+        """Dotted field name, e.g. ``narrative`` or ``characters.0.name``."""
+        return ".".join(str(part) for part in self.path)
+
+
+class _Frame:
+    """An open object or array on the parser stack."""
+    __slots__ = ("container", "path", "state", "key")
+
+    def __init__(self, container: Union[Dict[str, Any], List[Any]], path: Path):
+        self.container = container
+        self.path = path
+        # object: key_or_end, colon, value, comma_or_end
+        # array:  value_or_end, comma_or_end
+        self.state = "key_or_end" if isinstance(container, dict) else "value_or_end"
+        self.key: Optional[str] = None
+
+    @property
+    def is_object(self) -> bool:
+        return isinstance(self.container, dict)
+
+
+class StreamingJSONExtractor:
+    """Single-pass, incremental parser for one JSON object in an LLM stream."""
+
+    def __init__(
+        self,
+        stream_fields: Optional[Set[str]] = None,
+        value_event_depth: int = 1,
+        strict: bool = False,
+    ):
+        """Initialize the extractor.
+
+        Args:
+            stream_fields: Dotted field names whose string content is emitted as
+                ``string_delta`` events; None streams every string value
+            value_event_depth: Emit ``value`` events for values at most this deep
+            strict: Only apply the repairs listed in the module docstring (minus
+                surrounding prose and truncation); stop with ``error`` set on any
+                other unexpected character, invalid literal or trailing content
+        """
+        self.stream_fields = stream_fields
+        self.value_event_depth = value_event_depth
+        self.strict = strict
+        self.error: Optional[str] = None
+
+        self.root: Optional[Dict[str, Any]] = None
+        self._stack: List[_Frame] = []
+        self._mode = "seek"  # seek, structure, string, bare_key, scalar, done, error
+        self._events: List[JSONStreamEvent] = []
+
+        # String state
+        self._string_parts: List[str] = []
+        self._string_is_key = False
+        self._string_path: Path = ()
+        self._string_streamed = False
+        self._delta_parts: List[str] = []
+        self._escape: Optional[str] = None  # None, "\\" or "u" + hex digits
+        self._pending_high_surrogate: Optional[int] = None
+
+        # Scalar / bare key state
+        self._token_parts: List[str] = []
+        self._scalar_path: Path = ()
+
+    @property
+    def done(self) -> bool:
+        """True once the root object has been closed."""
+        return self._mode == "done"
+
+    def feed(self, chunk: str) -> List[JSONStreamEvent]:
+        """Consume a chunk of streamed text and return the events it produced."""
+        if not chunk or self._mode == "error":
+            return []
+        if self._mode == "done":
+            self._check_trailing(chunk)
+            return []
+
+        index = 0
+        length = len(chunk)
+        while index < length and self._mode not in ("done", "error"):
+            mode = self._mode
+            if mode == "string":
+                index = self._consume_string(chunk, index)
+            elif mode == "seek":
+                start = chunk.find("{", index)
+                if start == -1:
+                    index = length
+                else:
+                    self.root = {}
+                    self._stack.append(_Frame(self.root, ()))
+                    self._mode = "structure"
+                    index = start + 1
+            elif mode == "scalar" or mode == "bare_key":
+                index = self._consume_token(chunk, index)
+            else:
+                self._consume_structure(chunk[index])
+                index += 1
+
+        if self._mode == "done":
+            self._check_trailing(chunk[index:])
+        self._flush_delta()
+        events, self._events = self._events, []
+        return events
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """Close any open string/containers (truncated output) and return the root object."""
+        if self._mode == "error":
+            return None
+        if self._mode == "string":
+            if self._string_is_key:
+                self._string_parts.clear()
+            else:
+                self._complete_string()
+        elif self._mode == "scalar":
+            self._complete_scalar()
+        elif self._mode == "bare_key":
+            self._token_parts.clear()
+
+        if self._mode != "done" and self.root is not None:
+            while self._stack:
+                self._close_container()
+        self._flush_delta()
+        self._mode = "done"
+        return self.root
+
+    def _reject(self, reason: str) -> None:
+        """Stop parsing on malformed input the strict mode does not repair."""
+        if self.strict:
+            self.error = reason
+            self._mode = "error"
+
+    def _check_trailing(self, text: str) -> None:
+        if text.strip():
+            self._reject("trailing content after the root object")
+
+    def drain_events(self) -> List[JSONStreamEvent]:
+        """Return events produced by ``finish`` that were not returned by ``feed``."""
+        events, self._events = self._events, []
+        return events
+
+    # ------------------------------------------------------------------
+    # Structure
+    # ------------------------------------------------------------------
+
+    def _consume_structure(self, char: str) -> None:
+        if char in " \t\r\n":
+            return
+        frame = self._stack[-1]
+        state = frame.state
+
+        if state == "key_or_end":
+            if char == '"':
+                self._start_string(is_key=True, path=frame.path)
+            elif char == "}":
+                self._close_container()
+            elif char.isalpha() or char == "_":
+                self._mode = "bare_key"
+                self._token_parts = [char]
+            else:
+                # Anything else (stray commas) is ignored
+                self._reject(f"unexpected {char!r} where a key was expected")
+        elif state == "colon":
+            if char == ":":
+                frame.state = "value"
+            else:
+                self._reject(f"unexpected {char!r} where ':' was expected")
+        elif state in ("value", "value_or_end"):
+            if char == "]" and not frame.is_object:
+                self._close_container()
+            elif char == "}" and frame.is_object and not self.strict:
+                # Key without a value; drop it
+                frame.key = None
+                self._close_container()
+            elif char != ",":
+                self._start_value(char, frame)
+            else:
+                self._reject("unexpected ',' where a value was expected")
+        elif state == "comma_or_end":
+            if char == ",":
+                frame.state = "key_or_end" if frame.is_object else "value_or_end"
+            elif char == "}" and frame.is_object:
+                self._close_container()
+            elif char == "]" and not frame.is_object:
+                self._close_container()
+            else:
+                self._reject(f"unexpected {char!r} where ',' or a closing bracket was expected")
+
+    def _child_path(self, frame: _Frame) -> Path:
+        if frame.is_object:
+            return frame.path + (frame.key,)
+        return frame.path + (len(frame.container),)
+
+    def _start_value(self, char: str, frame: _Frame) -> None:
+        path = self._child_path(frame)
+        if char == '"':
+            self._start_string(is_key=False, path=path)
+        elif char == "{" or char == "[":
+            container: Union[Dict[str, Any], List[Any]] = {} if char == "{" else []
+            self._store(frame, container)
+            self._stack.append(_Frame(container, path))
+        elif char in _SCALAR_CHARS:
+            self._mode = "scalar"
+            self._token_parts = [char]
+            self._scalar_path = path
+        else:
+            # Unknown characters are skipped
+            self._reject(f"unexpected {char!r} where a value was expected")
+
+    def _store(self, frame: _Frame, value: Any) -> None:
+        """Attach a value to its parent and advance the parent's state."""
+        if frame.is_object:
+            if frame.key is not None:
+                frame.container[frame.key] = value
+            frame.key = None
+        else:
+            frame.container.append(value)
+        frame.state = "comma_or_end"
+
+    def _close_container(self) -> None:
+        frame = self._stack.pop()
+        if frame.is_object and frame.key is not None and frame.state != "comma_or_end":
+            frame.key = None
+        if not self._stack:
+            self._mode = "done"
+            self._emit_value(frame.path, frame.container)
+            self._events.append(JSONStreamEvent(COMPLETE, (), frame.container))
+        else:
+            self._emit_value(frame.path, frame.container)
+
+    def _emit_value(self, path: Path, value: Any) -> None:
+        if 0 < len(path) <= self.value_event_depth:
+            self._events.append(JSONStreamEvent(VALUE, path, value))
+
+    # ------------------------------------------------------------------
+    # Strings
+    # ------------------------------------------------------------------
+
+    def _start_string(self, is_key: bool, path: Path) -> None:
+        self._mode = "string"
+        self._string_is_key = is_key
+        self._string_path = path
+        self._string_parts = []
+        self._escape = None
+        self._pending_high_surrogate = None
+        field_name = ".".join(str(part) for part in path)
+        self._string_streamed = not is_key and (
+            self.stream_fields is None or field_name in self.stream_fields
+        )
+
+    def _append_text(self, text: str) -> None:
+        if not text:
+            return
+        self._string_parts.append(text)
+        if self._string_streamed:
+            self._delta_parts.append(text)
+
+    def _flush_delta(self) -> None:
+        if self._delta_parts:
+            self._events.append(
+                JSONStreamEvent(STRING_DELTA, self._string_path, "".join(self._delta_parts))
+            )
+            self._delta_parts = []
+
+    def _consume_string(self, chunk: str, index: int) -> int:
+        length = len(chunk)
+        while index < length:
+            if self._escape is not None:
+                index = self._consume_escape(chunk, index)
+                if self._mode == "error":
+                    return index
+                continue
+
+            match = _STRING_SPECIAL_RE.search(chunk, index)
+            if match is None:
+                self._append_text(chunk[index:])
+                return length
+
+            position = match.start()
+            self._append_text(chunk[index:position])
+            char = chunk[position]
+            index = position + 1
+            if char == '"':
+                if self._string_is_key:
+                    self._complete_key()
+                else:
+                    self._complete_string()
+                return index
+            if char == "\\":
+                self._escape = "\\"
+            elif char in "\n\r\t":
+                self._append_text(char)
+            # Other raw control characters are dropped
+        return index
+
+    def _consume_escape(self, chunk: str, index: int) -> int:
+        char = chunk[index]
+        if self._escape == "\\":
+            if char == "u":
+                self._escape = "u"
+            else:
+                self._escape = None
+                if char not in _SIMPLE_ESCAPES:
+                    self._reject(f"invalid escape '\\{char}'")
+                self._append_text(_SIMPLE_ESCAPES.get(char, char))
+            return index + 1
+
+        # Collecting \uXXXX digits, possibly across chunk boundaries
+        digits = self._escape[1:]
+        while index < len(chunk) and len(digits) < 4:
+            digits += chunk[index]
+            index += 1
+        if len(digits) < 4:
+            self._escape = "u" + digits
+            return index
+
+        self._escape = None
+        try:
+            code = int(digits, 16)
+        except ValueError:
+            self._reject(f"invalid unicode escape '\\u{digits}'")
+            self._append_text(digits)
+            return index
+
+        if 0xD800 <= code <= 0xDBFF:
+            self._pending_high_surrogate = code
+        elif 0xDC00 <= code <= 0xDFFF and self._pending_high_surrogate is not None:
+            combined = 0x10000 + ((self._pending_high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+            self._pending_high_surrogate = None
+            self._append_text(chr(combined))
+        else:
+            self._pending_high_surrogate = None
+            self._append_text(chr(code))
+        return index
+
+    def _complete_key(self) -> None:
+        frame = self._stack[-1]
+        frame.key = "".join(self._string_parts)
+        frame.state = "colon"
+        self._string_parts = []
+        self._mode = "structure"
+
+    def _complete_string(self) -> None:
+        self._flush_delta()
+        value = "".join(self._string_parts)
+        self._string_parts = []
+        self._mode = "structure"
+        frame = self._stack[-1]
+        self._store(frame, value)
+        self._emit_value(self._string_path, value)
+
+    # ------------------------------------------------------------------
+    # Scalars and bare keys
+    # ------------------------------------------------------------------
+
+    def _consume_token(self, chunk: str, index: int) -> int:
+        length = len(chunk)
+        start = index
+        if self._mode == "bare_key":
+            while index < length and (chunk[index].isalnum() or chunk[index] == "_"):
+                index += 1
+            self._token_parts.append(chunk[start:index])
+            if index < length:
+                frame = self._stack[-1]
+                frame.key = "".join(self._token_parts)
+                frame.state = "colon"
+                self._token_parts = []
+                self._mode = "structure"
+            return index
+
+        while index < length and chunk[index] in _SCALAR_CHARS:
+            index += 1
+        self._token_parts.append(chunk[start:index])
+        if index < length:
+            self._complete_scalar()
+        return index
+
+    def _complete_scalar(self) -> None:
+        token = "".join(self._token_parts)
+        self._token_parts = []
+        self._mode = "structure"
+        lowered = token.lower()
+        if self.strict:
+            try:
+                value: Any = json.loads(token)
+            except ValueError:
+                self._reject(f"invalid literal {token!r}")
+                return
+        elif lowered == "true":
+            value = True
+        elif lowered == "false":
+            value = False
+        elif lowered == "null":
+            value = None
+        else:
+            try:
+                value = json.loads(token)
+            except ValueError:
+                value = token
+        frame = self._stack[-1]
+        self._store(frame, value)
+        self._emit_value(self._scalar_path, value)
+
+
+def extract_json_incrementally(text: str) -> Optional[Dict[str, Any]]:
+    """Parse a complete (possibly malformed) response in one pass."""
+    extractor = StreamingJSONExtractor(stream_fields=set())
+    extractor.feed(text)
+    return extractor.finish()
+
+
+def repair_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Repair a malformed but complete JSON object document.
+
+    Unlike :func:`extract_json_incrementally`, this never closes truncated
+    output, only handles documents whose root is an object and parses in
+    strict mode: raw control characters in strings, trailing commas and
+    unquoted keys are repaired, anything else fails rather than being guessed
+    at, so malformed output is not turned into something that validates.
+
+    Returns:
+        The repaired object, or None if the root is not ``{``, the object
+        never closed or the document needs more than those repairs
+    """
+    if not text.lstrip().startswith("{"):
+        return None
+    extractor = StreamingJSONExtractor(stream_fields=set(), strict=True)
+    extractor.feed(text)
+    return extractor.root if extractor.done else None
+
+
+async def stream_json_events(
+    chunks: AsyncIterable[str],
+    stream_fields: Optional[Set[str]] = None,
+    value_event_depth: int = 1,
+) -> AsyncIterator[JSONStreamEvent]:
+    """Parse an async stream of text chunks, yielding events as they occur.
+
+    The final event is always ``complete`` with the (possibly repaired) root
+    object, or None if the stream never contained a JSON object.
+    """
+    extractor = StreamingJSONExtractor(stream_fields=stream_fields, value_event_depth=value_event_depth)
+    completed = False
+    async for chunk in chunks:
+        for event in extractor.feed(chunk):
+            completed = completed or event.kind == COMPLETE
+            yield event
+
+    if not completed:
+        if extractor.root is not None:
+            logger.debug("Streamed JSON ended before the root object closed; repairing truncated output")
+        extractor.finish()
+        for event in extractor.drain_events():
+            if event.kind == COMPLETE:
+                completed = True
+            yield event
+        if not completed:
+            yield JSONStreamEvent(COMPLETE, (), extractor.root)
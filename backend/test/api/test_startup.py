@@ -0,0 +1,99 @@
+"""Tests for the lifespan startup orchestrator."""
+
+import asyncio
+import time
+
+import pytest
+
+from fastapi import FastAPI
+
+from gaia.api.startup import StartupOrchestrator, include_optional_routers
+
+
+async def test_independent_chains_run_concurrently():
+    startup = StartupOrchestrator(parallel=True)
+
+    async def chain(name):
+        return await startup.run(name, time.sleep, 0.2, in_thread=True)
+
+    started = time.perf_counter()
+    await startup.run_group(lambda: chain("database"), lambda: chain("orchestrator"))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.35
+    steps = startup.snapshot()["steps"]
+    assert [step["status"] for step in steps] == ["ok", "ok"]
+    assert all(step["duration_ms"] >= 190 for step in steps)
+
+
+async def test_critical_failure_propagates_and_non_critical_is_recorded():
+    startup = StartupOrchestrator()
+
+    def boom():
+        raise RuntimeError("db down")
+
+    assert await startup.run("optional", boom, critical=False) is None
+    with pytest.raises(RuntimeError, match="db down"):
+        await startup.run("database", boom)
+
+    steps = {step["name"]: step for step in startup.snapshot()["steps"]}
+    assert steps["optional"]["status"] == "failed"
+    assert steps["database"]["error"] == "db down"
+    assert startup.ready is False
+
+
+async def test_deferred_work_starts_only_after_ready():
+    startup = StartupOrchestrator(deferred_delay_seconds=0)
+    ran = asyncio.Event()
+
+    async def backfill():
+        ran.set()
+
+    startup.defer("campaign_rooms", backfill)
+    await asyncio.sleep(0)
+    assert not ran.is_set()
+    assert startup.snapshot()["steps"][0]["status"] == "pending"
+
+    startup.mark_ready()
+    await startup.wait_deferred()
+
+    assert ran.is_set()
+    snapshot = startup.snapshot()
+    assert snapshot["ready"] is True
+    assert snapshot["ready_after_ms"] is not None
+    assert snapshot["steps"][0] == {
+        "name": "campaign_rooms",
+        "critical": False,
+        "deferred": True,
+        "status": "ok",
+        "duration_ms": snapshot["steps"][0]["duration_ms"],
+        "error": None,
+    }
+
+
+async def test_shutdown_cancels_running_deferred_work():
+    startup = StartupOrchestrator()
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    startup.defer("pending_registrations", slow)
+    startup.mark_ready()
+    await asyncio.sleep(0.01)
+    await startup.shutdown(timeout=1)
+
+    assert startup.ready is False
+    assert startup.reason == "shutting_down"
+    assert startup.steps["pending_registrations"].status == "cancelled"
+
+
+async def test_optional_router_import_failure_aborts_startup():
+    startup = StartupOrchestrator()
+    app = FastAPI()
+    routes_before = len(app.routes)
+
+    with pytest.raises(ModuleNotFoundError):
+        await startup.run("optional_routers", include_optional_routers, app, ["no_such_router"])
+
+    assert startup.steps["optional_routers"].status == "failed"
+    assert len(app.routes) == routes_before
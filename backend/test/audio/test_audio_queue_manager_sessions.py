@@ -120,3 +120,61 @@ async def test_audio_queue_preserves_playback_group_order(monkeypatch, tmp_path)
     assert history[-1]["playback_id"] == second_token
 
     await audio_queue_manager.stop_current(session_id=session_id)
+
+
+@pytest.mark.asyncio
+async def test_thread_count_constant_as_sessions_grow(monkeypatch):
+    """Sessions are scheduled on the event loop rather than one thread each."""
+    import threading
+
+    from gaia.infra.audio import audio_queue_manager as queue_module
+    from gaia.infra.audio.audio_queue_manager import audio_queue_manager
+
+    monkeypatch.setattr(
+        queue_module,
+        "get_playback_config",
+        lambda: {"chunk_delay": 0.0, "paragraph_delay": 0.01, "seamless": False},
+    )
+
+    baseline_threads = threading.active_count()
+    session_ids = [f"thread-count-session-{index}" for index in range(50)]
+    for session_id in session_ids:
+        await audio_queue_manager.add_paragraph_break(session_id=session_id, playback_id="p")
+        await audio_queue_manager.add_paragraph_break(session_id=session_id, playback_id="p")
+
+    assert threading.active_count() == baseline_threads
+
+    for _ in range(40):
+        statuses = [audio_queue_manager.get_queue_status(session_id=s) for s in session_ids]
+        if all(s["history_count"] == 2 and not s["is_playing"] for s in statuses):
+            break
+        await asyncio.sleep(0.05)
+    else:
+        pytest.fail("Audio queues did not drain in expected time")
+
+    assert threading.active_count() == baseline_threads
+    assert all(not s["pending_playback_ids"] for s in statuses)
+
+    for session_id in session_ids:
+        await audio_queue_manager.stop_current(session_id=session_id)
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_released_by_timer(monkeypatch):
+    from gaia.infra.audio import audio_queue_manager as queue_module
+    from gaia.infra.audio.audio_queue_manager import audio_queue_manager
+
+    monkeypatch.setattr(
+        queue_module,
+        "get_playback_config",
+        lambda: {"chunk_delay": 0.0, "paragraph_delay": 0.0, "seamless": False},
+    )
+    monkeypatch.setattr(audio_queue_manager, "_session_idle_timeout", 0.05)
+
+    session_id = "idle-release-session"
+    await audio_queue_manager.add_paragraph_break(session_id=session_id)
+    await asyncio.sleep(0.01)
+    assert audio_queue_manager._get_session(session_id, create=False) is not None
+
+    await asyncio.sleep(0.2)
+    assert audio_queue_manager._get_session(session_id, create=False) is None
@@ -0,0 +1,176 @@
+"""Tests for the set-based audio retention engine."""
+
+import uuid
+from datetime import datetime, timezone, timedelta
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from gaia.infra.audio.audio_models import (
+    AudioChunk,
+    AudioPlaybackRequest,
+    PlaybackStatus,
+    UserAudioQueue,
+)
+from gaia.infra.audio.audio_retention import AudioRetentionEngine
+
+
+class RecordingArtifactStore:
+    def __init__(self):
+        self.deleted = []
+
+    def delete_artifacts(self, artifacts):
+        artifacts = list(artifacts)
+        self.deleted.extend(artifacts)
+        return {"deleted": len(artifacts), "failed": 0}
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    for model in (AudioPlaybackRequest, AudioChunk, UserAudioQueue):
+        model.__table__.create(bind=engine)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
+
+
+def _seed(session_factory, campaign_id, played_chunks, fresh_chunks=0, age_days=10):
+    now = datetime.now(timezone.utc)
+    played_at = now - timedelta(days=age_days)
+    with session_factory() as session:
+        request = AudioPlaybackRequest(
+            request_id=uuid.uuid4(),
+            campaign_id=campaign_id,
+            playback_group="narrative",
+            status=PlaybackStatus.COMPLETED,
+            requested_at=played_at,
+            completed_at=played_at,
+        )
+        session.add(request)
+        for index in range(played_chunks + fresh_chunks):
+            old = index < played_chunks
+            chunk = AudioChunk(
+                chunk_id=uuid.uuid4(),
+                request_id=request.request_id,
+                campaign_id=campaign_id,
+                artifact_id=f"artifact-{index}",
+                url=f"/api/media/audio/{campaign_id}/artifact-{index}.mp3",
+                sequence_number=index,
+                status=PlaybackStatus.PLAYED,
+                size_bytes=100,
+                storage_path=f"{campaign_id}/media/audio/artifact-{index}.mp3",
+                played_at=played_at if old else now,
+            )
+            session.add(chunk)
+            session.add(
+                UserAudioQueue(
+                    queue_id=uuid.uuid4(),
+                    user_id="user-1",
+                    campaign_id=campaign_id,
+                    chunk_id=chunk.chunk_id,
+                    request_id=request.request_id,
+                    played_at=played_at if old else now,
+                )
+            )
+        session.commit()
+        return request.request_id
+
+
+def _count(session_factory, model):
+    with session_factory() as session:
+        return len(session.execute(select(model)).scalars().all())
+
+
+def test_expires_rows_across_campaigns_in_bounded_batches(session_factory):
+    store = RecordingArtifactStore()
+    engine = AudioRetentionEngine(batch_size=2, max_batches=10, session_factory=session_factory, artifact_store=store)
+    _seed(session_factory, "campaign-a", played_chunks=3)
+    _seed(session_factory, "campaign-b", played_chunks=2, fresh_chunks=1)
+
+    result = engine.run(days=7)
+
+    assert result.chunks_deleted == 5
+    assert result.queue_entries_deleted == 5
+    # campaign-b's request still owns a fresh chunk and is kept
+    assert result.requests_deleted == 1
+    assert result.artifacts_deleted == 5
+    assert not result.exhausted
+    assert _count(session_factory, AudioChunk) == 1
+    assert _count(session_factory, UserAudioQueue) == 1
+    assert {a["session_id"] for a in store.deleted} == {"campaign-a", "campaign-b"}
+    assert "campaign-a/media/audio/artifact-0.mp3" in {a["storage_path"] for a in store.deleted}
+    assert engine.metrics["chunks_deleted_total"] == 5
+    assert engine.get_metrics()["last_run_deleted"] == 11
+
+
+def test_pass_stops_at_max_batches_and_resumes(session_factory):
+    engine = AudioRetentionEngine(
+        batch_size=1,
+        max_batches=2,
+        session_factory=session_factory,
+        artifact_store=RecordingArtifactStore(),
+    )
+    _seed(session_factory, "campaign-a", played_chunks=3)
+
+    first = engine.run(days=7)
+    assert first.chunks_deleted == 2
+    assert first.exhausted
+
+    second = engine.run(days=7)
+    assert second.chunks_deleted == 1
+    assert _count(session_factory, AudioChunk) == 0
+    assert engine.metrics["retention_runs_total"] == 2
+
+
+def test_campaign_scope_and_recent_rows_are_preserved(session_factory):
+    engine = AudioRetentionEngine(session_factory=session_factory, artifact_store=RecordingArtifactStore())
+    _seed(session_factory, "campaign-a", played_chunks=2)
+    _seed(session_factory, "campaign-b", played_chunks=2)
+    _seed(session_factory, "campaign-c", played_chunks=2, age_days=1)
+
+    result = engine.run(days=7, campaign_id="campaign-a")
+
+    assert result.chunks_deleted == 2
+    with session_factory() as session:
+        campaigns = set(session.execute(select(AudioChunk.campaign_id)).scalars())
+    assert campaigns == {"campaign-b", "campaign-c"}
+
+
+def test_table_scoped_passes_leave_other_tables_alone(session_factory):
+    engine = AudioRetentionEngine(session_factory=session_factory, artifact_store=RecordingArtifactStore())
+    _seed(session_factory, "campaign-a", played_chunks=2)
+
+    queue_only = engine.purge_queue_entries(days=7, campaign_id="campaign-a")
+    assert (queue_only.queue_entries_deleted, queue_only.chunks_deleted, queue_only.requests_deleted) == (2, 0, 0)
+    assert _count(session_factory, AudioChunk) == 2
+
+    chunks_only = engine.purge_chunks(days=7, campaign_id="campaign-a")
+    assert (chunks_only.chunks_deleted, chunks_only.artifacts_deleted, chunks_only.requests_deleted) == (2, 2, 0)
+    assert _count(session_factory, AudioPlaybackRequest) == 1
+
+    with pytest.raises(ValueError):
+        engine.run(tables=("sessions",))
+
+
+def test_local_artifacts_are_deleted_in_bulk(tmp_path):
+    from gaia.infra.audio.audio_artifact_store import AudioArtifactStore
+
+    store = AudioArtifactStore.__new__(AudioArtifactStore)
+    store.local_root = tmp_path.resolve()
+    store.bucket_name = ""
+    store._bucket = None
+    session_dir = tmp_path / "campaign-a"
+    session_dir.mkdir()
+    (session_dir / "one.mp3").write_bytes(b"1")
+    (session_dir / "two.mp3").write_bytes(b"2")
+
+    outcome = store.delete_artifacts([
+        {"session_id": "campaign-a", "storage_path": "campaign-a/media/audio/one.mp3"},
+        {"session_id": "campaign-a", "storage_path": "campaign-a/media/audio/two.mp3"},
+        {"session_id": "campaign-a", "storage_path": "campaign-a/media/audio/gone.mp3"},
+        {"session_id": "..", "storage_path": "../../etc/passwd"},
+    ])
+
+    assert outcome == {"deleted": 2, "failed": 1}
+    assert list(session_dir.iterdir()) == []
@@ -0,0 +1,140 @@
+"""Tests for the playback state reconciler and read-only queue advancement."""
+
+import uuid
+from datetime import datetime, timezone, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from gaia.infra.audio.audio_models import (
+    AudioChunk,
+    AudioPlaybackRequest,
+    PlaybackStatus,
+    UserAudioQueue,
+)
+from gaia.infra.audio.audio_playback_service import AudioPlaybackService
+from gaia.infra.audio.playback_reconciler import PlaybackStateReconciler
+
+CAMPAIGN = "campaign-queue"
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    for model in (AudioPlaybackRequest, AudioChunk, UserAudioQueue):
+        model.__table__.create(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def service(session_factory, monkeypatch):
+    service = AudioPlaybackService()
+    monkeypatch.setattr(service, "_db_enabled", True)
+    monkeypatch.setattr(service, "_get_session", session_factory)
+    return service
+
+
+def _add_request(session_factory, minutes_ago, status=PlaybackStatus.PENDING, total_chunks=None,
+                 chunks=0, played=False, started_minutes_ago=None):
+    now = datetime.now(timezone.utc)
+    with session_factory() as session:
+        request = AudioPlaybackRequest(
+            request_id=uuid.uuid4(),
+            campaign_id=CAMPAIGN,
+            playback_group="narrative",
+            status=status,
+            requested_at=now - timedelta(minutes=minutes_ago),
+            started_at=(now - timedelta(minutes=started_minutes_ago)) if started_minutes_ago else None,
+            total_chunks=total_chunks,
+        )
+        session.add(request)
+        for index in reversed(range(chunks)):
+            session.add(
+                AudioChunk(
+                    chunk_id=uuid.uuid4(),
+                    request_id=request.request_id,
+                    campaign_id=CAMPAIGN,
+                    artifact_id=f"a{index}",
+                    url=f"/api/media/audio/{CAMPAIGN}/a{index}.mp3",
+                    sequence_number=index,
+                    size_bytes=1,
+                    storage_path=f"{CAMPAIGN}/media/audio/a{index}.mp3",
+                    played_at=now if played else None,
+                )
+            )
+        session.commit()
+        return request.request_id
+
+
+def _status(session_factory, request_id):
+    with session_factory() as session:
+        return session.execute(
+            select(AudioPlaybackRequest.status).where(AudioPlaybackRequest.request_id == request_id)
+        ).scalar_one()
+
+
+def test_reconciler_fails_only_stuck_requests(session_factory):
+    unfinalized = _add_request(session_factory, minutes_ago=10)
+    fresh = _add_request(session_factory, minutes_ago=1)
+    empty = _add_request(session_factory, minutes_ago=1, total_chunks=0)
+    silent = _add_request(session_factory, minutes_ago=10, status=PlaybackStatus.GENERATING,
+                          total_chunks=2, chunks=2, started_minutes_ago=5)
+    playing = _add_request(session_factory, minutes_ago=10, status=PlaybackStatus.GENERATING,
+                           total_chunks=2, chunks=2, played=True, started_minutes_ago=5)
+    done = _add_request(session_factory, minutes_ago=30, status=PlaybackStatus.COMPLETED)
+
+    reconciler = PlaybackStateReconciler(session_factory=session_factory)
+    counts = reconciler.reconcile()
+
+    assert counts == {"unfinalized": 1, "empty": 1, "no_progress": 1}
+    assert _status(session_factory, unfinalized) == PlaybackStatus.FAILED
+    assert _status(session_factory, empty) == PlaybackStatus.FAILED
+    assert _status(session_factory, silent) == PlaybackStatus.FAILED
+    assert _status(session_factory, fresh) == PlaybackStatus.PENDING
+    assert _status(session_factory, playing) == PlaybackStatus.GENERATING
+    assert _status(session_factory, done) == PlaybackStatus.COMPLETED
+    assert reconciler.metrics["requests_failed_no_progress_total"] == 1
+
+
+def test_next_pending_request_is_one_read_only_select(engine, session_factory, service):
+    _add_request(session_factory, minutes_ago=10, chunks=1)  # unfinalized and stale: skipped
+    _add_request(session_factory, minutes_ago=9, total_chunks=0)  # empty: skipped
+    expected = _add_request(session_factory, minutes_ago=8, total_chunks=3, chunks=3)
+    _add_request(session_factory, minutes_ago=1, total_chunks=1, chunks=1)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    result = service.get_next_pending_request(CAMPAIGN)
+    event.remove(engine, "before_cursor_execute", record)
+
+    assert result["request_id"] == str(expected)
+    assert result["chunk_count"] == 3
+    with session_factory() as session:
+        ordered = session.execute(
+            select(AudioChunk.chunk_id)
+            .where(AudioChunk.request_id == expected)
+            .order_by(AudioChunk.sequence_number)
+        ).scalars().all()
+    assert result["chunk_ids"] == [str(chunk_id) for chunk_id in ordered]
+
+    selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1
+    assert len(statements) == 1
+
+
+def test_oldest_request_still_generating_blocks_advance(session_factory, service):
+    _add_request(session_factory, minutes_ago=1)  # no chunks yet
+    _add_request(session_factory, minutes_ago=0.5, total_chunks=1, chunks=1)
+
+    assert service.get_next_pending_request(CAMPAIGN) is None
@@ -0,0 +1,139 @@
+"""Tests for bounded, ordered audio generation in StreamingAudioBuffer."""
+
+import asyncio
+import random
+
+import pytest
+
+from gaia.infra.audio import streaming_audio_buffer as buffer_module
+from gaia.infra.audio.streaming_audio_buffer import StreamingAudioBuffer
+
+
+class _RecordingWriter:
+    def __init__(self, session_id, broadcaster, playback_group="narrative", text=None):
+        self.chunks = []
+        self.finalized_text = None
+
+    async def add_chunk(self, artifact, sequence_number, text_preview=None):
+        self.chunks.append((sequence_number, text_preview))
+        await asyncio.sleep(0)
+        return str(sequence_number)
+
+    async def finalize(self, text=None):
+        self.finalized_text = text
+
+
+class _SlowTTS:
+    def __init__(self, fail_on=None):
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+        self.fail_on = fail_on or set()
+
+    async def __call__(self, text, session_id, return_artifact=True):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.calls.append(text)
+        try:
+            # Random latency makes chunks finish out of order
+            await asyncio.sleep(random.uniform(0.001, 0.02))
+            if text.strip() in self.fail_on:
+                raise RuntimeError("provider error")
+            return {"id": text, "url": "u", "mime_type": "audio/mpeg", "size_bytes": 1, "storage_path": "p"}
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def recording_writer(monkeypatch):
+    monkeypatch.setattr(buffer_module, "PlaybackRequestWriter", _RecordingWriter)
+
+
+def _stream(text):
+    # Token-sized pieces like an LLM stream
+    return [text[i:i + 3] for i in range(0, len(text), 3)]
+
+
+async def test_generation_is_bounded_and_released_in_order():
+    tts = _SlowTTS()
+    buffer = StreamingAudioBuffer("session", broadcaster=None, tts_generator=tts, max_workers=2)
+    sentences = [f"Sentence number {index} is here." for index in range(12)]
+
+    for piece in _stream(" ".join(sentences) + " Tail without stop"):
+        await buffer.add_chunk(piece)
+    await buffer.add_chunk("", is_final=True)
+    await buffer.finalize()
+
+    assert tts.max_active <= 2
+    assert len(buffer.pending_tasks) <= 2
+    sequence_numbers = [seq for seq, _ in buffer.writer.chunks]
+    assert sequence_numbers == sorted(sequence_numbers)
+    assert sequence_numbers == list(range(len(sequence_numbers)))
+    assert "".join(text for _, text in buffer.writer.chunks).replace(" ", "") == (
+        " ".join(sentences) + " Tail without stop"
+    ).replace(" ", "")
+    assert buffer.writer.finalized_text == buffer.full_text
+
+
+async def test_global_provider_semaphore_caps_all_buffers(monkeypatch):
+    monkeypatch.setattr(buffer_module, "_provider_semaphore", asyncio.Semaphore(3))
+    monkeypatch.setattr(buffer_module, "_provider_semaphore_loop", asyncio.get_running_loop())
+    tts = _SlowTTS()
+    buffers = [
+        StreamingAudioBuffer(f"session-{i}", broadcaster=None, tts_generator=tts, max_workers=4)
+        for i in range(4)
+    ]
+
+    for buffer in buffers:
+        for index in range(6):
+            await buffer.add_chunk(f"Line {index}. ")
+    await asyncio.gather(*(buffer.finalize() for buffer in buffers))
+
+    assert tts.max_active <= 3
+    assert all(len(buffer.writer.chunks) == 6 for buffer in buffers)
+
+
+async def test_failed_chunk_leaves_gap_without_blocking_later_chunks():
+    tts = _SlowTTS(fail_on={"Two."})
+    buffer = StreamingAudioBuffer("session", broadcaster=None, tts_generator=tts, max_workers=3)
+
+    for text in ("One. ", "Two. ", "Three. "):
+        await buffer.add_chunk(text)
+    await buffer.finalize()
+
+    assert [seq for seq, _ in buffer.writer.chunks] == [0, 2]
+
+
+async def test_boundary_scan_only_looks_at_new_text():
+    tts = _SlowTTS()
+    buffer = StreamingAudioBuffer("session", broadcaster=None, tts_generator=tts)
+
+    await buffer.add_chunk("No boundary yet, still going")
+    assert buffer._scan_pos == len(buffer.buffer)
+    assert buffer.sequence_number == 0
+
+    # Terminator arrives before its whitespace; the next token completes it
+    await buffer.add_chunk(" and done.")
+    assert buffer.sequence_number == 0
+    await buffer.add_chunk(" Next")
+    assert buffer.sequence_number == 1
+    assert buffer.buffer == "Next"
+    await buffer.finalize()
+
+
+async def test_abandoned_buffer_leaves_no_idle_workers():
+    tts = _SlowTTS()
+    buffer = StreamingAudioBuffer("session", broadcaster=None, tts_generator=tts, max_workers=3)
+
+    for text in ("One. ", "Two. ", "Three. "):
+        await buffer.add_chunk(text)
+    # The stream errors out before finalize(); workers drain the queue and exit
+    await asyncio.wait_for(asyncio.gather(*buffer.pending_tasks), timeout=1)
+
+    assert all(task.done() for task in buffer.pending_tasks)
+    assert [seq for seq, _ in buffer.writer.chunks] == [0, 1, 2]
+
+    # Later chunks still start a worker
+    await buffer.add_chunk("Four. ")
+    await buffer.finalize()
+    assert [seq for seq, _ in buffer.writer.chunks] == [0, 1, 2, 3]
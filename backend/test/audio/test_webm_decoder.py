@@ -0,0 +1,100 @@
+"""Tests for the per-session streaming WebM decoder."""
+
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+from gaia.infra.audio import webm_decoder
+from gaia.infra.audio.webm_decoder import StreamingWebMDecoder
+
+
+@pytest.fixture(autouse=True)
+def passthrough_decoder(monkeypatch):
+    """Swap ffmpeg for ``cat`` so the pipe plumbing runs without codecs."""
+    monkeypatch.setattr(webm_decoder, "_ffmpeg_stream_command", lambda rate, channels: ["cat"])
+    yield
+    webm_decoder.close_all_decoders()
+
+
+def test_streaming_decoder_keeps_one_process_and_aligns_frames():
+    decoder = StreamingWebMDecoder()
+    samples = np.arange(-500, 500, dtype=np.int16)
+    payload = samples.tobytes()
+
+    try:
+        first = decoder.decode(payload[:301])  # odd byte count splits a sample
+        process = decoder._process
+        second = decoder.decode(payload[301:])
+    finally:
+        decoder.close()
+
+    assert decoder._process is process
+    assert len(first) == 150
+    assert np.array_equal(np.concatenate([first, second]), samples)
+    assert decoder.samples_out == len(samples)
+    assert not decoder.is_alive
+
+
+def test_session_decoders_are_reused_and_released():
+    first = webm_decoder.get_session_decoder("session-a")
+    assert webm_decoder.get_session_decoder("session-a") is first
+
+    audio = webm_decoder.decode_session_chunk("session-a", np.ones(64, dtype=np.int16).tobytes())
+    assert audio.tolist() == [1] * 64
+
+    webm_decoder.release_session_decoder("session-a")
+    assert not first.is_alive
+    assert webm_decoder.get_session_decoder("session-a") is not first
+
+
+def test_session_limit_closes_least_recently_used(monkeypatch):
+    monkeypatch.setattr(webm_decoder, "WEBM_DECODER_MAX_SESSIONS", 2)
+
+    oldest = webm_decoder.get_session_decoder("one")
+    webm_decoder.get_session_decoder("two")
+    webm_decoder.get_session_decoder("three")
+
+    assert not oldest.is_alive
+    assert list(webm_decoder._session_decoders) == ["two", "three"]
+
+
+def test_read_returns_none_after_output_ends():
+    decoder = StreamingWebMDecoder(command=["true"])
+    decoder._ensure_started().wait()
+    decoder._reader.join()
+
+    try:
+        assert decoder.read(timeout=0) is None
+    finally:
+        decoder.close()
+
+
+def test_dead_stream_falls_back_to_one_shot_decode(monkeypatch, tmp_path):
+    missing = str(tmp_path / "no-ffmpeg")
+    monkeypatch.setattr(webm_decoder, "_ffmpeg_stream_command", lambda rate, channels: [missing])
+    monkeypatch.setattr(webm_decoder, "decode_webm_chunk", lambda data: np.zeros(4, dtype=np.int16))
+
+    audio = webm_decoder.decode_session_chunk("broken", b"\x1a\x45\xdf\xa3")
+
+    assert audio.tolist() == [0, 0, 0, 0]
+    assert "broken" not in webm_decoder._session_decoders
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_streaming_beats_one_shot_per_cpu_second(tmp_path, monkeypatch):
+    monkeypatch.undo()
+    path = tmp_path / "tone.webm"
+    generated = subprocess.run(
+        ["ffmpeg", "-loglevel", "error", "-f", "lavfi", "-i", "sine=frequency=220:duration=4",
+         "-c:a", "libopus", "-b:a", "32k", str(path)],
+        capture_output=True,
+    )
+    if generated.returncode != 0:
+        pytest.skip("ffmpeg built without libopus")
+
+    results = webm_decoder.benchmark_decoders(path.read_bytes(), chunk_bytes=1000)
+
+    assert results["streaming"]["decoded_samples"] > 0
+    assert results["streaming"]["chunks_per_cpu_second"] > results["one_shot"]["chunks_per_cpu_second"]
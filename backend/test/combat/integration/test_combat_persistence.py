@@ -21,7 +21,7 @@ from gaia.mechanics.combat.combat_state_manager import CombatStateManager
 from gaia.mechanics.combat.combat_persistence import CombatPersistenceManager
 from gaia.models.combat import (
     CombatSession, CombatantState, CombatStatus,
-    CombatStats, Position
+    CombatStats, Position, CombatAction
 )
 from gaia_private.models.combat.agent_io.initiation import BattlefieldConfig
 from gaia.models.character.character_info import CharacterInfo
@@ -402,3 +402,231 @@ class TestCombatPersistence:
 
         # Persistence lookup should also return no active combat
         assert persistence_manager.load_active_combat(campaign_id) is None
+
+    def _record_attack(self, session, round_number, damage):
+        session.combat_log.append(CombatAction(
+            timestamp=datetime.now(),
+            round_number=round_number,
+            actor_id="player_001",
+            action_type="basic_attack",
+            target_id="enemy_001",
+            ap_cost=2,
+            damage_dealt=damage,
+            description=f"Thorin hits for {damage}",
+        ))
+        session.combatants["enemy_001"].hp -= damage
+
+    def test_actions_append_events_instead_of_rewriting_snapshot(
+        self, mock_campaign_manager, combat_session
+    ):
+        """Per-action saves append to the event log and replay on load."""
+        campaign_id = "test_campaign_006"
+        mock_campaign_manager.ensure_campaign_structure(campaign_id)
+        persistence_manager = CombatPersistenceManager(mock_campaign_manager)
+        persistence_manager.snapshot_interval = 100
+
+        assert persistence_manager.save_combat_session(campaign_id, combat_session) is True
+        active_dir = mock_campaign_manager.get_campaign_path(campaign_id) / "combat" / "active"
+        snapshot_file = active_dir / f"{combat_session.session_id}.json"
+        snapshot_before = snapshot_file.read_text()
+
+        for damage in (3, 4, 5):
+            self._record_attack(combat_session, combat_session.round_number, damage)
+            combat_session.current_turn_index = (combat_session.current_turn_index + 1) % 2
+            assert persistence_manager.save_combat_session(campaign_id, combat_session) is True
+        combat_session.round_number = 3
+        assert persistence_manager.save_combat_session(campaign_id, combat_session) is True
+
+        # Snapshot untouched; one compact record per save with only the changed combatant
+        assert snapshot_file.read_text() == snapshot_before
+        events_file = active_dir / f"{combat_session.session_id}.events.jsonl"
+        records = [json.loads(line) for line in events_file.read_text().splitlines()]
+        assert [record["seq"] for record in records] == [1, 2, 3, 4]
+        assert list(records[0]["combatants"]) == ["enemy_001"]
+        assert len(records[0]["actions"]) == 1
+        assert records[3]["actions"] == []
+
+        # A fresh manager replays the log on top of the snapshot
+        loaded = CombatPersistenceManager(mock_campaign_manager).load_active_combat(campaign_id)
+        assert loaded.round_number == 3
+        assert loaded.current_turn_index == combat_session.current_turn_index
+        assert loaded.combatants["enemy_001"].hp == 30 - 12
+        assert loaded.combatants["player_001"].hp == 45
+        assert [action.damage_dealt for action in loaded.combat_log] == [3, 4, 5]
+
+    def test_snapshot_interval_compacts_event_log(self, mock_campaign_manager, combat_session):
+        """Reaching the snapshot interval rewrites the snapshot and truncates the log."""
+        campaign_id = "test_campaign_007"
+        mock_campaign_manager.ensure_campaign_structure(campaign_id)
+        persistence_manager = CombatPersistenceManager(mock_campaign_manager)
+        persistence_manager.snapshot_interval = 2
+
+        persistence_manager.save_combat_session(campaign_id, combat_session)
+        for damage in (1, 2, 3):
+            self._record_attack(combat_session, 2, damage)
+            persistence_manager.save_combat_session(campaign_id, combat_session)
+
+        active_dir = mock_campaign_manager.get_campaign_path(campaign_id) / "combat" / "active"
+        events_file = active_dir / f"{combat_session.session_id}.events.jsonl"
+        assert not events_file.exists()
+
+        snapshot = json.loads((active_dir / f"{combat_session.session_id}.json").read_text())
+        assert snapshot["_metadata"]["event_seq"] == 2
+        assert len(snapshot["combat_log"]) == 3
+
+        loaded = persistence_manager.load_combat_session(campaign_id, combat_session.session_id)
+        assert loaded.combatants["enemy_001"].hp == 30 - 6
+        assert len(loaded.combat_log) == 3
+
+    def test_archive_removes_event_log(self, mock_campaign_manager, combat_session):
+        """Archiving compacts the session into history and drops active files."""
+        campaign_id = "test_campaign_008"
+        mock_campaign_manager.ensure_campaign_structure(campaign_id)
+        persistence_manager = CombatPersistenceManager(mock_campaign_manager)
+
+        persistence_manager.save_combat_session(campaign_id, combat_session)
+        self._record_attack(combat_session, 2, 7)
+        persistence_manager.save_combat_session(campaign_id, combat_session)
+
+        combat_session.status = CombatStatus.COMPLETED
+        assert persistence_manager.archive_completed_combat(campaign_id, combat_session) is True
+
+        combat_path = mock_campaign_manager.get_campaign_path(campaign_id) / "combat"
+        assert list((combat_path / "active").iterdir()) == []
+        archived = json.loads(next((combat_path / "history").glob("*.json")).read_text())
+        assert archived["combatants"]["enemy_001"]["hp"] == 23
+        assert len(archived["combat_log"]) == 1
+
+    def test_history_listing_reads_summary_index(self, mock_campaign_manager, combat_session):
+        """Archiving appends to the history index; listings page through it."""
+        campaign_id = "test_campaign_009"
+        mock_campaign_manager.ensure_campaign_structure(campaign_id)
+        persistence_manager = CombatPersistenceManager(mock_campaign_manager)
+
+        for round_number in (1, 2, 3):
+            combat_session.session_id = f"combat_{round_number}"
+            combat_session.round_number = round_number
+            combat_session.status = CombatStatus.COMPLETED
+            assert persistence_manager.archive_completed_combat(campaign_id, combat_session) is True
+
+        combat_path = mock_campaign_manager.get_campaign_path(campaign_id) / "combat"
+        index_lines = (combat_path / "history_index.jsonl").read_text().splitlines()
+        assert len(index_lines) == 3
+
+        # Archived files are not opened for listings
+        for archive in (combat_path / "history").glob("*.json"):
+            archive.write_text(json.dumps({"session_id": "tampered"}))
+
+        history = persistence_manager.list_combat_history(campaign_id)
+        assert [entry["session_id"] for entry in history] == ["combat_3", "combat_2", "combat_1"]
+        assert history[0]["rounds"] == 3
+        assert history[0]["combatant_count"] == 2
+
+        page = persistence_manager.list_combat_history(campaign_id, limit=1, offset=1)
+        assert [entry["session_id"] for entry in page] == ["combat_2"]
+
+    def test_history_index_rebuilt_for_existing_campaigns(self, mock_campaign_manager, combat_session):
+        """Campaigns archived before the index existed get it rebuilt on listing."""
+        campaign_id = "test_campaign_010"
+        mock_campaign_manager.ensure_campaign_structure(campaign_id)
+        persistence_manager = CombatPersistenceManager(mock_campaign_manager)
+
+        combat_session.status = CombatStatus.COMPLETED
+        assert persistence_manager.archive_completed_combat(campaign_id, combat_session) is True
+        index_file = mock_campaign_manager.get_campaign_path(campaign_id) / "combat" / "history_index.jsonl"
+        index_file.unlink()
+
+        history = persistence_manager.list_combat_history(campaign_id)
+        assert [entry["session_id"] for entry in history] == [combat_session.session_id]
+        assert index_file.exists()
+        assert persistence_manager.rebuild_combat_history_index(campaign_id) == 1
+
+    def test_recovery_loads_only_registered_campaigns(self, mock_campaign_manager, combat_session):
+        """Once seeded, the active-combat registry replaces the campaign scan."""
+        persistence_manager = CombatPersistenceManager(mock_campaign_manager)
+        for campaign_id in ("idle_1", "idle_2", "fighting"):
+            mock_campaign_manager.ensure_campaign_structure(campaign_id)
+
+        # First recovery scans every campaign and seeds the registry
+        assert persistence_manager.recover_active_sessions() == {}
+        registry_file = mock_campaign_manager.campaign_storage_path / "combat_registry.json"
+        assert json.loads(registry_file.read_text())["complete"] is True
+
+        persistence_manager.save_combat_session("fighting", combat_session)
+        registry = json.loads(registry_file.read_text())
+        assert registry["campaigns"] == {"fighting": {"sessions": [combat_session.session_id]}}
+
+        mock_campaign_manager.list_campaigns = Mock(side_effect=AssertionError("should not scan"))
+        recovered = CombatPersistenceManager(mock_campaign_manager).recover_active_sessions()
+        assert list(recovered) == ["fighting"]
+        assert recovered["fighting"].session_id == combat_session.session_id
+
+        # Archiving removes the campaign from the registry
+        combat_session.status = CombatStatus.COMPLETED
+        assert persistence_manager.archive_completed_combat("fighting", combat_session) is True
+        assert json.loads(registry_file.read_text())["campaigns"] == {}
+        assert CombatPersistenceManager(mock_campaign_manager).recover_active_sessions() == {}
+
+    class _DictStore:
+        """In-memory stand-in for the campaign object store."""
+
+        def __init__(self):
+            self.objects = {}
+
+        def write_json(self, payload, campaign_id, path):
+            self.objects[(campaign_id, path)] = json.loads(json.dumps(payload, default=str))
+            return True
+
+        def read_json(self, campaign_id, path):
+            return self.objects.get((campaign_id, path))
+
+        def list_json_prefix(self, campaign_id, prefix):
+            return [
+                path.rsplit("/", 1)[1] for cid, path in self.objects
+                if cid == campaign_id and path.startswith(prefix + "/")
+            ]
+
+        def delete(self, campaign_id, path):
+            return self.objects.pop((campaign_id, path), None) is not None
+
+    def _manager_with_store(self, mock_campaign_manager, store):
+        manager = CombatPersistenceManager(mock_campaign_manager)
+        manager._store = store
+        manager.snapshot_interval = 100
+        return manager
+
+    def _load_from_store_only(self, mock_campaign_manager, store, campaign_id, session_id):
+        active_dir = mock_campaign_manager.get_campaign_path(campaign_id) / "combat" / "active"
+        for path in active_dir.iterdir():
+            path.unlink()
+        return self._manager_with_store(mock_campaign_manager, store).load_combat_session(campaign_id, session_id)
+
+    @pytest.mark.parametrize("reload_before_save", [True, False])
+    def test_restart_does_not_replay_stale_store_events(
+        self, mock_campaign_manager, combat_session, reload_before_save
+    ):
+        """A restarted manager continues the event sequence and purges superseded events."""
+        campaign_id = "test_campaign_012"
+        mock_campaign_manager.ensure_campaign_structure(campaign_id)
+        store = self._DictStore()
+        manager = self._manager_with_store(mock_campaign_manager, store)
+
+        manager.save_combat_session(campaign_id, combat_session)
+        for damage in (5, 5, 5):
+            self._record_attack(combat_session, 2, damage)
+            manager.save_combat_session(campaign_id, combat_session)
+        assert combat_session.combatants["enemy_001"].hp == 15
+
+        # Simulated restart: no in-memory log state
+        restarted = self._manager_with_store(mock_campaign_manager, store)
+        if reload_before_save:
+            combat_session = restarted.load_combat_session(campaign_id, combat_session.session_id)
+            assert restarted._log_state[combat_session.session_id].event_seq == 3
+        else:
+            restarted.snapshot_interval = 1
+        self._record_attack(combat_session, 3, 5)
+        assert restarted.save_combat_session(campaign_id, combat_session) is True
+
+        loaded = self._load_from_store_only(mock_campaign_manager, store, campaign_id, combat_session.session_id)
+        assert loaded.combatants["enemy_001"].hp == 10
+        assert [action.damage_dealt for action in loaded.combat_log] == [5, 5, 5, 5]
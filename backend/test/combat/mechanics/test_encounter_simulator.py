@@ -0,0 +1,89 @@
+"""Tests for the Monte-Carlo encounter simulator."""
+
+import pytest
+
+from gaia.mechanics.combat.encounter_simulator import (
+    CombatantLoadout,
+    EncounterSimulator,
+)
+from gaia.models.combat import CombatantState, CombatStats
+
+
+def _combatant(name, hp, ac, hostile, attack_bonus=5, damage_bonus=3):
+    return CombatantState(
+        character_id=name,
+        name=name,
+        initiative=0,
+        hp=hp,
+        max_hp=hp,
+        ac=ac,
+        level=3,
+        is_npc=hostile,
+        hostile=hostile,
+        combat_stats=CombatStats(attack_bonus=attack_bonus, damage_bonus=damage_bonus),
+    )
+
+
+def _party():
+    return [
+        _combatant("fighter", 30, 17, False),
+        _combatant("wizard", 18, 12, False),
+        _combatant("cleric", 24, 16, False),
+    ]
+
+
+def test_lopsided_encounters_are_rated_at_the_extremes():
+    simulator = EncounterSimulator(max_workers=1)
+
+    easy = simulator.simulate(_party() + [_combatant("rat", 2, 10, True, 0, 0)], runs=300, seed=3)
+    deadly = simulator.simulate(
+        _party() + [_combatant("dragon", 200, 19, True, 11, 8)],
+        runs=300,
+        loadouts={"dragon": CombatantLoadout(weapon_damage="2d10")},
+        seed=3,
+    )
+
+    assert easy.win_rate > 0.99
+    assert easy.difficulty in {"trivial", "easy"}
+    assert deadly.loss_rate > 0.9
+    assert deadly.difficulty == "deadly"
+    assert deadly.party_hp_loss["p50"] > 0.9
+
+
+def test_results_are_reproducible_and_roster_is_untouched():
+    simulator = EncounterSimulator(max_workers=1)
+    roster = _party() + [_combatant(f"goblin{i}", 7, 15, True, 4, 2) for i in range(4)]
+    loadouts = {"wizard": CombatantLoadout(spell_damage="3d6", save_type="dex", save_dc=14, spell_uses=2)}
+
+    first = simulator.simulate(roster, runs=200, loadouts=loadouts, seed=11)
+    second = simulator.simulate(roster, runs=200, loadouts=loadouts, seed=11)
+
+    assert first.win_rate == second.win_rate
+    assert first.rounds_distribution == second.rounds_distribution
+    assert sum(first.rounds_distribution.values()) == pytest.approx(1.0)
+    assert first.win_rate + first.loss_rate + first.draw_rate == pytest.approx(1.0)
+    assert set(first.hp_loss_by_combatant) == {"fighter", "wizard", "cleric"}
+    assert all(c.hp == c.max_hp and c.is_conscious and not c.status_effects for c in roster)
+
+
+def test_batches_are_spread_over_the_pool():
+    simulator = EncounterSimulator(max_workers=3, use_processes=False)
+    roster = _party() + [_combatant("ogre", 59, 11, True, 6, 4)]
+
+    try:
+        result = simulator.simulate(roster, runs=100, policy="random")
+    finally:
+        simulator.close()
+
+    assert result.runs == 100
+    assert result.metadata == {"batches": 3, "workers": 3}
+    assert simulator.metrics["fights_total"] == 100
+
+
+def test_rejects_one_sided_rosters_and_unknown_policies():
+    simulator = EncounterSimulator(max_workers=1)
+
+    with pytest.raises(ValueError):
+        simulator.simulate(_party(), runs=10)
+    with pytest.raises(ValueError):
+        simulator.simulate(_party() + [_combatant("rat", 2, 10, True)], runs=10, policy="smart")
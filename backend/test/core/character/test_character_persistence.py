@@ -184,3 +184,36 @@ class TestCharacterPersistence:
             loaded = json.load(f)
         assert loaded["name"] == "Pregenerated Warrior"
         assert loaded["preset"] is True
+
+    def test_index_serves_listings_and_campaign_lookups(self, char_storage, temp_dir):
+        """Listings come from the summary index; changed files are re-read."""
+        merry = char_storage.save_character({"name": "Merry", "class": "Rogue"}, character_id="merry")
+        sam = char_storage.save_character({"name": "Sam", "class": "Fighter"}, character_id="sam")
+        assert char_storage.link_character_to_campaign(merry, "shire")
+        assert char_storage.link_character_to_campaign(sam, "shire")
+        assert char_storage.link_character_to_campaign(sam, "mordor")
+
+        assert sorted(char_storage.get_campaign_characters("shire")) == ["merry", "sam"]
+        assert char_storage.get_campaign_characters("mordor") == ["sam"]
+
+        # The file holds only summaries; the campaign mapping is derived on load
+        index = json.loads((Path(temp_dir) / "character_index.json").read_text())
+        assert sorted(index["characters"]) == ["merry", "sam"]
+        assert "campaigns" not in index
+        char_storage._index = None
+        assert char_storage.get_campaign_characters("mordor") == ["sam"]
+
+        # An edit outside CharacterStorage is picked up through its mtime/size
+        sam_file = char_storage.characters_path / "sam.json"
+        sam_data = json.loads(sam_file.read_text())
+        sam_data["level"] = 12
+        sam_file.write_text(json.dumps(sam_data, indent=4))
+        summaries = {c["id"]: c for c in char_storage.list_characters()}
+        assert summaries["sam"]["level"] == 12
+        assert "mtime_ns" not in summaries["sam"]
+
+        # Deleted files drop out of the index and the campaign mapping
+        sam_file.unlink()
+        assert [c["id"] for c in char_storage.list_characters()] == ["merry"]
+        assert char_storage.get_campaign_characters("mordor") == []
+        assert char_storage.rebuild_index() == 1
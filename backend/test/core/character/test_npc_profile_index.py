@@ -0,0 +1,182 @@
+"""Tests for the NPC profile name index."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from gaia.mechanics.character import npc_profile_storage as storage_module
+from gaia.mechanics.character.npc_profile_storage import NpcProfileStorage
+from gaia.models.character.npc_profile import NpcProfile
+from gaia.utils.singleton import SingletonMeta
+
+
+class DictStore:
+    """In-memory stand-in for the shared campaign store."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def write_json(self, payload, *parts):
+        self.objects["/".join(parts)] = json.loads(json.dumps(payload))
+        return True
+
+    def read_json(self, *parts):
+        return self.objects.get("/".join(parts))
+
+    def list_json_prefix(self, *parts):
+        prefix = "/".join(parts) + "/"
+        return [key[len(prefix):] for key in self.objects if key.startswith(prefix)]
+
+
+@pytest.fixture
+def make_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_module, "SessionStorage", Mock())
+    monkeypatch.setattr(storage_module, "get_campaign_store", lambda storage: None)
+
+    def _make(base_path=tmp_path, store=None):
+        SingletonMeta.clear_instance(NpcProfileStorage)
+        if store is not None:
+            monkeypatch.setattr(storage_module, "get_campaign_store", lambda storage: store)
+        return NpcProfileStorage(base_path=base_path)
+
+    yield _make
+    SingletonMeta.clear_instance(NpcProfileStorage)
+
+
+def test_lookup_is_case_insensitive_and_skips_profile_scan(make_storage, monkeypatch):
+    storage = make_storage()
+    storage.save_profile(NpcProfile(npc_id="npc_profile:mira", display_name="Mira the Bold"))
+    storage.save_profile(NpcProfile(npc_id="npc_profile:oren", display_name="Oren"))
+
+    # Lookups must not fall back to listing every profile
+    monkeypatch.setattr(storage, "list_profiles", Mock(side_effect=AssertionError("full scan")))
+
+    profile = storage.get_profile_by_name("mira THE bold")
+    assert profile is not None
+    assert profile.npc_id == "npc_profile:mira"
+    assert storage.get_profile_by_name("Unknown Stranger") is None
+
+
+def test_index_is_persisted_and_reused_after_restart(make_storage):
+    storage = make_storage()
+    storage.save_profile(NpcProfile(npc_id="npc_profile:oren", display_name="Oren"))
+
+    index = json.loads(storage.index_path.read_text())
+    assert index["profiles"] == {"npc_profile:oren": "oren"}
+
+    restarted = make_storage()
+    assert restarted.get_profile_by_name("OREN").npc_id == "npc_profile:oren"
+
+
+def test_rename_replaces_old_index_entry(make_storage):
+    storage = make_storage()
+    profile = NpcProfile(npc_id="npc_profile:hooded", display_name="Hooded Figure")
+    storage.save_profile(profile)
+
+    profile.display_name = "Valka"
+    storage.save_profile(profile)
+
+    assert storage.get_profile_by_name("Hooded Figure") is None
+    assert storage.get_profile_by_name("valka").npc_id == "npc_profile:hooded"
+
+
+def test_missing_index_is_rebuilt_from_existing_profiles(make_storage, tmp_path):
+    profiles_dir = tmp_path / "npc_profiles"
+    profiles_dir.mkdir()
+    legacy = NpcProfile(npc_id="npc_profile:legacy", display_name="Old Tom")
+    (profiles_dir / "npc_profile:legacy.json").write_text(json.dumps(legacy.to_dict()))
+
+    storage = make_storage()
+    assert storage.get_profile_by_name("old tom").npc_id == "npc_profile:legacy"
+    assert storage.index_path.exists()
+
+
+def test_stale_index_entry_triggers_rebuild(make_storage):
+    storage = make_storage()
+    storage.save_profile(NpcProfile(npc_id="npc_profile:gone", display_name="Ghost"))
+    (storage.profiles_path / "npc_profile:gone.json").unlink()
+
+    assert storage.get_profile_by_name("Ghost") is None
+    assert "npc_profile:gone" not in json.loads(storage.index_path.read_text())["profiles"]
+
+
+def test_instances_merge_the_shared_index(make_storage, tmp_path):
+    store = DictStore()
+    first = make_storage(tmp_path / "a", store)
+    first.save_profile(NpcProfile(npc_id="npc_profile:mira", display_name="Mira"))
+    second = make_storage(tmp_path / "b", store)
+    second.save_profile(NpcProfile(npc_id="npc_profile:oren", display_name="Oren"))
+
+    shared = store.read_json("shared", "npc_profile_index.json")["profiles"]
+    assert shared == {"npc_profile:mira": "mira", "npc_profile:oren": "oren"}
+    assert second.get_profile_by_name("MIRA").npc_id == "npc_profile:mira"
+
+
+def test_index_miss_falls_back_to_store_listing(make_storage, tmp_path):
+    store = DictStore()
+    storage = make_storage(tmp_path / "a", store)
+    storage.save_profile(NpcProfile(npc_id="npc_profile:oren", display_name="Oren"))
+
+    # Saved by another instance whose index write never landed
+    late = NpcProfile(npc_id="npc_profile:valka", display_name="Valka")
+    store.write_json(late.to_dict(), "shared", "npc_profiles/npc_profile:valka.json")
+
+    assert storage.get_profile_by_name("valka").npc_id == "npc_profile:valka"
+    assert json.loads(storage.index_path.read_text())["profiles"]["npc_profile:valka"] == "valka"
+
+
+class CountingStore(DictStore):
+    def __init__(self):
+        super().__init__()
+        self.listings = 0
+        self.reads = []
+        self.index_writes = 0
+
+    def list_json_prefix(self, *parts):
+        self.listings += 1
+        return super().list_json_prefix(*parts)
+
+    def read_json(self, *parts):
+        self.reads.append("/".join(parts))
+        return super().read_json(*parts)
+
+    def write_json(self, payload, *parts):
+        if parts[-1] == "npc_profile_index.json":
+            self.index_writes += 1
+        return super().write_json(payload, *parts)
+
+
+def test_store_listing_is_throttled_and_skips_unreadable_profiles(make_storage, tmp_path, monkeypatch):
+    store = CountingStore()
+    store.objects["shared/npc_profiles/npc_profile:broken.json"] = None
+    storage = make_storage(tmp_path / "a", store)
+    storage._ensure_name_index()
+    store.listings = 0
+    store.reads.clear()
+
+    assert storage.get_profile_by_name("Brand New Npc") is None
+    assert storage.get_profile_by_name("Another New Npc") is None
+    assert store.listings == 1
+
+    # Once the interval passes the store is listed again, but the unreadable profile is not re-fetched
+    monkeypatch.setattr(storage, "_store_listing_checked_at", float("-inf"))
+    assert storage.get_profile_by_name("Third New Npc") is None
+    assert store.listings == 2
+    assert store.reads.count("shared/npc_profiles/npc_profile:broken.json") == 1
+
+
+def test_store_index_merge_is_debounced_across_saves(make_storage, tmp_path, monkeypatch):
+    store = CountingStore()
+    storage = make_storage(tmp_path / "a", store)
+    for index in range(5):
+        storage.save_profile(NpcProfile(npc_id=f"npc_profile:{index}", display_name=f"Npc {index}"))
+
+    assert store.index_writes == 1
+    assert len(json.loads(storage.index_path.read_text())["profiles"]) == 5
+
+    # The next save after the interval carries the batched entries to the store copy
+    monkeypatch.setattr(storage, "_store_index_flushed_at", float("-inf"))
+    storage.save_profile(NpcProfile(npc_id="npc_profile:5", display_name="Npc 5"))
+    assert store.index_writes == 2
+    assert len(store.objects["shared/npc_profile_index.json"]["profiles"]) == 6
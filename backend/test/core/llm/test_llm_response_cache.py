@@ -0,0 +1,101 @@
+import types
+
+import pytest
+
+from gaia.infra.llm import agent_runner as agent_runner_module
+from gaia.infra.llm.agent_runner import AgentRunner
+from gaia.infra.llm.response_cache import LLMResponseCache
+
+
+@pytest.fixture
+def enabled_cache(monkeypatch):
+    cache = LLMResponseCache(enabled=True, ttl_seconds=60, max_entries=8)
+    monkeypatch.setattr(agent_runner_module, "llm_response_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def fake_runner(monkeypatch):
+    calls = []
+
+    class FakeRunner:
+        async def run(self, agent, prompt, **kwargs):
+            calls.append(prompt)
+            return types.SimpleNamespace(final_output=f"result-{len(calls)}")
+
+    monkeypatch.setattr(agent_runner_module, "Runner", FakeRunner)
+    monkeypatch.setattr(
+        agent_runner_module,
+        "create_model_provider_for_model",
+        lambda model: (None, model),
+    )
+    return calls
+
+
+def _agent(name="SceneAnalyzer", instructions="Analyze the scene."):
+    return types.SimpleNamespace(name=name, model="test-model", tools=[], instructions=instructions)
+
+
+def test_key_ignores_whitespace_differences():
+    first = LLMResponseCache.make_key("agent", "model", "Describe  the\n tavern ")
+    second = LLMResponseCache.make_key("agent", "model", "Describe the tavern")
+    assert first == second
+    assert first != LLMResponseCache.make_key("other", "model", "Describe the tavern")
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache = LLMResponseCache(enabled=True, ttl_seconds=10)
+    now = [100.0]
+    monkeypatch.setattr("gaia.utils.bounded_cache.time.monotonic", lambda: now[0])
+
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    now[0] += 11
+    assert cache.get("key") is None
+
+
+def test_size_cap_evicts_least_recently_used():
+    cache = LLMResponseCache(enabled=True, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_allowlist_and_bypass():
+    cache = LLMResponseCache(enabled=True, allowed_agents=["Summarizer"])
+    assert cache.is_cacheable("Summarizer")
+    assert not cache.is_cacheable("DungeonMaster")
+    assert not cache.is_cacheable("Summarizer", bypass=True)
+    assert not LLMResponseCache(enabled=False).is_cacheable("Summarizer")
+
+
+async def test_agent_runner_serves_repeat_calls_from_cache(enabled_cache, fake_runner):
+    agent = _agent()
+
+    first = await AgentRunner.run(agent, "What is happening?")
+    second = await AgentRunner.run(agent, "What is happening?")
+
+    assert first is second
+    assert fake_runner == ["What is happening?"]
+    assert enabled_cache.stats()["hits"] == 1
+
+
+async def test_agent_runner_cache_respects_bypass_and_instructions(enabled_cache, fake_runner):
+    await AgentRunner.run(_agent(), "Prompt")
+    await AgentRunner.run(_agent(), "Prompt", bypass_cache=True)
+    await AgentRunner.run(_agent(instructions="Updated prompt"), "Prompt")
+
+    assert len(fake_runner) == 3
+
+
+async def test_agent_runner_skips_cache_when_context_provided(enabled_cache, fake_runner):
+    await AgentRunner.run(_agent(), "Prompt", context={"campaign_id": "c1"})
+    await AgentRunner.run(_agent(), "Prompt", context={"campaign_id": "c1"})
+
+    assert len(fake_runner) == 2
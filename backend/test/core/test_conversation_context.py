@@ -0,0 +1,82 @@
+"""Tests for the incremental, token-budgeted DM conversation context builder."""
+
+from gaia.engine.conversation_context import ConversationContextBuilder, estimate_tokens
+
+
+def _history(count):
+    messages = []
+    for index in range(count):
+        if index % 2 == 0:
+            messages.append({"role": "user", "content": f"I search room {index}."})
+        else:
+            messages.append({"role": "assistant", "content": {"narrative": f"Room {index} is empty."}})
+    return messages
+
+
+def test_renders_full_history_when_under_budget():
+    builder = ConversationContextBuilder(token_budget=10_000)
+    result = builder.build("campaign_1", _history(4))
+
+    assert result.included_messages == 4
+    assert result.omitted_messages == 0
+    assert result.text.splitlines()[0] == "user: I search room 0."
+    assert '"narrative": "Room 1 is empty."' in result.text
+    assert result.history_tokens > 0
+
+
+def test_only_new_messages_are_rendered_on_subsequent_builds():
+    builder = ConversationContextBuilder(token_budget=10_000)
+    history = _history(6)
+    first = builder.build("campaign_1", history)
+
+    history.extend(_history(2))
+    second = builder.build("campaign_1", history)
+
+    assert first.rendered_new_messages == 6
+    assert second.rendered_new_messages == 2
+    assert second.included_messages == 8
+
+
+def test_rewritten_history_triggers_full_rerender():
+    builder = ConversationContextBuilder(token_budget=10_000)
+    builder.build("campaign_1", _history(6))
+
+    replaced = [{"role": "user", "content": "A new beginning."}]
+    result = builder.build("campaign_1", replaced)
+
+    assert result.rendered_new_messages == 1
+    assert result.text == "user: A new beginning."
+
+
+def test_budget_keeps_newest_messages_and_prepends_summary():
+    loads = []
+
+    def summary_loader(campaign_id):
+        loads.append(campaign_id)
+        return {"summary": "The party cleared the crypt."}
+
+    builder = ConversationContextBuilder(token_budget=30, summary_loader=summary_loader)
+    history = _history(40)
+    result = builder.build("campaign_1", history)
+
+    assert result.omitted_messages > 0
+    assert result.included_messages + result.omitted_messages == 40
+    assert result.history_tokens <= 30
+    assert result.text.startswith("CAMPAIGN SUMMARY (earlier turns):\nThe party cleared the crypt.")
+    assert result.text.endswith('Room 39 is empty."}')
+    assert result.summary_tokens == estimate_tokens(
+        "CAMPAIGN SUMMARY (earlier turns):\nThe party cleared the crypt."
+    )
+
+    # The summary is reused until enough new messages accumulate
+    history.extend(_history(2))
+    builder.build("campaign_1", history)
+    assert loads == ["campaign_1"]
+
+
+def test_cached_messages_are_bounded():
+    builder = ConversationContextBuilder(token_budget=10_000, max_cached_messages=10)
+    result = builder.build("campaign_1", _history(50))
+
+    assert result.included_messages == 10
+    assert result.omitted_messages == 40
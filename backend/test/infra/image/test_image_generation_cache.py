@@ -0,0 +1,150 @@
+"""Tests for the image generation cache and request coalescing."""
+
+import asyncio
+import base64
+
+import pytest
+
+from gaia.infra.image.generation_cache import ImageGenerationCache, generation_cache_key
+from gaia.infra.image.image_service_manager import ImageServiceManager
+
+
+class FakeProvider:
+    """Counts provider calls; each call returns a distinct payload."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = 0
+
+    def is_available(self):
+        return True
+
+    def get_provider_name(self):
+        return "runware"
+
+    async def generate_image(self, prompt, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        payload = base64.b64encode(f"{prompt}#{self.calls}".encode()).decode()
+        return {"success": True, "images": [{"b64_json": payload}], "provider": "runware"}
+
+
+@pytest.fixture
+def provider():
+    return FakeProvider()
+
+
+@pytest.fixture
+def manager(monkeypatch, provider):
+    monkeypatch.setattr(ImageServiceManager, "_register_providers", lambda self: None)
+    manager = ImageServiceManager()
+    manager.providers = {"runware": provider}
+    manager.generation_cache = ImageGenerationCache()
+    return manager
+
+
+def test_key_ignores_cosmetic_prompt_whitespace():
+    a = generation_cache_key(provider="runware", prompt="A  dark\nforest ", seed=1)
+    b = generation_cache_key(provider="runware", prompt="A dark forest", seed=1)
+    c = generation_cache_key(provider="runware", prompt="A dark forest", seed=2)
+    assert a == b
+    assert a != c
+
+
+async def test_seeded_repeat_is_served_from_cache(manager, provider):
+    first = await manager.generate_image(prompt="A castle", seed=7, model="hidream_fast")
+    second = await manager.generate_image(prompt="A  castle", seed=7, model="hidream_fast")
+
+    assert provider.calls == 1
+    assert second["images"] == first["images"]
+    assert (first["cache_status"], second["cache_status"]) == ("miss", "hit")
+    assert manager.get_cache_stats()["hit_rate"] == 0.5
+
+
+async def test_unseeded_requests_are_not_cached(manager, provider):
+    await manager.generate_image(prompt="A castle", model="hidream_fast")
+    await manager.generate_image(prompt="A castle", model="hidream_fast")
+    await manager.generate_image(prompt="A castle", seed=7, model="hidream_fast", use_cache=False)
+
+    assert provider.calls == 3
+
+
+async def test_concurrent_identical_requests_share_one_call(manager, provider):
+    results = await asyncio.gather(*[
+        manager.generate_image(prompt="A dragon", seed=5, model="hidream_fast") for _ in range(5)
+    ])
+
+    assert provider.calls == 1
+    assert len({r["images"][0]["b64_json"] for r in results}) == 1
+    assert sorted(r["cache_status"] for r in results) == ["coalesced"] * 4 + ["miss"]
+    assert manager.get_cache_stats()["provider_calls_saved"] == 4
+
+
+async def test_concurrent_unseeded_requests_are_not_coalesced(manager, provider):
+    results = await asyncio.gather(*[
+        manager.generate_image(prompt="A dragon", model="hidream_fast") for _ in range(3)
+    ])
+
+    assert provider.calls == 3
+    assert all("cache_status" not in r for r in results)
+
+
+async def test_failures_are_shared_but_not_cached(manager, provider):
+    async def failing(prompt, **kwargs):
+        provider.calls += 1
+        raise RuntimeError("provider down")
+
+    provider.generate_image = failing
+    results = await asyncio.gather(*[
+        manager.generate_image(prompt="A ship", seed=3, model="hidream_fast") for _ in range(3)
+    ])
+    await manager.generate_image(prompt="A ship", seed=3, model="hidream_fast")
+
+    assert all(not r["success"] for r in results)
+    assert provider.calls == 2
+
+
+async def test_hits_whose_image_file_is_gone_are_misses(tmp_path, provider):
+    cache = ImageGenerationCache()
+    image_path = tmp_path / "scene.png"
+    image_path.write_bytes(b"png")
+
+    async def generate():
+        provider.calls += 1
+        return {"success": True, "images": [{"path": str(image_path)}]}
+
+    await cache.get_or_generate("a", generate)
+    assert (await cache.get_or_generate("a", generate))["cache_status"] == "hit"
+
+    image_path.unlink()
+    assert (await cache.get_or_generate("a", generate))["cache_status"] == "miss"
+    assert provider.calls == 2
+    assert cache.metrics["stale"] == 1
+
+
+async def test_entries_expire_and_are_bounded(provider):
+    cache = ImageGenerationCache(ttl_seconds=0, max_entries=1)
+
+    await cache.get_or_generate("a", lambda: provider.generate_image("a"))
+    await cache.get_or_generate("a", lambda: provider.generate_image("a"))
+    assert provider.calls == 2
+
+    cache.ttl_seconds = 60
+    await cache.get_or_generate("b", lambda: provider.generate_image("b"))
+    await cache.get_or_generate("c", lambda: provider.generate_image("c"))
+    assert cache.stats()["entries"] == 1
+    assert cache.metrics["evictions"] >= 1
+
+
+async def test_entries_are_bounded_by_payload_bytes(provider):
+    # Each FakeProvider payload here is 4 base64 characters
+    cache = ImageGenerationCache(max_bytes=10)
+
+    for key in ("a", "b", "c"):
+        await cache.get_or_generate(key, lambda key=key: provider.generate_image(key))
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] == 8
+    assert await cache.get_or_generate("a", lambda: provider.generate_image("a")) is not None
+    assert provider.calls == 4
@@ -0,0 +1,96 @@
+"""Tests for the off-event-loop image processing service."""
+
+import asyncio
+import base64
+import time
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from gaia.infra.image.image_processing import (
+    ImageProcessingBusyError,
+    ImageProcessingService,
+    ImageProcessingTimeoutError,
+)
+
+
+def _png(width, height, color="red", mode="RGB"):
+    buffer = BytesIO()
+    Image.new(mode, (width, height), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+@pytest.fixture
+def service():
+    service = ImageProcessingService(max_workers=1, max_pending=1, timeout_seconds=5, use_processes=False)
+    yield service
+    service.shutdown(wait=True)
+
+
+async def test_composite_runs_in_worker_and_skips_bad_images(service):
+    images = [_png(200, 100), b"not an image", _png(100, 100, mode="RGBA")]
+
+    png, width, height, used = await service.composite_horizontal(images, target_height=50)
+
+    assert (width, height, used) == (150, 50, 2)
+    composite = Image.open(BytesIO(png))
+    assert composite.size == (150, 50)
+    assert service.metrics["jobs_completed_total"] == 1
+
+
+async def test_composite_in_process_pool():
+    service = ImageProcessingService(max_workers=1, max_pending=2, timeout_seconds=60, use_processes=True)
+    try:
+        result = await service.composite_horizontal([_png(64, 32)], target_height=16)
+    finally:
+        service.shutdown(wait=True)
+
+    assert result[1:] == (32, 16, 1)
+    assert service.get_metrics()["mode"] == "process"
+
+
+async def test_save_base64_image_reencodes_or_writes_raw(service, tmp_path):
+    payload = base64.b64encode(_png(10, 10, mode="RGBA")).decode()
+
+    jpeg_path = await service.save_base64_image(payload, str(tmp_path / "out" / "a.jpg"), image_format="JPEG")
+    raw_path = await service.save_base64_image(payload, str(tmp_path / "b.png"), image_format=None)
+
+    assert Image.open(jpeg_path).format == "JPEG"
+    assert open(raw_path, "rb").read() == base64.b64decode(payload)
+
+
+async def test_event_loop_keeps_running_during_job(service):
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    await service.run(_sleep, 0.2)
+    task.cancel()
+
+    assert ticks >= 5
+
+
+async def test_timeout_and_full_queue(service):
+    with pytest.raises(ImageProcessingTimeoutError):
+        await service.run(_sleep, 0.5, timeout=0.05)
+
+    # The timed-out job still occupies the only slot until it finishes
+    with pytest.raises(ImageProcessingBusyError):
+        await service.run(_sleep, 0, timeout=0.1)
+    assert service.metrics["jobs_timed_out_total"] == 1
+    assert service.metrics["jobs_rejected_total"] == 1
+
+    await asyncio.sleep(0.5)
+    assert await service.run(_sleep, 0) == 0
+    assert service.get_metrics()["pending_jobs"] == 0
@@ -0,0 +1,96 @@
+"""Tests for responsive WebP variants generated when images are persisted."""
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from gaia.infra.image.image_artifact_store import ImageArtifactStore, select_image_variant
+from gaia.infra.image.image_processing import render_image_variants
+
+
+def _png(width, height, mode="RGB"):
+    buffer = BytesIO()
+    Image.new(mode, (width, height), "blue").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("IMAGE_STORAGE_PATH", str(tmp_path))
+    monkeypatch.setenv("IMAGE_VARIANT_WIDTHS", "256,512,1024")
+    monkeypatch.delenv("MEDIA_GCS_BUCKET", raising=False)
+    store = ImageArtifactStore()
+    store.local_root = tmp_path
+    store._bucket = None
+    store._client = None
+    return store
+
+
+def test_render_variants_skips_upscaling_and_keeps_aspect_ratio():
+    variants = render_image_variants(_png(600, 300, mode="P"), [256, 512, 1024])
+
+    assert [(w, h) for w, h, _ in variants] == [(256, 128), (512, 256), (600, 300)]
+    for width, _, data in variants:
+        with Image.open(BytesIO(data)) as image:
+            assert image.format == "WEBP"
+            assert image.width == width
+
+
+async def test_persist_image_stores_variants_next_to_original(store):
+    artifact = await store.persist_image_async(
+        session_id="campaign_1", image_bytes=_png(800, 400), image_type="scene"
+    )
+
+    assert sorted(artifact.variants, key=int) == ["256", "512", "800"]
+    small = artifact.variants["256"]
+    assert small["mime_type"] == "image/webp"
+    assert small["filename"].endswith("_w256.webp")
+    assert small["url"] == f"/api/images/{small['storage_path']}"
+    assert (store.local_root / "campaign_1" / "scenes" / small["filename"]).exists()
+    assert store.read_variant_bytes("campaign_1", small)[:4] == b"RIFF"
+    assert artifact.to_payload()["variants"] == artifact.variants
+
+    filename = artifact.storage_path.rsplit("/", 1)[-1]
+    assert store.get_recent_variants(filename) == artifact.variants
+
+
+def test_sync_persist_skips_variant_rendering(store):
+    artifact = store.persist_image(session_id="campaign_1", image_bytes=_png(300, 300), image_type="portrait")
+
+    assert artifact.variants == {}
+    assert store.read_artifact_bytes("campaign_1", artifact.storage_path.rsplit("/", 1)[-1])[:4] == b"\x89PNG"
+
+
+async def test_variants_are_added_to_images_persisted_without_them(store):
+    artifact = store.persist_image(session_id="campaign_1", image_bytes=_png(300, 300), image_type="portrait")
+    filename = artifact.storage_path.rsplit("/", 1)[-1]
+
+    variants = await store.add_variants_async(session_id="campaign_1", filename=filename, image_type="portrait")
+
+    assert sorted(variants, key=int) == ["256", "300"]
+    assert (store.local_root / "campaign_1" / "portraits" / variants["256"]["filename"]).exists()
+    assert store.get_recent_variants(filename) == variants
+
+
+def test_non_raster_images_get_no_variants(store):
+    artifact = store.persist_image(
+        session_id="campaign_1", image_bytes=b"GIF89a", image_type="scene", mime_type="image/gif"
+    )
+
+    assert artifact.variants == {}
+
+
+def test_select_variant_negotiates_on_accept_and_width():
+    variants = {
+        "256": {"width": 256, "filename": "a_w256.webp"},
+        "512": {"width": 512, "filename": "a_w512.webp"},
+        "800": {"width": 800, "filename": "a_w800.webp"},
+    }
+    accept = "image/avif,image/webp,*/*"
+
+    assert select_image_variant(variants, width=300, accept="image/png,*/*") is None
+    assert select_image_variant(variants, width=300, accept=accept)["width"] == 512
+    assert select_image_variant(variants, width=2000, accept=accept)["width"] == 800
+    assert select_image_variant(variants, accept=accept)["width"] == 800
+    assert select_image_variant({}, width=300, accept=accept) is None
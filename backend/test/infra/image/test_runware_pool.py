@@ -0,0 +1,117 @@
+"""Tests for least-loaded, race-free checkout in the Runware client pool."""
+
+import asyncio
+import time
+
+import pytest
+
+from gaia.infra.image.providers import runware_pool
+from gaia.infra.image.providers.runware_pool import RunwareClientPool
+
+LATENCY = 0.05
+
+
+class FakeRunwareService:
+    """Stands in for RunwareImageService and records overlapping use."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+        self.disconnected = False
+
+    def is_available(self):
+        return True
+
+    async def generate_image(self, prompt, **kwargs):
+        self.active += 1
+        self.calls += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(LATENCY)
+        self.active -= 1
+        return {"success": True, "images": [prompt], "provider": "runware"}
+
+    async def disconnect(self):
+        self.disconnected = True
+
+
+@pytest.fixture
+def fake_clients(monkeypatch):
+    created = []
+
+    def factory():
+        client = FakeRunwareService()
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(runware_pool, "RunwareImageService", factory)
+    return created
+
+
+async def test_clients_are_never_shared_and_throughput_scales(fake_clients):
+    pool = RunwareClientPool(pool_size=3)
+
+    started = time.perf_counter()
+    results = await pool.generate_images_parallel([{"prompt": f"p{i}"} for i in range(6)])
+    elapsed = time.perf_counter() - started
+
+    assert [r["images"] for r in results] == [[f"p{i}"] for i in range(6)]
+    assert all(client.max_active == 1 for client in fake_clients)
+    assert [client.calls for client in fake_clients] == [2, 2, 2]
+    # Six requests on three clients take two rounds, not six
+    assert elapsed < LATENCY * 4
+
+
+async def test_least_loaded_client_is_preferred(fake_clients):
+    pool = RunwareClientPool(pool_size=2)
+    await pool.generate_image(prompt="first")
+    await pool.generate_image(prompt="second")
+
+    assert [client.calls for client in fake_clients] == [1, 1]
+
+
+async def test_cancelled_waiter_does_not_leak_a_client(fake_clients):
+    pool = RunwareClientPool(pool_size=1)
+    holder = asyncio.create_task(pool.generate_image(prompt="holder"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(pool.generate_image(prompt="waiter"))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    await holder
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert (await pool.generate_image(prompt="after"))["success"]
+    assert pool.get_pool_status()["waiting_requests"] == 0
+
+
+async def test_resize_grows_and_shrinks_under_load(fake_clients):
+    pool = RunwareClientPool(pool_size=1)
+    tasks = [asyncio.create_task(pool.generate_image(prompt=str(i))) for i in range(3)]
+    await asyncio.sleep(0)
+
+    await pool.resize(3)
+    await asyncio.sleep(0)
+    assert pool.get_pool_status()["busy_clients"] == 3
+    await asyncio.gather(*tasks)
+
+    await pool.resize(1)
+    await asyncio.sleep(0)
+    status = pool.get_pool_status()
+    assert status["active_clients"] == 1
+    assert sum(client.disconnected for client in fake_clients) == 2
+
+
+async def test_status_reports_per_client_utilization(fake_clients):
+    pool = RunwareClientPool(pool_size=2)
+    await pool.generate_image(prompt="one")
+
+    status = pool.get_pool_status()
+    clients = status["clients"]
+
+    assert status["available_clients"] == 2
+    assert [c["checkouts"] for c in clients] == [1, 0]
+    assert clients[0]["busy_seconds"] >= LATENCY * 0.8
+    assert 0 < clients[0]["utilization"] <= 1
+    assert clients[1]["utilization"] == 0
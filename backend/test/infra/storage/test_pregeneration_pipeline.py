@@ -0,0 +1,119 @@
+"""Tests for the concurrent pregeneration pipeline."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from gaia.infra.storage.pregeneration_pipeline import (
+    PregenerationCheckpoint,
+    PregenerationJob,
+    PregenerationPipeline,
+)
+
+LLM_LATENCY = 0.05
+IMAGE_LATENCY = 0.03
+
+
+class FakeProvider:
+    """Sleeps like a remote call and tracks peak concurrency."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def __call__(self, value):
+        self.active += 1
+        self.calls += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            return value
+        finally:
+            self.active -= 1
+
+
+def _jobs(tmp_path, llm, image, count=6, fail=()):
+    jobs = []
+    for index in range(count):
+        key = f"character:{index}"
+
+        async def character(deps, index=index):
+            if index in fail:
+                raise RuntimeError("model unavailable")
+            return await llm({"name": f"Hero {index}"})
+
+        async def portrait(deps, key=key):
+            return await image({**deps[key], "portrait_path": f"{key}.png"})
+
+        jobs.append(PregenerationJob(
+            key=key,
+            provider="llm",
+            run=character,
+            output_path=tmp_path / "characters" / f"{index}.json",
+            fingerprint=f"v1-{index}",
+        ))
+        jobs.append(PregenerationJob(
+            key=f"portrait:{index}",
+            provider="image",
+            run=portrait,
+            depends_on=(key,),
+            required=False,
+        ))
+    return jobs
+
+
+async def test_concurrency_limits_and_throughput(tmp_path):
+    llm, image = FakeProvider(LLM_LATENCY), FakeProvider(IMAGE_LATENCY)
+    pipeline = PregenerationPipeline(_jobs(tmp_path, llm, image), concurrency={"llm": 3, "image": 2})
+
+    report = await pipeline.run()
+
+    assert (llm.peak, image.peak) == (3, 2)
+    assert len(report.completed) == 12 and not report.failed
+    # Sequential generation would take 6 * (LLM + IMAGE) = 0.48s
+    assert report.elapsed_seconds < 6 * (LLM_LATENCY + IMAGE_LATENCY) / 2
+    summary = report.summary()
+    assert summary["jobs_per_second"] > 0
+    assert set(summary["provider_utilization"]) == {"llm", "image"}
+    assert json.loads((tmp_path / "characters" / "0.json").read_text()) == {"name": "Hero 0"}
+    assert list(report.results) == [job.key for job in pipeline.jobs]
+
+
+async def test_failed_run_resumes_from_checkpoint(tmp_path):
+    checkpoint = PregenerationCheckpoint(tmp_path / "checkpoint.json")
+    llm, image = FakeProvider(0), FakeProvider(0)
+
+    first = await PregenerationPipeline(_jobs(tmp_path, llm, image, count=4, fail={2}), checkpoint=checkpoint).run()
+    assert first.incomplete == ["character:2"]
+    assert "portrait:2" in first.skipped
+    assert llm.calls == 3
+
+    resumed_checkpoint = PregenerationCheckpoint(tmp_path / "checkpoint.json")
+    assert resumed_checkpoint.load() == 6
+    second = await PregenerationPipeline(_jobs(tmp_path, llm, image, count=4), checkpoint=resumed_checkpoint).run()
+
+    assert not second.incomplete
+    assert sorted(second.completed) == ["character:2", "portrait:2"]
+    assert len(second.resumed) == 6
+    assert llm.calls == 4
+    assert second.results["portrait:0"]["portrait_path"] == "character:0.png"
+
+
+async def test_checkpoint_entry_ignored_when_inputs_change(tmp_path):
+    checkpoint = PregenerationCheckpoint(tmp_path / "checkpoint.json")
+    job = PregenerationJob(key="campaign:a", provider="llm", run=None, fingerprint="old")
+    checkpoint.record(job, {"title": "Old"})
+
+    job.fingerprint = "new"
+    assert checkpoint.get(job) is None
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError):
+        PregenerationPipeline([
+            PregenerationJob(key="portrait:x", provider="image", run=None, depends_on=("character:x",))
+        ])
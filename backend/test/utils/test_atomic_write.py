@@ -0,0 +1,14 @@
+"""Tests for atomic file writes."""
+
+import json
+
+from gaia.utils.atomic_write import atomic_write_json
+
+
+def test_atomic_write_leaves_no_temp_files(tmp_path):
+    target = tmp_path / "pregenerated" / "characters.json"
+    atomic_write_json(target, {"characters": []})
+    atomic_write_json(target, {"characters": [1]})
+
+    assert json.loads(target.read_text()) == {"characters": [1]}
+    assert [p.name for p in target.parent.iterdir()] == ["characters.json"]
@@ -0,0 +1,93 @@
+"""Tests for the shared bounded LRU/TTL cache."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from gaia.utils import bounded_cache
+from gaia.utils.bounded_cache import BoundedCache, approximate_size, cache_stats
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(bounded_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entry_limit_evicts_least_recently_used():
+    cache = BoundedCache("test_lru", max_entries=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache["c"] = 3
+
+    assert cache.keys() == ["a", "c"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_budget_evicts_until_under_limit():
+    cache = BoundedCache("test_bytes", max_entries=None, max_bytes=100, sizeof=len)
+    cache.set("a", "x" * 40)
+    cache.set("b", "x" * 40)
+    cache.set("c", "x" * 40)
+
+    assert cache.keys() == ["b", "c"]
+    assert cache.stats()["bytes"] == 80
+
+    # A single entry larger than the budget is kept on its own
+    cache.set("big", "x" * 500)
+    assert cache.keys() == ["big"]
+
+
+def test_ttl_expires_entries(clock):
+    cache = BoundedCache("test_ttl", ttl_seconds=10)
+    cache.set("short", 1, ttl_seconds=1)
+    cache.set("long", 2)
+
+    clock[0] += 5
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    assert "long" in cache
+
+    clock[0] += 10
+    assert cache.purge_expired() == 1
+    assert len(cache) == 0
+    assert cache.stats()["expirations"] == 2
+
+
+def test_invalidation_hooks_report_reason():
+    cache = BoundedCache("test_hooks", max_entries=1)
+    seen = []
+    cache.add_invalidation_hook(lambda key, value, reason: seen.append((key, value, reason)))
+
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.pop("b")
+    cache["c"] = 3
+    cache["c"] = 4
+    cache.invalidate_where(lambda key, value: value == 4)
+
+    assert seen == [("a", 1, "evicted"), ("b", 2, "invalidated"), ("c", 3, "replaced"), ("c", 4, "invalidated")]
+
+
+def test_counters_and_registry():
+    cache = BoundedCache("test_registry")
+    cache.setdefault("a", [])
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache_stats()["test_registry"]
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-3)
+
+
+def test_approximate_size_grows_with_content():
+    @dataclass
+    class Profile:
+        name: str
+        notes: list
+
+    small = approximate_size(Profile("a", []))
+    large = approximate_size(Profile("a", [str(i) * 1000 for i in range(10)]))
+    assert large > small + 10_000
@@ -0,0 +1,116 @@
+"""Tests for compiled dice expressions, batch rolling and exact distributions."""
+
+import random
+import re
+import time
+
+import pytest
+
+from gaia.utils import dice as dice_module
+from gaia.utils.dice import (
+    DiceRoller,
+    compile_dice_expression,
+    dice_distribution,
+    roll_many,
+)
+
+
+def test_compiled_expression_is_cached_and_parsed_once():
+    compile_dice_expression.cache_clear()
+
+    first = compile_dice_expression("2d6+1d4fire+3")
+    second = compile_dice_expression("2d6+1d4fire+3")
+
+    assert first is second
+    assert compile_dice_expression.cache_info().hits == 1
+    assert [(t.count, t.sides) for t in first.terms] == [(2, 6), (1, 4)]
+    assert first.modifier == 3
+    assert first.damage_types == ["fire"]
+
+
+def test_plain_d20_has_no_damage_type():
+    result = DiceRoller().roll("1d20+5")
+
+    assert "damage_types" not in result
+
+
+def test_invalid_expressions_still_raise():
+    for expression in ("", "fire", "0d6", "2d0", "+3"):
+        with pytest.raises(ValueError):
+            compile_dice_expression(expression)
+
+
+def test_history_is_bounded():
+    roller = DiceRoller(history_size=5)
+
+    for _ in range(20):
+        roller.roll("1d6")
+
+    assert len(roller.roll_history) == 5
+
+
+def test_distribution_is_exact():
+    distribution = dice_distribution("2d6+1")
+
+    assert sum(distribution.values()) == pytest.approx(1.0)
+    assert min(distribution) == 3
+    assert max(distribution) == 13
+    assert distribution[8] == pytest.approx(6 / 36)
+
+
+def test_advantage_distribution_matches_two_roll_maximum():
+    advantage = dice_distribution("1d20", advantage=True)
+    disadvantage = dice_distribution("1d20", disadvantage=True)
+
+    assert advantage[20] == pytest.approx(39 / 400)
+    assert disadvantage[1] == pytest.approx(39 / 400)
+    assert sum(total * p for total, p in advantage.items()) == pytest.approx(13.825)
+
+
+def test_roll_many_is_reproducible_and_in_range():
+    first = roll_many("3d8-2", 2000, seed=7)
+    second = roll_many("3d8-2", 2000, seed=7)
+
+    assert first == second
+    assert min(first) >= 1 and max(first) <= 22
+    assert sum(first) / len(first) == pytest.approx(11.5, abs=0.3)
+
+
+def test_get_statistics_keeps_its_shape():
+    stats = DiceRoller().get_statistics("1d20+2", num_rolls=500)
+
+    assert stats["num_rolls"] == 500
+    assert len(stats["results"]) == 500
+    assert 3 <= stats["min"] <= stats["max"] <= 22
+    assert stats["expected"] == pytest.approx(12.5)
+
+
+def _legacy_statistics(expression, num_rolls):
+    """Per-roll regex parsing, as get_statistics did before compilation."""
+    results = []
+    for _ in range(num_rolls):
+        total = 0
+        for token in re.findall(r'([+-]?[^+-]+)', expression.replace(' ', '')):
+            match = re.match(r'([+-]?)(\d*)d(\d+)', token)
+            if match:
+                count = int(match.group(2) or 1)
+                total += sum(random.randint(1, int(match.group(3))) for _ in range(count))
+            elif re.fullmatch(r'([+-]?\d+)', token):
+                total += int(token)
+        results.append(total)
+    return results
+
+
+@pytest.mark.skipif(not dice_module._NUMPY_AVAILABLE, reason="numpy not installed")
+def test_batch_rolling_beats_legacy_loop():
+    expression, num_rolls = "4d6+1d8+3", 20000
+
+    started = time.perf_counter()
+    _legacy_statistics(expression, num_rolls)
+    legacy = time.perf_counter() - started
+
+    started = time.perf_counter()
+    roll_many(expression, num_rolls)
+    batched = time.perf_counter() - started
+
+    assert batched * 5 < legacy
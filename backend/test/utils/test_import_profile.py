@@ -0,0 +1,58 @@
+"""Import-time benchmark guarding the lazy optional-dependency imports."""
+
+import os
+import sys
+
+import pytest
+
+from gaia.utils.import_profile import parse_importtime, profile_import
+from gaia.utils.lazy_imports import lazy_module, module_available
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        80 |        300 | encodings
+import time:      1500 |       4200 |     gaia.api.app
+not an importtime line
+"""
+
+
+def _child_env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    return env
+
+
+def test_parse_importtime_reads_timings_and_depth():
+    timings = parse_importtime(SAMPLE)
+
+    assert [t.module for t in timings] == ["_io", "encodings", "gaia.api.app"]
+    assert timings[2].self_us == 1500
+    assert timings[2].cumulative_us == 4200
+    assert timings[2].depth == 2
+
+
+def test_lazy_module_imports_on_first_attribute_access():
+    module = lazy_module("colorsys")
+
+    assert not module.is_loaded
+    assert module.rgb_to_hsv(1, 0, 0)[0] == 0
+    assert module.is_loaded
+    assert module_available("colorsys")
+    assert not module_available("gaia_missing_optional_sdk")
+
+
+@pytest.mark.parametrize(
+    "module, heavy",
+    [
+        ("gaia.infra.storage.campaign_object_store", "google.cloud.storage"),
+        ("gaia.infra.image.image_artifact_store", "google.cloud.storage"),
+        ("gaia.infra.image.providers.runware", "runware"),
+    ],
+)
+def test_importing_provider_does_not_load_optional_sdk(module, heavy):
+    profile = profile_import(module, top=5, env=_child_env())
+
+    assert module in profile.loaded_modules
+    assert heavy not in profile.loaded_modules
+    assert profile.top_cumulative
+    assert profile.peak_rss_mb > 0
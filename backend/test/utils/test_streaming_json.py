@@ -0,0 +1,127 @@
+"""Tests for the incremental streaming JSON extractor."""
+
+import json
+
+import pytest
+
+from gaia.utils.streaming_json import (
+    COMPLETE,
+    STRING_DELTA,
+    VALUE,
+    StreamingJSONExtractor,
+    extract_json_incrementally,
+    repair_json_object,
+    stream_json_events,
+)
+
+PAYLOAD = {
+    "narrative": "The door creaks open.\n\"Who goes there?\" a voice asks. 🐉",
+    "turn": "Aria's turn",
+    "status": {"hp": 12, "conscious": True, "effects": None, "rolls": [3, 17.5, -1]},
+    "characters": [{"name": "Aria"}],
+}
+
+
+def _feed_in_chunks(extractor, text, size):
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(extractor.feed(text[start:start + size]))
+    return events
+
+
+def test_parses_object_split_across_arbitrary_chunks():
+    text = json.dumps(PAYLOAD)
+    for size in (1, 2, 3, 7, 64):
+        extractor = StreamingJSONExtractor()
+        _feed_in_chunks(extractor, text, size)
+        assert extractor.done
+        assert extractor.finish() == PAYLOAD
+
+
+def test_streams_narrative_deltas_before_completion():
+    text = json.dumps(PAYLOAD)
+    extractor = StreamingJSONExtractor(stream_fields={"narrative"})
+    midpoint = text.index("a voice")
+
+    first = extractor.feed(text[:midpoint])
+    deltas = [event.value for event in first if event.kind == STRING_DELTA]
+    assert "".join(deltas).startswith("The door creaks open.\n")
+    assert not extractor.done
+
+    rest = extractor.feed(text[midpoint:])
+    deltas += [event.value for event in rest if event.kind == STRING_DELTA]
+    assert "".join(deltas) == PAYLOAD["narrative"]
+    assert all(event.field == "narrative" for event in first + rest if event.kind == STRING_DELTA)
+
+
+def test_emits_top_level_value_events_and_completion():
+    extractor = StreamingJSONExtractor(stream_fields=set())
+    events = extractor.feed(json.dumps(PAYLOAD))
+
+    value_fields = [event.field for event in events if event.kind == VALUE]
+    assert value_fields == ["narrative", "turn", "status", "characters"]
+    assert events[-1].kind == COMPLETE
+    assert events[-1].value == PAYLOAD
+
+
+def test_ignores_surrounding_prose_and_markdown_fences():
+    text = "Here is the response:\n```json\n" + json.dumps(PAYLOAD) + "\n```\nLet me know!"
+    assert extract_json_incrementally(text) == PAYLOAD
+
+
+def test_tolerates_control_characters_trailing_commas_and_bare_keys():
+    text = '{narrative: "line one\nline two\x07 done", "tags": ["a", "b",],}'
+    assert extract_json_incrementally(text) == {
+        "narrative": "line one\nline two done",
+        "tags": ["a", "b"],
+    }
+
+
+def test_repairs_truncated_output():
+    assert extract_json_incrementally('{"narrative": "The dragon ro') == {"narrative": "The dragon ro"}
+    assert extract_json_incrementally('{"narrative": "x", "status": {"hp": 4') == {
+        "narrative": "x",
+        "status": {"hp": 4},
+    }
+    assert extract_json_incrementally("no json here") is None
+
+
+def test_repair_only_accepts_complete_object_documents():
+    assert repair_json_object('{"a": "line\nbreak", "b": [1, 2,],}') == {"a": "line\nbreak", "b": [1, 2]}
+    assert repair_json_object('{"narrative": "The dragon ro') is None
+    assert repair_json_object('[{"a": 1}, {"b": 2}]') is None
+    assert repair_json_object('Sure! {"a": 1}') is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": Hello world, "b": 2}',
+        '{"a": "x" "b": 2}',
+        '{"n": None}',
+        '{"hp": 1e}',
+        '{"a": 1} trailing {"b": 2}',
+        '{"a": }',
+        '{"a": "\\q"}',
+    ],
+)
+def test_repair_rejects_output_it_would_have_to_guess_at(text):
+    assert repair_json_object(text) is None
+
+
+def test_unicode_escapes_split_across_chunks():
+    extractor = StreamingJSONExtractor()
+    _feed_in_chunks(extractor, '{"text": "caf\\u00e9 \\ud83d\\ude00"}', 1)
+    assert extractor.finish() == {"text": "café 😀"}
+
+
+async def test_stream_json_events_yields_final_complete_event_for_truncated_stream():
+    async def chunks():
+        yield '{"narrative": "Rain '
+        yield 'falls", "turn": "Bo'
+
+    events = [event async for event in stream_json_events(chunks(), stream_fields={"narrative"})]
+
+    assert "".join(e.value for e in events if e.kind == STRING_DELTA) == "Rain falls"
+    assert events[-1].kind == COMPLETE
+    assert events[-1].value == {"narrative": "Rain falls", "turn": "Bo"}
@@ -0,0 +1,32 @@
+-- Migration: Add indexes for audio retention sweeps
+-- Created: 2026-10-18
+-- Description: Index the timestamps used by the audio retention engine
+--
+-- Background:
+-- Audio retention previously ran one query per campaign and deleted rows one
+-- ORM object at a time. The retention engine now issues bounded, set-based
+-- DELETE ... RETURNING statements across all campaigns, filtered only by
+-- age. Without these indexes each batch would scan the whole table.
+--
+-- Performance impact:
+-- - Each retention batch becomes an index range scan on the timestamp
+-- - Cleanup cost is proportional to expired rows rather than campaign count
+
+CREATE INDEX IF NOT EXISTS ix_audio_chunks_played_at
+    ON audio_chunks (played_at);
+
+CREATE INDEX IF NOT EXISTS ix_audio_playback_requests_completed
+    ON audio_playback_requests (completed_at);
+
+COMMENT ON INDEX ix_audio_chunks_played_at IS 'Retention sweeps of played audio chunks';
+COMMENT ON INDEX ix_audio_playback_requests_completed IS 'Retention sweeps of finished playback requests';
+
+-- user_audio_queue is created by the backend at startup, so it may not exist yet
+DO $$
+BEGIN
+    IF to_regclass('user_audio_queue') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS ix_user_queue_played_at
+            ON user_audio_queue (played_at);
+        COMMENT ON INDEX ix_user_queue_played_at IS 'Retention sweeps of played user queue entries';
+    END IF;
+END $$;
@@ -0,0 +1,22 @@
+-- Migration: Add indexes for read-only playback queue advancement
+-- Created: 2026-10-18
+-- Description: Support the single-SELECT queue read and the playback state reconciler
+--
+-- Background:
+-- get_next_pending_request used to repair stuck requests inline, issuing
+-- UPDATEs and loading chunk collections on every client poll. Repairs now run
+-- in a background reconciler, and the queue read is one SELECT for the oldest
+-- PENDING request of a campaign joined to its chunks.
+--
+-- Performance impact:
+-- - Queue advancement is an index range scan on (campaign_id, status, requested_at)
+-- - Reconciler sweeps by status across all campaigns without a sequential scan
+
+CREATE INDEX IF NOT EXISTS ix_audio_playback_requests_queue
+    ON audio_playback_requests (campaign_id, status, requested_at);
+
+CREATE INDEX IF NOT EXISTS ix_audio_playback_requests_active
+    ON audio_playback_requests (status, requested_at);
+
+COMMENT ON INDEX ix_audio_playback_requests_queue IS 'Next pending playback request per campaign in FIFO order';
+COMMENT ON INDEX ix_audio_playback_requests_active IS 'Playback state reconciler sweeps by status';
@@ -3,12 +3,16 @@
 
 import argparse
 import asyncio
+import base64
+import hashlib
+import json
 import logging
 import os
+import re
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -29,6 +33,13 @@ from gaia.infra.llm.model_manager import (
     retry_with_fallback,
 )
 from gaia.infra.storage.campaign_object_store import get_pregenerated_content_store
+from gaia.infra.storage.pregeneration_pipeline import (
+    PregenerationCheckpoint,
+    PregenerationJob,
+    PregenerationPipeline,
+    default_concurrency,
+)
+from gaia.utils.atomic_write import atomic_write_bytes, atomic_write_json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -42,6 +53,12 @@ OUTPUT_DIR = CAMPAIGN_STORAGE_PATH / "pregenerated"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 LOCK_FILE = OUTPUT_DIR / ".pregenerate.lock"
 LOCK_POLL_INTERVAL = 2.0
+CHECKPOINT_FILE = OUTPUT_DIR / ".pregenerate.checkpoint.json"
+
+# Per-item files read by CharacterStorage.load_pregenerated_*()
+CAMPAIGNS_DIR = OUTPUT_DIR / "campaigns"
+CHARACTERS_DIR = OUTPUT_DIR / "characters"
+PORTRAITS_DIR = CHARACTERS_DIR / "portraits"
 
 # Campaign variations to generate
 CAMPAIGN_PROMPTS = [
@@ -197,176 +214,323 @@ def _release_generation_lock() -> None:
         logger.warning("⚠️ Failed to remove pregeneration lock %s: %s", LOCK_FILE, exc)
 
 
-async def generate_campaigns() -> List[Dict[str, Any]]:
-    """Generate multiple campaign variations using the CampaignGeneratorAgent."""
-    campaigns = []
-    campaign_generator = CampaignGeneratorAgent()
-
+async def generate_campaign(
+    prompt_config: Dict[str, str],
+    campaign_generator: CampaignGeneratorAgent,
+) -> Dict[str, Any]:
+    """Generate one campaign variation using the CampaignGeneratorAgent."""
     # Use centralized fallback chain starting with Kimi
     primary_model = PreferredModels.KIMI.value
 
-    for i, prompt_config in enumerate(CAMPAIGN_PROMPTS):
-        logger.info(f"Generating campaign {i+1}/{len(CAMPAIGN_PROMPTS)}: {prompt_config['style']}")
-
-        # Define the generation operation
-        async def generate_campaign_with_model(model: str, provider) -> Dict[str, Any]:
-            """Inner function that generates campaign with a specific model."""
-            # Create RunConfig with the provider
-            run_config = RunConfig(
-                model=model,
-                model_provider=provider,
-                model_settings=ModelSettings(
-                    temperature=campaign_generator.temperature,
-                    parallel_tool_calls=False,
-                    tool_choice="auto"
-                )
+    logger.info(f"Generating campaign: {prompt_config['style']}")
+
+    # Define the generation operation
+    async def generate_campaign_with_model(model: str, provider) -> Dict[str, Any]:
+        """Inner function that generates campaign with a specific model."""
+        # Create RunConfig with the provider
+        run_config = RunConfig(
+            model=model,
+            model_provider=provider,
+            model_settings=ModelSettings(
+                temperature=campaign_generator.temperature,
+                parallel_tool_calls=False,
+                tool_choice="auto"
             )
+        )
 
-            await campaign_generator.ensure_prompt_loaded()
-            agent = campaign_generator.as_openai_agent(model_override=model)
-            result = await Runner.run(
-                agent,
-                prompt_config['prompt'],
-                run_config=run_config
-            )
+        await campaign_generator.ensure_prompt_loaded()
+        agent = campaign_generator.as_openai_agent(model_override=model)
+        result = await Runner.run(
+            agent,
+            prompt_config['prompt'],
+            run_config=run_config
+        )
 
-            if hasattr(result, 'final_output') and result.final_output:
-                if hasattr(result.final_output, 'model_dump'):
-                    campaign_data = result.final_output.model_dump()
-                    campaign_data['style'] = prompt_config['style']
-
-                    # Validate the campaign is actually interesting
-                    if (campaign_data.get('title') and
-                        campaign_data.get('description') and
-                        len(campaign_data.get('description', '')) > 50 and
-                        len(campaign_data.get('key_npcs', [])) >= 3):
-                        return campaign_data
-                    else:
-                        # Validation failure - raise to trigger retry
-                        raise ValueError("Campaign lacks required detail (title, description, or NPCs)")
+        if hasattr(result, 'final_output') and result.final_output:
+            if hasattr(result.final_output, 'model_dump'):
+                campaign_data = result.final_output.model_dump()
+                campaign_data['style'] = prompt_config['style']
+
+                # Validate the campaign is actually interesting
+                if (campaign_data.get('title') and
+                    campaign_data.get('description') and
+                    len(campaign_data.get('description', '')) > 50 and
+                    len(campaign_data.get('key_npcs', [])) >= 3):
+                    return campaign_data
                 else:
-                    raise ValueError("No structured output from model")
+                    # Validation failure - raise to trigger retry
+                    raise ValueError("Campaign lacks required detail (title, description, or NPCs)")
             else:
-                raise ValueError("No final output from model")
-
-        try:
-            # Use automatic retry with fallback
-            campaign_data, model_used = await retry_with_fallback(
-                model_key=primary_model,
-                operation=generate_campaign_with_model,
-                max_retries_per_model=2,
-                retry_on_validation_failure=True
-            )
+                raise ValueError("No structured output from model")
+        else:
+            raise ValueError("No final output from model")
 
-            campaigns.append(campaign_data)
-            logger.info(f"✅ Generated with {model_used}: {campaign_data.get('title')}")
+    try:
+        # Use automatic retry with fallback
+        campaign_data, model_used = await retry_with_fallback(
+            model_key=primary_model,
+            operation=generate_campaign_with_model,
+            max_retries_per_model=2,
+            retry_on_validation_failure=True
+        )
 
-        except Exception as e:
-            error_msg = f"Failed to generate campaign {i+1} with all models in fallback chain"
-            logger.error(f"❌ {error_msg}: {e}")
-            raise RuntimeError(error_msg) from e
+        logger.info(f"✅ Generated with {model_used}: {campaign_data.get('title')}")
+        return campaign_data
 
-    return campaigns
+    except Exception as e:
+        error_msg = f"Failed to generate campaign '{prompt_config['style']}' with all models in fallback chain"
+        logger.error(f"❌ {error_msg}: {e}")
+        raise RuntimeError(error_msg) from e
 
-async def generate_characters() -> List[Dict[str, Any]]:
-    """Generate multiple character variations using the CharacterGeneratorAgent."""
-    characters = []
-    character_generator = CharacterGeneratorAgent()
 
+async def generate_character(
+    prompt_config: Dict[str, str],
+    character_generator: CharacterGeneratorAgent,
+) -> Dict[str, Any]:
+    """Generate one character variation using the CharacterGeneratorAgent."""
     # Use centralized fallback chain starting with Kimi
     primary_model = PreferredModels.KIMI.value
 
-    for i, prompt_config in enumerate(CHARACTER_PROMPTS):
-        logger.info(f"Generating character {i+1}/{len(CHARACTER_PROMPTS)}: {prompt_config['type']}")
-
-        # Define the generation operation
-        async def generate_character_with_model(model: str, provider) -> Dict[str, Any]:
-            """Inner function that generates character with a specific model."""
-            # Create RunConfig with the provider
-            run_config = RunConfig(
-                model=model,
-                model_provider=provider,
-                model_settings=ModelSettings(
-                    temperature=character_generator.temperature,
-                    parallel_tool_calls=False,
-                    tool_choice="auto"
-                )
+    logger.info(f"Generating character: {prompt_config['type']}")
+
+    # Define the generation operation
+    async def generate_character_with_model(model: str, provider) -> Dict[str, Any]:
+        """Inner function that generates character with a specific model."""
+        # Create RunConfig with the provider
+        run_config = RunConfig(
+            model=model,
+            model_provider=provider,
+            model_settings=ModelSettings(
+                temperature=character_generator.temperature,
+                parallel_tool_calls=False,
+                tool_choice="auto"
             )
+        )
 
-            await character_generator.ensure_prompt_loaded()
-            agent = character_generator.as_openai_agent(model_override=model)
-            result = await Runner.run(
-                agent,
-                prompt_config['prompt'],
-                run_config=run_config
-            )
+        await character_generator.ensure_prompt_loaded()
+        agent = character_generator.as_openai_agent(model_override=model)
+        result = await Runner.run(
+            agent,
+            prompt_config['prompt'],
+            run_config=run_config
+        )
 
-            if hasattr(result, 'final_output') and result.final_output:
-                if hasattr(result.final_output, 'model_dump'):
-                    character_data = result.final_output.model_dump()
-                    character_data['type'] = prompt_config['type']
-
-                    # Apply default visual values if not provided by AI
-                    default_visual_values = {
-                        'gender': 'non-binary',
-                        'facial_expression': 'determined',
-                        'build': 'average'
-                    }
-                    for field, default_value in default_visual_values.items():
-                        if not character_data.get(field):
-                            character_data[field] = default_value
-
-                    # Validate character has proper name and details
-                    name = character_data.get('name', '').strip()
-                    backstory = character_data.get('backstory', '').strip()
-                    char_class = character_data.get('character_class', '').strip()
-
-                    # Reject invalid names
-                    invalid_name = (
-                        not name or
-                        name.lower().startswith('unnamed') or
-                        'tool_call' in name.lower() or
-                        '<' in name or '>' in name or  # Reject XML/HTML tags
-                        len(name) < 2 or
-                        not any(c.isalpha() for c in name)  # Must have at least one letter
-                    )
-
-                    if invalid_name:
-                        raise ValueError(f"Invalid character name: '{name}'")
-
-                    if not backstory or len(backstory) < 50:
-                        raise ValueError(f"Backstory too short ({len(backstory)} chars, need 50+)")
-
-                    if not char_class:
-                        raise ValueError("Missing character_class")
-
-                    # All validations passed
-                    return character_data
-                else:
-                    raise ValueError("No structured output from model")
+        if hasattr(result, 'final_output') and result.final_output:
+            if hasattr(result.final_output, 'model_dump'):
+                character_data = result.final_output.model_dump()
+                character_data['type'] = prompt_config['type']
+
+                # Apply default visual values if not provided by AI
+                default_visual_values = {
+                    'gender': 'non-binary',
+                    'facial_expression': 'determined',
+                    'build': 'average'
+                }
+                for field, default_value in default_visual_values.items():
+                    if not character_data.get(field):
+                        character_data[field] = default_value
+
+                # Validate character has proper name and details
+                name = character_data.get('name', '').strip()
+                backstory = character_data.get('backstory', '').strip()
+                char_class = character_data.get('character_class', '').strip()
+
+                # Reject invalid names
+                invalid_name = (
+                    not name or
+                    name.lower().startswith('unnamed') or
+                    'tool_call' in name.lower() or
+                    '<' in name or '>' in name or  # Reject XML/HTML tags
+                    len(name) < 2 or
+                    not any(c.isalpha() for c in name)  # Must have at least one letter
+                )
+
+                if invalid_name:
+                    raise ValueError(f"Invalid character name: '{name}'")
+
+                if not backstory or len(backstory) < 50:
+                    raise ValueError(f"Backstory too short ({len(backstory)} chars, need 50+)")
+
+                if not char_class:
+                    raise ValueError("Missing character_class")
+
+                # All validations passed
+                return character_data
             else:
-                raise ValueError("No final output from model")
+                raise ValueError("No structured output from model")
+        else:
+            raise ValueError("No final output from model")
 
-        try:
-            # Use automatic retry with fallback
-            character_data, model_used = await retry_with_fallback(
-                model_key=primary_model,
-                operation=generate_character_with_model,
-                max_retries_per_model=2,
-                retry_on_validation_failure=True
+    try:
+        # Use automatic retry with fallback
+        character_data, model_used = await retry_with_fallback(
+            model_key=primary_model,
+            operation=generate_character_with_model,
+            max_retries_per_model=2,
+            retry_on_validation_failure=True
+        )
+
+        name = character_data.get('name', 'Unknown')
+        char_class = character_data.get('character_class', 'Unknown')
+        logger.info(f"✅ Generated with {model_used}: {name} ({char_class})")
+        return character_data
+
+    except Exception as e:
+        error_msg = f"Failed to generate character '{prompt_config['type']}' with all models in fallback chain"
+        logger.error(f"❌ {error_msg}: {e}")
+        raise RuntimeError(error_msg) from e
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+
+
+def _fingerprint(*parts: Any) -> str:
+    """Identify a job's inputs so stale checkpoint entries are not reused."""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def build_portrait_prompt(character: Dict[str, Any]) -> str:
+    """Describe a pregenerated character for the image provider."""
+    parts = [
+        character.get("name"),
+        character.get("facial_expression"),
+        character.get("gender"),
+        character.get("race"),
+        character.get("character_class"),
+        f"{character['build']} build" if character.get("build") else None,
+        character.get("appearance") or character.get("visual_description"),
+    ]
+    description = ", ".join(str(part) for part in parts if part)
+    return f"Fantasy character portrait, head and shoulders: {description}"
+
+
+async def generate_portrait(character: Dict[str, Any], character_type: str) -> Dict[str, Any]:
+    """Generate a portrait for a pregenerated character and store it next to it."""
+    from gaia.infra.image.image_service_manager import get_image_service_manager
+
+    prompt = build_portrait_prompt(character)
+    logger.info(f"Generating portrait: {character_type}")
+    result = await get_image_service_manager().generate_image(
+        prompt=prompt,
+        width=768,
+        height=768,
+        response_format="b64_json",
+        # Stable seed: a retried run reuses the image cache instead of paying again
+        seed=int(_fingerprint(character_type, prompt), 16) % (2 ** 31),
+    )
+    images = result.get("images") or []
+    if not result.get("success") or not images or "b64_json" not in images[0]:
+        raise RuntimeError(f"Portrait generation failed for {character_type}: {result.get('error', 'no image data')}")
+
+    path = PORTRAITS_DIR / f"{_slug(character_type)}.png"
+    await asyncio.to_thread(atomic_write_bytes, path, base64.b64decode(images[0]["b64_json"]))
+    logger.info(f"✅ Portrait saved for {character.get('name', character_type)}: {path}")
+    return {"portrait_path": str(path), "portrait_prompt": prompt}
+
+
+def build_jobs(*, with_portraits: bool = False) -> List[PregenerationJob]:
+    """One job per campaign and character (plus portraits), ready for the pipeline."""
+    campaign_generator = CampaignGeneratorAgent()
+    character_generator = CharacterGeneratorAgent()
+    jobs: List[PregenerationJob] = []
+
+    for prompt_config in CAMPAIGN_PROMPTS:
+        jobs.append(PregenerationJob(
+            key=f"campaign:{prompt_config['style']}",
+            provider="llm",
+            run=lambda deps, config=prompt_config: generate_campaign(config, campaign_generator),
+            output_path=CAMPAIGNS_DIR / f"{_slug(prompt_config['style'])}.json",
+            fingerprint=_fingerprint(prompt_config),
+        ))
+
+    for prompt_config in CHARACTER_PROMPTS:
+        character_key = f"character:{prompt_config['type']}"
+        jobs.append(PregenerationJob(
+            key=character_key,
+            provider="llm",
+            run=lambda deps, config=prompt_config: generate_character(config, character_generator),
+            # Written after the portrait (if any) so the file includes portrait_path
+            output_path=None if with_portraits else CHARACTERS_DIR / f"{_slug(prompt_config['type'])}.json",
+            fingerprint=_fingerprint(prompt_config),
+        ))
+        if with_portraits:
+            jobs.append(PregenerationJob(
+                key=f"portrait:{prompt_config['type']}",
+                provider="image",
+                run=lambda deps, key=character_key, config=prompt_config: _generate_portrait_job(
+                    deps[key], config["type"]
+                ),
+                depends_on=(character_key,),
+                fingerprint=_fingerprint(prompt_config, "portrait"),
+                # A missing portrait shouldn't fail the whole refresh
+                required=False,
+            ))
+
+    return jobs
+
+
+async def _generate_portrait_job(character: Dict[str, Any], character_type: str) -> Dict[str, Any]:
+    portrait = await generate_portrait(character, character_type)
+    return {**character, **portrait}
+
+
+def _collect_results(results: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split pipeline results into campaigns and characters (portraits merged in)."""
+    campaigns = [results[f"campaign:{c['style']}"] for c in CAMPAIGN_PROMPTS if f"campaign:{c['style']}" in results]
+    characters = []
+    for config in CHARACTER_PROMPTS:
+        character = results.get(f"portrait:{config['type']}") or results.get(f"character:{config['type']}")
+        if character is not None:
+            characters.append(character)
+    return campaigns, characters
+
+
+async def run_pipeline(
+    *,
+    with_portraits: bool = False,
+    concurrency: Optional[Dict[str, int]] = None,
+    resume: bool = True,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Generate all content concurrently, resuming from a previous partial run.
+
+    Raises:
+        RuntimeError: If a campaign or character could not be generated; the
+            checkpoint is kept so the next run only redoes what is missing
+    """
+    checkpoint = PregenerationCheckpoint(CHECKPOINT_FILE)
+    if resume:
+        finished = checkpoint.load()
+        if finished:
+            logger.info("♻️ Resuming pregeneration: %s jobs already finished", finished)
+    else:
+        checkpoint.clear()
+
+    pipeline = PregenerationPipeline(
+        build_jobs(with_portraits=with_portraits),
+        concurrency=concurrency,
+        checkpoint=checkpoint,
+    )
+    logger.info("⚙️ Pregeneration concurrency: %s", pipeline.concurrency)
+    report = await pipeline.run()
+    logger.info("📊 Pregeneration stats: %s", report.summary())
+
+    campaigns, characters = _collect_results(report.results)
+    if with_portraits:
+        # Character files are written once the portrait job settled (or failed)
+        for character in characters:
+            await asyncio.to_thread(
+                atomic_write_json, CHARACTERS_DIR / f"{_slug(character['type'])}.json", character
             )
 
-            characters.append(character_data)
-            name = character_data.get('name', 'Unknown')
-            char_class = character_data.get('character_class', 'Unknown')
-            logger.info(f"✅ Generated with {model_used}: {name} ({char_class})")
+    if report.incomplete:
+        raise RuntimeError(
+            f"Pregeneration incomplete ({len(report.incomplete)} jobs failed: "
+            f"{', '.join(report.incomplete)}); rerun to resume"
+        )
 
-        except Exception as e:
-            error_msg = f"Failed to generate character {i+1} with all models in fallback chain"
-            logger.error(f"❌ {error_msg}: {e}")
-            raise RuntimeError(error_msg) from e
+    checkpoint.clear()
+    return campaigns, characters
 
-    return characters
 
 def save_content(campaigns: List[Dict[str, Any]], characters: List[Dict[str, Any]]):
     """Save pre-generated content to local files and GCS."""
@@ -417,9 +581,17 @@ async def generate_content(
     min_campaigns: int = len(CAMPAIGN_PROMPTS),
     min_characters: int = len(CHARACTER_PROMPTS),
     lock_timeout: int = 600,
+    with_portraits: bool = False,
+    concurrency: Optional[Dict[str, int]] = None,
+    resume: bool = True,
 ) -> bool:
     """Generate and persist pre-generated content.
 
+    Campaigns, characters and (optionally) portraits are generated
+    concurrently within the per-provider ``concurrency`` limits. A failed run
+    leaves a checkpoint behind, and the next run resumes from it unless
+    ``resume`` is False.
+
     Returns:
         True if new content was generated, False if skipped because sufficient
         content already exists.
@@ -485,13 +657,13 @@ async def generate_content(
             )
             logger.warning("⚠️ Will attempt to use local models only")
 
-        # Generate campaigns
-        logger.info("\n📜 Generating campaigns...")
-        campaigns = await generate_campaigns()
-
-        # Generate characters
-        logger.info("\n🎭 Generating characters...")
-        characters = await generate_characters()
+        # Generate campaigns, characters and portraits concurrently
+        logger.info("\n📜 Generating campaigns and characters...")
+        campaigns, characters = await run_pipeline(
+            with_portraits=with_portraits,
+            concurrency=concurrency,
+            resume=resume,
+        )
 
         # Save everything
         logger.info("\n💾 Saving content...")
@@ -545,6 +717,28 @@ def parse_args() -> argparse.Namespace:
         default=600,
         help="Seconds to wait for another generator to finish before failing.",
     )
+    parser.add_argument(
+        "--with-portraits",
+        action="store_true",
+        help="Also generate a portrait for each pregenerated character.",
+    )
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=default_concurrency()["llm"],
+        help="Maximum concurrent LLM generations (PREGEN_LLM_CONCURRENCY).",
+    )
+    parser.add_argument(
+        "--image-concurrency",
+        type=int,
+        default=default_concurrency()["image"],
+        help="Maximum concurrent image generations (PREGEN_IMAGE_CONCURRENCY).",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore the checkpoint of a previous partial run and start over.",
+    )
     return parser.parse_args()
 
 
@@ -559,6 +753,12 @@ def _run_cli() -> None:
                 min_campaigns=max(args.min_campaigns, 0),
                 min_characters=max(args.min_characters, 0),
                 lock_timeout=max(args.lock_timeout, 1),
+                with_portraits=args.with_portraits,
+                concurrency={
+                    "llm": max(args.llm_concurrency, 1),
+                    "image": max(args.image_concurrency, 1),
+                },
+                resume=not args.fresh,
             )
         )
         if not generated:
@@ -0,0 +1,262 @@
+"""
+Batch (Scribe V1) transcription helpers for the realtime fallback path
+Segments 16-bit PCM at voice-activity pauses and uploads segments in the
+background so the WebSocket keeps receiving audio during uploads
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+import numpy as np
+
+from .voice_detection import VoiceDetectionService
+
+logger = logging.getLogger(__name__)
+
+V1_VAD_FRAME_MS = int(os.getenv("STT_V1_VAD_FRAME_MS", "100"))
+V1_PAUSE_MS = int(os.getenv("STT_V1_PAUSE_MS", "600"))
+V1_MAX_SEGMENT_SECS = float(os.getenv("STT_V1_MAX_SEGMENT_SECS", "8"))
+V1_MIN_SPEECH_MS = int(os.getenv("STT_V1_MIN_SPEECH_MS", "250"))
+V1_PRE_ROLL_MS = int(os.getenv("STT_V1_PRE_ROLL_MS", "200"))
+V1_MAX_IN_FLIGHT = int(os.getenv("STT_V1_MAX_IN_FLIGHT", "2"))
+
+QUOTA_ERROR_MARKERS = ("quota", "billing", "insufficient")
+
+
+class PCMSegmenter:
+    """
+    Cuts a mono 16-bit PCM stream into speech segments.
+
+    Audio is classified in fixed frames with VoiceDetectionService. A segment
+    starts at the first voiced frame (plus a little pre-roll) and ends after
+    a pause, or when it reaches the maximum length. Silence between segments
+    is dropped instead of being uploaded.
+    """
+
+    def __init__(
+        self,
+        vad: VoiceDetectionService,
+        sample_rate: int = 16000,
+        frame_ms: int = V1_VAD_FRAME_MS,
+        pause_ms: int = V1_PAUSE_MS,
+        max_segment_secs: float = V1_MAX_SEGMENT_SECS,
+        min_speech_ms: int = V1_MIN_SPEECH_MS,
+        pre_roll_ms: int = V1_PRE_ROLL_MS,
+    ):
+        self.vad = vad
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame_bytes = sample_rate * frame_ms // 1000 * 2
+        self.pause_frames = max(1, pause_ms // frame_ms)
+        self.max_segment_bytes = int(max_segment_secs * sample_rate) * 2
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self._pre_roll: Deque[bytes] = deque(maxlen=max(0, pre_roll_ms // frame_ms))
+        self._pending = bytearray()
+        self._segment = bytearray()
+        self._in_speech = False
+        self._speech_frames = 0
+        self._silent_run = 0
+        # Running totals (bytes) instead of re-summing buffers
+        self.received_bytes = 0
+        self.skipped_bytes = 0
+        self.segmented_bytes = 0
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Audio held in the current segment and partial frame."""
+        return len(self._segment) + len(self._pending)
+
+    def push(self, data: bytes) -> List[bytes]:
+        """Add audio and return any segments it completed."""
+        self.received_bytes += len(data)
+        self._pending.extend(data)
+        segments: List[bytes] = []
+        offset = 0
+        while len(self._pending) - offset >= self.frame_bytes:
+            frame = bytes(self._pending[offset:offset + self.frame_bytes])
+            offset += self.frame_bytes
+            segment = self._process_frame(frame)
+            if segment:
+                segments.append(segment)
+        del self._pending[:offset]
+        return segments
+
+    def flush(self) -> Optional[bytes]:
+        """End the current segment (e.g. on stop or when audio stops arriving)."""
+        if self._in_speech:
+            self._segment.extend(self._pending)
+            self._pending.clear()
+            return self._cut()
+        self.skipped_bytes += len(self._pending) + sum(len(frame) for frame in self._pre_roll)
+        self._pending.clear()
+        self._pre_roll.clear()
+        return None
+
+    def _is_voiced(self, frame: bytes) -> bool:
+        has_voice, _confidence = self.vad.analyze_audio_frequencies(
+            np.frombuffer(frame, dtype=np.int16), sample_rate=self.sample_rate
+        )
+        return bool(has_voice)
+
+    def _process_frame(self, frame: bytes) -> Optional[bytes]:
+        voiced = self._is_voiced(frame)
+        if not self._in_speech:
+            if not voiced:
+                if not self._pre_roll.maxlen:
+                    self.skipped_bytes += len(frame)
+                else:
+                    if len(self._pre_roll) == self._pre_roll.maxlen:
+                        self.skipped_bytes += len(self._pre_roll[0])
+                    self._pre_roll.append(frame)
+                return None
+            self._in_speech = True
+            for previous in self._pre_roll:
+                self._segment.extend(previous)
+            self._pre_roll.clear()
+
+        self._segment.extend(frame)
+        if voiced:
+            self._speech_frames += 1
+            self._silent_run = 0
+        else:
+            self._silent_run += 1
+
+        if self._silent_run >= self.pause_frames or len(self._segment) >= self.max_segment_bytes:
+            return self._cut()
+        return None
+
+    def _cut(self) -> Optional[bytes]:
+        segment = bytes(self._segment)
+        enough_speech = self._speech_frames >= self.min_speech_frames
+        self._segment.clear()
+        self._in_speech = False
+        self._speech_frames = 0
+        self._silent_run = 0
+        if not enough_speech:
+            # A click or cough: not worth a billed upload
+            self.skipped_bytes += len(segment)
+            return None
+        self.segmented_bytes += len(segment)
+        return segment
+
+
+class BatchTranscriptionPipeline:
+    """
+    Uploads segments in the background with bounded concurrency.
+
+    Results are sent to the client in segment order even when uploads finish
+    out of order. A quota/billing error stops the pipeline; callers check
+    ``stopped`` and end the session.
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[[bytes], Awaitable[Dict[str, Any]]],
+        send_json: Callable[[Dict[str, Any]], Awaitable[None]],
+        max_in_flight: int = V1_MAX_IN_FLIGHT,
+    ):
+        self.transcribe = transcribe
+        self.send_json = send_json
+        self.max_in_flight = max(1, max_in_flight)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_in_flight)
+        self._workers: List[asyncio.Task] = []
+        self._results: Dict[int, Optional[str]] = {}
+        self._next_seq = 0
+        self._next_release = 0
+        self._release_lock = asyncio.Lock()
+        self.stopped = False
+        self.segments_sent = 0
+
+    async def submit(self, segment: bytes) -> None:
+        """Queue a segment; waits only when max_in_flight uploads are queued already."""
+        if self.stopped:
+            return
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_in_flight)]
+        seq = self._next_seq
+        self._next_seq += 1
+        await self._queue.put((seq, segment))
+
+    async def close(self) -> None:
+        """Wait for queued uploads to finish and deliver their results."""
+        for _ in self._workers:
+            await self._queue.put(None)
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def cancel(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            seq, segment = item
+            text = None
+            if not self.stopped:
+                text = await self._transcribe(segment)
+            self._results[seq] = text
+            await self._release()
+
+    async def _transcribe(self, segment: bytes) -> Optional[str]:
+        logger.debug(f"📤 V1: Sending {len(segment)} bytes for transcription")
+        self.segments_sent += 1
+        try:
+            result = await self.transcribe(segment)
+        except Exception as e:
+            logger.error(f"❌ V1 transcription failed: {e}")
+            return None
+
+        if result.get("text"):
+            return result["text"].strip() or None
+        if result.get("error"):
+            error_msg = result["error"]
+            logger.error(f"❌ V1 transcription error: {error_msg}")
+            # Check for quota/billing errors - stop retrying
+            if any(marker in error_msg.lower() for marker in QUOTA_ERROR_MARKERS) and not self.stopped:
+                logger.error("💸 V1 API quota exhausted - stopping transcription")
+                self.stopped = True
+                await self._send({
+                    "event": "error",
+                    "data": {
+                        "message": "Transcription quota exhausted. Please try again later.",
+                        "code": "quota_exceeded",
+                        "timestamp": time.time()
+                    }
+                })
+        return None
+
+    async def _release(self) -> None:
+        async with self._release_lock:
+            while self._next_release in self._results:
+                text = self._results.pop(self._next_release)
+                self._next_release += 1
+                if text:
+                    # Add period for sentence separation
+                    text = text + ". "
+                    logger.info(f"✅ V1 Transcription: {text}")
+                    await self._send({
+                        "event": "transcription_segment",
+                        "data": {
+                            "text": text,
+                            "is_final": True,
+                            "mode": "batch",
+                            "timestamp": time.time()
+                        }
+                    })
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        try:
+            await self.send_json(message)
+        except Exception as e:
+            logger.warning(f"Failed to send V1 result: {e}")
@@ -2,24 +2,42 @@
 
 Manages concurrent connections to ElevenLabs API to stay within rate limits.
 Provides queueing when at capacity with status updates to waiting clients.
+
+Waiters park on a future instead of polling: ``release`` hands the freed
+slot straight to the next waiter. Pool state only changes in synchronous
+sections (no awaits), so no lock is needed on the event loop; client
+notifications are sent afterwards, outside those sections.
 """
 
 import asyncio
+import bisect
 import logging
+import os
 import time
-from typing import Optional, Callable, Awaitable
+from collections import Counter, OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Callable, Awaitable, Tuple
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+STT_MAX_QUEUE_DEPTH = int(os.getenv("STT_MAX_QUEUE_DEPTH", "100"))
+
+# Upper bounds (ms) of the queue wait-time histogram buckets
+WAIT_TIME_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+NotifyCallback = Callable[[str, dict], Awaitable[None]]
+
 
 @dataclass
 class QueuedRequest:
     """A queued connection request waiting for a slot."""
     request_id: str
-    notify_callback: Callable[[str, dict], Awaitable[None]]
+    notify_callback: NotifyCallback
+    user_id: str = ""
     queued_at: float = field(default_factory=time.time)
     cancelled: bool = False
+    position: int = 0
+    future: Optional[asyncio.Future] = None
 
 
 class ElevenLabsConnectionPool:
@@ -27,28 +45,37 @@ class ElevenLabsConnectionPool:
     Manages a pool of concurrent ElevenLabs Scribe V2 connections.
 
     When the pool is at capacity, new requests are queued and notified
-    of their position. When a slot becomes available, the next queued
-    request is activated.
+    of their position. When a slot becomes available, it is handed to the
+    next queued request. Users are served round-robin so one user opening
+    many connections cannot starve everyone else; requests from the same
+    user are served in arrival order.
     """
 
-    def __init__(self, max_connections: int = 20):
+    def __init__(self, max_connections: int = 20, max_queue_depth: int = STT_MAX_QUEUE_DEPTH):
         """
         Initialize the connection pool.
 
         Args:
             max_connections: Maximum concurrent ElevenLabs connections
+            max_queue_depth: Maximum waiting requests; further requests are
+                rejected immediately with a 'queue_full' event
         """
         self.max_connections = max_connections
+        self.max_queue_depth = max_queue_depth
         self.active_connections = 0
-        self.waiting_queue: asyncio.Queue[QueuedRequest] = asyncio.Queue()
-        self.queue_list: list[QueuedRequest] = []  # For position tracking
-        self._lock = asyncio.Lock()
+        # user_id -> that user's waiters; dict order is the round-robin order
+        self._user_queues: "OrderedDict[str, Deque[QueuedRequest]]" = OrderedDict()
+        self._queued: Dict[str, QueuedRequest] = {}
+        self._notify_tasks: set = set()
+        self.metrics: Counter = Counter()
+        self._wait_histogram: List[int] = [0] * (len(WAIT_TIME_BUCKETS_MS) + 1)
         logger.info(f"🔌 Connection pool initialized with max {max_connections} connections")
 
     async def acquire(
         self,
         request_id: str,
-        notify_callback: Callable[[str, dict], Awaitable[None]]
+        notify_callback: NotifyCallback,
+        user_id: Optional[str] = None
     ) -> bool:
         """
         Acquire a connection slot from the pool.
@@ -60,79 +87,75 @@ class ElevenLabsConnectionPool:
             request_id: Unique identifier for this request
             notify_callback: Async callback to notify client of status updates
                             Called with (event_type, data) where event_type is
-                            'queued', 'queue_position', or 'slot_available'
+                            'queued', 'queue_position', 'slot_available' or
+                            'queue_full'
+            user_id: Requesting user, for round-robin fairness between users
+                     (anonymous requests each count as their own user)
 
         Returns:
-            True when a slot is acquired (may wait if queued)
+            True when a slot is acquired (may wait if queued), False if the
+            request was cancelled while queued or the queue is full
         """
-        async with self._lock:
-            if self.active_connections < self.max_connections:
-                # Slot available immediately
-                self.active_connections += 1
-                logger.debug(f"🟢 Slot acquired for {request_id} ({self.active_connections}/{self.max_connections} active)")
-                return True
-
-            # At capacity - queue the request
-            queued_request = QueuedRequest(
-                request_id=request_id,
-                notify_callback=notify_callback
-            )
-            self.queue_list.append(queued_request)
-            position = len(self.queue_list)
-
-            logger.info(f"⏳ Request {request_id} queued at position {position}")
-
-        # Notify client they're queued (outside lock)
-        try:
-            await notify_callback('queued', {
-                'position': position,
-                'message': f'Waiting for available slot. Position: {position}'
+        if self.active_connections < self.max_connections and not self._queued:
+            # Slot available immediately
+            self.active_connections += 1
+            self.metrics["admitted_immediately"] += 1
+            self._record_wait(0.0)
+            logger.debug(f"🟢 Slot acquired for {request_id} ({self.active_connections}/{self.max_connections} active)")
+            return True
+
+        if len(self._queued) >= self.max_queue_depth:
+            self.metrics["rejected_queue_full"] += 1
+            logger.warning(f"🚫 Queue full ({self.max_queue_depth}), rejecting {request_id}")
+            await self._notify(notify_callback, 'queue_full', {
+                'max_queue_depth': self.max_queue_depth,
+                'message': 'Transcription is at capacity, please try again shortly'
             })
-        except Exception as e:
-            logger.warning(f"Failed to notify queued client: {e}")
-
-        # Wait for a slot to become available
-        while True:
-            await asyncio.sleep(0.5)  # Check every 500ms
-
-            async with self._lock:
-                # Check if cancelled
-                if queued_request.cancelled:
-                    if queued_request in self.queue_list:
-                        self.queue_list.remove(queued_request)
-                    return False
-
-                # Check if we're at the front of the queue and a slot is available
-                if self.queue_list and self.queue_list[0] == queued_request:
-                    if self.active_connections < self.max_connections:
-                        self.queue_list.pop(0)
-                        self.active_connections += 1
-                        logger.debug(f"🟢 Slot acquired for queued {request_id} ({self.active_connections}/{self.max_connections} active)")
-
-                        try:
-                            await notify_callback('slot_available', {
-                                'message': 'Connection slot available, starting transcription'
-                            })
-                        except Exception as e:
-                            logger.warning(f"Failed to notify slot available: {e}")
-
-                        return True
-
-                # Update position if still queued
-                try:
-                    current_position = self.queue_list.index(queued_request) + 1
-                    if current_position != position:
-                        position = current_position
-                        try:
-                            await notify_callback('queue_position', {
-                                'position': position,
-                                'message': f'Queue position updated: {position}'
-                            })
-                        except Exception as e:
-                            logger.warning(f"Failed to notify position update: {e}")
-                except ValueError:
-                    # Not in queue anymore
-                    pass
+            return False
+
+        # At capacity - queue the request
+        queued_request = QueuedRequest(
+            request_id=request_id,
+            notify_callback=notify_callback,
+            user_id=user_id or request_id,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._user_queues.setdefault(queued_request.user_id, deque()).append(queued_request)
+        self._queued[request_id] = queued_request
+        self.metrics["queued"] += 1
+        # A new user's request can overtake other users' later requests
+        queued_request.position = self._admission_order().index(queued_request) + 1
+        position = queued_request.position
+        self._push_positions()
+        logger.info(f"⏳ Request {request_id} queued at position {position}")
+
+        # Notify client they're queued
+        await self._notify(notify_callback, 'queued', {
+            'position': position,
+            'message': f'Waiting for available slot. Position: {position}'
+        })
+
+        # Wait for release() to hand us a slot (or cancel_queued() to give up)
+        try:
+            acquired = await queued_request.future
+        except asyncio.CancelledError:
+            if queued_request.future.done() and not queued_request.future.cancelled() \
+                    and queued_request.future.result():
+                # A slot was handed over as we were cancelled; pass it on
+                self._release_slot()
+            else:
+                self._remove(queued_request)
+            raise
+
+        if not acquired:
+            return False
+
+        self._record_wait(time.time() - queued_request.queued_at)
+        logger.debug(f"🟢 Slot acquired for queued {request_id} ({self.active_connections}/{self.max_connections} active)")
+        await self._notify(notify_callback, 'slot_available', {
+            'message': 'Connection slot available, starting transcription'
+        })
+        return True
 
     async def release(self, request_id: str):
         """
@@ -141,10 +164,8 @@ class ElevenLabsConnectionPool:
         Args:
             request_id: Identifier of the connection being released
         """
-        async with self._lock:
-            if self.active_connections > 0:
-                self.active_connections -= 1
-                logger.debug(f"🔴 Slot released by {request_id} ({self.active_connections}/{self.max_connections} active)")
+        self._release_slot()
+        logger.debug(f"🔴 Slot released by {request_id} ({self.active_connections}/{self.max_connections} active)")
 
     def cancel_queued(self, request_id: str):
         """
@@ -153,11 +174,102 @@ class ElevenLabsConnectionPool:
         Args:
             request_id: Identifier of the request to cancel
         """
-        for req in self.queue_list:
-            if req.request_id == request_id:
-                req.cancelled = True
-                logger.info(f"❌ Cancelled queued request {request_id}")
-                break
+        req = self._queued.get(request_id)
+        if req is None:
+            return
+        req.cancelled = True
+        self._remove(req)
+        if not req.future.done():
+            req.future.set_result(False)
+        self.metrics["cancelled"] += 1
+        logger.info(f"❌ Cancelled queued request {request_id}")
+
+    def _release_slot(self) -> None:
+        """Hand the slot to the next waiter, or return it to the pool."""
+        while True:
+            waiter = self._pop_next()
+            if waiter is None:
+                if self.active_connections > 0:
+                    self.active_connections -= 1
+                return
+            if not waiter.future.done():
+                # Slot transfers directly; active_connections is unchanged
+                waiter.future.set_result(True)
+                self.metrics["admitted_from_queue"] += 1
+                self._push_positions()
+                return
+
+    def _pop_next(self) -> Optional[QueuedRequest]:
+        if not self._user_queues:
+            return None
+        user_id, user_queue = next(iter(self._user_queues.items()))
+        waiter = user_queue.popleft()
+        if user_queue:
+            # Rotate: this user's next request waits behind other users
+            self._user_queues.move_to_end(user_id)
+        else:
+            del self._user_queues[user_id]
+        self._queued.pop(waiter.request_id, None)
+        return waiter
+
+    def _remove(self, req: QueuedRequest) -> None:
+        if self._queued.pop(req.request_id, None) is None:
+            return
+        user_queue = self._user_queues.get(req.user_id)
+        if user_queue is not None:
+            try:
+                user_queue.remove(req)
+            except ValueError:
+                pass
+            if not user_queue:
+                del self._user_queues[req.user_id]
+        self._push_positions()
+
+    def _admission_order(self) -> List[QueuedRequest]:
+        """Waiters in the order release() will admit them."""
+        order: List[QueuedRequest] = []
+        queues = [list(q) for q in self._user_queues.values()]
+        depth = 0
+        while queues:
+            queues = [q for q in queues if len(q) > depth]
+            order.extend(q[depth] for q in queues)
+            depth += 1
+        return order
+
+    def _push_positions(self) -> None:
+        """Tell waiters whose position changed, without blocking the caller."""
+        updates: List[Tuple[NotifyCallback, int]] = []
+        for index, req in enumerate(self._admission_order(), start=1):
+            if req.position != index:
+                req.position = index
+                updates.append((req.notify_callback, index))
+        if not updates:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._send_positions(updates))
+        except RuntimeError:
+            return
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+
+    async def _send_positions(self, updates: List[Tuple[NotifyCallback, int]]) -> None:
+        await asyncio.gather(*(
+            self._notify(callback, 'queue_position', {
+                'position': position,
+                'message': f'Queue position updated: {position}'
+            })
+            for callback, position in updates
+        ))
+
+    @staticmethod
+    async def _notify(callback: NotifyCallback, event_type: str, data: dict) -> None:
+        try:
+            await callback(event_type, data)
+        except Exception as e:
+            logger.warning(f"Failed to notify client ({event_type}): {e}")
+
+    def _record_wait(self, seconds: float) -> None:
+        self._wait_histogram[bisect.bisect_left(WAIT_TIME_BUCKETS_MS, seconds * 1000)] += 1
 
     @property
     def available_slots(self) -> int:
@@ -167,7 +279,12 @@ class ElevenLabsConnectionPool:
     @property
     def queue_length(self) -> int:
         """Number of requests currently waiting in queue."""
-        return len(self.queue_list)
+        return len(self._queued)
+
+    def get_wait_time_histogram(self) -> Dict[str, int]:
+        """Admission wait times, keyed by bucket upper bound (ms)."""
+        labels = [f"le_{bound}ms" for bound in WAIT_TIME_BUCKETS_MS] + ["gt_60000ms"]
+        return dict(zip(labels, self._wait_histogram))
 
     def get_status(self) -> dict:
         """Get current pool status for monitoring."""
@@ -175,7 +292,11 @@ class ElevenLabsConnectionPool:
             'max_connections': self.max_connections,
             'active_connections': self.active_connections,
             'available_slots': self.available_slots,
-            'queue_length': self.queue_length
+            'queue_length': self.queue_length,
+            'max_queue_depth': self.max_queue_depth,
+            'waiting_users': len(self._user_queues),
+            'metrics': dict(self.metrics),
+            'wait_time_histogram': self.get_wait_time_histogram(),
         }
 
 
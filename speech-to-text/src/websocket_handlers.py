@@ -11,6 +11,8 @@ import numpy as np
 
 from .services.elevenlabs_stt import get_elevenlabs_stt_service
 from .services.connection_pool import get_connection_pool
+from .services.batch_transcription import BatchTranscriptionPipeline, PCMSegmenter
+from .services.voice_detection import get_voice_detection_service
 from .scribe_message_processor import ScribeMessageProcessor
 from .config import get_settings
 
@@ -207,10 +209,14 @@ async def handle_scribe_v2_realtime_websocket(websocket: WebSocket, user_info: O
     try:
         # Acquire connection pool slot
         logger.info(f"🔄 Requesting connection slot for {request_id}")
-        slot_acquired = await connection_pool.acquire(request_id, notify_queue_status)
+        slot_acquired = await connection_pool.acquire(
+            request_id,
+            notify_queue_status,
+            user_id=(user_info or {}).get("user_id")
+        )
 
         if not slot_acquired:
-            logger.info(f"❌ Connection cancelled while queued: {request_id}")
+            logger.info(f"❌ No connection slot for {request_id} (cancelled or queue full)")
             return
 
         logger.debug(f"✅ Connection slot acquired for {request_id}")
@@ -374,8 +380,8 @@ async def _run_v1_fallback_loop(
     """
     Run V1 (batch API) fallback mode for transcription.
 
-    Buffers audio and periodically sends to batch API for transcription.
-    Uses simple silence detection based on audio energy levels.
+    Cuts the incoming 16kHz PCM into speech segments at VAD-detected pauses
+    and uploads them to the batch API in the background, skipping silence.
 
     Args:
         websocket: Client WebSocket connection
@@ -394,16 +400,27 @@ async def _run_v1_fallback_loop(
         }
     })
 
-    # Audio buffer and timing
-    audio_buffer = list(initial_chunks)
-    last_transcribe_time = time.time()
-    BATCH_INTERVAL_SECS = 2.5  # Transcribe every 2.5 seconds of audio
-    MIN_AUDIO_BYTES = 8000  # Minimum audio to transcribe (~0.25s at 16kHz 16-bit)
+    # Segment audio at voice pauses; silence is never uploaded
+    segmenter = PCMSegmenter(get_voice_detection_service(), sample_rate=16000)
+
+    async def transcribe_segment(pcm: bytes) -> Dict[str, Any]:
+        # Convert PCM to WAV format for batch API
+        return await stt_service.transcribe_audio(
+            _pcm_to_wav(pcm, sample_rate=16000),
+            audio_format="wav"
+        )
+
+    # Uploads run in the background so audio keeps being received meanwhile
+    pipeline = BatchTranscriptionPipeline(transcribe_segment, websocket.send_json)
 
     try:
-        while True:
+        for chunk in initial_chunks:
+            for segment in segmenter.push(chunk):
+                await pipeline.submit(segment)
+
+        while not pipeline.stopped:
             try:
-                # Use timeout to periodically check if we should transcribe
+                # Use timeout so a pause in incoming audio also ends a segment
                 message = await asyncio.wait_for(
                     websocket.receive(),
                     timeout=0.5
@@ -416,8 +433,9 @@ async def _run_v1_fallback_loop(
                 # Handle binary audio data
                 if "bytes" in message:
                     audio_data = message["bytes"]
-                    audio_buffer.append(audio_data)
-                    logger.debug(f"📥 V1: Buffered {len(audio_data)} bytes")
+                    for segment in segmenter.push(audio_data):
+                        await pipeline.submit(segment)
+                    logger.debug(f"📥 V1: Buffered {len(audio_data)} bytes ({segmenter.buffered_bytes} pending)")
 
                 # Handle control messages
                 elif "text" in message:
@@ -432,102 +450,29 @@ async def _run_v1_fallback_loop(
                         pass
 
             except asyncio.TimeoutError:
-                # Check if we should transcribe the buffer
-                pass
+                # No audio for a while: treat it as a pause
+                segment = segmenter.flush()
+                if segment:
+                    await pipeline.submit(segment)
             except WebSocketDisconnect:
                 logger.info("🔌 WebSocket disconnected (V1 mode)")
                 break
 
-            # Check if we should transcribe
-            current_time = time.time()
-            time_since_last = current_time - last_transcribe_time
-            total_audio_bytes = sum(len(chunk) for chunk in audio_buffer)
-
-            if audio_buffer and (
-                time_since_last >= BATCH_INTERVAL_SECS or
-                total_audio_bytes >= 64000  # ~2s of audio at 16kHz 16-bit
-            ):
-                if total_audio_bytes >= MIN_AUDIO_BYTES:
-                    # Combine and transcribe
-                    combined_audio = b''.join(audio_buffer)
-                    audio_buffer.clear()
-                    last_transcribe_time = current_time
-
-                    logger.debug(f"📤 V1: Sending {len(combined_audio)} bytes for transcription")
-
-                    try:
-                        # Convert PCM to WAV format for batch API
-                        wav_audio = _pcm_to_wav(combined_audio, sample_rate=16000)
-
-                        result = await stt_service.transcribe_audio(
-                            wav_audio,
-                            audio_format="wav"
-                        )
-
-                        if result.get("text"):
-                            text = result["text"].strip()
-                            if text:
-                                # Add period for sentence separation
-                                text = text + ". "
-                                logger.info(f"✅ V1 Transcription: {text}")
-                                await websocket.send_json({
-                                    "event": "transcription_segment",
-                                    "data": {
-                                        "text": text,
-                                        "is_final": True,
-                                        "mode": "batch",
-                                        "timestamp": time.time()
-                                    }
-                                })
-                        elif result.get("error"):
-                            error_msg = result['error']
-                            logger.error(f"❌ V1 transcription error: {error_msg}")
-                            # Check for quota/billing errors - stop retrying
-                            if "quota" in error_msg.lower() or "billing" in error_msg.lower() or "insufficient" in error_msg.lower():
-                                logger.error("💸 V1 API quota exhausted - stopping transcription")
-                                await websocket.send_json({
-                                    "event": "error",
-                                    "data": {
-                                        "message": "Transcription quota exhausted. Please try again later.",
-                                        "code": "quota_exceeded",
-                                        "timestamp": time.time()
-                                    }
-                                })
-                                return  # Exit the fallback loop
-
-                    except Exception as e:
-                        logger.error(f"❌ V1 transcription failed: {e}")
-
         # Transcribe any remaining audio
-        if audio_buffer:
-            total_audio_bytes = sum(len(chunk) for chunk in audio_buffer)
-            if total_audio_bytes >= MIN_AUDIO_BYTES:
-                combined_audio = b''.join(audio_buffer)
-                logger.info(f"📤 V1: Final transcription of {len(combined_audio)} bytes")
-
-                try:
-                    wav_audio = _pcm_to_wav(combined_audio, sample_rate=16000)
-                    result = await stt_service.transcribe_audio(wav_audio, audio_format="wav")
-
-                    if result.get("text"):
-                        text = result["text"].strip()
-                        if text:
-                            text = text + ". "
-                            await websocket.send_json({
-                                "event": "transcription_segment",
-                                "data": {
-                                    "text": text,
-                                    "is_final": True,
-                                    "mode": "batch",
-                                    "timestamp": time.time()
-                                }
-                            })
-                except Exception as e:
-                    logger.error(f"❌ V1 final transcription failed: {e}")
+        segment = segmenter.flush()
+        if segment:
+            logger.info(f"📤 V1: Final transcription of {len(segment)} bytes")
+            await pipeline.submit(segment)
+        await pipeline.close()
 
     except Exception as e:
         logger.error(f"❌ Error in V1 fallback loop: {e}")
+        await pipeline.cancel()
 
+    logger.info(
+        f"📊 V1: received {segmenter.received_bytes} bytes, uploaded {segmenter.segmented_bytes} "
+        f"in {pipeline.segments_sent} segments, skipped {segmenter.skipped_bytes} bytes of silence"
+    )
     logger.info("🏁 V1 fallback loop completed")
 
 
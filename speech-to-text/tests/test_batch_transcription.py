@@ -0,0 +1,138 @@
+"""
+Unit tests for the V1 fallback segmenter and upload pipeline.
+
+Tests cover:
+- Silence is never uploaded; segments end at pauses
+- Uploads run in the background with bounded concurrency
+- Results are delivered in segment order
+- Quota errors stop the pipeline
+"""
+
+import asyncio
+import random
+
+import numpy as np
+import pytest
+
+from src.services.batch_transcription import BatchTranscriptionPipeline, PCMSegmenter
+from src.services.voice_detection import VoiceDetectionService
+
+SAMPLE_RATE = 16000
+
+
+def _tone(seconds, freq=300, amplitude=8000):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * freq * t) * amplitude).astype(np.int16).tobytes()
+
+
+def _silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.int16).tobytes()
+
+
+def _chunks(data, size=4096):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestPCMSegmenter:
+    """Test VAD-gated segmentation."""
+
+    def test_cuts_at_pauses_and_skips_silence(self):
+        segmenter = PCMSegmenter(VoiceDetectionService(), sample_rate=SAMPLE_RATE)
+        stream = _silence(2) + _tone(1) + _silence(1) + _tone(0.5) + _silence(1)
+
+        segments = []
+        for chunk in _chunks(stream):
+            segments.extend(segmenter.push(chunk))
+        final = segmenter.flush()
+        if final:
+            segments.append(final)
+
+        assert len(segments) == 2
+        assert segmenter.received_bytes == len(stream)
+        assert segmenter.segmented_bytes == sum(len(s) for s in segments)
+        assert segmenter.segmented_bytes + segmenter.skipped_bytes == len(stream)
+        # Only pre-roll and pause tails of the 4.5s of silence were kept
+        assert segmenter.skipped_bytes == len(_silence(2.4))
+
+    def test_long_speech_is_split_at_max_length(self):
+        segmenter = PCMSegmenter(VoiceDetectionService(), sample_rate=SAMPLE_RATE, max_segment_secs=2)
+
+        segments = segmenter.push(_tone(5))
+
+        assert len(segments) == 2
+        assert all(len(s) == len(_tone(2)) for s in segments)
+        assert segmenter.buffered_bytes == len(_tone(1))
+
+    def test_short_blip_is_not_uploaded(self):
+        segmenter = PCMSegmenter(VoiceDetectionService(), sample_rate=SAMPLE_RATE)
+
+        segments = segmenter.push(_silence(0.5) + _tone(0.1) + _silence(1))
+
+        assert segments == []
+        assert segmenter.segmented_bytes == 0
+
+
+class TestBatchTranscriptionPipeline:
+    """Test background uploads."""
+
+    @pytest.mark.asyncio
+    async def test_uploads_are_bounded_and_results_ordered(self):
+        active = 0
+        max_active = 0
+        sent = []
+
+        async def transcribe(segment):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(random.uniform(0.001, 0.02))
+            active -= 1
+            return {"text": segment.decode()}
+
+        async def send_json(message):
+            sent.append(message["data"]["text"])
+
+        pipeline = BatchTranscriptionPipeline(transcribe, send_json, max_in_flight=2)
+        for index in range(8):
+            await pipeline.submit(str(index).encode())
+        await pipeline.close()
+
+        assert max_active <= 2
+        assert sent == [f"{index}. " for index in range(8)]
+
+    @pytest.mark.asyncio
+    async def test_submit_does_not_wait_for_upload(self):
+        release = asyncio.Event()
+
+        async def transcribe(segment):
+            await release.wait()
+            return {"text": "hi"}
+
+        async def send_json(message):
+            pass
+
+        pipeline = BatchTranscriptionPipeline(transcribe, send_json, max_in_flight=1)
+        await asyncio.wait_for(pipeline.submit(b"a"), timeout=0.1)
+        await asyncio.sleep(0)
+        assert pipeline.segments_sent == 1
+
+        release.set()
+        await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_quota_error_stops_pipeline(self):
+        sent = []
+
+        async def transcribe(segment):
+            return {"error": "API error: 402 - insufficient credits", "text": ""}
+
+        async def send_json(message):
+            sent.append(message)
+
+        pipeline = BatchTranscriptionPipeline(transcribe, send_json)
+        await pipeline.submit(b"a")
+        await pipeline.submit(b"b")
+        await pipeline.close()
+
+        assert pipeline.stopped
+        assert [m["data"]["code"] for m in sent] == ["quota_exceeded"]
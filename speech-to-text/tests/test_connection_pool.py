@@ -0,0 +1,106 @@
+"""
+Unit tests for the ElevenLabs connection pool admission queue.
+
+Tests cover:
+- Direct slot hand-off on release (no polling delay)
+- Round-robin fairness between users
+- Fast rejection when the queue is full
+- Cancellation while queued
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.services.connection_pool import ElevenLabsConnectionPool
+
+
+class Recorder:
+    """Collects notify_callback events per request."""
+
+    def __init__(self):
+        self.events = {}
+
+    def callback(self, request_id):
+        async def notify(event_type, data):
+            self.events.setdefault(request_id, []).append((event_type, data))
+        return notify
+
+
+async def _queue(pool, recorder, request_id, user_id=None):
+    task = asyncio.create_task(pool.acquire(request_id, recorder.callback(request_id), user_id=user_id))
+    await asyncio.sleep(0)
+    return task
+
+
+class TestConnectionPoolAdmission:
+    """Test future-based admission and hand-off."""
+
+    @pytest.mark.asyncio
+    async def test_release_hands_slot_to_waiter_immediately(self):
+        pool = ElevenLabsConnectionPool(max_connections=1)
+        recorder = Recorder()
+        assert await pool.acquire("a", recorder.callback("a"))
+
+        waiter = await _queue(pool, recorder, "b")
+        started = time.perf_counter()
+        await pool.release("a")
+        assert await asyncio.wait_for(waiter, timeout=1)
+
+        assert time.perf_counter() - started < 0.1
+        assert pool.active_connections == 1
+        assert pool.queue_length == 0
+        assert [event for event, _ in recorder.events["b"]] == ["queued", "slot_available"]
+
+    @pytest.mark.asyncio
+    async def test_users_are_admitted_round_robin(self):
+        pool = ElevenLabsConnectionPool(max_connections=1)
+        recorder = Recorder()
+        await pool.acquire("holder", recorder.callback("holder"))
+
+        tasks = {}
+        for request_id, user_id in [("a1", "alice"), ("a2", "alice"), ("a3", "alice"), ("b1", "bob")]:
+            tasks[request_id] = await _queue(pool, recorder, request_id, user_id)
+
+        admitted = []
+        for _ in range(4):
+            await pool.release("previous")
+            await asyncio.sleep(0)
+            done = [rid for rid, task in tasks.items() if task.done() and rid not in admitted]
+            admitted.extend(done)
+
+        assert admitted == ["a1", "b1", "a2", "a3"]
+        # bob's request overtook alice's second and third, so they were told
+        assert ("queue_position", {"position": 3, "message": "Queue position updated: 3"}) in recorder.events["a2"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_without_waiting(self):
+        pool = ElevenLabsConnectionPool(max_connections=1, max_queue_depth=1)
+        recorder = Recorder()
+        await pool.acquire("holder", recorder.callback("holder"))
+        await _queue(pool, recorder, "waiting")
+
+        assert await asyncio.wait_for(pool.acquire("late", recorder.callback("late")), timeout=0.1) is False
+        assert recorder.events["late"][0][0] == "queue_full"
+        assert pool.get_status()["metrics"]["rejected_queue_full"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiters_are_skipped(self):
+        pool = ElevenLabsConnectionPool(max_connections=1)
+        recorder = Recorder()
+        await pool.acquire("holder", recorder.callback("holder"))
+        first = await _queue(pool, recorder, "first")
+        second = await _queue(pool, recorder, "second")
+
+        pool.cancel_queued("first")
+        assert await first is False
+
+        await pool.release("holder")
+        assert await asyncio.wait_for(second, timeout=1) is True
+        assert pool.active_connections == 1
+
+        await pool.release("second")
+        assert pool.active_connections == 0
+        histogram = pool.get_status()["wait_time_histogram"]
+        assert sum(histogram.values()) == 2